@@ -0,0 +1,1538 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Offline simulator of an MS, its peer nodes and their nested
+            VMs, so the testsets can be run, profiled and benchmarked on a
+            single Linux box.
+            Every host gets its own root directory, and the commands sent
+            to it run in a local bash with the host paths (/etc, /var, ...)
+            mapped into that root, so pipes, redirections and command
+            substitution behave as on a real host. That bash only finds the
+            helpers in SANDBOX_COMMANDS, and the ones writing files only
+            touch the root of the host; any other command (yum, rpm,
+            systemctl, ...) fails as not simulated. The commands the
+            testsets expect from LITP, VCS and libvirt (litp, hastatus,
+            hagrp, hares, virsh, ip, nc, hostname and reboot) are answered
+            by the simulator itself from a stateful model of the
+            deployment, including the time VMs take to boot and service
+            groups take to fail over.
+            The state is kept in a JSON file in the simulator directory,
+            so several processes can share one simulated deployment.
+
+            Create a simulated deployment with:
+                python libvirt_cluster_sim.py create <directory>
+            and point the testsets at it with LIBVIRT_SIM_DIR=<directory>.
+"""
+
+import contextlib
+import fcntl
+import hashlib
+import json
+import os
+import pipes
+import re
+import shutil
+import subprocess
+import sys
+import time
+import uuid
+
+SIM_DIR_ENV = 'LIBVIRT_SIM_DIR'
+SIM_HOST_ENV = 'LIBVIRT_SIM_HOST'
+STATE_FILE = 'state.json'
+LOCK_FILE = 'state.lock'
+HOSTS_DIR = 'hosts'
+
+# Commands answered by the simulator instead of the local box.
+SIM_COMMANDS = ('litp', 'hastatus', 'hagrp', 'hares', 'virsh', 'ip', 'nc',
+                'hostname', 'reboot', 'shutdown')
+# Top level directories mapped into the root directory of each host.
+HOST_ROOT_DIRS = ('etc', 'var', 'proc', 'root', 'opt', 'home', 'tmp')
+# Local helpers a simulated host may run, linked into SANDBOX_BIN_DIR which
+# is the only directory on its PATH.
+SANDBOX_COMMANDS = ('awk', 'base64', 'basename', 'cat', 'cksum', 'cmp',
+                    'cut', 'date', 'diff', 'dirname', 'egrep', 'fgrep',
+                    'file', 'find', 'grep', 'head', 'ls', 'md5sum', 'od',
+                    'readlink', 'sed', 'seq', 'sha1sum', 'sha256sum',
+                    'sleep', 'sort', 'stat', 'tail', 'timeout', 'tr',
+                    'uniq', 'wc', 'xargs')
+# Helpers writing files, only run when all their paths are in the host root.
+SANDBOX_WRITE_COMMANDS = ('chmod', 'cp', 'ln', 'mkdir', 'mv', 'rm', 'tee',
+                          'touch')
+SANDBOX_BIN_DIR = 'bin'
+NOT_SIMULATED_RC = 127
+
+# Seconds, multiplied by the time_scale of the simulated deployment.
+DEFAULT_TIMING = {'vm_boot': 20.0,
+                  'vm_stop': 5.0,
+                  'fault_detect': 10.0,
+                  'failover': 30.0,
+                  'node_reboot': 180.0,
+                  'plan_task': 2.0}
+
+UNREACHABLE_RC = 255
+LIBVIRT_INSTANCES_DIR = '/var/lib/libvirt/instances'
+NODE_IMAGE_DIR = '/var/lib/libvirt/images'
+MS_IMAGE_DIR = '/var/www/html/images'
+NETWORK_SCRIPTS_DIR = '/etc/sysconfig/network-scripts'
+YUM_REPOS_DIR = '/etc/yum.repos.d'
+BOOT_ID_PATH = '/proc/sys/kernel/random/boot_id'
+
+# States of the model items, and of the plan.
+APPLIED = 'Applied'
+INITIAL = 'Initial'
+UPDATED = 'Updated'
+FOR_REMOVAL = 'ForRemoval'
+
+# Service group states on a system.
+ONLINE = 'ONLINE'
+OFFLINE = 'OFFLINE'
+FAULTED = 'FAULTED'
+
+_COMMAND_RE = re.compile(
+    r'(^|[;|&(`]|\bthen\b|\bdo\b|\belse\b)(\s*)(?:/[\w.-]+)*/?('
+    + '|'.join(SIM_COMMANDS) + r')(?=[\s;|&)`]|$)', re.M)
+# Shell scripts run by path, rewritten like commands before they run.
+_SCRIPT_RE = re.compile(
+    r'(^|[;|&(`]|\bthen\b|\bdo\b|\belse\b)(\s*)/bin/(?:ba)?sh\s+(?=[^-\s])',
+    re.M)
+# Commands run by absolute path, looked up in the sandbox by name instead.
+_ABS_COMMAND_RE = re.compile(
+    r'(^|[;|&(`]|\bthen\b|\bdo\b|\belse\b)(\s*)(?:/[\w.-]+)*/(?=[\w.-]+'
+    r'(?:[\s;|&)`]|$))', re.M)
+_PATH_RE = re.compile(
+    r'(^|[\s=\'"(<>:,])/(' + '|'.join(HOST_ROOT_DIRS) +
+    r')(?=[/\s\'";|&)]|$)', re.M)
+
+
+def _lines(text):
+    """
+    Description:
+        Split command output into lines, as run_command returns it.
+    """
+    return text.splitlines() if text else []
+
+
+def _mac_address(*seed):
+    """
+    Description:
+        A stable locally administered MAC address derived from seed.
+    """
+    digest = hashlib.md5('/'.join(seed)).hexdigest()
+    return '52:54:00:' + ':'.join(digest[i:i + 2] for i in (0, 2, 4))
+
+
+def _ram_kib(ram):
+    """
+    Description:
+        Convert a vm-service ram property such as 256M or 2G to KiB.
+    """
+    match = re.match(r'^(\d+)([MG]?)$', ram or '')
+    if not match:
+        return 262144
+    factor = 1024 * 1024 if match.group(2) == 'G' else 1024
+    return int(match.group(1)) * factor
+
+
+def _split_list(value):
+    """
+    Description:
+        Split a comma separated model property into a list.
+    """
+    return [part.strip() for part in (value or '').split(',')
+            if part.strip()]
+
+
+class SimulatorError(Exception):
+    """
+    Description:
+        A simulated command failed; message is written to stderr.
+    """
+
+    def __init__(self, message, rc=1):
+        super(SimulatorError, self).__init__(message)
+        self.rc = rc
+
+
+class ClusterSimulator(object):
+    """
+    Description:
+        A simulated deployment kept in sim_dir.
+    """
+
+    def __init__(self, sim_dir):
+        self.sim_dir = os.path.abspath(sim_dir)
+        self.state = None
+        self.now = None
+
+    @classmethod
+    def from_environment(cls):
+        """
+        Description:
+            The simulator named by LIBVIRT_SIM_DIR, or None if not set.
+        """
+        sim_dir = os.environ.get(SIM_DIR_ENV)
+        if not sim_dir:
+            return None
+        return cls(sim_dir)
+
+    @classmethod
+    def create(cls, sim_dir, ms='ms1', nodes=('node1', 'node2'),
+               cluster='c1', time_scale=1.0, timing=None):
+        """
+        Description:
+            Create a simulated deployment with an MS and one cluster of
+            peer nodes, with an empty applied model.
+        :param sim_dir: Directory to keep the simulated deployment in.
+        :type sim_dir: str
+        :param ms: Hostname of the MS.
+        :type ms: str
+        :param nodes: Hostnames of the peer nodes.
+        :type nodes: tuple
+        :param cluster: Id of the cluster.
+        :type cluster: str
+        :param time_scale: Factor applied to every delay, e.g. 0.01 to
+                           run a failover in a fraction of a second.
+        :type time_scale: float
+        :param timing: Delays replacing the DEFAULT_TIMING ones.
+        :type timing: dict
+        :return: The ClusterSimulator.
+        """
+        sim = cls(sim_dir)
+        if os.path.isdir(sim.sim_dir):
+            shutil.rmtree(sim.sim_dir)
+        os.makedirs(os.path.join(sim.sim_dir, HOSTS_DIR))
+        delays = dict(DEFAULT_TIMING)
+        delays.update(timing or {})
+        sim.state = {'timing': dict((key, value * time_scale)
+                                    for key, value in delays.iteritems()),
+                     'hosts': {}, 'model': {}, 'order': [],
+                     'plan': None, 'groups': {}, 'events': [],
+                     'next_dom_id': 1}
+        sim.now = time.time()
+        sim._add_host(ms, 'ms')
+        for node in nodes:
+            sim._add_host(node, 'node')
+        for url, item_type, props in [
+                ('/deployments/d1', 'deployment', {}),
+                ('/deployments/d1/clusters/' + cluster, 'vcs-cluster',
+                 {'cluster_type': 'sfha', 'cluster_id': '4761'}),
+                ('/deployments/d1/clusters/{0}/services'.format(cluster),
+                 'collection-of-clustered-service', {}),
+                ('/software/images', 'collection-of-image-base', {}),
+                ('/software/services', 'collection-of-service-base', {}),
+                ('/infrastructure', 'infrastructure', {}),
+                ('/ms', 'ms', {'hostname': ms}),
+                ('/ms/services', 'collection-of-service-base', {})]:
+            sim._create_item(url, item_type, props, APPLIED)
+        for index, node in enumerate(nodes):
+            sim._create_item(
+                '/deployments/d1/clusters/{0}/nodes/n{1}'.format(
+                    cluster, index + 1), 'node',
+                {'hostname': node, 'node_id': str(index + 1)}, APPLIED)
+        sim._save()
+        return sim
+
+    # State handling
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """
+        Description:
+            Load the state under an exclusive lock, bring it up to the
+            current time, and save it back once the block is done.
+        """
+        with open(os.path.join(self.sim_dir, LOCK_FILE), 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                with open(os.path.join(self.sim_dir, STATE_FILE)) as state:
+                    self.state = json.load(state)
+                self.now = time.time()
+                self._advance()
+                yield
+                self._save()
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _save(self):
+        """
+        Description:
+            Write the state back to the simulator directory.
+        """
+        path = os.path.join(self.sim_dir, STATE_FILE)
+        with open(path + '.new', 'w') as state:
+            json.dump(self.state, state, indent=1, sort_keys=True)
+        os.rename(path + '.new', path)
+
+    def _delay(self, name):
+        """
+        Description:
+            A delay of the simulated deployment, in seconds.
+        """
+        return self.state['timing'][name]
+
+    def _host_root(self, host):
+        """
+        Description:
+            The root directory of a host.
+        """
+        return os.path.join(self.sim_dir, HOSTS_DIR, host)
+
+    def _write_file(self, host, path, lines):
+        """
+        Description:
+            Write a file on a host.
+        """
+        local = self._host_root(host) + path
+        if not os.path.isdir(os.path.dirname(local)):
+            os.makedirs(os.path.dirname(local))
+        with open(local, 'w') as output:
+            output.write(''.join(line + '\n' for line in lines))
+
+    def _add_host(self, host, kind):
+        """
+        Description:
+            Add an MS, node or VM host, up and freshly booted.
+        """
+        if host in self.state['hosts']:
+            return
+        self.state['hosts'][host] = {'kind': kind, 'up_at': 0}
+        for name in HOST_ROOT_DIRS:
+            os.makedirs(os.path.join(self._host_root(host), name))
+        self._new_boot_id(host)
+
+    def _new_boot_id(self, host):
+        """
+        Description:
+            Give a host a new boot id, as after a reboot.
+        """
+        self._write_file(host, BOOT_ID_PATH, [str(uuid.uuid4())])
+
+    # Running commands
+
+    def run_command(self, host, cmd, **_):
+        """
+        Description:
+            Run a command on a simulated host, as run_command does.
+        :param host: The MS, node or VM hostname.
+        :type host: str
+        :param cmd: The command to run.
+        :type cmd: str
+        :return: stdout lines, stderr lines and return code.
+        """
+        with self._locked():
+            reachable = self._is_reachable(host)
+        if not reachable:
+            return [], ['ssh: connect to host {0} port 22: No route to '
+                        'host'.format(host)], UNREACHABLE_RC
+        return self._run_shell(host, cmd)
+
+    def run_command_via_node(self, via_node, host, cmd, **_):
+        """
+        Description:
+            Run a command on a VM reached through its peer node, as
+            run_command_via_node does.
+        :param via_node: The peer node.
+        :type via_node: str
+        :param host: The VM hostname.
+        :type host: str
+        :param cmd: The command to run.
+        :type cmd: str
+        :return: stdout lines, stderr lines and return code.
+        """
+        with self._locked():
+            reachable = self._is_reachable(via_node) and \
+                self._is_reachable(host, via_node)
+        if not reachable:
+            return [], ['ssh: connect to host {0} port 22: No route to '
+                        'host'.format(host)], UNREACHABLE_RC
+        return self._run_shell(host, cmd)
+
+    def _sandbox_bin(self):
+        """
+        Description:
+            The directory linking the local helpers in SANDBOX_COMMANDS and
+            SANDBOX_WRITE_COMMANDS, created on first use.
+        """
+        bin_dir = os.path.join(self.sim_dir, SANDBOX_BIN_DIR)
+        for name in SANDBOX_COMMANDS + SANDBOX_WRITE_COMMANDS:
+            link = os.path.join(bin_dir, name)
+            if os.path.lexists(link):
+                continue
+            for local_dir in ('/usr/bin', '/bin'):
+                if os.path.exists(os.path.join(local_dir, name)):
+                    if not os.path.isdir(bin_dir):
+                        os.makedirs(bin_dir)
+                    try:
+                        os.symlink(os.path.join(local_dir, name), link)
+                    except OSError:
+                        # Linked by another process in the meantime.
+                        pass
+                    break
+        return bin_dir
+
+    def shell_script(self, host, cmd):
+        """
+        Description:
+            The bash script running cmd as if on host: simulated commands
+            call back into the simulator, shell scripts run by path are
+            rewritten the same way, and host paths are mapped into the
+            root directory of the host. Only the helpers linked in the
+            sandbox bin directory are found, the ones writing files refuse
+            paths outside the root of the host, and every other command
+            fails with NOT_SIMULATED_RC.
+        """
+        root = self._host_root(host)
+        script = _COMMAND_RE.sub(r'\1\2__sim \3',
+                                 _SCRIPT_RE.sub(r'\1\2__sim --script ', cmd))
+        script = _ABS_COMMAND_RE.sub(r'\1\2', script)
+        script = _PATH_RE.sub(lambda m: m.group(1) + root + '/' +
+                              m.group(2), script)
+        preamble = [
+            'PATH={0}'.format(pipes.quote(self._sandbox_bin())),
+            'command_not_found_handle() {{ echo "$1: not simulated" >&2; '
+            'return {0}; }}'.format(NOT_SIMULATED_RC),
+            '__sim() {{ {0} {1} "$@"; }}'.format(
+                pipes.quote(sys.executable),
+                pipes.quote(os.path.splitext(os.path.abspath(__file__))[0] +
+                            '.py')),
+            '__in_root() {{ local arg path; for arg in "${{@:2}}"; do '
+            'case $arg in -*) continue;; esac; '
+            'path=$(command readlink -m -- "$arg"); '
+            'case $path in {0}|{0}/*) ;; *) echo "$1: $arg: not simulated" '
+            '>&2; return {1};; esac; done; command "$@"; }}'.format(
+                pipes.quote(root), NOT_SIMULATED_RC)]
+        preamble.extend('{0}() {{ __in_root {0} "$@"; }}'.format(name)
+                        for name in SANDBOX_WRITE_COMMANDS)
+        return '\n'.join(preamble + [script])
+
+    def _run_shell(self, host, cmd):
+        """
+        Description:
+            Run cmd in a local bash, as if on host. The paths of the host
+            are mapped into its root directory, and mapped back in the
+            output.
+        """
+        root = self._host_root(host)
+        env = dict(os.environ)
+        env.update({SIM_DIR_ENV: self.sim_dir, SIM_HOST_ENV: host,
+                    'TMPDIR': root + '/tmp', 'HOME': root + '/root'})
+        proc = subprocess.Popen(['/bin/bash', '-c',
+                                 self.shell_script(host, cmd)],
+                                cwd=root, env=env, stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE)
+        out, err = proc.communicate()
+        return (_lines(out.replace(root, '')), _lines(err.replace(root, '')),
+                proc.returncode)
+
+    def dispatch(self, host, argv):
+        """
+        Description:
+            Answer one of SIM_COMMANDS run on host.
+        :param host: The host the command runs on.
+        :type host: str
+        :param argv: The command and its arguments.
+        :type argv: list
+        :return: stdout lines, stderr lines and return code.
+        """
+        name = os.path.basename(argv[0])
+        with self._locked():
+            try:
+                out = getattr(self, '_cmd_' + name)(host, argv[1:])
+            except SimulatorError as error:
+                return [], [str(error)], error.rc
+        return out, [], 0
+
+    # Time
+
+    def _advance(self):
+        """
+        Description:
+            Complete a plan that has run all its tasks, and apply every
+            scheduled service group transition that is due.
+        """
+        self._complete_plan()
+        events = self.state['events']
+        while events:
+            events.sort()
+            if events[0][0] > self.now:
+                break
+            at, group, system, state = events.pop(0)
+            if group in self.state['groups']:
+                self._set_group_state(group, system, state, at)
+
+    def _schedule(self, at, group, system, state):
+        """
+        Description:
+            Move a service group to state on system at a given time.
+        """
+        self.state['events'].append([at, group, system, state])
+
+    def _pending(self, group, system):
+        """
+        Description:
+            The state a service group is moving to on system, if any.
+        """
+        for _, name, sys_name, state in self.state['events']:
+            if name == group and sys_name == system:
+                return state
+        return None
+
+    def _set_group_state(self, name, system, state, at):
+        """
+        Description:
+            Move a service group to state on system, starting whatever
+            VCS would start as a consequence.
+        """
+        group = self.state['groups'][name]
+        sys_state = group['states'][system]
+        sys_state['state'] = state
+        if state == ONLINE:
+            sys_state['dom_id'] = self.state['next_dom_id']
+            sys_state['down_until'] = 0
+            self.state['next_dom_id'] += 1
+            self._new_boot_id(group['hostnames'][system])
+        elif state == FAULTED and not group['parallel']:
+            target = self._failover_target(group, system)
+            if target is not None:
+                self._schedule(at + self._delay('failover'), name, target,
+                               ONLINE)
+
+    def _failover_target(self, group, system):
+        """
+        Description:
+            The system a failover service group moves to from system.
+        """
+        for other in group['systems']:
+            if other != system and self._host_up(other) and \
+                    group['states'][other]['state'] == OFFLINE and \
+                    self._pending(group['name'], other) is None:
+                return other
+        return None
+
+    def _host_up(self, host):
+        """
+        Description:
+            True if an MS or node host is up.
+        """
+        return self.state['hosts'][host]['up_at'] <= self.now
+
+    def _vm_instances(self, host):
+        """
+        Description:
+            (group, system) pairs a VM hostname may run as.
+        """
+        for group in self.state['groups'].itervalues():
+            for system, vm_host in group['hostnames'].iteritems():
+                if vm_host == host:
+                    yield group, system
+
+    def _domain_running(self, group, system):
+        """
+        Description:
+            True if the VM of group is running on system.
+        """
+        sys_state = group['states'][system]
+        if not self._host_up(system) or sys_state['down_until'] is None \
+                or sys_state['down_until'] > self.now:
+            return False
+        return sys_state['state'] == ONLINE or \
+            self._pending(group['name'], system) == ONLINE
+
+    def _is_reachable(self, host, via_node=None):
+        """
+        Description:
+            True if host is up and, for a VM, has finished booting.
+        """
+        info = self.state['hosts'].get(host)
+        if info is None:
+            return False
+        if info['kind'] != 'vm':
+            return self._host_up(host)
+        for group, system in self._vm_instances(host):
+            if via_node is not None and system != via_node:
+                continue
+            if self._domain_running(group, system) and \
+                    group['states'][system]['state'] == ONLINE:
+                return True
+        return False
+
+    # litp
+
+    def _create_item(self, url, item_type, props, state=INITIAL,
+                     source=None):
+        """
+        Description:
+            Add an item, and its missing parents, to the model. Items
+            inheriting from a parent of url get an inherited copy of it.
+        """
+        model = self.state['model']
+        parent = url.rsplit('/', 1)[0]
+        if parent and parent not in model:
+            self._create_item(parent, 'collection', {}, APPLIED)
+        model[url] = {'type': item_type, 'state': state, 'props': props,
+                      'source': source}
+        self.state['order'].append(url)
+        for other, item in model.items():
+            if item['source'] and (url == item['source'] or
+                                   url.startswith(item['source'] + '/')) \
+                    and other != url:
+                child = other + url[len(item['source']):]
+                if child not in model:
+                    self._create_item(child, item_type, {}, state, url)
+
+    def _item_props(self, url):
+        """
+        Description:
+            The properties of an item, inherited ones included, as
+            (value, inherited) pairs.
+        """
+        item = self.state['model'][url]
+        props = {}
+        if item['source'] in self.state['model']:
+            props = dict((key, (value, True)) for key, (value, _) in
+                         self._item_props(item['source']).iteritems())
+        props.update((key, (value, False))
+                     for key, value in item['props'].iteritems())
+        return props
+
+    def props(self, url):
+        """
+        Description:
+            The effective properties of a model item.
+        """
+        return dict((key, value) for key, (value, _) in
+                    self._item_props(url).iteritems())
+
+    def find(self, path, item_type):
+        """
+        Description:
+            The urls of the items of item_type under path.
+        """
+        return sorted(url for url, item in self.state['model'].iteritems()
+                      if item['type'] == item_type and
+                      (url == path or url.startswith(path + '/')))
+
+    def _show_item(self, url, children):
+        """
+        Description:
+            The litp show output of an item.
+        """
+        item = self.state['model'][url]
+        lines = [url, '    type: ' + item['type'],
+                 '    state: ' + item['state']]
+        if item['source']:
+            lines.append('    inherited from: ' + item['source'])
+        props = self._item_props(url)
+        if props:
+            lines.append('    properties:')
+            for key in sorted(props):
+                value, inherited = props[key]
+                lines.append('        {0}: {1}{2}'.format(
+                    key, value, ' [*]' if inherited else ''))
+        if children:
+            lines.append('    children:')
+            lines.extend('        ' + child for child in children)
+        return lines
+
+    @staticmethod
+    def _litp_options(args):
+        """
+        Description:
+            Parse litp options: -p path -t type -s source -o k=v ...
+            -d k ... and flags such as -r.
+        """
+        options = {'o': {}, 'd': []}
+        index = 0
+        while index < len(args):
+            arg = args[index]
+            index += 1
+            if arg in ('-p', '-t', '-s'):
+                options[arg[1]] = args[index]
+                index += 1
+            elif arg in ('-o', '-d'):
+                while index < len(args) and not args[index].startswith('-'):
+                    if arg == '-o':
+                        key, _, value = args[index].partition('=')
+                        options['o'][key] = value
+                    else:
+                        options['d'].append(args[index])
+                    index += 1
+            elif arg.startswith('-'):
+                options[arg.lstrip('-')] = True
+        return options
+
+    def _get_item(self, url):
+        """
+        Description:
+            A model item, or a litp InvalidLocationError.
+        """
+        item = self.state['model'].get(url)
+        if item is None:
+            raise SimulatorError('{0}\nInvalidLocationError    Not found'
+                                 .format(url))
+        return item
+
+    def _cmd_litp(self, host, args):
+        """
+        Description:
+            litp create, update, remove, inherit, show, create_plan,
+            run_plan, show_plan and remove_plan.
+        """
+        if self.state['hosts'][host]['kind'] != 'ms':
+            raise SimulatorError('bash: litp: command not found', 127)
+        action, options = args[0], self._litp_options(args[1:])
+        model = self.state['model']
+        url = options.get('p', '').rstrip('/')
+        if action in ('create', 'inherit'):
+            if url in model:
+                raise SimulatorError('{0}\nItemExistsError    Item '
+                                     'already exists in model: {1}'
+                                     .format(url, url.split('/')[-1]))
+            if action == 'inherit':
+                source = self._get_item(options['s'])
+                self._create_item(url, source['type'], {}, INITIAL,
+                                  options['s'])
+                self._copy_inherited_children(options['s'], url)
+                model[url]['props'].update(options['o'])
+            else:
+                self._create_item(url, options['t'], options['o'])
+            return []
+        if action == 'update':
+            item = self._get_item(url)
+            item['props'].update(options['o'])
+            for key in options['d']:
+                item['props'].pop(key, None)
+            self._mark_updated(url)
+            return []
+        if action == 'remove':
+            self._get_item(url)
+            for other in list(model):
+                if other == url or other.startswith(url + '/'):
+                    if model[other]['state'] == INITIAL:
+                        del model[other]
+                    else:
+                        model[other]['state'] = FOR_REMOVAL
+            return []
+        if action == 'show':
+            self._get_item(url)
+            if options.get('r'):
+                return sum([self._show_item(other, None)
+                            for other in sorted(model)
+                            if other == url or
+                            other.startswith(url + '/')], [])
+            children = sorted(other for other in model
+                              if other.rsplit('/', 1)[0] == url)
+            return self._show_item(url, children)
+        return self._litp_plan(action)
+
+    def _copy_inherited_children(self, source, url):
+        """
+        Description:
+            Give a newly inherited item a copy of the source's children.
+        """
+        for other in sorted(self.state['model']):
+            if other.startswith(source + '/'):
+                child = url + other[len(source):]
+                if child not in self.state['model']:
+                    self._create_item(child,
+                                      self.state['model'][other]['type'],
+                                      {}, INITIAL, other)
+
+    def _mark_updated(self, url):
+        """
+        Description:
+            Mark an applied item and the items inheriting from it updated.
+        """
+        for other, item in self.state['model'].iteritems():
+            if (other == url or item['source'] == url) and \
+                    item['state'] == APPLIED:
+                item['state'] = UPDATED
+
+    def _litp_plan(self, action):
+        """
+        Description:
+            litp create_plan, run_plan, show_plan and remove_plan.
+        """
+        plan = self.state['plan']
+        if action == 'create_plan':
+            tasks = sorted(url for url, item in
+                           self.state['model'].iteritems()
+                           if item['state'] in (INITIAL, UPDATED,
+                                                FOR_REMOVAL))
+            if not tasks:
+                raise SimulatorError('DoNothingPlanError    Create plan '
+                                     'failed: no tasks were generated')
+            self.state['plan'] = {'state': 'Initial', 'tasks': tasks,
+                                  'started': None}
+            return []
+        if plan is None:
+            raise SimulatorError('InvalidLocationError    Plan does not '
+                                 'exist')
+        if action == 'run_plan':
+            if plan['state'] != 'Initial':
+                raise SimulatorError('InvalidRequestError    Plan not '
+                                     'in initial state')
+            plan['state'] = 'Running'
+            plan['started'] = self.now
+            return []
+        if action == 'remove_plan':
+            self.state['plan'] = None
+            return []
+        if action == 'show_plan':
+            done = len(plan['tasks'])
+            if plan['state'] == 'Running':
+                done = min(done, int((self.now - plan['started']) /
+                                     self._delay('plan_task')))
+            lines = ['Task status', '-----------']
+            for index, url in enumerate(plan['tasks']):
+                status = 'Initial'
+                if plan['state'] != 'Initial':
+                    status = 'Success' if index < done else 'Running'
+                lines.append('{0}\t\t{1}'.format(status, url))
+            lines.append('')
+            lines.append('Tasks: {0} | Initial: {1} | Running: {2} | '
+                         'Success: {3} | Failed: 0 | Stopped: 0'.format(
+                             len(plan['tasks']),
+                             len(plan['tasks']) if plan['state'] ==
+                             'Initial' else 0,
+                             len(plan['tasks']) - done if plan['state'] ==
+                             'Running' else 0,
+                             done if plan['state'] != 'Initial' else 0))
+            lines.append('Plan Status: ' + plan['state'])
+            return lines
+        raise SimulatorError('Unknown litp action "{0}"'.format(action), 2)
+
+    def _complete_plan(self):
+        """
+        Description:
+            Apply the model once a running plan has run all its tasks.
+        """
+        plan = self.state['plan']
+        if plan is None or plan['state'] != 'Running' or \
+                self.now - plan['started'] < \
+                len(plan['tasks']) * self._delay('plan_task'):
+            return
+        model = self.state['model']
+        for url in list(model):
+            if model[url]['state'] == FOR_REMOVAL:
+                del model[url]
+            else:
+                model[url]['state'] = APPLIED
+        plan['state'] = 'Successful'
+        self._deploy(plan['started'] +
+                     len(plan['tasks']) * self._delay('plan_task'))
+
+    # Deployment
+
+    def _deploy(self, at):
+        """
+        Description:
+            Bring the VCS groups, VMs and files in line with the model.
+        """
+        for cluster in self.find('/deployments', 'vcs-cluster'):
+            node_hosts = dict(
+                (url.split('/')[-1], self.props(url)['hostname'])
+                for url in self.find(cluster + '/nodes', 'node'))
+            cluster_id = cluster.split('/')[-1]
+            for cs_url in self.find(cluster + '/services',
+                                    'vcs-clustered-service'):
+                for vm_url in self.find(cs_url, 'vm-service'):
+                    self._deploy_group(cluster_id, cs_url, vm_url,
+                                       node_hosts, at)
+        wanted = set('{0}/{1}'.format(group['cs_url'], group['vm_url'])
+                     for group in self.state['groups'].itervalues()
+                     if group['cs_url'] in self.state['model'] and
+                     group['vm_url'] in self.state['model'])
+        for name, group in self.state['groups'].items():
+            if '{0}/{1}'.format(group['cs_url'], group['vm_url']) \
+                    not in wanted:
+                del self.state['groups'][name]
+        for vm_url in self.find('/ms/services', 'vm-service'):
+            props = self.props(vm_url)
+            hostname = (_split_list(props.get('hostnames')) or
+                        [props['service_name']])[0]
+            self._add_host(hostname, 'ms_vm')
+            self.state['hosts'][hostname]['vm_url'] = vm_url
+            self._write_vm_files(hostname, vm_url, 0)
+        for image_url in self.find('/software/images', 'vm-image'):
+            source_uri = self.props(image_url).get('source_uri', '')
+            filename = source_uri.split('/')[-1]
+            content = ['image ' + source_uri]
+            ms_host = self.props('/ms')['hostname']
+            self._write_file(ms_host, MS_IMAGE_DIR + '/' + filename,
+                             content)
+            for host, info in self.state['hosts'].iteritems():
+                if info['kind'] == 'node':
+                    self._write_file(host, NODE_IMAGE_DIR + '/' + filename,
+                                     content)
+
+    def _deploy_group(self, cluster_id, cs_url, vm_url, node_hosts, at):
+        """
+        Description:
+            Define or update the VCS group of a clustered vm-service.
+        """
+        cs_props = self.props(cs_url)
+        vm_props = self.props(vm_url)
+        node_ids = _split_list(cs_props.get('node_list'))
+        systems = [node_hosts[node] for node in node_ids
+                   if node in node_hosts]
+        active = int(cs_props.get('active', '1'))
+        standby = int(cs_props.get('standby', '0'))
+        service_name = vm_props.get('service_name', vm_url.split('/')[-1])
+        hostnames = _split_list(vm_props.get('hostnames'))
+        if not hostnames:
+            if standby != 1:
+                hostnames = ['{0}-{1}'.format(node, service_name)
+                             for node in node_ids]
+            else:
+                hostnames = [service_name]
+        if active == 1 and standby == 1:
+            hostnames = [hostnames[0]] * len(systems)
+        name = 'Grp_CS_{0}_{1}'.format(cluster_id, cs_url.split('/')[-1])
+        ha_configs = self.find(cs_url, 'ha-service-config')
+        ha_props = self.props(ha_configs[0]) if ha_configs else {}
+        group = self.state['groups'].get(name)
+        if group is None:
+            group = {'name': name, 'states': {}}
+            self.state['groups'][name] = group
+            for index, system in enumerate(systems):
+                group['states'][system] = {'state': OFFLINE, 'dom_id': None,
+                                           'down_until': 0}
+                if index < active:
+                    self._schedule(at + self._delay('vm_boot'), name,
+                                   system, ONLINE)
+        group.update({
+            'cs_url': cs_url, 'vm_url': vm_url,
+            'resource': 'Res_App_{0}_{1}_{2}'.format(
+                cluster_id, cs_props.get('name', ''),
+                vm_url.split('/')[-1]),
+            'service_name': service_name, 'systems': systems,
+            'parallel': standby == 0,
+            'restart_limit': int(ha_props.get('restart_limit', '0')),
+            'hostnames': dict(zip(systems, hostnames))})
+        for index, system in enumerate(systems):
+            self._add_host(group['hostnames'][system], 'vm')
+            self._write_vm_files(group['hostnames'][system], vm_url,
+                                 index)
+            self._write_instance_files(system, vm_url)
+
+    def _vm_interfaces(self, vm_url, index):
+        """
+        Description:
+            (device, mac, ipv4, ipv6, gateway, gateway6) of each network
+            interface of the VM with a given node index.
+        """
+        interfaces = []
+        for if_url in self.find(vm_url, 'vm-network-interface'):
+            props = self.props(if_url)
+            addresses = []
+            for prop in ('ipaddresses', 'ipv6addresses'):
+                values = _split_list(props.get(prop))
+                if len(values) > index:
+                    addresses.append(values[index])
+                else:
+                    addresses.append(values[0] if values else None)
+            device = props.get('device_name', if_url.split('/')[-1])
+            interfaces.append((device, _mac_address(vm_url, device,
+                                                    str(index)),
+                               addresses[0], addresses[1],
+                               props.get('gateway'), props.get('gateway6')))
+        return interfaces
+
+    def _write_vm_files(self, host, vm_url, index):
+        """
+        Description:
+            Write the files cloud-init leaves on a VM.
+        """
+        hosts = ['127.0.0.1 localhost localhost.localdomain',
+                 '::1 localhost6 localhost6.localdomain6']
+        for url in self.find(vm_url, 'vm-alias'):
+            props = self.props(url)
+            hosts.append('{0} {1}'.format(
+                props.get('address', '').split('/')[0],
+                ' '.join(_split_list(props.get('alias_names')))))
+        self._write_file(host, '/etc/hosts', hosts)
+        fstab = ['/dev/vda1 / ext4 defaults 1 1']
+        for url in self.find(vm_url, 'vm-nfs-mount'):
+            props = self.props(url)
+            fstab.append('{0} {1} nfs {2} 0 0'.format(
+                props.get('device_path'), props.get('mount_point'),
+                props.get('mount_options', 'defaults')))
+        for url in self.find(vm_url, 'vm-ram-mount'):
+            props = self.props(url)
+            fstab.append('{0} {1} {0} {2} 0 0'.format(
+                props.get('type', 'tmpfs'), props.get('mount_point'),
+                props.get('mount_options', 'defaults')))
+        self._write_file(host, '/etc/fstab', fstab)
+        self._write_file(host, '/root/.ssh/authorized_keys',
+                         [self.props(url).get('ssh_key', '') for url in
+                          self.find(vm_url, 'vm-ssh-key')])
+        for url in self.find(vm_url, 'vm-yum-repo'):
+            props = self.props(url)
+            self._write_file(host, '{0}/{1}.repo'.format(
+                YUM_REPOS_DIR, props.get('name', '').lower()),
+                ['[{0}]'.format(props.get('name')),
+                 'name = {0}'.format(props.get('name')),
+                 'baseurl = {0}'.format(props.get('base_url')),
+                 'enabled = 1', 'gpgcheck = 0'])
+        for device, mac, ipv4, ipv6, gateway, gateway6 in \
+                self._vm_interfaces(vm_url, index):
+            ifcfg = ['DEVICE={0}'.format(device), 'HWADDR={0}'.format(mac),
+                     'ONBOOT=yes']
+            if ipv4 == 'dhcp':
+                ifcfg.append('BOOTPROTO=dhcp')
+            else:
+                ifcfg.append('BOOTPROTO=static')
+                if ipv4:
+                    ifcfg.extend(['IPADDR={0}'.format(ipv4),
+                                  'NETMASK=255.255.255.0'])
+                if gateway:
+                    ifcfg.append('GATEWAY={0}'.format(gateway))
+            if ipv6:
+                ifcfg.extend(['IPV6INIT=yes',
+                              'IPV6ADDR={0}'.format(ipv6)])
+                if gateway6:
+                    ifcfg.append('IPV6_DEFAULTGW={0}'.format(gateway6))
+            self._write_file(host, '{0}/ifcfg-{1}'.format(
+                NETWORK_SCRIPTS_DIR, device), ifcfg)
+
+    def _write_instance_files(self, node, vm_url):
+        """
+        Description:
+            Write the libvirt instance files of a VM on its peer node.
+        """
+        props = self.props(vm_url)
+        instance_dir = '{0}/{1}'.format(LIBVIRT_INSTANCES_DIR,
+                                        props.get('service_name'))
+        user_data = ['#cloud-config', 'packages:']
+        user_data.extend('- ' + self.props(url).get('name', '')
+                         for url in self.find(vm_url, 'vm-package'))
+        user_data.append('runcmd:')
+        for url in self.find(vm_url, 'vm-custom-script'):
+            user_data.extend('- ' + script for script in _split_list(
+                self.props(url).get('custom_script_names')))
+        self._write_file(node, instance_dir + '/user-data', user_data)
+        self._write_file(node, instance_dir + '/meta-data',
+                         ['instance-id: ' + props.get('service_name', '')])
+        self._write_file(node, instance_dir + '/network-config',
+                         ['version: 1'])
+        self._write_file(node, instance_dir + '/config.json', [json.dumps({
+            'adaptor_data': {'internal_status_check': {
+                'active': props.get('internal_status_check', 'on')}},
+            'vm_data': {'cpu': props.get('cpus'),
+                        'ram': props.get('ram')}})])
+
+    # VCS
+
+    def _group_state_name(self, group, system):
+        """
+        Description:
+            The state of a service group on system, as hastatus shows it.
+        """
+        state = group['states'][system]['state']
+        pending = self._pending(group['name'], system)
+        if not self._host_up(system):
+            return OFFLINE
+        if state == OFFLINE and pending == ONLINE:
+            return 'OFFLINE|STARTING'
+        if state == ONLINE and pending == OFFLINE:
+            return 'ONLINE|STOPPING'
+        if state == FAULTED:
+            return 'OFFLINE|FAULTED'
+        return state
+
+    def _get_group(self, name):
+        """
+        Description:
+            A service group, or a VCS error.
+        """
+        group = self.state['groups'].get(name)
+        if group is None:
+            raise SimulatorError('VCS WARNING V-16-1-40131 Group {0} does '
+                                 'not exist in the local cluster'
+                                 .format(name))
+        return group
+
+    def _cmd_hastatus(self, host, args):
+        """
+        Description:
+            hastatus -sum.
+        """
+        if args[:1] != ['-sum']:
+            raise SimulatorError('hastatus: only -sum is simulated', 2)
+        lines = ['', '-- SYSTEM STATE',
+                 '-- System               State                Frozen', '']
+        for node in sorted(name for name, info in
+                           self.state['hosts'].iteritems()
+                           if info['kind'] == 'node'):
+            lines.append('A  {0:<20} {1:<20} 0'.format(
+                node, 'RUNNING' if self._host_up(node) else 'FAULTED'))
+        lines.extend(['', '-- GROUP STATE',
+                      '-- Group           System               Probed     '
+                      'AutoDisabled    State', ''])
+        for name in sorted(self.state['groups']):
+            group = self.state['groups'][name]
+            for system in group['systems']:
+                lines.append('B  {0:<15} {1:<20} {2:<10} {3:<15} {4}'
+                             .format(name, system, 'Y', 'N',
+                                     self._group_state_name(group,
+                                                            system)))
+        return lines
+
+    def _cmd_hagrp(self, host, args):
+        """
+        Description:
+            hagrp -state, -value, -display, -switch, -online, -offline
+            and -clear.
+        """
+        action = args[0]
+        rest = [arg for arg in args[1:] if not arg.startswith('-')]
+        options = dict(zip(args[1:], args[2:]))
+        if action == '-state':
+            names = rest[:1] or sorted(self.state['groups'])
+            if rest and '-sys' in options:
+                group = self._get_group(rest[0])
+                return ['|{0}|'.format(self._group_state_name(
+                    group, options['-sys']))]
+            lines = ['#Group                Attribute             System     '
+                     '           Value']
+            for name in names:
+                group = self._get_group(name)
+                for system in group['systems']:
+                    lines.append('{0:<21} {1:<21} {2:<21} |{3}|'.format(
+                        name, 'State', system,
+                        self._group_state_name(group, system)))
+            return lines
+        group = self._get_group(rest[0])
+        name = group['name']
+        if action == '-value':
+            attribute, system = rest[1], rest[2] if len(rest) > 2 else None
+            if attribute == 'State':
+                return ['|{0}|'.format(self._group_state_name(
+                    group, system or group['systems'][0]))]
+            return [self._group_attributes(group).get(attribute, '')]
+        if action == '-display':
+            lines = ['#Group                Attribute             System     '
+                     '           Value']
+            for attribute, value in sorted(
+                    self._group_attributes(group).iteritems()):
+                lines.append('{0:<21} {1:<21} {2:<21} {3}'.format(
+                    name, attribute, 'global', value))
+            for system in group['systems']:
+                lines.append('{0:<21} {1:<21} {2:<21} |{3}|'.format(
+                    name, 'State', system,
+                    self._group_state_name(group, system)))
+            return lines
+        if action == '-switch':
+            target = options['-to']
+            if not self._host_up(target):
+                raise SimulatorError('VCS WARNING V-16-1-40151 System {0} '
+                                     'is not in RUNNING state'
+                                     .format(target))
+            if group['states'][target]['state'] == FAULTED:
+                raise SimulatorError('VCS WARNING V-16-1-10228 Group {0} '
+                                     'is FAULTED on system {1}'
+                                     .format(name, target))
+            for system in group['systems']:
+                if group['states'][system]['state'] == ONLINE and \
+                        system != target:
+                    self._schedule(self.now + self._delay('vm_stop'), name,
+                                   system, OFFLINE)
+            self._schedule(self.now + self._delay('vm_stop') +
+                           self._delay('vm_boot'), name, target, ONLINE)
+            return []
+        if action == '-online':
+            self._schedule(self.now + self._delay('vm_boot'), name,
+                           options['-sys'], ONLINE)
+            return []
+        if action == '-offline':
+            self._schedule(self.now + self._delay('vm_stop'), name,
+                           options['-sys'], OFFLINE)
+            return []
+        if action == '-clear':
+            for system in group['systems']:
+                if options.get('-sys', system) == system and \
+                        group['states'][system]['state'] == FAULTED:
+                    group['states'][system]['state'] = OFFLINE
+                    group['states'][system]['restarts'] = 0
+            return []
+        raise SimulatorError('hagrp: {0} is not simulated'.format(action), 2)
+
+    def _group_attributes(self, group):
+        """
+        Description:
+            The global attributes of a service group.
+        """
+        return {'Parallel': '1' if group['parallel'] else '0',
+                'SystemList': '  '.join('{0} {1}'.format(system, index)
+                                        for index, system in
+                                        enumerate(group['systems'])),
+                'AutoStartList': '  '.join(group['systems']),
+                'OnlineRetryLimit': '0',
+                'Frozen': '0'}
+
+    def _cmd_hares(self, host, args):
+        """
+        Description:
+            hares -display of the application resource of a group.
+        """
+        if args[:1] != ['-display'] or len(args) < 2:
+            raise SimulatorError('hares: only -display is simulated', 2)
+        for group in self.state['groups'].itervalues():
+            if group['resource'] == args[1]:
+                break
+        else:
+            raise SimulatorError('VCS WARNING V-16-1-40130 Resource {0} '
+                                 'does not exist in the local cluster'
+                                 .format(args[1]))
+        cs_props = self.props(group['cs_url'])
+        vm_props = self.props(group['vm_url'])
+        program = '/usr/share/litp_libvirt/vm_utils {0} {1}'.format(
+            group['service_name'], '{0}')
+        attributes = {
+            'Group': group['name'], 'Type': 'Application',
+            'OnlineTimeout': cs_props.get('online_timeout', '300'),
+            'OfflineTimeout': cs_props.get('offline_timeout', '300'),
+            'CleanProgram': vm_props.get(
+                'cleanup_command', program.format('force-stop')),
+            'StartProgram': program.format('start'),
+            'StopProgram': program.format('stop'),
+            'MonitorProgram': program.format('status')}
+        lines = ['#Resource             Attribute             System     '
+                 '           Value']
+        for attribute, value in sorted(attributes.iteritems()):
+            lines.append('{0:<21} {1:<21} {2:<21} {3}'.format(
+                args[1], attribute, 'global', value))
+        for system in group['systems']:
+            state = group['states'][system]['state']
+            lines.append('{0:<21} {1:<21} {2:<21} {3}'.format(
+                args[1], 'State', system,
+                ONLINE if state == ONLINE else OFFLINE))
+        return lines
+
+    # libvirt
+
+    def _node_domain(self, node, name):
+        """
+        Description:
+            The group whose VM is the domain name on node, or an error.
+        """
+        for group in self.state['groups'].itervalues():
+            if group['service_name'] == name and node in group['systems']:
+                return group
+        raise SimulatorError('error: failed to get domain \'{0}\'\n'
+                             'error: Domain not found: no domain with '
+                             'matching name \'{0}\''.format(name))
+
+    def _cmd_virsh(self, host, args):
+        """
+        Description:
+            virsh list, dominfo, dumpxml, vcpuinfo and destroy.
+        """
+        action = args[0]
+        if action == 'list':
+            lines = [' Id    Name                           State',
+                     '-' * 52]
+            for group in sorted(self.state['groups'].itervalues(),
+                                key=lambda group: group['service_name']):
+                if host not in group['systems']:
+                    continue
+                running = self._domain_running(group, host)
+                if running or '--all' in args:
+                    lines.append(' {0:<5} {1:<30} {2}'.format(
+                        group['states'][host]['dom_id'] if running else '-',
+                        group['service_name'],
+                        'running' if running else 'shut off'))
+            return lines
+        group = self._node_domain(host, args[1])
+        vm_props = self.props(group['vm_url'])
+        running = self._domain_running(group, host)
+        cpus = vm_props.get('cpus', '1')
+        uuid_ = str(uuid.UUID(hashlib.md5(group['vm_url'] + host)
+                              .hexdigest()))
+        if action == 'dominfo':
+            dom_id = group['states'][host]['dom_id'] if running else '-'
+            return ['Id:             {0}'.format(dom_id),
+                    'Name:           {0}'.format(group['service_name']),
+                    'UUID:           {0}'.format(uuid_),
+                    'OS Type:        hvm',
+                    'State:          {0}'.format(
+                        'running' if running else 'shut off'),
+                    'CPU(s):         {0}'.format(cpus),
+                    'Max memory:     {0} KiB'.format(
+                        _ram_kib(vm_props.get('ram'))),
+                    'Used memory:    {0} KiB'.format(
+                        _ram_kib(vm_props.get('ram'))),
+                    'Persistent:     yes',
+                    'Autostart:      disable',
+                    'Managed save:   no',
+                    'Security model: none',
+                    'Security DOI:   0']
+        if action == 'dumpxml':
+            cpuset = vm_props.get('cpuset')
+            vcpu = "<vcpu placement='static'{0}>{1}</vcpu>".format(
+                " cpuset='{0}'".format(cpuset) if cpuset else '', cpus)
+            dom_id = ''
+            if running:
+                dom_id = " id='{0}'".format(group['states'][host]['dom_id'])
+            lines = ["<domain type='kvm'{0}>".format(dom_id),
+                     '  <name>{0}</name>'.format(group['service_name']),
+                     '  <uuid>{0}</uuid>'.format(uuid_),
+                     "  <memory unit='KiB'>{0}</memory>".format(
+                         _ram_kib(vm_props.get('ram'))),
+                     '  ' + vcpu,
+                     '  <devices>']
+            index = group['systems'].index(host)
+            for device, mac, _, _, _, _ in self._vm_interfaces(
+                    group['vm_url'], index):
+                lines.extend(["    <interface type='bridge'>",
+                              "      <mac address='{0}'/>".format(mac),
+                              "      <target dev='{0}'/>".format(device),
+                              '    </interface>'])
+            lines.extend(['  </devices>', '</domain>'])
+            return lines
+        if action == 'vcpuinfo':
+            if not running:
+                raise SimulatorError('error: Requested operation is not '
+                                     'valid: domain is not running')
+            lines = []
+            for vcpu in xrange(int(cpus)):
+                lines.extend(['VCPU:           {0}'.format(vcpu),
+                              'CPU:            {0}'.format(vcpu),
+                              'State:          running',
+                              'CPU time:       1.0s',
+                              'CPU Affinity:   ' + 'y' * int(cpus), ''])
+            return lines
+        if action == 'destroy':
+            if not running:
+                raise SimulatorError('error: Failed to destroy domain {0}\n'
+                                     'error: Requested operation is not '
+                                     'valid: domain is not running'
+                                     .format(args[1]))
+            self._fault_vm(group, host)
+            return ['Domain {0} destroyed'.format(args[1]), '']
+        raise SimulatorError('virsh: {0} is not simulated'.format(action), 2)
+
+    def _fault_vm(self, group, system):
+        """
+        Description:
+            A VM was killed: VCS restarts it in place while the restart
+            limit allows, and faults the group on that system otherwise.
+        """
+        sys_state = group['states'][system]
+        restarts = sys_state.get('restarts', 0)
+        if restarts < group['restart_limit']:
+            sys_state['restarts'] = restarts + 1
+            sys_state['down_until'] = self.now + \
+                self._delay('fault_detect') + self._delay('vm_boot')
+            self._new_boot_id(group['hostnames'][system])
+        else:
+            sys_state['down_until'] = None
+            self._schedule(self.now + self._delay('fault_detect'),
+                           group['name'], system, FAULTED)
+
+    # Hosts
+
+    def _host_interfaces(self, host):
+        """
+        Description:
+            (device, mac, ipv4, ipv6, gateway, gateway6) of each network
+            interface of host.
+        """
+        vm_url = self.state['hosts'][host].get('vm_url')
+        if vm_url is not None:
+            return self._vm_interfaces(vm_url, 0)
+        for group, system in self._vm_instances(host):
+            return self._vm_interfaces(group['vm_url'],
+                                       group['systems'].index(system))
+        return [('eth0', _mac_address(host, 'eth0'), None, None, None,
+                 None)]
+
+    def _cmd_ip(self, host, args):
+        """
+        Description:
+            ip link, addr and route, plain or one line per record.
+        """
+        one_line = '-o' in args
+        ipv6 = '-6' in args
+        words = [arg for arg in args if not arg.startswith('-')]
+        obj = words[0] if words else 'addr'
+        devices = [word for word in words[1:]
+                   if word not in ('show', 'list', 'dev')]
+        interfaces = self._host_interfaces(host)
+        if obj.startswith('r'):
+            lines = []
+            for device, _, ipv4, ipv6_addr, gateway, gateway6 in interfaces:
+                if ipv6:
+                    if ipv6_addr:
+                        lines.append('{0} dev {1} proto kernel metric 256'
+                                     .format(ipv6_addr, device))
+                    if gateway6:
+                        lines.append('default via {0} dev {1} metric 1024'
+                                     .format(gateway6, device))
+                else:
+                    if ipv4 and ipv4 != 'dhcp':
+                        lines.append('{0}.0/24 dev {1} proto kernel scope '
+                                     'link src {2}'.format(
+                                         ipv4.rsplit('.', 1)[0], device,
+                                         ipv4))
+                    if gateway:
+                        lines.append('default via {0} dev {1}'.format(
+                            gateway, device))
+            return lines
+        lines = []
+        records = [(1, 'lo', '<LOOPBACK,UP,LOWER_UP>', 'loopback',
+                    '00:00:00:00:00:00', '127.0.0.1', '::1', 65536)]
+        for index, (device, mac, ipv4, ipv6_addr, _, _) in \
+                enumerate(interfaces):
+            records.append((index + 2, device,
+                            '<BROADCAST,MULTICAST,UP,LOWER_UP>', 'ether',
+                            mac, ipv4 if ipv4 != 'dhcp' else None,
+                            ipv6_addr, 1500))
+        for index, device, flags, kind, mac, ipv4, ipv6_addr, mtu in \
+                records:
+            if devices and device not in devices:
+                continue
+            header = '{0}: {1}: {2} mtu {3} qdisc pfifo_fast state UP ' \
+                     'qlen 1000'.format(index, device, flags, mtu)
+            link = '    link/{0} {1} brd {2}'.format(
+                kind, mac, '00:00:00:00:00:00' if kind == 'loopback'
+                else 'ff:ff:ff:ff:ff:ff')
+            if obj.startswith('l'):
+                lines.append(header + ('\\' + link if one_line else ''))
+                if not one_line:
+                    lines.append(link)
+                continue
+            addresses = []
+            if ipv4 and not ipv6:
+                addresses.append('    inet {0}/{1} scope global {2}'
+                                 .format(ipv4, 8 if kind == 'loopback'
+                                         else 24, device))
+            if ipv6_addr and ('-4' not in args):
+                if '/' not in ipv6_addr:
+                    ipv6_addr += '/128' if kind == 'loopback' else '/64'
+                addresses.append('    inet6 {0} scope {1}'.format(
+                    ipv6_addr, 'host' if kind == 'loopback' else 'global'))
+            if one_line:
+                lines.extend('{0}: {1}{2}'.format(index, device,
+                                                  address.replace(
+                                                      '    ', ' ', 1))
+                             for address in addresses)
+                continue
+            lines.append(header)
+            if not ipv6:
+                lines.append(link)
+            for address in addresses:
+                lines.extend([address, '       valid_lft forever '
+                              'preferred_lft forever'])
+        return lines
+
+    def _cmd_nc(self, host, args):
+        """
+        Description:
+            nc -z host port: succeeds if host is reachable.
+        """
+        words = []
+        index = 0
+        while index < len(args):
+            if args[index] in ('-w', '-i', '-s', '-p'):
+                index += 2
+                continue
+            if not args[index].startswith('-'):
+                words.append(args[index])
+            index += 1
+        target = words[0] if words else ''
+        known = dict((name, name) for name in self.state['hosts'])
+        for group in self.state['groups'].itervalues():
+            for system in group['systems']:
+                for _, _, ipv4, ipv6, _, _ in self._vm_interfaces(
+                        group['vm_url'], group['systems'].index(system)):
+                    for address in (ipv4, ipv6):
+                        if address:
+                            known[address.split('/')[0]] = \
+                                group['hostnames'][system]
+        if target in known and self._is_reachable(known[target]):
+            return []
+        raise SimulatorError('', 1)
+
+    def _cmd_hostname(self, host, args):
+        """
+        Description:
+            hostname.
+        """
+        return [host]
+
+    def _cmd_reboot(self, host, args):
+        """
+        Description:
+            Reboot a node or a VM.
+        """
+        info = self.state['hosts'][host]
+        if info['kind'] == 'vm':
+            for group, system in self._vm_instances(host):
+                if self._domain_running(group, system):
+                    group['states'][system]['down_until'] = \
+                        self.now + self._delay('vm_boot')
+            self._new_boot_id(host)
+            return []
+        info['up_at'] = self.now + self._delay('node_reboot')
+        self._new_boot_id(host)
+        self.state['events'] = [event for event in self.state['events']
+                                if event[2] != host]
+        for group in self.state['groups'].itervalues():
+            if host not in group['systems']:
+                continue
+            sys_state = group['states'][host]
+            was_online = sys_state['state'] == ONLINE
+            sys_state['state'] = OFFLINE
+            if group['parallel']:
+                self._schedule(info['up_at'] + self._delay('vm_boot'),
+                               group['name'], host, ONLINE)
+            elif was_online:
+                target = self._failover_target(group, host)
+                if target is not None:
+                    self._schedule(self.now + self._delay('failover'),
+                                   group['name'], target, ONLINE)
+        return []
+
+    def _cmd_shutdown(self, host, args):
+        """
+        Description:
+            shutdown -r: reboot a node or a VM.
+        """
+        if '-r' not in args:
+            raise SimulatorError('shutdown: only -r is simulated', 2)
+        return self._cmd_reboot(host, args)
+
+
+def main(argv):
+    """
+    Description:
+        Create a simulated deployment, or answer a simulated command or
+        run a shell script for the host named by LIBVIRT_SIM_HOST.
+    """
+    if len(argv) > 2 and argv[1] == 'create':
+        ClusterSimulator.create(
+            argv[2], time_scale=float(argv[3]) if len(argv) > 3 else 1.0)
+        return 0
+    sim = ClusterSimulator.from_environment()
+    if len(argv) > 2 and argv[1] == '--script':
+        with open(argv[2]) as script:
+            cmd = script.read()
+        os.execv('/bin/bash', ['/bin/bash', '-c', sim.shell_script(
+            os.environ[SIM_HOST_ENV], cmd), argv[2]] + argv[3:])
+    out, err, rc = sim.dispatch(os.environ[SIM_HOST_ENV], argv[1:])
+    sys.stdout.write(''.join(line + '\n' for line in out))
+    sys.stderr.write(''.join(line + '\n' for line in err if line))
+    return rc
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,289 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Engine keeping many remote commands in flight at once across
+            the MS, the peer nodes and the nested VMs. Commands are
+            submitted without blocking and answered with a CommandFuture;
+            the synchronous run and run_all methods are the facade for
+            existing callers. Every command is answered with a
+            CommandResult holding its output and timing, which still
+            unpacks as the usual (stdout, stderr, rc) tuple.
+"""
+
+import subprocess
+import sys
+import threading
+import time
+import Queue
+
+# Queued to wake an idle worker up, e.g. so that it sees the engine is
+# shutting down. A worker only stops on it if nothing else is pending, so
+# one left over in the queue is harmless.
+WAKE_WORKER = None
+# Seconds run and run_all wait for a command by default.
+RESULT_TIMEOUT = 1800
+
+
+class CommandResult(object):
+    """
+    Description:
+        Outcome of a command run on a node, or on a VM via its peer node.
+    """
+
+    def __init__(self, node, cmd, stdout, stderr, rc, started, finished,
+                 via_node=None):
+        self.node = node
+        self.cmd = cmd
+        self.stdout = stdout
+        self.stderr = stderr
+        self.rc = rc
+        self.started = started
+        self.finished = finished
+        self.via_node = via_node
+
+    @property
+    def duration(self):
+        """
+        Description:
+            Seconds the command took, queueing excluded.
+        """
+        return self.finished - self.started
+
+    @property
+    def ok(self):
+        """
+        Description:
+            True if the command returned 0 and wrote nothing to stderr.
+        """
+        return self.rc == 0 and not self.stderr
+
+    def __iter__(self):
+        return iter((self.stdout, self.stderr, self.rc))
+
+    def __repr__(self):
+        target = self.node
+        if self.via_node is not None:
+            target = '{0} via {1}'.format(self.node, self.via_node)
+        return '<CommandResult {0} rc={1} {2:.3f}s: {3}>'.format(
+            target, self.rc, self.duration, self.cmd)
+
+
+class CommandFuture(object):
+    """
+    Description:
+        A submitted command, answered with a CommandResult once it has run.
+    """
+
+    def __init__(self, node, cmd, via_node=None):
+        self.node = node
+        self.cmd = cmd
+        self.via_node = via_node
+        self.submitted = time.time()
+        self._done = threading.Event()
+        self._result = None
+        self._exc_info = None
+
+    def done(self):
+        """
+        Description:
+            True once the command has run.
+        """
+        return self._done.is_set()
+
+    def result(self, timeout=None):
+        """
+        Description:
+            Wait for the command and return its CommandResult. An exception
+            raised while running the command is raised again here.
+        :param timeout: Seconds to wait, or None to wait until it has run.
+        :type timeout: float
+        :return: The CommandResult of the command.
+        """
+        if not self._done.wait(timeout):
+            raise AssertionError('Command "{0}" on "{1}" still running '
+                                 'after {2}s'.format(self.cmd, self.node,
+                                                     timeout))
+        if self._exc_info is not None:
+            raise self._exc_info[0], self._exc_info[1], self._exc_info[2]
+        return self._result
+
+    def _set_result(self, result=None, exc_info=None):
+        """
+        Description:
+            Record the outcome of the command and wake up any waiter.
+        """
+        self._result = result
+        self._exc_info = exc_info
+        self._done.set()
+
+
+def run_local_command(node, cmd, **_):
+    """
+    Description:
+        Stand-in for run_command that runs cmd in a local shell whatever
+        the node, to exercise the engine without a deployment.
+    :param node: Ignored.
+    :type node: str
+    :param cmd: The command to run.
+    :type cmd: str
+    :return: stdout lines, stderr lines and return code of the command.
+    """
+    proc = subprocess.Popen(['/bin/sh', '-c', cmd], stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE)
+    out, err = proc.communicate()
+    return out.splitlines(), err.splitlines(), proc.returncode
+
+
+class CommandEngine(object):
+    """
+    Description:
+        Runs submitted commands on up to max_in_flight worker threads.
+        Workers are started as commands are submitted and stop once they
+        have been idle for idle_timeout seconds, or once nothing is left
+        to run after shutdown.
+    """
+
+    def __init__(self, run_command, run_command_via_node=None,
+                 max_in_flight=64, idle_timeout=5,
+                 result_timeout=RESULT_TIMEOUT):
+        self.run_command = run_command
+        self.run_command_via_node = run_command_via_node
+        self.max_in_flight = max_in_flight
+        self.idle_timeout = idle_timeout
+        self.result_timeout = result_timeout
+        self._pending = Queue.Queue()
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._workers = 0
+        self._idle = 0
+
+    def submit(self, node, cmd, via_node=None, **kwargs):
+        """
+        Description:
+            Queue a command without waiting for it.
+        :param node: The node, or VM, to run the command on.
+        :type node: str
+        :param cmd: The command to run.
+        :type cmd: str
+        :param via_node: The peer node a VM is reached through.
+        :type via_node: str
+        :return: The CommandFuture of the command.
+        """
+        future = CommandFuture(node, cmd, via_node)
+        with self._lock:
+            self._pending.put((future, kwargs))
+            if self._pending.qsize() > self._idle and \
+                    self._workers < self.max_in_flight:
+                self._workers += 1
+                thread = threading.Thread(target=self._worker)
+                thread.daemon = True
+                thread.start()
+        return future
+
+    def _worker(self):
+        """
+        Description:
+            Run pending commands until none has been submitted for
+            idle_timeout seconds, or none is left once shutting down.
+        """
+        while True:
+            with self._lock:
+                self._idle += 1
+            try:
+                item = self._pending.get(timeout=self.idle_timeout)
+            except Queue.Empty:
+                item = WAKE_WORKER
+            with self._lock:
+                self._idle -= 1
+            if item is not WAKE_WORKER:
+                self._execute(*item)
+            with self._lock:
+                if self._pending.empty() and \
+                        (item is WAKE_WORKER or self._stopping.is_set()):
+                    self._workers -= 1
+                    return
+
+    def shutdown(self):
+        """
+        Description:
+            Stop the workers once the commands already submitted have run,
+            and wait for them. Commands submitted afterwards start new
+            workers.
+        """
+        self._stopping.set()
+        try:
+            with self._lock:
+                idle = self._idle
+            for _ in xrange(idle):
+                self._pending.put(WAKE_WORKER)
+            while True:
+                with self._lock:
+                    if not self._workers:
+                        break
+                time.sleep(0.01)
+        finally:
+            self._stopping.clear()
+
+    def _execute(self, future, kwargs):
+        """
+        Description:
+            Run the command of future and record its outcome.
+        """
+        started = time.time()
+        try:
+            if future.via_node is None:
+                out, err, rc = self.run_command(future.node, future.cmd,
+                                                **kwargs)
+            else:
+                out, err, rc = self.run_command_via_node(
+                    future.via_node, future.node, future.cmd, **kwargs)
+        except Exception:  # pylint: disable=broad-except
+            future._set_result(exc_info=sys.exc_info())
+            return
+        future._set_result(CommandResult(future.node, future.cmd, out, err,
+                                         rc, started, time.time(),
+                                         future.via_node))
+
+    @staticmethod
+    def gather(futures, timeout=None):
+        """
+        Description:
+            Wait for every future and return their results.
+        :param futures: The futures to wait for.
+        :type futures: list
+        :param timeout: Seconds to wait for each future.
+        :type timeout: float
+        :return: The CommandResults, in the order of futures.
+        """
+        return [future.result(timeout) for future in futures]
+
+    def run(self, node, cmd, via_node=None, timeout=None, **kwargs):
+        """
+        Description:
+            Run a command and wait for it, failing if it has not run
+            within timeout seconds, result_timeout by default.
+        :return: The CommandResult of the command.
+        """
+        return self.submit(node, cmd, via_node, **kwargs).result(
+            timeout if timeout is not None else self.result_timeout)
+
+    def run_all(self, commands, timeout=None):
+        """
+        Description:
+            Run several commands at the same time and wait for all of them.
+        :param commands: (node, cmd) or (node, cmd, via_node) tuples.
+        :type commands: list
+        :param timeout: Seconds to wait for each command, result_timeout
+                        by default.
+        :type timeout: float
+        :return: The CommandResults, in the order of commands.
+        """
+        return self.gather([self.submit(*command) for command in commands],
+                           timeout if timeout is not None
+                           else self.result_timeout)
@@ -0,0 +1,77 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Memoization of read-only commands whose output cannot change
+            within one verification epoch, e.g. the RHEL version or the
+            timezone of a node. The epoch is bumped whenever the
+            deployment may have changed underneath the tests: a plan run,
+            a reboot, a failover or a service restart.
+"""
+
+import threading
+
+
+class EpochMemo(object):
+    """
+    Description:
+        Values computed once per epoch, keyed by any hashable key.
+    """
+
+    def __init__(self):
+        self.epoch = 0
+        self.values = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key, compute, keep=None):
+        """
+        Description:
+            Return the value of key for the current epoch, calling
+            compute() if it was not computed yet in this epoch.
+        :param key: Identifies the value, e.g. (node, command).
+        :type key: tuple
+        :param compute: Computes the value.
+        :type compute: function
+        :param keep: Tells if a computed value may be kept, e.g. only
+                     the output of commands that succeeded.
+        :type keep: function
+        :return: The value of key.
+        """
+        with self.lock:
+            if key in self.values:
+                self.hits += 1
+                return self.values[key]
+            self.misses += 1
+            epoch = self.epoch
+        value = compute()
+        if keep is None or keep(value):
+            self.put(key, value, epoch)
+        return value
+
+    def put(self, key, value, epoch):
+        """
+        Description:
+            Keep value for key, unless the epoch it was computed in is
+            over already.
+        """
+        with self.lock:
+            if epoch == self.epoch:
+                self.values[key] = value
+
+    def bump(self):
+        """
+        Description:
+            Start a new epoch, forgetting every value.
+        :return: The new epoch.
+        """
+        with self.lock:
+            self.epoch += 1
+            self.values.clear()
+            return self.epoch
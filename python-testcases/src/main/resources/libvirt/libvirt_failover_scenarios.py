@@ -0,0 +1,159 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Runner for failover scenarios declaring the service groups
+            and nodes they disturb. A scenario starts as soon as every
+            earlier scenario it conflicts with has finished, so scenarios
+            on independent service groups run at the same time, those on
+            the same group run in the order given, and exclusive ones,
+            e.g. node reboots, run alone. Each scenario keeps its own
+            result, and its cleanups run whether it passed or not.
+"""
+
+import sys
+import threading
+import time
+
+from libvirt_fanout import FanOutResult, raise_failures
+
+
+class FailoverScenario(object):
+    """
+    Description:
+        A failover scenario and what it disturbs.
+    """
+
+    def __init__(self, name, run, groups=(), nodes=(), exclusive=False):
+        """
+        :param name: The name of the scenario used in reports.
+        :type name: str
+        :param run: Runs the scenario. It is given a function registering
+                    cleanups, called as add_cleanup(func, *args).
+        :type run: function
+        :param groups: The service groups the scenario fails over,
+                       including the groups depending on them.
+        :type groups: list
+        :param nodes: The nodes the scenario takes down.
+        :type nodes: list
+        :param exclusive: True if the scenario may disturb every group
+                          and node, e.g. a node reboot.
+        :type exclusive: bool
+        """
+        self.name = name
+        self.run = run
+        self.groups = frozenset(groups)
+        self.nodes = frozenset(nodes)
+        self.exclusive = exclusive
+
+    def conflicts_with(self, other):
+        """
+        Description:
+            True if the scenario cannot run at the same time as other.
+        """
+        return self.exclusive or other.exclusive or \
+            bool(self.groups & other.groups) or \
+            bool(self.nodes & other.nodes)
+
+
+def schedule(scenarios):
+    """
+    Description:
+        The earlier scenarios each scenario has to wait for.
+    :param scenarios: The scenarios, in the order conflicting ones run.
+    :type scenarios: list
+    :return: A list of the indexes of the scenarios each one waits for.
+    """
+    return [[index for index in xrange(position)
+             if scenario.conflicts_with(scenarios[index])]
+            for position, scenario in enumerate(scenarios)]
+
+
+class ScenarioRunner(object):
+    """
+    Description:
+        Runs failover scenarios, concurrently where they do not conflict.
+    """
+
+    def __init__(self, log=None):
+        """
+        :param log: Logs a message, called as log(level, message).
+        :type log: function
+        """
+        self.log = log or (lambda level, message: None)
+        self.durations = {}
+
+    def map(self, scenarios):
+        """
+        Description:
+            Run every scenario.
+        :param scenarios: The scenarios, in the order conflicting ones run.
+        :type scenarios: list
+        :return: A FanOutResult per scenario, in the order of scenarios.
+        """
+        scenarios = list(scenarios)
+        waits = schedule(scenarios)
+        results = [None] * len(scenarios)
+        done = [threading.Event() for _ in scenarios]
+
+        def worker(position):
+            """
+            Description:
+                Run a scenario once the scenarios it waits for are done.
+            """
+            try:
+                for index in waits[position]:
+                    done[index].wait()
+                results[position] = self._run(scenarios[position])
+            finally:
+                done[position].set()
+
+        threads = [threading.Thread(target=worker, args=(position,))
+                   for position in xrange(len(scenarios))]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def _run(self, scenario):
+        """
+        Description:
+            Run a scenario and then its cleanups, last registered first.
+            A failed cleanup fails the scenario, unless it failed already.
+        """
+        cleanups = []
+        exc_info = None
+        started = time.time()
+        self.log('info', 'Failover scenario "{0}" started'
+                 .format(scenario.name))
+        try:
+            scenario.run(lambda func, *args: cleanups.append((func, args)))
+        except Exception:  # pylint: disable=broad-except
+            exc_info = sys.exc_info()
+        for func, args in reversed(cleanups):
+            try:
+                func(*args)
+            except Exception:  # pylint: disable=broad-except
+                exc_info = exc_info or sys.exc_info()
+        duration = time.time() - started
+        self.durations[scenario.name] = duration
+        self.log('info', 'Failover scenario "{0}" {1} in {2:.0f}s'.format(
+            scenario.name, 'failed' if exc_info else 'passed', duration))
+        return FanOutResult(scenario, scenario.name, exc_info=exc_info)
+
+    def run(self, scenarios):
+        """
+        Description:
+            Run every scenario and raise if any of them failed, as
+            FanOutExecutor.run does.
+        :param scenarios: The scenarios, in the order conflicting ones run.
+        :type scenarios: list
+        """
+        raise_failures(self.map(scenarios))
@@ -0,0 +1,326 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Failover soak: switches and destroys cycled across service
+            groups for a number of iterations or minutes, each iteration
+            timed and its failure kept, with the peer nodes sampled for
+            leaks along the way: .live files left in the instances
+            directory for VMs that are not running, domains defined but
+            not running, and growth of the images directory.
+            The summary gives the throughput, failure rate, latency
+            percentiles per step and leaks of a soak, and is appended to
+            failover_soak.json in LIBVIRT_TIMING_DIR, if set, to compare
+            soaks across adaptor versions.
+"""
+
+import json
+import os
+import sys
+import time
+import traceback
+
+from libvirt_failover_timing import TIMING_DIR_ENV, percentile
+from libvirt_probe_cache import ProbeScript
+from libvirt_vm_probe import PROBE_MARKER
+
+SOAK_FILE = 'failover_soak.json'
+SOAK_ITERATIONS_ENV = 'LIBVIRT_SOAK_ITERATIONS'
+SOAK_MINUTES_ENV = 'LIBVIRT_SOAK_MINUTES'
+VIRSH_PATH = '/usr/bin/virsh'
+
+# Takes the instances directory and the images directory as arguments.
+LEAK_PROBE = ProbeScript('soak_leak_probe', '\n'.join([
+    '#!/bin/sh',
+    "echo '{0} running'; {1} list --name".format(PROBE_MARKER, VIRSH_PATH),
+    "echo '{0} defined'; {1} list --all --name".format(PROBE_MARKER,
+                                                       VIRSH_PATH),
+    "echo '{0} live'; /bin/find \"$1\" -name '*.live' 2>/dev/null"
+    .format(PROBE_MARKER),
+    "echo '{0} images'; /usr/bin/du -sk \"$2\" 2>/dev/null"
+    .format(PROBE_MARKER), '']))
+
+
+class LeakSample(object):
+    """
+    Description:
+        Domains, .live files and images directory size of a peer node, as
+        collected by LEAK_PROBE.
+    """
+
+    def __init__(self, instances_dir):
+        self.instances_dir = instances_dir.rstrip('/')
+        self.running = set()
+        self.defined = set()
+        self.live_files = []
+        self.images_kb = None
+
+    @classmethod
+    def from_output(cls, lines, instances_dir):
+        """
+        Description:
+            Parse the output of LEAK_PROBE.
+        :param lines: The stdout lines of the probe.
+        :type lines: list
+        :param instances_dir: The instances directory probed.
+        :type instances_dir: str
+        :return: A LeakSample.
+        """
+        sample = cls(instances_dir)
+        section = None
+        for line in lines:
+            if line.startswith(PROBE_MARKER + ' '):
+                section = line.split()[1]
+            elif not line.strip():
+                continue
+            elif section == 'running':
+                sample.running.add(line.strip())
+            elif section == 'defined':
+                sample.defined.add(line.strip())
+            elif section == 'live':
+                sample.live_files.append(line.strip())
+            elif section == 'images' and line.split()[0].isdigit():
+                sample.images_kb = int(line.split()[0])
+        return sample
+
+    @property
+    def stale_domains(self):
+        """
+        Description:
+            The domains defined but not running, sorted.
+        """
+        return sorted(self.defined - self.running)
+
+    @property
+    def leftover_live_files(self):
+        """
+        Description:
+            The .live files of the instances whose VM is not running.
+        """
+        return [path for path in self.live_files
+                if path[len(self.instances_dir) + 1:].split('/')[0]
+                not in self.running]
+
+
+class SoakIteration(object):
+    """
+    Description:
+        One soak step run: its name, wall time and failure, if any.
+    """
+
+    def __init__(self, index, step, duration, error=None):
+        self.index = index
+        self.step = step
+        self.duration = duration
+        self.error = error
+
+    def to_dict(self):
+        """
+        Description:
+            The iteration as a JSON serialisable dict.
+        """
+        return dict(self.__dict__)
+
+
+class FailoverSoak(object):
+    """
+    Description:
+        Runs soak steps round robin until the iteration count or the time
+        limit is reached, sampling the nodes for leaks every leak_interval
+        iterations.
+    """
+
+    def __init__(self, steps, sample_leaks, log=None, iterations=None,
+                 minutes=None, leak_interval=10, max_consecutive_failures=3):
+        """
+        :param steps: (name, function) pairs of the steps to cycle
+                      through. A step raises if it fails and is expected
+                      to restore the service groups it failed over.
+        :type steps: list
+        :param sample_leaks: Returns a LeakSample by node.
+        :type sample_leaks: function
+        :param log: Logs a message, called as log(level, message).
+        :type log: function
+        :param iterations: The number of steps to run.
+        :type iterations: int
+        :param minutes: The time after which no step is started.
+        :type minutes: float
+        :param leak_interval: Iterations between leak samples.
+        :type leak_interval: int
+        :param max_consecutive_failures: Consecutive failed steps after
+                                         which the soak stops, as the
+                                         cluster is unlikely to recover.
+        :type max_consecutive_failures: int
+        """
+        self.steps = list(steps)
+        self.sample_leaks = sample_leaks
+        self.log = log or (lambda level, message: None)
+        self.iterations = iterations
+        self.minutes = minutes
+        self.leak_interval = leak_interval
+        self.max_consecutive_failures = max_consecutive_failures
+        self.results = []
+        self.leak_samples = []
+        self.started = None
+        self.finished = None
+
+    @classmethod
+    def limits_from_environment(cls, default_iterations=100):
+        """
+        Description:
+            The iteration count and time limit given by
+            LIBVIRT_SOAK_ITERATIONS and LIBVIRT_SOAK_MINUTES, the
+            default iteration count if neither is set.
+        :return: (iterations, minutes), either of them None if unset.
+        """
+        iterations = os.environ.get(SOAK_ITERATIONS_ENV)
+        minutes = os.environ.get(SOAK_MINUTES_ENV)
+        if not iterations and not minutes:
+            return default_iterations, None
+        return (int(iterations) if iterations else None,
+                float(minutes) if minutes else None)
+
+    def _done(self):
+        """
+        Description:
+            True once the iteration count or the time limit is reached.
+        """
+        if self.iterations is not None and \
+                len(self.results) >= self.iterations:
+            return True
+        return self.minutes is not None and \
+            time.time() - self.started >= self.minutes * 60
+
+    def _sample(self, index):
+        """
+        Description:
+            Keep a leak sample of every node, taken after index steps.
+        """
+        self.leak_samples.append((index, time.time(),
+                                  self.sample_leaks()))
+
+    def run(self):
+        """
+        Description:
+            Run the soak.
+        :return: The summary of the soak, see summary.
+        """
+        self.started = time.time()
+        self._sample(0)
+        consecutive_failures = 0
+        while not self._done() and \
+                consecutive_failures < self.max_consecutive_failures:
+            index = len(self.results)
+            name, step = self.steps[index % len(self.steps)]
+            started = time.time()
+            error = None
+            try:
+                step()
+            except Exception:  # pylint: disable=broad-except
+                error = ''.join(traceback.format_exception(
+                    *sys.exc_info())).rstrip()
+            duration = time.time() - started
+            self.results.append(SoakIteration(index, name, duration, error))
+            consecutive_failures = consecutive_failures + 1 if error else 0
+            self.log('info', 'Soak iteration {0} "{1}" {2} in {3:.1f}s'
+                     .format(index + 1, name,
+                             'failed' if error else 'passed', duration))
+            if error:
+                self.log('error', error)
+            if (index + 1) % self.leak_interval == 0:
+                self._sample(index + 1)
+        if not self.leak_samples or \
+                self.leak_samples[-1][0] != len(self.results):
+            self._sample(len(self.results))
+        self.finished = time.time()
+        return self.summary()
+
+    def leaks(self):
+        """
+        Description:
+            The leaks of each node at the end of the soak: the leftover
+            .live files and the stale domains not there before the soak,
+            and the growth of the images directory in KB.
+        """
+        baseline = self.leak_samples[0][2]
+        final = self.leak_samples[-1][2]
+        leaks = {}
+        for node, sample in final.iteritems():
+            before = baseline.get(node)
+            leaks[node] = {
+                'leftover_live_files': sorted(
+                    set(sample.leftover_live_files) -
+                    set(before.leftover_live_files if before else [])),
+                'stale_domains': sorted(
+                    set(sample.stale_domains) -
+                    set(before.stale_domains if before else [])),
+                'images_growth_kb': None
+                if before is None or None in (sample.images_kb,
+                                              before.images_kb)
+                else sample.images_kb - before.images_kb,
+                'images_kb': [(index, samples[node].images_kb)
+                              for index, _, samples in self.leak_samples
+                              if node in samples]}
+        return leaks
+
+    def summary(self):
+        """
+        Description:
+            Throughput, failure rate, latency percentiles per step and
+            leaks of the soak.
+        :return: A JSON serialisable dict.
+        """
+        duration = (self.finished or time.time()) - self.started
+        failures = [result for result in self.results if result.error]
+        latency = {}
+        for name, _ in self.steps:
+            values = [result.duration for result in self.results
+                      if result.step == name and not result.error]
+            latency[name] = {'count': len(values),
+                             'p50': percentile(values, 50),
+                             'p95': percentile(values, 95),
+                             'max': max(values) if values else None}
+        return {
+            'started': self.started,
+            'duration': duration,
+            'iterations': len(self.results),
+            'failures': len(failures),
+            'failure_rate': float(len(failures)) / len(self.results)
+            if self.results else 0.0,
+            'iterations_per_hour': len(self.results) * 3600.0 / duration
+            if duration else 0.0,
+            'latency': latency,
+            'leaks': self.leaks(),
+            'results': [result.to_dict() for result in self.results]}
+
+
+def write_soak_summary(summary, timing_dir=None):
+    """
+    Description:
+        Append a soak summary to failover_soak.json in timing_dir, or in
+        LIBVIRT_TIMING_DIR if not given. Nothing is written if neither is
+        set.
+    :param summary: The summary, see FailoverSoak.summary.
+    :type summary: dict
+    :param timing_dir: The directory to write to.
+    :type timing_dir: str
+    """
+    timing_dir = timing_dir or os.environ.get(TIMING_DIR_ENV)
+    if not timing_dir:
+        return
+    if not os.path.isdir(timing_dir):
+        os.makedirs(timing_dir)
+    path = os.path.join(timing_dir, SOAK_FILE)
+    soaks = []
+    if os.path.exists(path):
+        with open(path) as soak_file:
+            soaks = json.load(soak_file)['soaks']
+    with open(path + '.tmp', 'w') as soak_file:
+        json.dump({'soaks': soaks + [summary]}, soak_file, indent=1,
+                  sort_keys=True)
+    os.rename(path + '.tmp', path)
@@ -0,0 +1,181 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Timings of the transitions of the failover tests, e.g. the
+            seconds from a virsh destroy to VCS marking the group FAULTED,
+            to the standby going ONLINE, to virsh reporting the VM running
+            and to the VM answering SSH on its IP.
+            Every run of a failover test is appended to a JSON file along
+            with the p50, p95 and max of each transition over all the runs
+            in the file, so repeated runs show regressions in failover
+            latency, not only failures. Timings are written when
+            LIBVIRT_TIMING_DIR is set to the directory to write them to.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+
+TIMING_DIR_ENV = 'LIBVIRT_TIMING_DIR'
+TIMING_FILE = 'failover_timings.json'
+
+
+def percentile(values, percent):
+    """
+    Description:
+        The nearest-rank percentile of values.
+    :param values: The values.
+    :type values: list
+    :param percent: The percentile, from 0 to 100.
+    :type percent: float
+    :return: The percentile, or None if there are no values.
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    rank = int(math.ceil(percent / 100.0 * len(values)))
+    return values[max(rank, 1) - 1]
+
+
+class FailoverTimer(object):
+    """
+    Description:
+        Timestamps of the transitions of one failover run, in seconds
+        since the run started. Transitions observed by sampling also
+        record the sampling interval, the most the mark may be late by.
+    """
+
+    def __init__(self, scenario, log=None):
+        self.scenario = scenario
+        self.log = log
+        self.started = time.time()
+        self.marks = OrderedDict()
+        self.intervals = OrderedDict()
+
+    def mark(self, transition, interval=None):
+        """
+        Description:
+            Record that transition has just been observed.
+        :param transition: The transition, e.g. "vcs_faulted".
+        :type transition: str
+        :param interval: Seconds between the sample that observed the
+                         transition and the one before it, if sampled.
+        :type interval: float
+        :return: Seconds since the run started.
+        """
+        seconds = self.marks[transition] = time.time() - self.started
+        resolution = ''
+        if interval is not None:
+            self.intervals[transition] = interval
+            resolution = ' (sampled every {0:.1f}s)'.format(interval)
+        if self.log is not None:
+            self.log('info', 'Failover "{0}": {1} after {2:.1f}s{3}'.format(
+                self.scenario, transition, seconds, resolution))
+        return seconds
+
+    def to_dict(self):
+        """
+        Description:
+            The run as a JSON serialisable dict.
+        """
+        return {'scenario': self.scenario, 'started': self.started,
+                'marks': self.marks, 'intervals': self.intervals}
+
+
+def summarize(runs):
+    """
+    Description:
+        Count, p50, p95 and max of each transition of each scenario, and
+        the longest sampling interval of the sampled transitions.
+    :param runs: Runs as returned by FailoverTimer.to_dict.
+    :type runs: list
+    :return: A dict of transition summaries by transition, by scenario.
+    """
+    seconds = {}
+    intervals = {}
+    for run in runs:
+        transitions = seconds.setdefault(run['scenario'], OrderedDict())
+        for transition, value in run['marks'].iteritems():
+            transitions.setdefault(transition, []).append(value)
+        # Runs written before intervals were recorded have none.
+        for transition, value in run.get('intervals', {}).iteritems():
+            key = (run['scenario'], transition)
+            intervals[key] = max(intervals.get(key, value), value)
+    summary = dict((scenario, OrderedDict(
+        (transition, {'count': len(values),
+                      'p50': percentile(values, 50),
+                      'p95': percentile(values, 95),
+                      'max': max(values)})
+        for transition, values in transitions.iteritems()))
+        for scenario, transitions in seconds.iteritems())
+    for (scenario, transition), value in intervals.iteritems():
+        summary[scenario][transition]['max_interval'] = value
+    return summary
+
+
+class FailoverTimings(object):
+    """
+    Description:
+        Collects FailoverTimers and writes them out with their summary.
+    """
+
+    def __init__(self, timing_dir=None):
+        self.timing_dir = timing_dir
+        self.runs = []
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls):
+        """
+        Description:
+            Timings written to LIBVIRT_TIMING_DIR, if set.
+        """
+        return cls(os.environ.get(TIMING_DIR_ENV) or None)
+
+    def start(self, scenario, log=None):
+        """
+        Description:
+            Start timing a run of scenario.
+        :param scenario: The name of the failover scenario.
+        :type scenario: str
+        :param log: Logs each transition, called as log(level, message).
+        :type log: function
+        :return: The FailoverTimer of the run.
+        """
+        timer = FailoverTimer(scenario, log)
+        with self.lock:
+            self.runs.append(timer)
+        return timer
+
+    def write(self):
+        """
+        Description:
+            Append the runs timed so far to the timings file and update
+            the summary of every run in it.
+        """
+        if self.timing_dir is None:
+            return
+        with self.lock:
+            runs, self.runs = [timer.to_dict() for timer in self.runs], []
+        if not runs:
+            return
+        if not os.path.isdir(self.timing_dir):
+            os.makedirs(self.timing_dir)
+        path = os.path.join(self.timing_dir, TIMING_FILE)
+        if os.path.exists(path):
+            with open(path) as timings:
+                runs = json.load(timings, object_pairs_hook=OrderedDict)[
+                    'runs'] + runs
+        with open(path + '.tmp', 'w') as timings:
+            json.dump({'runs': runs, 'summary': summarize(runs)}, timings,
+                      indent=1)
+        os.rename(path + '.tmp', path)
@@ -0,0 +1,184 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Bounded thread pool running the same check against several
+            independent targets, such as the VMs of a service group or
+            the service groups of a deployment, at the same time.
+            Results and failures are kept per target and reported in the
+            order the targets were given, whatever order they finish in.
+            Checks may run framework commands and asserts: the libvirt
+            testsets run at most one command per node at a time, see
+            KeyedLocks, and a failed assert is raised again on the test
+            thread.
+"""
+
+import sys
+import threading
+import traceback
+import Queue
+
+
+class FanOutResult(object):
+    """
+    Description:
+        Outcome of running a check against one target.
+    """
+
+    def __init__(self, target, label, value=None, exc_info=None):
+        self.target = target
+        self.label = label
+        self.value = value
+        self.exc_info = exc_info
+
+    @property
+    def failed(self):
+        """
+        Description:
+            True if the check raised an exception, failed asserts included.
+        """
+        return self.exc_info is not None
+
+    def __str__(self):
+        if not self.failed:
+            return '{0}: passed'.format(self.label)
+        return '{0}: {1}'.format(self.label, ''.join(
+            traceback.format_exception(*self.exc_info)).rstrip())
+
+
+class FanOutExecutor(object):
+    """
+    Description:
+        Run a function against a list of targets on at most max_workers
+        threads. Every call to map starts its own threads, so a check
+        running on the executor can use it again for its own targets.
+    """
+
+    def __init__(self, max_workers=8):
+        self.max_workers = max_workers
+
+    def map(self, func, targets, label=str):
+        """
+        Description:
+            Run func(target) for every target.
+        :param func: The function to run against each target.
+        :type func: function
+        :param targets: The targets, e.g. node names.
+        :type targets: list
+        :param label: Returns the name of a target used in reports.
+        :type label: function
+        :return: A FanOutResult per target, in the order of targets.
+        """
+        targets = list(targets)
+        results = [None] * len(targets)
+        if len(targets) <= 1 or self.max_workers <= 1:
+            for index, target in enumerate(targets):
+                results[index] = self._run(func, target, label)
+            return results
+
+        pending = Queue.Queue()
+        for index, target in enumerate(targets):
+            pending.put((index, target))
+
+        def worker():
+            """
+            Description:
+                Run the pending targets until there are none left.
+            """
+            while True:
+                try:
+                    index, target = pending.get_nowait()
+                except Queue.Empty:
+                    return
+                results[index] = self._run(func, target, label)
+
+        threads = [threading.Thread(target=worker)
+                   for _ in xrange(min(self.max_workers, len(targets)))]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    @staticmethod
+    def _run(func, target, label):
+        """
+        Description:
+            Run func(target), catching any exception it raises.
+        """
+        try:
+            return FanOutResult(target, label(target), value=func(target))
+        except Exception:  # pylint: disable=broad-except
+            return FanOutResult(target, label(target),
+                                exc_info=sys.exc_info())
+
+    def run(self, func, targets, label=str):
+        """
+        Description:
+            Run func(target) for every target and raise if any of them
+            failed. A single failure is raised again as it was, so the
+            test reports its original assert. Several failures are raised
+            as one AssertionError listing every failed target in order.
+        :param func: The function to run against each target.
+        :type func: function
+        :param targets: The targets, e.g. node names.
+        :type targets: list
+        :param label: Returns the name of a target used in reports.
+        :type label: function
+        :return: The values returned by func, in the order of targets.
+        """
+        return raise_failures(self.map(func, targets, label))
+
+
+def raise_failures(results):
+    """
+    Description:
+        Raise if any of results failed. A single failure is raised again
+        as it was, several failures as one AssertionError listing every
+        failed target in order.
+    :param results: The results of a check.
+    :type results: list
+    :return: The values of results, if none failed.
+    """
+    failed = [result for result in results if result.failed]
+    if len(failed) == 1:
+        raise failed[0].exc_info[0], failed[0].exc_info[1], \
+            failed[0].exc_info[2]
+    if failed:
+        raise AssertionError(
+            '{0} of {1} targets failed:\n{2}'.format(
+                len(failed), len(results),
+                '\n'.join(str(result) for result in failed)))
+    return [result.value for result in results]
+
+
+class KeyedLocks(object):
+    """
+    Description:
+        A re-entrant lock per key, created on first use, e.g. to run at
+        most one framework command at a time on each node while checks
+        of different nodes run at the same time.
+    """
+
+    def __init__(self):
+        self.locks = {}
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Description:
+            The lock of key.
+        :param key: Identifies the lock, e.g. a node name.
+        :type key: str
+        :return: A threading.RLock.
+        """
+        with self.lock:
+            if key not in self.locks:
+                self.locks[key] = threading.RLock()
+            return self.locks[key]
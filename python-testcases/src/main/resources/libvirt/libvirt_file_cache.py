@@ -0,0 +1,120 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Cache of remote files such as user-data, /etc/hosts,
+            /etc/fstab and config.json, read many times during one
+            verification pass. Each file is kept with a stamp made of the
+            host boot id and the file's mtime, size and inode. A read
+            sends the cached stamp to the host, and the host only sends
+            the file back if the stamp no longer matches. A changed file
+            or a rebooted host therefore always gets a fresh read.
+"""
+
+import pipes
+import posixpath
+import threading
+
+STAT_PATH = '/usr/bin/stat'
+BOOT_ID_PATH = '/proc/sys/kernel/random/boot_id'
+
+
+def get_read_file_cmd(path, stamp=None):
+    """
+    Description:
+        Build the command printing the stamp of a file, followed by its
+        contents unless the stamp equals the one given.
+    :param path: The remote file.
+    :type path: str
+    :param stamp: The stamp of the cached copy, if any.
+    :type stamp: str
+    :return: The command to run on the host.
+    """
+    return ("S=\"$(/bin/cat {boot_id}) $({stat} -c '%y %s %i' {path})\" "
+            "|| exit $?; echo \"$S\"; [ \"$S\" = '{stamp}' ] || "
+            "/bin/cat {path}".format(boot_id=BOOT_ID_PATH, stat=STAT_PATH,
+                                     path=pipes.quote(path),
+                                     stamp=stamp or ''))
+
+
+def find_fstab_entry(fstab, path):
+    """
+    Description:
+        Find the /etc/fstab entry of the filesystem path is on, as
+        findmnt -s -T does: the entry with the longest mount point that
+        is path or one of its parents.
+    :param fstab: The lines of /etc/fstab.
+    :type fstab: list
+    :param path: The path to look for.
+    :type path: str
+    :return: The fstab line, or None.
+    """
+    path = posixpath.normpath(path)
+    best = None
+    best_len = -1
+    for line in fstab:
+        fields = line.split()
+        if len(fields) < 2 or fields[0].startswith('#'):
+            continue
+        mount_point = posixpath.normpath(fields[1])
+        if (path == mount_point or mount_point == '/' or
+                path.startswith(mount_point + '/')) and \
+                len(mount_point) > best_len:
+            best = line
+            best_len = len(mount_point)
+    return best
+
+
+class RemoteFileCache(object):
+    """
+    Description:
+        Remote file contents keyed by (host, via node, path).
+    """
+
+    def __init__(self):
+        self.files = {}
+        self.lock = threading.Lock()
+
+    def read(self, run, host, path, via_node=None):
+        """
+        Description:
+            Return the contents of a remote file, read again only if it
+            changed since it was cached.
+        :param run: Runs a command on host, returning (stdout, stderr, rc).
+        :type run: function
+        :param host: The host, or VM, holding the file.
+        :type host: str
+        :param path: The remote file.
+        :type path: str
+        :param via_node: The peer node a VM is reached through.
+        :type via_node: str
+        :return: (stdout, stderr, rc); stdout is the file contents.
+        """
+        key = (host, via_node, path)
+        with self.lock:
+            cached = self.files.get(key)
+        out, err, rc = run(get_read_file_cmd(
+            path, cached[0] if cached else None))
+        if rc != 0 or not out:
+            with self.lock:
+                self.files.pop(key, None)
+            return out, err, rc
+        stamp = out[0]
+        if cached is not None and cached[0] == stamp:
+            return list(cached[1]), err, rc
+        with self.lock:
+            self.files[key] = (stamp, tuple(out[1:]))
+        return out[1:], err, rc
+
+    def clear(self):
+        """
+        Description:
+            Forget every cached file, e.g. once a plan has run.
+        """
+        with self.lock:
+            self.files.clear()
@@ -0,0 +1,310 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Latency tracer for the remote commands run by the testsets.
+            Every call to a traced helper (run_command,
+            run_command_via_node, execute_cli_*_cmd, wait_for_cmd and
+            wait_for_plan_state) is recorded with its target host, hop
+            count, command class, bytes returned and wall time, along with
+            the test helpers it was called from. Calls made from within
+            another traced call are accounted to the outer one. Calls made
+            on a worker thread, e.g. by a FanOutExecutor, only see the
+            helpers called on that thread.
+            The records are written as a per-test and per-helper breakdown
+            in JSON, and as collapsed stacks for flamegraph.pl.
+            Tracing is enabled by setting LIBVIRT_TRACE_DIR to the
+            directory to write the files to.
+"""
+
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+TRACE_DIR_ENV = 'LIBVIRT_TRACE_DIR'
+TRACE_JSON_FILE = 'latency_trace.json'
+TRACE_FOLDED_FILE = 'latency_trace.folded'
+
+# Sub-commands worth telling apart in the command class.
+_SUB_COMMANDS = ('litp', 'hagrp', 'hares', 'hastatus', 'virsh', 'systemctl',
+                 'service', 'yum', 'rpm', 'ip')
+# Shell words skipped to find the command that is actually run.
+_PREFIX_WORDS = ('sudo', 'env', 'timeout', 'nohup', '/usr/bin/sudo')
+
+
+def classify_command(cmd):
+    """
+    Description:
+        The class of a shell command: the basename of the first command
+        run, followed by its sub-command for the tools that have them,
+        e.g. "virsh dominfo" or "cat".
+    :param cmd: The shell command.
+    :type cmd: str
+    :return: The command class.
+    """
+    words = [word for word in cmd.split() if '=' not in word or
+             word.startswith('-')]
+    while words and (words[0] in _PREFIX_WORDS or words[0].isdigit()):
+        words.pop(0)
+    if not words:
+        return ''
+    name = os.path.basename(words[0])
+    if name in _SUB_COMMANDS:
+        for word in words[1:]:
+            if not word.startswith('-'):
+                return '{0} {1}'.format(name, word)
+            if name in ('hagrp', 'hares'):
+                return '{0} {1}'.format(name, word)
+    return name
+
+
+def _output_bytes(result):
+    """
+    Description:
+        Bytes of stdout and stderr in a (stdout, stderr, rc) result.
+    """
+    try:
+        out, err, _ = result
+        return sum(len(line) + 1 for line in list(out) + list(err))
+    except (TypeError, ValueError):
+        return 0
+
+
+class TraceRecord(object):
+    """
+    Description:
+        One traced call.
+    """
+
+    def __init__(self, test, stack, helper, host, hops, cmd_class,
+                 nbytes, started, duration):
+        self.test = test
+        self.stack = stack
+        self.helper = helper
+        self.host = host
+        self.hops = hops
+        self.cmd_class = cmd_class
+        self.nbytes = nbytes
+        self.started = started
+        self.duration = duration
+
+    def to_dict(self):
+        """
+        Description:
+            The record as a JSON serialisable dict.
+        """
+        return dict(self.__dict__)
+
+
+class LatencyTracer(object):
+    """
+    Description:
+        Collects TraceRecords and writes them out.
+    """
+
+    def __init__(self, trace_dir=None):
+        self.trace_dir = trace_dir
+        self.records = []
+        self.lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def enabled(self):
+        """
+        Description:
+            True if records are collected.
+        """
+        return self.trace_dir is not None
+
+    @classmethod
+    def from_environment(cls):
+        """
+        Description:
+            A tracer writing to LIBVIRT_TRACE_DIR, disabled if not set.
+        """
+        return cls(os.environ.get(TRACE_DIR_ENV) or None)
+
+    @staticmethod
+    def helper_stack(test, skip=1):
+        """
+        Description:
+            Names of the methods of test on the calling thread's stack,
+            outermost first, starting with the test method itself.
+        :param test: The test case.
+        :type test: GenericTest
+        :param skip: Frames to skip, the caller's own included.
+        :type skip: int
+        :return: The list of method names.
+        """
+        test_name = getattr(test, '_testMethodName', 'unknown')
+        stack = []
+        frame = sys._getframe(skip + 1)  # pylint: disable=protected-access
+        while frame is not None:
+            code = frame.f_code
+            if frame.f_locals.get('self') is test and \
+                    code.co_name not in ('<lambda>', test_name, '_traced'):
+                stack.append(code.co_name)
+            frame = frame.f_back
+        stack.append(test_name)
+        stack.reverse()
+        return stack
+
+    def call(self, test, helper, host, hops, cmd_class, func, args, kwargs):
+        """
+        Description:
+            Run func, recording the call unless it is made from within
+            another traced call.
+        :param test: The test case making the call.
+        :type test: GenericTest
+        :param helper: The name of the traced helper.
+        :type helper: str
+        :param host: The host the command runs on.
+        :type host: str
+        :param hops: SSH hops to the host: 1, or 2 through a peer node.
+        :type hops: int
+        :param cmd_class: The class of the command, see classify_command.
+        :type cmd_class: str
+        :return: What func returns.
+        """
+        if getattr(self._local, 'active', False):
+            return func(*args, **kwargs)
+        stack = self.helper_stack(test, skip=2)
+        self._local.active = True
+        started = time.time()
+        result = None
+        try:
+            result = func(*args, **kwargs)
+            return result
+        finally:
+            duration = time.time() - started
+            self._local.active = False
+            record = TraceRecord(stack[0], stack[1:], helper, host, hops,
+                                 cmd_class, _output_bytes(result), started,
+                                 duration)
+            with self.lock:
+                self.records.append(record)
+
+    def breakdown(self):
+        """
+        Description:
+            Time, calls and bytes per test, and per helper and command
+            class within each test.
+        :return: A dict keyed by test name.
+        """
+        tests = {}
+        with self.lock:
+            records = list(self.records)
+        for record in records:
+            test = tests.setdefault(record.test, {
+                'time': 0.0, 'calls': 0, 'bytes': 0, 'helpers': {},
+                'commands': {}})
+            command = '{0} {1}'.format(record.helper,
+                                       record.cmd_class).strip()
+            totals_list = [test, test['commands'].setdefault(
+                command, {'time': 0.0, 'calls': 0, 'bytes': 0})]
+            for helper in set(record.stack) or ['(test body)']:
+                totals_list.append(test['helpers'].setdefault(
+                    helper, {'time': 0.0, 'calls': 0, 'bytes': 0}))
+            for totals in totals_list:
+                totals['time'] += record.duration
+                totals['calls'] += 1
+                totals['bytes'] += record.nbytes
+        return tests
+
+    def collapsed_stacks(self):
+        """
+        Description:
+            Milliseconds per stack, in the collapsed format read by
+            flamegraph.pl: test;helper;...;call count.
+        :return: The lines of the collapsed stacks file.
+        """
+        stacks = {}
+        with self.lock:
+            records = list(self.records)
+        for record in records:
+            frames = [record.test] + record.stack + [
+                '{0} [{1}]'.format(record.helper, record.cmd_class)
+                if record.cmd_class else record.helper]
+            key = ';'.join(frame.replace(';', ',') for frame in frames)
+            stacks[key] = stacks.get(key, 0) + record.duration
+        return ['{0} {1}'.format(key, int(round(value * 1000)))
+                for key, value in sorted(stacks.iteritems())]
+
+    def write(self):
+        """
+        Description:
+            Write the breakdown and the raw records as JSON, and the
+            collapsed stacks, to the trace directory.
+        """
+        if not self.enabled:
+            return
+        if not os.path.isdir(self.trace_dir):
+            os.makedirs(self.trace_dir)
+        with self.lock:
+            records = [record.to_dict() for record in self.records]
+        with open(os.path.join(self.trace_dir, TRACE_JSON_FILE), 'w') as out:
+            json.dump({'tests': self.breakdown(), 'records': records}, out,
+                      indent=1, sort_keys=True)
+        with open(os.path.join(self.trace_dir, TRACE_FOLDED_FILE),
+                  'w') as out:
+            out.write(''.join(line + '\n'
+                              for line in self.collapsed_stacks()))
+
+
+def _call_target(name, args):
+    """
+    Description:
+        Host, hop count and command class of a call to a traced helper.
+    """
+    host = args[0] if args else None
+    if name == 'run_command_via_node':
+        return (args[1] if len(args) > 1 else None, 2,
+                classify_command(args[2]) if len(args) > 2 else '')
+    if name in ('run_command', 'wait_for_cmd'):
+        return host, 1, classify_command(args[1]) if len(args) > 1 else ''
+    if name == 'wait_for_plan_state':
+        return host, 1, 'litp show_plan'
+    return host, 1, 'litp ' + name[len('execute_cli_'):-len('_cmd')]
+
+
+def _traced_method(name, func, tracer_attr):
+    """
+    Description:
+        Wrap the method func so its calls are recorded with the tracer
+        held in the tracer_attr attribute of the test.
+    """
+    @functools.wraps(func)
+    def _traced(self, *args, **kwargs):
+        """ Record the call with the latency tracer, if enabled """
+        tracer = getattr(self, tracer_attr)
+        if not tracer.enabled:
+            return func(self, *args, **kwargs)
+        host, hops, cmd_class = _call_target(name, args)
+        return tracer.call(self, name, host, hops, cmd_class, func,
+                           (self,) + args, kwargs)
+    return _traced
+
+
+def trace_methods(cls, names, tracer_attr='_latency_tracer'):
+    """
+    Description:
+        Replace methods of cls with wrappers recording each call with the
+        tracer held in the tracer_attr attribute of the test.
+    :param cls: The test class.
+    :type cls: type
+    :param names: The names of the methods to trace.
+    :type names: list
+    :param tracer_attr: The attribute holding the LatencyTracer.
+    :type tracer_attr: str
+    """
+    for name in names:
+        setattr(cls, name, _traced_method(name, getattr(cls, name).im_func,
+                                          tracer_attr))
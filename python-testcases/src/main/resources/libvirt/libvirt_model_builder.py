@@ -0,0 +1,447 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Collects the litp create, update, remove and inherit commands
+            of a model building phase into a ModelBatch, which is applied
+            with a single script run on the MS instead of one remote
+            execution per item. Failures are reported against the key of
+            the operation that caused them. Also compiles the
+            libvirt_test_data service group dictionaries into a ModelBatch.
+"""
+
+import re
+
+from libvirt_model_utils import LITP_PATH
+
+BATCH_MARKER = '@@litp-batch'
+
+# Items created under the vm-service for each section of a service group
+# data dictionary, in creation order:
+# (data key, item type, collection, item name format)
+# The name format can use the data key as {KEY}, in lower case as {key},
+# its trailing number as {num}, the item's name property as {name} and
+# the number of the vm-service, e.g. "1" for vm_service_1, as {service}.
+SERVICE_GROUP_LAYOUT = (
+    ('VM_ALIAS', 'vm-alias', 'vm_aliases', '{key}'),
+    ('NETWORK_INTERFACES', 'vm-network-interface', 'vm_network_interfaces',
+     '{key}'),
+    ('YUM_REPOS', 'vm-yum-repo', 'vm_yum_repos', 'repo_{KEY}'),
+    ('ZYPPER_REPOS', 'vm-zypper-repo', 'vm_zypper_repos', 'repo_{KEY}'),
+    ('PACKAGES', 'vm-package', 'vm_packages', 'pkg_{name}'),
+    ('NFS_MOUNTS', 'vm-nfs-mount', 'vm_nfs_mounts', 'vm_nfs_mount_{num}'),
+    ('SSH_KEYS', 'vm-ssh-key', 'vm_ssh_keys', 'ssh_key_rsa_{service}{num}'),
+)
+# Sections describing a single item rather than a collection of them,
+# with the entries that are not named after the item property they hold,
+# mapped to that property or to None if they are not properties at all:
+# (data key, item type, collection, item name format, property names)
+SERVICE_GROUP_SINGLE_ITEMS = (
+    ('VM_RAM_MOUNT', 'vm-ram-mount', 'vm_ram_mounts',
+     'vm_ram_mount_{service}', {}),
+    ('VM_CUSTOM_SCRIPT', 'vm-custom-script', 'vm_custom_script',
+     'vm_custom_script_{service}',
+     {'custom_scripts': 'custom_script_names', 'type': None}),
+)
+# Data keys compiled outside the two tables above.
+SERVICE_GROUP_DATA_KEYS = ('VM_SERVICE', 'CLUSTER_SERVICE', 'HA_CONFIG')
+# vm-network-interface properties set on the item inherited by the
+# clustered service rather than on the vm-service itself
+CLUSTER_INTERFACE_PROPS = ('ipaddresses', 'ipv6addresses')
+IMAGE_DATA_KEYS = ('VM_IMAGE', 'VM IMAGE')
+
+
+class ModelOperation(object):
+    """
+    Description:
+        A single litp command of a ModelBatch.
+    """
+
+    def __init__(self, key, args, url=None, add_to_cleanup=False,
+                 missing_ok=False):
+        self.key = key
+        self.args = args
+        self.url = url
+        # The item at url is removed when the test ends.
+        self.add_to_cleanup = add_to_cleanup
+        # Succeed without running if there is no item at url.
+        self.missing_ok = missing_ok
+
+    def get_cmd(self):
+        """
+        Description:
+            Return the litp command line of the operation. Properties are
+            passed on unchanged, so any shell quoting in them is kept.
+        """
+        cmd = "{0} {1}".format(LITP_PATH, self.args)
+        if self.missing_ok:
+            cmd = "{0} show -p {1} >/dev/null 2>&1 || exit 0; {2}".format(
+                LITP_PATH, self.url, cmd)
+        return cmd
+
+    def __str__(self):
+        return "{0}: litp {1}".format(self.key, self.args)
+
+
+class ModelOperationResult(object):
+    """
+    Description:
+        Outcome of a ModelOperation once its batch has been applied.
+        rc is None if the operation was not run because an earlier one
+        failed.
+    """
+
+    def __init__(self, operation, rc=None, output=None):
+        self.operation = operation
+        self.rc = rc
+        self.output = output if output is not None else []
+
+    @property
+    def success(self):
+        """
+        Description:
+            True if the operation ran and the litp command succeeded.
+        """
+        return self.rc == 0
+
+    def __str__(self):
+        if self.rc is None:
+            return "{0} (not run)".format(self.operation)
+        return "{0} (rc {1}): {2}".format(self.operation, self.rc,
+                                          " ".join(self.output))
+
+
+class ModelBatch(object):
+    """
+    Description:
+        Ordered list of model changes applied in one remote execution.
+        The methods mirror execute_cli_create_cmd and friends, minus the
+        node, e.g. batch.create(url, "vm-alias", props="..."), including
+        add_to_cleanup: apply_model_batch registers the items created
+        with it for removal when the test ends. Every operation takes an
+        optional key naming the test data it came from, which defaults
+        to the item url.
+        Operations run in the order they were added and the batch stops
+        at the first failure, as the execute_cli_* calls would.
+    """
+
+    def __init__(self):
+        self.operations = []
+
+    def __len__(self):
+        return len(self.operations)
+
+    def _add(self, key, args, **kwargs):
+        """
+        Description:
+            Append an operation and return it.
+        """
+        operation = ModelOperation(key, args, **kwargs)
+        self.operations.append(operation)
+        return operation
+
+    def create(self, url, class_type, props='', args='', key=None,
+               add_to_cleanup=True):
+        """
+        Description:
+            Add a litp create of an item of type class_type at url.
+        :param url: The url of the item to create.
+        :type url: str
+        :param class_type: The item type.
+        :type class_type: str
+        :param props: The properties of the item.
+        :type props: str
+        :param args: Any extra arguments for the litp command.
+        :type args: str
+        :param key: The key reported if the command fails.
+        :type key: str
+        :param add_to_cleanup: Remove the item when the test ends.
+        :type add_to_cleanup: bool
+        :return: The ModelOperation added.
+        """
+        cmd_args = "create -p {0} -t {1}".format(url, class_type)
+        if props:
+            cmd_args += " -o {0}".format(props)
+        if args:
+            cmd_args += " {0}".format(args)
+        return self._add(key or url, cmd_args, url=url,
+                         add_to_cleanup=add_to_cleanup)
+
+    def update(self, url, props, action_del=False, key=None):
+        """
+        Description:
+            Add a litp update of the item at url. With action_del the
+            properties named in props are deleted instead.
+        :param url: The url of the item to update.
+        :type url: str
+        :param props: The properties to set, or to delete.
+        :type props: str
+        :param action_del: Delete the properties rather than set them.
+        :type action_del: bool
+        :param key: The key reported if the command fails.
+        :type key: str
+        :return: The ModelOperation added.
+        """
+        option = '-d' if action_del else '-o'
+        return self._add(key or url,
+                         "update -p {0} {1} {2}".format(url, option, props))
+
+    def remove(self, url, key=None, missing_ok=False):
+        """
+        Description:
+            Add a litp remove of the item at url.
+        :param url: The url of the item to remove.
+        :type url: str
+        :param key: The key reported if the command fails.
+        :type key: str
+        :param missing_ok: Succeed if there is no item at url.
+        :type missing_ok: bool
+        :return: The ModelOperation added.
+        """
+        return self._add(key or url, "remove -p {0}".format(url), url=url,
+                         missing_ok=missing_ok)
+
+    def inherit(self, url, source_url, props='', key=None,
+                add_to_cleanup=True):
+        """
+        Description:
+            Add a litp inherit of source_url at url.
+        :param url: The url of the new reference.
+        :type url: str
+        :param source_url: The url of the item to inherit from.
+        :type source_url: str
+        :param props: Properties to override on the reference.
+        :type props: str
+        :param key: The key reported if the command fails.
+        :type key: str
+        :param add_to_cleanup: Remove the reference when the test ends.
+        :type add_to_cleanup: bool
+        :return: The ModelOperation added.
+        """
+        cmd_args = "inherit -p {0} -s {1}".format(url, source_url)
+        if props:
+            cmd_args += " -o {0}".format(props)
+        return self._add(key or url, cmd_args, url=url,
+                         add_to_cleanup=add_to_cleanup)
+
+    def get_cmd(self):
+        """
+        Description:
+            Return a script running every operation in order. Each
+            command's output is preceded by a marker line holding the
+            operation index and return code, and the script exits at the
+            first failure.
+        """
+        lines = []
+        for index, operation in enumerate(self.operations):
+            lines.append('out=$({0} 2>&1); rc=$?; echo "{1} {2} $rc"; '
+                         '[ -z "$out" ] || printf \'%s\\n\' "$out"; '
+                         '[ $rc -eq 0 ] || exit $rc'
+                         .format(operation.get_cmd(), BATCH_MARKER, index))
+        return "\n".join(lines)
+
+    def parse_output(self, lines):
+        """
+        Description:
+            Match the output of the script from get_cmd to the operations.
+        :param lines: The stdout lines of the script.
+        :type lines: list
+        :return: A ModelOperationResult per operation, in batch order.
+        """
+        results = [ModelOperationResult(operation)
+                   for operation in self.operations]
+        current = None
+        for line in lines:
+            if line.startswith(BATCH_MARKER + ' '):
+                index, rc = line.split()[1:3]
+                current = results[int(index)]
+                current.rc = int(rc)
+            elif current is not None:
+                current.output.append(line)
+        return results
+
+
+def _trailing_number(text):
+    """
+    Description:
+        Return the digits at the end of text, e.g. "1" for "VM_MOUNT1".
+    """
+    return re.search(r'\d*$', text).group(0)
+
+
+def format_props(props):
+    """
+    Description:
+        Format a property dictionary for a litp -o option, quoting every
+        value so spaces and empty values are passed on as they are.
+    :param props: The item properties.
+    :type props: dict
+    :return: The properties as a string, sorted by name.
+    """
+    return " ".join("{0}='{1}'".format(name, props[name])
+                    for name in sorted(props))
+
+
+class ServiceGroupBuilder(object):
+    """
+    Description:
+        Compiles an INITIAL_SERVICE_GROUP_*_DATA style dictionary into
+        the operations that create the service group: the vm-image, the
+        vm-service and its items, the vcs-clustered-service with its
+        ha-service-config, and the inherited vm-service. Item names follow
+        SERVICE_GROUP_LAYOUT unless given in names. Interface addresses
+        are set on the inherited vm-network-interface items, as they
+        belong to the clustered service. Like the initial setup, it adds
+        nothing to the test cleanup.
+    """
+
+    def __init__(self, data, service_id, image_id=None, names=None):
+        """
+        Description:
+            Builder for one service group.
+        :param data: The service group data dictionary.
+        :type data: dict
+        :param service_id: Item name of the vm-service, e.g. vm_service_1.
+        :type service_id: str
+        :param image_id: Item name of the vm-image, if the data holds one.
+        :type image_id: str
+        :param names: Item names that do not follow the layout, keyed by
+                      data key for single items and by (data key, item
+                      key) for collections.
+        :type names: dict
+        """
+        self.data = data
+        self.service_id = service_id
+        self.image_id = image_id
+        self.names = names or {}
+        self.service_num = _trailing_number(service_id)
+
+    @property
+    def name(self):
+        """
+        Description:
+            The name of the vcs-clustered-service, e.g. CS_VM1.
+        """
+        return self.data["CLUSTER_SERVICE"]["name"]
+
+    def _item_name(self, data_key, item_key, name_format, props):
+        """
+        Description:
+            Return the item name of an entry of a data section.
+        """
+        name = self.names.get((data_key, item_key) if item_key is not None
+                              else data_key)
+        if name is not None:
+            return name
+        item_key = item_key or ''
+        return name_format.format(KEY=item_key, key=item_key.lower(),
+                                  num=_trailing_number(item_key),
+                                  name=props.get('name', ''),
+                                  service=self.service_num)
+
+    @staticmethod
+    def _create(batch, url, item_type, props, key, prop_names=None):
+        """
+        Description:
+            Add the create of one item, renaming the entries given in
+            prop_names to the item properties they hold and leaving out
+            the ones mapped to None.
+        """
+        prop_names = prop_names or {}
+        props = dict((prop_names.get(name, name), value)
+                     for name, value in props.iteritems()
+                     if prop_names.get(name, name) is not None)
+        batch.create(url, item_type, props=format_props(props), key=key,
+                     add_to_cleanup=False)
+
+    def compile(self, batch, images_path, services_path, clusters_path):
+        """
+        Description:
+            Add the operations creating the service group to batch.
+        :param batch: The batch to add the operations to.
+        :type batch: ModelBatch
+        :param images_path: The /software/images path, with trailing '/'.
+        :type images_path: str
+        :param services_path: The /software/services path, with
+                              trailing '/'.
+        :type services_path: str
+        :param clusters_path: The cluster's services collection path.
+        :type clusters_path: str
+        :return: The batch.
+        :raises ValueError: If the data holds a section the builder does
+                            not compile, rather than leaving it out.
+        """
+        data = self.data
+        handled = set(SERVICE_GROUP_DATA_KEYS)
+        handled.update(layout[0] for layout in SERVICE_GROUP_LAYOUT)
+        handled.update(single[0] for single in SERVICE_GROUP_SINGLE_ITEMS)
+        if self.image_id:
+            handled.update(IMAGE_DATA_KEYS)
+        unhandled = sorted(set(data) - handled)
+        if unhandled:
+            raise ValueError("{0}: no layout for {1}".format(
+                self.name, ", ".join(unhandled)))
+        service_path = services_path + self.service_id
+        cs_path = "{0}/{1}".format(clusters_path, self.name)
+        applications_path = "{0}/applications/{1}".format(cs_path,
+                                                          self.service_id)
+        image_key = [key for key in IMAGE_DATA_KEYS if key in data]
+        if self.image_id and image_key:
+            image = data[image_key[0]]
+            batch.create(images_path + self.image_id, "vm-image",
+                         props=format_props(
+                             {"source_uri": image["image_url"],
+                              "name": image["image_name"]}),
+                         key="{0}/{1}".format(self.name, image_key[0]),
+                         add_to_cleanup=False)
+        self._create(batch, service_path, "vm-service", data["VM_SERVICE"],
+                     "{0}/VM_SERVICE".format(self.name))
+        self._create(batch, cs_path, "vcs-clustered-service",
+                     data["CLUSTER_SERVICE"],
+                     "{0}/CLUSTER_SERVICE".format(self.name))
+        self._create(batch, cs_path + "/ha_configs/service_config",
+                     "ha-service-config", data.get("HA_CONFIG", {}),
+                     "{0}/HA_CONFIG".format(self.name))
+        batch.inherit(applications_path, service_path,
+                      key="{0}/applications".format(self.name),
+                      add_to_cleanup=False)
+
+        cluster_updates = []
+        for data_key, item_type, collection, name_format in \
+                SERVICE_GROUP_LAYOUT:
+            for item_key in sorted(data.get(data_key, {})):
+                props = data[data_key][item_key]
+                item_name = self._item_name(data_key, item_key,
+                                            name_format, props)
+                item_path = "/{0}/{1}".format(collection, item_name)
+                key = "{0}/{1}/{2}".format(self.name, data_key, item_key)
+                if item_type == "vm-network-interface":
+                    cluster_props = dict(
+                        (name, props[name]) for name in props
+                        if name in CLUSTER_INTERFACE_PROPS)
+                    props = dict((name, props[name]) for name in props
+                                 if name not in CLUSTER_INTERFACE_PROPS)
+                    if cluster_props:
+                        cluster_updates.append(
+                            (applications_path + item_path,
+                             format_props(cluster_props), key))
+                self._create(batch, service_path + item_path, item_type,
+                             props, key)
+        for data_key, item_type, collection, name_format, prop_names in \
+                SERVICE_GROUP_SINGLE_ITEMS:
+            if data_key in data:
+                item_name = self._item_name(data_key, None, name_format,
+                                            data[data_key])
+                item_path = "{0}/{1}/{2}".format(service_path, collection,
+                                                 item_name)
+                self._create(batch, item_path, item_type, data[data_key],
+                             "{0}/{1}".format(self.name, data_key),
+                             prop_names)
+        for url, props, key in cluster_updates:
+            batch.update(url, props, key=key)
+        return batch
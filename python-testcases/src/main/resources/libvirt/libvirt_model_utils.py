@@ -0,0 +1,573 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   In-memory snapshot of the LITP model used by the libvirt
+            testsets to answer find/get_props_from_url style queries
+            without a round-trip to the MS for every item. Snapshots are
+            cached locally, keyed by a fingerprint of the model, and can
+            be diffed to find the items a plan has changed. Also holds the
+            lazy_property decorator used to load model attributes on
+            first use.
+"""
+
+from bisect import bisect_left
+from collections import OrderedDict
+import glob
+import json
+import os
+import tempfile
+import time
+
+LITP_PATH = "/usr/bin/litp"
+SNAPSHOT_PATHS = ('/deployments', '/software')
+# The trees read by the GenericTest model information loaders.
+MODEL_INFO_PATHS = SNAPSHOT_PATHS + ('/ms', '/infrastructure')
+REFERENCE_PREFIX = 'reference-to-'
+INHERITED_MARKER = ' [*]'
+SNAPSHOT_CACHE_FILE = 'libvirt_model_{0}_{1}.json'
+BASELINE_NAME = 'baseline_{0}_{1}'
+RUN_ID_ENV = 'LIBVIRT_RUN_ID'
+IMAGE_CHECKSUM_SUFFIX = '_checksum.md5'
+
+
+def get_model_snapshot_cmd(paths=SNAPSHOT_PATHS, known_fingerprint=None):
+    """
+    Description:
+        Build a single command that recursively shows every path given,
+        so the whole snapshot is fetched with one remote execution.
+        The first line of output is the md5sum of the show output, which
+        is used as the model fingerprint. If it equals known_fingerprint
+        the show output itself is not sent back.
+    :param paths: The model paths to include in the snapshot.
+    :type paths: tuple
+    :param known_fingerprint: Fingerprint of a locally cached snapshot.
+    :type known_fingerprint: str
+    :return: The command to run on the MS.
+    """
+    show_cmd = " && ".join("{0} show -p {1} -r".format(LITP_PATH, path)
+                           for path in paths)
+    return ("out=$({0}) || exit $?; "
+            "fp=$(printf '%s\\n' \"$out\" | /usr/bin/md5sum | "
+            "/bin/cut -d' ' -f1); echo \"$fp\"; "
+            "[ \"$fp\" = '{1}' ] || printf '%s\\n' \"$out\""
+            .format(show_cmd, known_fingerprint or ''))
+
+
+def get_model_fingerprint_cmd(paths=MODEL_INFO_PATHS):
+    """
+    Description:
+        Build a command printing only the md5sum of the recursive show of
+        every path given, to tell whether results read from those trees
+        are still current.
+    :param paths: The model paths the fingerprint covers.
+    :type paths: tuple
+    :return: The command to run on the MS.
+    """
+    show_cmd = " && ".join("{0} show -p {1} -r".format(LITP_PATH, path)
+                           for path in paths)
+    return ("out=$({0}) || exit $?; "
+            "printf '%s\\n' \"$out\" | /usr/bin/md5sum | /bin/cut -d' ' -f1"
+            .format(show_cmd))
+
+
+class lazy_property(object):
+    """
+    Description:
+        Decorator for a testset attribute that is only computed when first
+        read, and then kept on the instance for the rest of the test.
+        Use lazy_property.pinned for attributes taken from the model as it
+        is when the test starts, e.g. the result of a find. Those are
+        computed by resolve_pinned_properties before the model is changed.
+    """
+
+    def __init__(self, func, pinned=False):
+        self.func = func
+        self.pinned = pinned
+        self.__name__ = func.__name__
+        self.__doc__ = func.__doc__
+
+    @classmethod
+    def pinned(cls, func):
+        """
+        Description:
+            A lazy_property that is computed before the model is changed.
+        """
+        return cls(func, pinned=True)
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = self.func(obj)
+        obj.__dict__[self.__name__] = value
+        return value
+
+
+def resolve_pinned_properties(obj):
+    """
+    Description:
+        Compute the pinned lazy properties of obj that have not been read
+        yet, so they hold the model as it was before a change.
+    :param obj: The testset instance.
+    """
+    for klass in type(obj).__mro__:
+        for name, attr in klass.__dict__.items():
+            if isinstance(attr, lazy_property) and attr.pinned \
+                    and name not in obj.__dict__:
+                getattr(obj, name)
+
+
+def _decode_json_strings(data):
+    """
+    Description:
+        json returns unicode strings; convert them back to str so values
+        loaded from the cache compare and format like freshly fetched ones.
+    """
+    if isinstance(data, dict):
+        return dict((_decode_json_strings(key), _decode_json_strings(value))
+                    for key, value in data.iteritems())
+    if isinstance(data, list):
+        return [_decode_json_strings(value) for value in data]
+    if isinstance(data, unicode):
+        return data.encode('utf-8')
+    return data
+
+
+class ModelItem(object):
+    """
+    A single item as reported by "litp show".
+    """
+
+    def __init__(self, url):
+        self.url = url
+        self.item_type = None
+        self.state = None
+        self.source = None
+        self.properties = {}
+
+
+class ModelTypeIndex(object):
+    """
+    Description:
+        Index from item type to the sorted urls of all items of that type.
+        As urls sharing a path prefix are contiguous once sorted, all items
+        of a type below a path are found with two binary searches.
+    """
+
+    def __init__(self, items):
+        self._position = {}
+        self._by_type = {}
+        for position, item in enumerate(items):
+            self._position[item.url] = position
+            self._by_type.setdefault(item.item_type, []).append(item.url)
+        for urls in self._by_type.itervalues():
+            urls.sort()
+
+    def lookup(self, item_type, path):
+        """
+        Description:
+            Get the urls of all items of item_type at or below path.
+        :param item_type: The exact item type to look for.
+        :param path: The path to search under.
+        :return: A list of urls in model order.
+        """
+        urls = self._by_type.get(item_type, [])
+        path = path.rstrip('/')
+        # '0' is the character that sorts directly after '/', so the
+        # range [path + '/', path + '0') holds every descendant of path.
+        matches = urls[bisect_left(urls, path + '/'):
+                       bisect_left(urls, path + '0')]
+        index = bisect_left(urls, path)
+        if index < len(urls) and urls[index] == path:
+            matches.append(path)
+        return self.in_model_order(matches)
+
+    def in_model_order(self, urls):
+        """
+        Description:
+            Sort urls in the order the items were reported by the MS.
+        """
+        return sorted(urls, key=self._position.__getitem__)
+
+
+class ModelSnapshot(object):
+    """
+    Description:
+        Parsed output of a recursive "litp show", indexed by url. Items
+        are kept in the order the MS reported them so lookups return urls
+        in the same order as GenericTest.find.
+    """
+
+    def __init__(self, items=None, fingerprint=None):
+        self.items = OrderedDict()
+        for item in items or []:
+            self.items[item.url] = item
+        self.fingerprint = fingerprint
+        self._type_index = None
+        self._derived = {}
+
+    @property
+    def type_index(self):
+        """
+        Description:
+            The ModelTypeIndex of this snapshot, built on first use. A
+            snapshot never changes, so the index is only rebuilt when a new
+            snapshot is taken after the model has changed.
+        """
+        if self._type_index is None:
+            self._type_index = ModelTypeIndex(self.items.itervalues())
+        return self._type_index
+
+    def get_derived(self, name, build):
+        """
+        Description:
+            Get a value derived from this snapshot, calling build to create
+            it on first use. Derived values are not saved with the
+            snapshot.
+        :param name: The name the value is stored under.
+        :type name: str
+        :param build: Function without arguments returning the value.
+        :type build: function
+        """
+        if name not in self._derived:
+            self._derived[name] = build()
+        return self._derived[name]
+
+    def get_image_registry(self, node_image_dir, ms_image_dir):
+        """
+        Description:
+            The VMImageRegistry of this snapshot, built on first use.
+        :param node_image_dir: Directory holding the images on the nodes.
+        :type node_image_dir: str
+        :param ms_image_dir: Directory holding the images on the MS.
+        :type ms_image_dir: str
+        """
+        return self.get_derived(
+            'image_registry',
+            lambda: VMImageRegistry(self, node_image_dir, ms_image_dir))
+
+    @classmethod
+    def from_show_output(cls, lines, fingerprint=None):
+        """
+        Description:
+            Parse the output of one or more "litp show -r" commands.
+        :param lines: stdout of the command as a list of lines.
+        :type lines: list
+        :param fingerprint: The model fingerprint reported with the output.
+        :type fingerprint: str
+        :return: A populated ModelSnapshot.
+        """
+        items = []
+        item = None
+        section = None
+        for line in lines:
+            if not line.strip():
+                continue
+            if line.startswith('/'):
+                item = ModelItem(line.strip())
+                items.append(item)
+                section = None
+                continue
+            if item is None:
+                continue
+
+            indent = len(line) - len(line.lstrip(' '))
+            key, _, value = line.strip().partition(':')
+            value = value.strip()
+            if indent <= 4:
+                section = None
+                if not value:
+                    section = key
+                elif key == 'type':
+                    item.item_type = value
+                elif key == 'state':
+                    item.state = value
+                elif key == 'inherited from':
+                    item.source = value
+            elif section == 'properties':
+                if value.endswith(INHERITED_MARKER):
+                    value = value[:-len(INHERITED_MARKER)]
+                item.properties[key] = value
+        return cls(items, fingerprint)
+
+    def to_dict(self):
+        """
+        Description:
+            Serialisable form of the snapshot, see from_dict.
+        """
+        return {'fingerprint': self.fingerprint,
+                'items': [[item.url, item.item_type, item.state, item.source,
+                           item.properties]
+                          for item in self.items.itervalues()]}
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Description:
+            Rebuild a snapshot from the output of to_dict.
+        """
+        items = []
+        for url, item_type, state, source, properties in data['items']:
+            item = ModelItem(url)
+            item.item_type = item_type
+            item.state = state
+            item.source = source
+            item.properties = properties
+            items.append(item)
+        return cls(items, data['fingerprint'])
+
+    def __contains__(self, url):
+        return url.rstrip('/') in self.items
+
+    def get_item(self, url):
+        """
+        Description:
+            Return the ModelItem at url or None if it is not in the model.
+        """
+        return self.items.get(url.rstrip('/'))
+
+    def find(self, path, item_type, exact_match=False):
+        """
+        Description:
+            Equivalent of GenericTest.find answered from the snapshot.
+            Unless exact_match is set, "reference-to-<type>" items also
+            match "<type>", in line with GenericTest.find.
+        :param path: The path to search under.
+        :param item_type: The item type to look for.
+        :param exact_match: Do not match "reference-to-" items.
+        :return: A list of urls of matching items.
+        """
+        urls = self.type_index.lookup(item_type, path)
+        if exact_match:
+            return urls
+        return self.type_index.in_model_order(
+            urls + self.type_index.lookup(REFERENCE_PREFIX + item_type, path))
+
+    def get_props(self, url, prop=None):
+        """
+        Description:
+            Equivalent of GenericTest.get_props_from_url answered from the
+            snapshot.
+        :param url: The url of the item.
+        :param prop: If given only the value of this property is returned.
+        :return: A copy of the properties dict, the value of prop, or None
+                 if the item or property does not exist.
+        """
+        item = self.get_item(url)
+        if item is None:
+            return None
+        if prop is not None:
+            return item.properties.get(prop)
+        return dict(item.properties)
+
+
+class VMImage(object):
+    """
+    Description:
+        A vm-image item together with the paths its file is copied to.
+    """
+
+    def __init__(self, url, name, source_uri, node_image_dir, ms_image_dir):
+        self.url = url
+        self.name = name
+        self.source_uri = source_uri
+        self.filename = source_uri.split('/')[-1]
+        self.node_path = node_image_dir + '/' + self.filename
+        self.ms_path = ms_image_dir + '/' + self.filename
+        self.checksum_path = self.node_path + IMAGE_CHECKSUM_SUFFIX
+
+
+class VMImageRegistry(object):
+    """
+    Description:
+        Lookup of the vm-image items under /software by image name, as
+        used by the image_name property of a vm-service.
+    """
+
+    def __init__(self, snapshot, node_image_dir, ms_image_dir):
+        self._images = {}
+        for url in snapshot.find('/software', 'vm-image'):
+            props = snapshot.get_props(url)
+            self._images[props['name']] = VMImage(
+                url, props['name'], props['source_uri'], node_image_dir,
+                ms_image_dir)
+
+    def __contains__(self, name):
+        return name in self._images
+
+    def __iter__(self):
+        return iter(sorted(self._images))
+
+    def get(self, name):
+        """
+        Description:
+            Return the VMImage called name or None if there is none.
+        """
+        return self._images.get(name)
+
+
+class ModelDiff(object):
+    """
+    Description:
+        The items added, updated or removed between two ModelSnapshots.
+        An item counts as updated when its type, state or any of its
+        properties differ.
+    """
+    ADDED = 'added'
+    UPDATED = 'updated'
+    REMOVED = 'removed'
+
+    def __init__(self):
+        # url -> (change, item_type)
+        self.changes = {}
+
+    def __len__(self):
+        return len(self.changes)
+
+    def __str__(self):
+        return '\n'.join('{0}: {1} ({2})'.format(change, url, item_type)
+                         for url, (change, item_type)
+                         in sorted(self.changes.iteritems()))
+
+    @classmethod
+    def between(cls, before, after):
+        """
+        Description:
+            Compare two snapshots of the same model.
+        :param before: The older ModelSnapshot.
+        :param after: The newer ModelSnapshot.
+        :return: A ModelDiff holding every changed url.
+        """
+        diff = cls()
+        for url, item in after.items.iteritems():
+            old_item = before.items.get(url)
+            if old_item is None:
+                diff.changes[url] = (cls.ADDED, item.item_type)
+            elif (old_item.item_type, old_item.state, old_item.properties) \
+                    != (item.item_type, item.state, item.properties):
+                diff.changes[url] = (cls.UPDATED, item.item_type)
+        for url, old_item in before.items.iteritems():
+            if url not in after.items:
+                diff.changes[url] = (cls.REMOVED, old_item.item_type)
+        return diff
+
+    def changed_urls(self, path='/', item_type=None, change=None):
+        """
+        Description:
+            Get the changed urls at or below path, optionally filtered by
+            item type (matching "reference-to-" items as well) and kind of
+            change.
+        :return: A sorted list of urls.
+        """
+        path = path.rstrip('/')
+        types = None
+        if item_type is not None:
+            types = (item_type, REFERENCE_PREFIX + item_type)
+        return sorted(url for url, (url_change, url_type)
+                      in self.changes.iteritems()
+                      if (url == path or url.startswith(path + '/'))
+                      and (types is None or url_type in types)
+                      and (change is None or url_change == change))
+
+    def touches(self, path):
+        """
+        Description:
+            Check if any item at or below path has changed.
+        """
+        return bool(self.changed_urls(path))
+
+
+def get_run_id():
+    """
+    Description:
+        The id of the current test run: LIBVIRT_RUN_ID if set, so that
+        testsets run in separate processes share their baselines, or else
+        an id unique to this process.
+    :return: The run id.
+    """
+    return os.environ.get(RUN_ID_ENV) or \
+        '{0}-{1}'.format(os.getpid(), int(time.time()))
+
+
+class ModelSnapshotCache(object):
+    """
+    Description:
+        Local file holding the last ModelSnapshot taken from an MS, so
+        that testsets run one after another only fetch the model again
+        once its fingerprint has changed. Other names can be used to keep
+        further snapshots, such as the last verified model to diff against.
+    """
+
+    def __init__(self, ms_node, name='snapshot', cache_dir=None):
+        self.path = os.path.join(cache_dir or tempfile.gettempdir(),
+                                 SNAPSHOT_CACHE_FILE.format(name, ms_node))
+
+    def load(self):
+        """
+        Description:
+            Load the cached snapshot.
+        :return: A ModelSnapshot or None if there is no usable cache.
+        """
+        try:
+            with open(self.path) as cache_file:
+                return ModelSnapshot.from_dict(
+                    _decode_json_strings(json.load(cache_file)))
+        except (IOError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, snapshot):
+        """
+        Description:
+            Write the snapshot to the cache file. The file is replaced
+            atomically so a reader never sees a partial snapshot.
+        """
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as cache_file:
+            json.dump(snapshot.to_dict(), cache_file)
+        os.rename(tmp_path, self.path)
+
+    def clear(self):
+        """
+        Description:
+            Remove the cache file if present.
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    @classmethod
+    def baseline(cls, ms_node, name, run_id, cache_dir=None):
+        """
+        Description:
+            The cache of the baseline stored under name by the run run_id,
+            so baselines left behind by earlier runs are never read.
+        :param ms_node: The MS the baseline was taken from.
+        :type ms_node: str
+        :param name: The name of the baseline, e.g. "vcs_vm_verified".
+        :type name: str
+        :param run_id: The id of the run, see get_run_id.
+        :type run_id: str
+        :return: A ModelSnapshotCache.
+        """
+        return cls(ms_node, BASELINE_NAME.format(run_id, name), cache_dir)
+
+    @staticmethod
+    def clear_baselines(run_id, cache_dir=None):
+        """
+        Description:
+            Remove every baseline stored by the run run_id, on any MS.
+        :param run_id: The id of the run, see get_run_id.
+        :type run_id: str
+        """
+        pattern = os.path.join(cache_dir or tempfile.gettempdir(),
+                               SNAPSHOT_CACHE_FILE.format(
+                                   BASELINE_NAME.format(run_id, '*'), '*'))
+        for path in glob.glob(pattern):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
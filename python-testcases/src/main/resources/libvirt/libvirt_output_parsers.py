@@ -0,0 +1,273 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Parsers turning the output of the commands the testsets check
+            (virsh dominfo and vcpuinfo, hastatus -sum, ip -o link,
+            /etc/hosts and /etc/fstab) into indexed structures, so
+            assertions look values up instead of scanning the output lines
+            again for each check.
+"""
+
+import bisect
+import collections
+
+FstabEntry = collections.namedtuple(
+    'FstabEntry', 'device mount_point fs_type options dump passno')
+
+
+def parse_colon_fields(lines):
+    """
+    Description:
+        Parse "Key: value" lines into a dict. Only the first colon of a
+        line separates the key from the value.
+    :param lines: The output lines.
+    :type lines: list
+    :return: A dict of values by key.
+    """
+    fields = {}
+    for line in lines:
+        key, sep, value = line.partition(':')
+        if sep:
+            fields[key.strip()] = value.strip()
+    return fields
+
+
+def parse_virsh_dominfo(lines):
+    """
+    Description:
+        Parse the output of virsh dominfo, e.g. {'CPU(s)': '2', ...}.
+    :param lines: The output lines.
+    :type lines: list
+    :return: A dict of values by field name.
+    """
+    return parse_colon_fields(lines)
+
+
+def parse_virsh_vcpuinfo(lines):
+    """
+    Description:
+        Parse the output of virsh vcpuinfo, one block per virtual CPU.
+    :param lines: The output lines.
+    :type lines: list
+    :return: A list of dicts of values by field name, in VCPU order.
+    """
+    vcpus = []
+    for line in lines:
+        key, sep, value = line.partition(':')
+        if not sep:
+            continue
+        if key.strip() == 'VCPU':
+            vcpus.append({})
+        if vcpus:
+            vcpus[-1][key.strip()] = value.strip()
+    return vcpus
+
+
+class VcsStates(object):
+    """
+    Description:
+        States of the VCS systems and of the service groups on each
+        system, as reported by hastatus -sum or hagrp -state, indexed by
+        group, system, state and state flag (ONLINE, FAULTED, ...).
+    """
+
+    def __init__(self):
+        self.systems = {}
+        self.groups = {}
+        self._by_state = {}
+        self._by_flag = {}
+        self._by_system = {}
+
+    def add(self, group, system, state):
+        """
+        Description:
+            Record the state of group on system, e.g. OFFLINE|FAULTED.
+        """
+        self.groups.setdefault(group, {})[system] = state
+        bisect.insort(self._by_state.setdefault((group, state), []), system)
+        for flag in state.split('|'):
+            bisect.insort(self._by_flag.setdefault((group, flag), []),
+                          system)
+        self._by_system.setdefault((system, state), []).append(group)
+
+    def state(self, group, system):
+        """
+        Description:
+            The state of group on system, e.g. ONLINE or OFFLINE|FAULTED,
+            or None if the group is not configured on system.
+        """
+        return self.groups.get(group, {}).get(system)
+
+    def systems_in_state(self, group, state):
+        """
+        Description:
+            The systems on which group is in state, sorted.
+        """
+        return list(self._by_state.get((group, state), []))
+
+    def systems_with_flag(self, group, flag):
+        """
+        Description:
+            The systems on which the state of group includes flag, e.g.
+            FAULTED for OFFLINE|FAULTED, sorted.
+        """
+        return list(self._by_flag.get((group, flag), []))
+
+    def count(self, group, state):
+        """
+        Description:
+            The number of systems on which group is in state.
+        """
+        return len(self._by_state.get((group, state), []))
+
+    def online_systems(self, group):
+        """
+        Description:
+            The systems on which group is ONLINE, sorted.
+        """
+        return self.systems_in_state(group, 'ONLINE')
+
+    def faulted_systems(self, group):
+        """
+        Description:
+            The systems on which group is FAULTED, sorted.
+        """
+        return self.systems_with_flag(group, 'FAULTED')
+
+    def active_system(self, group):
+        """
+        Description:
+            The first system on which group is ONLINE, or None.
+        """
+        online = self._by_state.get((group, 'ONLINE'))
+        return online[0] if online else None
+
+    def groups_on(self, system, state='ONLINE'):
+        """
+        Description:
+            The groups in state on system, in the order they were listed.
+        """
+        return list(self._by_system.get((system, state), []))
+
+
+def parse_hastatus_sum(lines):
+    """
+    Description:
+        Parse the output of hastatus -sum: "A system state frozen" lines
+        and "B group system probed autodisabled state" lines.
+    :param lines: The output lines.
+    :type lines: list
+    :return: A VcsStates.
+    """
+    states = VcsStates()
+    for line in lines:
+        fields = line.split()
+        if len(fields) >= 3 and fields[0] == 'A':
+            states.systems[fields[1]] = fields[2]
+        elif len(fields) >= 6 and fields[0] == 'B':
+            states.add(fields[1], fields[2], fields[5])
+    return states
+
+
+def parse_ip_link(lines):
+    """
+    Description:
+        Parse the output of ip -o link show, e.g.
+        2: eth0: <BROADCAST,UP,LOWER_UP> mtu 1500 ... link/ether ...
+    :param lines: The output lines.
+    :type lines: list
+    :return: A dict of {'flags': [...], 'mac': str} by device.
+    """
+    links = {}
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        device = fields[1].rstrip(':').split('@')[0]
+        mac = None
+        if 'link/ether' in fields:
+            mac = fields[fields.index('link/ether') + 1]
+        links[device] = {'flags': fields[2].strip('<>').split(','),
+                         'mac': mac}
+    return links
+
+
+class HostsFile(object):
+    """
+    Description:
+        Entries of an /etc/hosts file, indexed by address and by name.
+    """
+
+    def __init__(self):
+        self.entries = []
+        self.by_address = {}
+        self.by_name = {}
+
+    def names_for(self, address):
+        """
+        Description:
+            The names given to address, on any of its lines.
+        """
+        return set(name for names in self.by_address.get(address, [])
+                   for name in names)
+
+    def addresses_for(self, name):
+        """
+        Description:
+            The addresses name is given to, in file order.
+        """
+        return list(self.by_name.get(name, []))
+
+    def count(self, address):
+        """
+        Description:
+            The number of lines for address.
+        """
+        return len(self.by_address.get(address, []))
+
+
+def parse_hosts_file(lines):
+    """
+    Description:
+        Parse an /etc/hosts file, comments and blank lines skipped.
+    :param lines: The file lines.
+    :type lines: list
+    :return: A HostsFile.
+    """
+    hosts = HostsFile()
+    for line in lines:
+        fields = line.split('#', 1)[0].split()
+        if len(fields) < 2:
+            continue
+        address, names = fields[0], fields[1:]
+        hosts.entries.append((address, names))
+        hosts.by_address.setdefault(address, []).append(names)
+        for name in names:
+            hosts.by_name.setdefault(name, []).append(address)
+    return hosts
+
+
+def parse_fstab(lines):
+    """
+    Description:
+        Parse an /etc/fstab file, comments and blank lines skipped.
+    :param lines: The file lines.
+    :type lines: list
+    :return: An OrderedDict of FstabEntry by mount point.
+    """
+    entries = collections.OrderedDict()
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 2 or fields[0].startswith('#'):
+            continue
+        fields += ['', 'defaults', '0', '0'][len(fields) - 2:]
+        entry = FstabEntry(*fields[:6])
+        entries[entry.mount_point] = entry
+    return entries
+
@@ -0,0 +1,139 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Probe scripts installed once into a cache directory on the
+            peer nodes and VMs, keyed by the hash of their content.
+            A probe is run by its cached path after the target checks the
+            hash of the installed copy, so the script itself is only sent
+            the first time, or when its content has changed. Installing a
+            new version of a probe evicts its older versions.
+"""
+
+import base64
+import hashlib
+import os
+import pipes
+import posixpath
+import threading
+
+PROBE_CACHE_DIR = '/var/tmp/litp_libvirt_probes'
+# Returned by the run command when the cached copy is missing or stale.
+PROBE_MISSING_RC = 125
+SHA1SUM_PATH = '/usr/bin/sha1sum'
+BASE64_PATH = '/usr/bin/base64'
+
+
+class ProbeScript(object):
+    """
+    Description:
+        A shell script run on the targets, named by its content hash.
+    """
+
+    def __init__(self, name, body):
+        self.name = name
+        self.body = body
+        self.digest = hashlib.sha1(body).hexdigest()
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Description:
+            A probe script read from a local file, named after it.
+        """
+        with open(path) as script:
+            return cls(os.path.splitext(os.path.basename(path))[0],
+                       script.read())
+
+    def remote_path(self, cache_dir=PROBE_CACHE_DIR):
+        """
+        Description:
+            The path of the probe in the cache directory of a target.
+        """
+        return posixpath.join(cache_dir, '{0}-{1}.sh'.format(
+            self.name, self.digest[:12]))
+
+
+def get_probe_run_cmd(script, args=(), cache_dir=PROBE_CACHE_DIR):
+    """
+    Description:
+        Build the command running the cached copy of a probe, or
+        returning PROBE_MISSING_RC if it is missing or stale.
+    :param script: The probe.
+    :type script: ProbeScript
+    :param args: The arguments of the probe.
+    :type args: list
+    :param cache_dir: The cache directory on the target.
+    :type cache_dir: str
+    :return: The command to run on the target.
+    """
+    path = pipes.quote(script.remote_path(cache_dir))
+    return ('[ "$({sha1sum} {path} 2>/dev/null)" = "{digest}  {path}" ] '
+            '|| exit {missing}; /bin/sh {path} {args}'.format(
+                sha1sum=SHA1SUM_PATH, path=path, digest=script.digest,
+                missing=PROBE_MISSING_RC,
+                args=' '.join(pipes.quote(arg) for arg in args)))
+
+
+def get_probe_install_cmd(script, cache_dir=PROBE_CACHE_DIR):
+    """
+    Description:
+        Build the command installing a probe into the cache directory,
+        and removing the other versions of the same probe.
+    :param script: The probe.
+    :type script: ProbeScript
+    :param cache_dir: The cache directory on the target.
+    :type cache_dir: str
+    :return: The command to run on the target.
+    """
+    path = pipes.quote(script.remote_path(cache_dir))
+    return ('/bin/mkdir -p {dir} && echo {payload} | {base64} -d > '
+            '{path}.$$ && /bin/mv -f {path}.$$ {path} && '
+            'for f in {dir}/{name}-*.sh; do [ "$f" = {path} ] || '
+            '/bin/rm -f "$f"; done'.format(
+                dir=pipes.quote(cache_dir), base64=BASE64_PATH,
+                payload=base64.b64encode(script.body), path=path,
+                name=pipes.quote(script.name)))
+
+
+class ProbeCache(object):
+    """
+    Description:
+        Runs probes on targets, installing them on the targets missing
+        the current version.
+    """
+
+    def __init__(self, cache_dir=PROBE_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.installs = 0
+        self.reuses = 0
+        self.lock = threading.Lock()
+
+    def run(self, run, script, args=()):
+        """
+        Description:
+            Run a probe on a target, installing it first if needed.
+        :param run: Runs a command on the target, returning (stdout,
+                    stderr, rc).
+        :type run: function
+        :param script: The probe.
+        :type script: ProbeScript
+        :param args: The arguments of the probe.
+        :type args: list
+        :return: (stdout, stderr, rc) of the probe.
+        """
+        run_cmd = get_probe_run_cmd(script, args, self.cache_dir)
+        out, err, rc = run(run_cmd)
+        if rc != PROBE_MISSING_RC or out or err:
+            with self.lock:
+                self.reuses += 1
+            return out, err, rc
+        with self.lock:
+            self.installs += 1
+        return run('{0} && {{ {1}; }}'.format(
+            get_probe_install_cmd(script, self.cache_dir), run_cmd))
@@ -0,0 +1,427 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Immutable records for the vm service groups in the LITP model.
+            Records use __slots__ and precompute the values the checks
+            derive from model properties, so they can be shared between
+            checks without being modified by them.
+"""
+
+import ast
+
+
+class FrozenDict(dict):
+    """
+    Description:
+        A dict that can not be modified once created.
+    """
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError('{0} can not be modified'
+                        .format(type(self).__name__))
+
+    __setitem__ = __delitem__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+def _new_record(record_type, values):
+    """
+    Description:
+        Create a record_type from its field values, without calling
+        __init__.
+    """
+    record = object.__new__(record_type)
+    for name, value in zip(record_type.fields(), values):
+        object.__setattr__(record, name, value)
+    return record
+
+
+def _to_plain(value):
+    """
+    Description:
+        Convert records, and the tuples and dicts holding them, into plain
+        lists and dicts for printing.
+    """
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(item) for item in value]
+    if isinstance(value, dict):
+        return dict((key, _to_plain(item)) for key, item in value.iteritems())
+    return value
+
+
+class Record(object):
+    """
+    Description:
+        Base of the immutable records. Fields are the __slots__ of the
+        class and its bases; use replace to get a changed copy.
+    """
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for name in self.fields():
+            object.__setattr__(self, name, fields.pop(name, None))
+        if fields:
+            raise TypeError('Unknown fields for {0}: {1}'
+                            .format(type(self).__name__,
+                                    ', '.join(sorted(fields))))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{0} is immutable'.format(type(self).__name__))
+
+    __delattr__ = __setattr__
+
+    def __reduce__(self):
+        return _new_record, (type(self), self._values())
+
+    def __repr__(self):
+        return '{0}({1})'.format(type(self).__name__, self.to_dict())
+
+    @classmethod
+    def fields(cls):
+        """
+        Description:
+            The names of all fields of the record, base class fields first.
+        """
+        names = []
+        for klass in reversed(cls.__mro__):
+            names.extend(klass.__dict__.get('__slots__', ()))
+        return names
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in self.fields())
+
+    def replace(self, **fields):
+        """
+        Description:
+            Get a copy of the record with the given fields changed.
+        """
+        values = dict(zip(self.fields(), self._values()))
+        for name in fields:
+            if name not in values:
+                raise TypeError('Unknown field for {0}: {1}'
+                                .format(type(self).__name__, name))
+        values.update(fields)
+        return _new_record(type(self),
+                           [values[name] for name in self.fields()])
+
+    def to_dict(self):
+        """
+        Description:
+            The record as a plain dict, for logging.
+        """
+        return dict((name, _to_plain(getattr(self, name)))
+                    for name in self.fields()
+                    if not name.startswith('_'))
+
+
+class ModelItemRecord(Record):
+    """
+    Description:
+        An item of the model. Properties are read as on the dict returned
+        by get_props_from_url, e.g. item['name'] and 'name' in item.
+    """
+    __slots__ = ('url', '_props')
+
+    def __init__(self, url, props):
+        fields = self._derive(props)
+        fields['url'] = url
+        fields['_props'] = FrozenDict(props)
+        super(ModelItemRecord, self).__init__(**fields)
+
+    @staticmethod
+    def _derive(props):
+        """
+        Description:
+            Compute the derived fields of the record from its properties.
+        """
+        return {}
+
+    def __getitem__(self, prop):
+        return self._props[prop]
+
+    def __contains__(self, prop):
+        return prop in self._props
+
+    def get(self, prop, default=None):
+        """
+        Description:
+            Get the value of prop, or default if it is not set.
+        """
+        return self._props.get(prop, default)
+
+    def to_dict(self):
+        item = dict(self._props)
+        item['url'] = self.url
+        return item
+
+
+class VcsClusteredService(ModelItemRecord):
+    """
+    Description:
+        A vcs-clustered-service, with the status_timeout of its
+        ha-service-config merged into its properties.
+    """
+    __slots__ = ('node_ids', 'active', 'standby')
+
+    @staticmethod
+    def _derive(props):
+        return {'node_ids': tuple(props['node_list'].split(',')),
+                'active': int(props['active']),
+                'standby': int(props['standby'])}
+
+
+class VmService(ModelItemRecord):
+    """
+    Description:
+        A vm-service, with its ram in MB and its hostnames as a tuple.
+    """
+    __slots__ = ('ram_mb', 'hostnames')
+
+    @staticmethod
+    def _derive(props):
+        hostnames = None
+        if 'hostnames' in props:
+            hostnames = tuple(props['hostnames'].split(','))
+        return {'ram_mb': props['ram'].strip('M'),
+                'hostnames': hostnames}
+
+
+class VmNetworkInterface(ModelItemRecord):
+    """
+    Description:
+        A vm-network-interface, with its node_ip_map parsed.
+    """
+    __slots__ = ('node_ip_map', 'is_dhcp')
+
+    @staticmethod
+    def _derive(props):
+        node_ip_map = {}
+        if 'node_ip_map' in props:
+            node_ip_map = ast.literal_eval(props['node_ip_map'])
+        return {'node_ip_map': FrozenDict(
+                    (node, FrozenDict(ips))
+                    for node, ips in node_ip_map.iteritems()),
+                'is_dhcp': props.get('ipaddresses') == 'dhcp'}
+
+
+class VmAlias(ModelItemRecord):
+    """ A vm-alias. """
+    __slots__ = ()
+
+
+class VmPackage(ModelItemRecord):
+    """ A vm-package. """
+    __slots__ = ()
+
+
+class VmNfsMount(ModelItemRecord):
+    """ A vm-nfs-mount. """
+    __slots__ = ()
+
+
+class VmYumRepo(ModelItemRecord):
+    """ A vm-yum-repo. """
+    __slots__ = ()
+
+
+class VmZypperRepo(ModelItemRecord):
+    """ A vm-zypper-repo. """
+    __slots__ = ()
+
+
+class VmSshKey(ModelItemRecord):
+    """ A vm-ssh-key. """
+    __slots__ = ()
+
+
+# Item types held by a ServiceGroup: (item type, field, record type)
+SERVICE_GROUP_ITEMS = (
+    ('vm-alias', 'aliases', VmAlias),
+    ('vm-yum-repo', 'yum_repos', VmYumRepo),
+    ('vm-zypper-repo', 'zypper_repos', VmZypperRepo),
+    ('vm-package', 'packages', VmPackage),
+    ('vm-nfs-mount', 'nfs_mounts', VmNfsMount),
+    ('vm-network-interface', 'interfaces', VmNetworkInterface),
+    ('vm-ssh-key', 'ssh_keys', VmSshKey),
+)
+
+
+class ServiceGroup(Record):
+    """
+    Description:
+        A vcs-clustered-service running a vm-service, with every item of
+        the vm-service and the names it is known by in VCS.
+        Fields:
+            clustered_service: The VcsClusteredService.
+            vm_service: The VmService.
+            vm_image: The VMImage used by the vm-service.
+            aliases, yum_repos, zypper_repos, packages, nfs_mounts,
+            interfaces, ssh_keys: Tuples of the vm-service items.
+            cluster_id: The id of the cluster in the model, e.g. "c1".
+            nodes: Node id -> hostname of the peer nodes in node_list.
+            vm_node_ids: The node ids the VM addresses are allocated over.
+            nodes_hostnames: Node id -> hostname of the VM on that node.
+            vcs_group_name: e.g. "Grp_CS_c1_CS_VM1".
+            vcs_resource_name: e.g. "Res_App_c1_CS_VM1_vm1".
+            node_state: Peer hostname -> True if the group is online there,
+                        set once VCS has been queried.
+    """
+    __slots__ = ('clustered_service', 'vm_service', 'vm_image', 'aliases',
+                 'yum_repos', 'zypper_repos', 'packages', 'nfs_mounts',
+                 'interfaces', 'ssh_keys', 'cluster_id', 'nodes',
+                 'vm_node_ids', 'nodes_hostnames', 'vcs_group_name',
+                 'vcs_resource_name', 'node_state')
+
+    @property
+    def name(self):
+        """
+        Description:
+            The name of the clustered service.
+        """
+        return self.clustered_service['name']
+
+
+def get_vm_hostname_map(vm_service, node_ids, active, standby):
+    """
+    Description:
+        Get the hostname the VM of a vm-service has on each node. These are
+        the hostnames in the model if set, otherwise they are derived from
+        the service name.
+    :param vm_service: The VmService.
+    :type vm_service: VmService
+    :param node_ids: The node ids the VMs are allocated over.
+    :type node_ids: tuple
+    :param active: Number of active nodes of the clustered service.
+    :type active: int
+    :param standby: Number of standby nodes of the clustered service.
+    :type standby: int
+    :return: A FrozenDict of node id -> VM hostname.
+    """
+    if vm_service.hostnames is not None:
+        sg_hsts = vm_service.hostnames
+    elif standby != 1:
+        service_name = vm_service['service_name'].split(',')[0]
+        sg_hsts = ["{0}-{1}".format(node, service_name)
+                   for node in node_ids]
+    else:
+        sg_hsts = vm_service['service_name'].split(',')
+
+    if active == 1 and standby == 1:
+        return FrozenDict((node, sg_hsts[0]) for node in node_ids)
+    return FrozenDict(zip(node_ids, sg_hsts))
+
+
+class VmAddress(Record):
+    """
+    Description:
+        The hostname and addresses a VM is expected to have on a node.
+        ipv4 and ipv6 are None if the VM has no such address.
+    """
+    __slots__ = ('hostname', 'ipv4', 'ipv6')
+
+
+def get_interface_addresses(vm_net):
+    """
+    Description:
+        Get the static addresses of a vm-network-interface, in node_ip_map
+        order. A dhcp interface has no static IPv4 addresses.
+    :param vm_net: The vm-network-interface.
+    :type vm_net: VmNetworkInterface
+    :return: The lists of IPv4 and IPv6 addresses.
+    """
+    ipaddr = []
+    ipv6addr = []
+    for node in vm_net.node_ip_map.keys():
+        if 'ipaddresses' in vm_net and not vm_net.is_dhcp:
+            ipaddr.append(vm_net.node_ip_map[node]['ipv4'])
+        if 'ipv6addresses' in vm_net:
+            ipv6addr.append(vm_net.node_ip_map[node]['ipv6'])
+    return ipaddr, ipv6addr
+
+
+def _map_addresses_to_nodes(node_ids, addresses):
+    """
+    Description:
+        Allocate addresses to nodes: one address per node if there are as
+        many addresses as nodes, or the same address on every node if there
+        is only one.
+    """
+    if len(addresses) == len(node_ids):
+        return dict(zip(node_ids, addresses))
+    if len(addresses) == 1:
+        return dict((node, addresses[0]) for node in node_ids)
+    return {}
+
+
+class VmAddressingPlan(object):
+    """
+    Description:
+        The addresses expected on every VM of a list of ServiceGroups,
+        per node and per vm-network-interface device, computed once.
+        The address a VM is connected to on a node is the one of its last
+        interface with an address on that node.
+    """
+
+    def __init__(self, service_groups):
+        # (vcs group name, node id, device name) -> VmAddress
+        self._interfaces = {}
+        # vcs group name -> [(node id, VmAddress)]
+        self._vms = {}
+        for sv_gp in service_groups:
+            ipv4 = dict.fromkeys(sv_gp.vm_node_ids)
+            ipv6 = dict.fromkeys(sv_gp.vm_node_ids)
+            for vm_net in sv_gp.interfaces:
+                ipaddr, ipv6addr = get_interface_addresses(vm_net)
+                net_ipv4 = _map_addresses_to_nodes(sv_gp.vm_node_ids, ipaddr)
+                net_ipv6 = _map_addresses_to_nodes(sv_gp.vm_node_ids,
+                                                   ipv6addr)
+                ipv4.update(net_ipv4)
+                ipv6.update(net_ipv6)
+                for node in sv_gp.vm_node_ids:
+                    self._interfaces[(sv_gp.vcs_group_name, node,
+                                      vm_net['device_name'])] = VmAddress(
+                        hostname=sv_gp.nodes_hostnames.get(node),
+                        ipv4=net_ipv4.get(node), ipv6=net_ipv6.get(node))
+            self._vms[sv_gp.vcs_group_name] = [
+                (node, VmAddress(hostname=sv_gp.nodes_hostnames.get(node),
+                                 ipv4=ipv4[node], ipv6=ipv6[node]))
+                for node in sv_gp.vm_node_ids]
+
+    def get_interface_address(self, sv_gp, node, device_name):
+        """
+        Description:
+            Get the addresses expected on an interface of the VM of sv_gp
+            on node.
+        :param sv_gp: The service group.
+        :type sv_gp: ServiceGroup
+        :param node: The node id, e.g. "n1".
+        :type node: str
+        :param device_name: The interface device name, e.g. "eth0".
+        :type device_name: str
+        :return: A VmAddress, with no addresses if none are expected.
+        """
+        return self._interfaces.get(
+            (sv_gp.vcs_group_name, node, device_name),
+            VmAddress(hostname=sv_gp.nodes_hostnames.get(node)))
+
+    def get_vm_addresses(self, sv_gp):
+        """
+        Description:
+            Get the address used to connect to the VM of sv_gp on each
+            node.
+        :param sv_gp: The service group.
+        :type sv_gp: ServiceGroup
+        :return: A list of (node id, VmAddress) in vm_node_ids order.
+        """
+        return list(self._vms.get(sv_gp.vcs_group_name, []))
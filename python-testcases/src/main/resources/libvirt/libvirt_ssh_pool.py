@@ -0,0 +1,163 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Pool of persistent SSH sessions from a peer node to its VMs.
+            Each session is an OpenSSH ControlMaster on the peer node,
+            keyed by (peer node, VM, user). It is authenticated once and
+            then reused by every command run through it, so a command
+            costs one connection to the peer and no SSH handshake with
+            the VM.
+"""
+
+import pipes
+import threading
+import time
+
+SSH_PATH = '/usr/bin/ssh'
+# Exit code and stderr marker of a command whose session could not be
+# opened, as opposed to a command that ran and failed.
+SESSION_FAILED_RC = 255
+SESSION_FAILED_MARKER = '@@vm-session-failed'
+# The keepalives close a session whose VM has gone away, e.g. after a
+# failover, instead of leaving commands hanging on it.
+SSH_OPTIONS = ('-o StrictHostKeyChecking=no -o UserKnownHostsFile=/dev/null '
+               '-o LogLevel=ERROR -o ConnectTimeout=10 '
+               '-o ServerAliveInterval=5 -o ServerAliveCountMax=3')
+# Environment variable the askpass script reads the password from.
+PASSWORD_ENV = 'LIBVIRT_VM_PASSWORD'
+
+
+class VmSession(object):
+    """
+    Description:
+        A ControlMaster session from a peer node to a VM.
+    """
+
+    def __init__(self, via_node, target, username):
+        self.via_node = via_node
+        self.target = target
+        self.username = username
+        self.socket = '/tmp/libvirt_vm_sessions_$(/usr/bin/id -u)/' \
+                      '{0}@{1}'.format(username, target)
+        self.last_used = None
+        self.commands = 0
+
+    def get_cmd(self, cmd, password, idle_timeout):
+        """
+        Description:
+            Build the command to run on the peer node. It checks the
+            session is alive, opens it if not, and runs cmd through it.
+            The password is only used when the session is opened, by a
+            temporary SSH_ASKPASS script reading it from the environment
+            of ssh, so the script holds no secret. ssh only runs the
+            script without a terminal and with DISPLAY set, hence setsid,
+            as SSH_ASKPASS_REQUIRE needs OpenSSH 8.4. The script is
+            removed once the session is open, or when the shell exits or
+            is signalled.
+        :param cmd: The command to run on the VM.
+        :type cmd: str
+        :param password: The VM password.
+        :type password: str
+        :param idle_timeout: Seconds an unused session is kept open for.
+        :type idle_timeout: int
+        :return: The command to run on the peer node.
+        """
+        ssh = '{0} {1} -S "$S"'.format(SSH_PATH, SSH_OPTIONS)
+        user_target = '{0}@{1}'.format(self.username, self.target)
+        return ('S={socket}; /bin/mkdir -p -m 700 "${{S%/*}}"; '
+                '{ssh} -O check {ut} 2>/dev/null || {{ '
+                'A=$(/bin/mktemp) && '
+                'trap \'/bin/rm -f "$A"\' EXIT && '
+                'trap \'exit 1\' HUP INT TERM && /bin/chmod 700 "$A" && '
+                'printf \'%s\\n\' \'#!/bin/sh\' '
+                '\'printf "%s\\n" "${pw_env}"\' > "$A" && '
+                '{pw_env}={pw} SSH_ASKPASS="$A" DISPLAY=none '
+                '/usr/bin/setsid {ssh} -fN -o ControlMaster=yes '
+                '-o ControlPersist={idle} {ut} </dev/null; '
+                'R=$?; /bin/rm -f "$A"; '
+                '[ $R -eq 0 ] || {{ echo {marker} >&2; exit {rc}; }}; }}; '
+                '{ssh} -o ControlMaster=no {ut} {cmd}'
+                .format(socket=self.socket, ssh=ssh, ut=user_target,
+                        pw=pipes.quote(password), pw_env=PASSWORD_ENV,
+                        idle=idle_timeout, marker=SESSION_FAILED_MARKER,
+                        rc=SESSION_FAILED_RC, cmd=pipes.quote(cmd)))
+
+
+class VmSessionPool(object):
+    """
+    Description:
+        Sessions from peer nodes to VMs, keyed by (peer node, VM, user).
+        A session left unused for idle_timeout seconds is closed by the
+        peer node itself and dropped from the pool. Each command checks
+        its session is still alive before using it and reopens it if
+        not. Sessions that cannot be opened are disabled for
+        retry_after seconds, e.g. while their VM fails over, and the
+        caller falls back to its own connection.
+    """
+
+    def __init__(self, idle_timeout=600, retry_after=120):
+        self.idle_timeout = idle_timeout
+        self.retry_after = retry_after
+        self.sessions = {}
+        # Time each disabled session was disabled at, by key.
+        self.disabled = {}
+        # Checks run on several threads at the same time share the pool.
+        self.lock = threading.Lock()
+
+    def _evict_idle(self, now):
+        """
+        Description:
+            Drop the sessions the peer nodes will have closed by now.
+        """
+        for key, session in self.sessions.items():
+            if now - session.last_used > self.idle_timeout:
+                del self.sessions[key]
+
+    def run(self, run_command, via_node, target, username, password, cmd):
+        """
+        Description:
+            Run cmd on a VM through its pooled session.
+        :param run_command: Runs a command on a node, returning
+                            (stdout, stderr, rc), e.g. self.run_command.
+        :type run_command: function
+        :param via_node: The peer node the VM is reached through.
+        :type via_node: str
+        :param target: The VM hostname or address.
+        :type target: str
+        :param username: The VM user.
+        :type username: str
+        :param password: The VM password.
+        :type password: str
+        :param cmd: The command to run on the VM.
+        :type cmd: str
+        :return: (stdout, stderr, rc) of the command, or None if the
+                 session could not be opened.
+        """
+        key = (via_node, target, username)
+        with self.lock:
+            now = time.time()
+            if key in self.disabled:
+                if now - self.disabled[key] < self.retry_after:
+                    return None
+                del self.disabled[key]
+            self._evict_idle(now)
+            session = self.sessions.get(key)
+            if session is None:
+                session = VmSession(via_node, target, username)
+                self.sessions[key] = session
+            session.last_used = now
+        out, err, rc = run_command(
+            via_node, session.get_cmd(cmd, password, self.idle_timeout))
+        with self.lock:
+            if rc == SESSION_FAILED_RC and SESSION_FAILED_MARKER in err:
+                self.sessions.pop(key, None)
+                self.disabled[key] = time.time()
+                return None
+            session.commands += 1
+        return out, err, rc
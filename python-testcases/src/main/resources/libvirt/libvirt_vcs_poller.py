@@ -0,0 +1,259 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   One VCS state poller per cluster, sampling hastatus -sum for
+            every waiter at once instead of each waiter polling on its own
+            or sleeping for a fixed time. Waiters wait for a predicate on
+            the latest VcsStates and are woken as soon as a sample matches
+            it. The poller samples quickly while the states are changing
+            and backs off while they are stable, unless a waiter timing a
+            transition asks for a shorter interval; its thread only runs
+            while somebody is waiting.
+            VcsStatesCache keeps the last VcsStates fetched from each node
+            for one tick, so a verification pass checking many groups
+            fetches the states once rather than once per group.
+"""
+
+import threading
+import time
+
+from libvirt_output_parsers import parse_hastatus_sum
+
+HASTATUS_SUM_CMD = '/opt/VRTSvcs/bin/hastatus -sum'
+
+
+class VcsStatePoller(object):
+    """
+    Description:
+        Samples the VCS states of a cluster from any of its nodes.
+    """
+
+    def __init__(self, run_command, nodes, cmd=HASTATUS_SUM_CMD,
+                 min_interval=1.0, max_interval=10.0):
+        """
+        :param run_command: Runs a command on a node, returning (stdout,
+                            stderr, rc).
+        :type run_command: function
+        :param nodes: The nodes of the cluster, any of which may be
+                      sampled.
+        :type nodes: list
+        :param cmd: The hastatus -sum command.
+        :type cmd: str
+        :param min_interval: Seconds between samples while states change.
+        :type min_interval: float
+        :param max_interval: Seconds between samples while states are
+                             stable.
+        :type max_interval: float
+        """
+        self.run_command = run_command
+        self.nodes = list(nodes)
+        self.cmd = cmd
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.states = None
+        self.sampled_at = None
+        # Seconds between the last two samples: a transition seen in the
+        # last sample happened at most that long before it was taken.
+        self.sample_gap = None
+        self.samples = 0
+        self._interval = min_interval
+        # The max_interval of each waiter asking for one.
+        self._interval_caps = []
+        self._waiters = 0
+        self._polling = False
+        self._cond = threading.Condition()
+
+    def sample(self, prefer=None):
+        """
+        Description:
+            Take a sample now, from the preferred node if given and up,
+            otherwise from the first node answering, and wake the waiters.
+        :param prefer: The node to sample first.
+        :type prefer: str
+        :return: The VcsStates sampled, or None if no node answered.
+        """
+        with self._cond:
+            nodes = list(self.nodes)
+        if prefer in nodes:
+            nodes.remove(prefer)
+            nodes.insert(0, prefer)
+        for node in nodes:
+            out, _, rc = self.run_command(node, self.cmd)
+            if rc != 0 or not out:
+                continue
+            states = parse_hastatus_sum(out)
+            with self._cond:
+                if self.states is None or \
+                        states.groups != self.states.groups or \
+                        states.systems != self.states.systems:
+                    self._interval = self.min_interval
+                else:
+                    self._interval = min(self._interval * 1.5,
+                                         self.max_interval)
+                sampled_at = time.time()
+                if self.sampled_at is not None:
+                    self.sample_gap = sampled_at - self.sampled_at
+                self.states = states
+                self.sampled_at = sampled_at
+                self.samples += 1
+                # Keep sampling the node that answered first.
+                self.nodes.remove(node)
+                self.nodes.insert(0, node)
+                self._cond.notify_all()
+            return states
+        return None
+
+    def _poll(self):
+        """
+        Description:
+            Sample until no waiter is left. The next sample is due after
+            the current interval, capped by the waiters' max_interval, so
+            a waiter asking for a shorter one shortens the current wait.
+        """
+        while True:
+            with self._cond:
+                if not self._waiters:
+                    self._polling = False
+                    return
+            self.sample()
+            sampled = time.time()
+            with self._cond:
+                while self._waiters:
+                    next_at = sampled + min([self._interval] +
+                                            self._interval_caps)
+                    if time.time() >= next_at:
+                        break
+                    self._cond.wait(next_at - time.time())
+
+    def wait_for(self, predicate, timeout, prefer=None, max_interval=None):
+        """
+        Description:
+            Wait until the states of the cluster match predicate.
+        :param predicate: Tells if a VcsStates is the one waited for.
+        :type predicate: function
+        :param timeout: Seconds to wait.
+        :type timeout: float
+        :param prefer: The node to take the first sample from.
+        :type prefer: str
+        :param max_interval: Seconds between samples at most while this
+                             waiter waits, e.g. min_interval to time the
+                             transition waited for.
+        :type max_interval: float
+        :return: The matching VcsStates, or None on timeout.
+        """
+        deadline = time.time() + timeout
+        states = self.sample(prefer)
+        if states is not None and predicate(states):
+            return states
+        with self._cond:
+            self._waiters += 1
+            if max_interval is not None:
+                self._interval_caps.append(max_interval)
+                self._cond.notify_all()
+            if not self._polling:
+                self._polling = True
+                thread = threading.Thread(target=self._poll)
+                thread.daemon = True
+                thread.start()
+            try:
+                while True:
+                    if self.states is not None and predicate(self.states):
+                        return self.states
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        return None
+                    self._cond.wait(remaining)
+            finally:
+                self._waiters -= 1
+                if max_interval is not None:
+                    self._interval_caps.remove(max_interval)
+                self._cond.notify_all()
+
+    def wait_for_state(self, group, system, state, timeout, prefer=None):
+        """
+        Description:
+            Wait until group is in state on system, as hastatus -sum
+            shows it, e.g. ONLINE or OFFLINE|FAULTED.
+        :return: True if it is, False on timeout.
+        """
+        return self.wait_for(
+            lambda states: states.state(group, system) == state,
+            timeout, prefer) is not None
+
+
+class VcsStatesCache(object):
+    """
+    Description:
+        The VcsStates last fetched from each node, reused for up to
+        max_age seconds within the same verification epoch. Concurrent
+        callers asking for the same node wait for a single fetch.
+    """
+
+    def __init__(self, max_age=10.0):
+        self.max_age = max_age
+        self.fetches = 0
+        self.hits = 0
+        self._snapshots = {}
+        self._locks = {}
+        self.lock = threading.Lock()
+
+    def get(self, node, fetch, epoch, max_age=None):
+        """
+        Description:
+            The VcsStates of node, fetched unless the last ones fetched
+            in epoch are younger than max_age.
+        :param node: The node the states are fetched from.
+        :type node: str
+        :param fetch: Fetches the VcsStates from node.
+        :type fetch: function
+        :param epoch: The current verification epoch.
+        :type epoch: int
+        :param max_age: Seconds the states may be reused for, the
+                        cache's max_age if None, 0 to fetch them again.
+        :type max_age: float
+        :return: The VcsStates.
+        """
+        if max_age is None:
+            max_age = self.max_age
+        with self.lock:
+            node_lock = self._locks.setdefault(node, threading.Lock())
+        with node_lock:
+            with self.lock:
+                snapshot = self._snapshots.get(node)
+            if snapshot is not None and snapshot[0] == epoch and \
+                    time.time() - snapshot[1] < max_age:
+                with self.lock:
+                    self.hits += 1
+                return snapshot[2]
+            states = fetch()
+            with self.lock:
+                self.fetches += 1
+                self._snapshots[node] = (epoch, time.time(), states)
+            return states
+
+    def put(self, node, states, epoch):
+        """
+        Description:
+            Keep states as the latest ones of node, e.g. states sampled
+            by a VcsStatePoller while waiting.
+        """
+        with self.lock:
+            self._snapshots[node] = (epoch, time.time(), states)
+
+    def invalidate(self, node=None):
+        """
+        Description:
+            Forget the states of node, or of every node, so the next get
+            fetches them.
+        """
+        with self.lock:
+            if node is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(node, None)
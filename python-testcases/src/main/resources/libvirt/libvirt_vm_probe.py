@@ -0,0 +1,164 @@
+"""
+COPYRIGHT Ericsson 2026
+The copyright to the computer program(s) herein is the property of
+Ericsson Inc. The programs may be used and/or copied only with written
+permission from Ericsson Inc. or in accordance with the terms and
+conditions stipulated in the agreement/contract under which the
+program(s) have been supplied.
+
+@since:     October 2026
+@summary:   Probe bundle collecting the network state of a VM, its
+            interfaces, addresses, routes and network scripts, with a
+            single remote execution. The output is parsed into a
+            VmNetworkProbe which the vm-network-interface checks run
+            against locally. The probe is shipped to the VMs once, as
+            VM_NETWORK_PROBE, and run from their probe cache afterwards.
+"""
+
+from libvirt_output_parsers import parse_ip_link
+from libvirt_probe_cache import ProbeScript
+
+PROBE_MARKER = '@@probe'
+IP_PATH = '/sbin/ip'
+
+
+def get_vm_network_probe_cmd(ifconfig_cmd, network_scripts_dir):
+    """
+    Description:
+        Build the command collecting the ifconfig output, links, IPv6
+        addresses, IPv4 and IPv6 routes and every ifcfg-* and ifroute-*
+        file of a VM, each section preceded by a marker line.
+        The VM images ship an iproute2 without JSON output, so the plain
+        output is sent back and parsed by VmNetworkProbe.
+    :param ifconfig_cmd: The ifconfig command to run.
+    :type ifconfig_cmd: str
+    :param network_scripts_dir: The directory holding the network scripts.
+    :type network_scripts_dir: str
+    :return: The command to run on the VM.
+    """
+    sections = (('ifconfig', ifconfig_cmd),
+                ('link', '{0} -o link show'.format(IP_PATH)),
+                ('addr6', '{0} -6 addr show'.format(IP_PATH)),
+                ('route', '{0} route show'.format(IP_PATH)),
+                ('route6', '{0} -6 route show'.format(IP_PATH)))
+    cmds = ["echo '{0} {1}'; {2} 2>&1".format(PROBE_MARKER, name, cmd)
+            for name, cmd in sections]
+    cmds.append('for f in {0}/ifcfg-* {0}/ifroute-*; do '
+                '[ -f "$f" ] || continue; '
+                'echo "{1} file ${{f##*/}}"; /bin/cat "$f"; done'
+                .format(network_scripts_dir, PROBE_MARKER))
+    return '; '.join(cmds)
+
+
+# Takes the ifconfig command and the network scripts directory as arguments.
+VM_NETWORK_PROBE = ProbeScript(
+    'vm_network_probe',
+    '#!/bin/sh\n{0}\n'.format(get_vm_network_probe_cmd('$1', '"$2"')))
+
+
+class VmNetworkProbe(object):
+    """
+    Description:
+        Network state of a VM, as collected by get_vm_network_probe_cmd.
+    """
+
+    def __init__(self):
+        self.ifconfig = []
+        self.links = {}
+        self.addr6 = {}
+        self.routes = []
+        self.routes6 = []
+        self.files = {}
+
+    @classmethod
+    def from_output(cls, lines):
+        """
+        Description:
+            Parse the output of the probe command.
+        :param lines: The stdout lines of the probe command.
+        :type lines: list
+        :return: A VmNetworkProbe.
+        """
+        sections = {}
+        current = None
+        for line in lines:
+            if line.startswith(PROBE_MARKER + ' '):
+                current = []
+                fields = line.split()[1:3] + [None]
+                sections[(fields[0], fields[1])] = current
+            elif current is not None:
+                current.append(line)
+
+        probe = cls()
+        probe.ifconfig = sections.get(('ifconfig', None), [])
+        probe.links = parse_ip_link(sections.get(('link', None), []))
+        device = None
+        for line in sections.get(('addr6', None), []):
+            if line[:1].isdigit():
+                device = line.split(':')[1].strip().split('@')[0]
+                probe.addr6[device] = [line]
+            elif device is not None:
+                probe.addr6[device].append(line)
+        probe.routes = sections.get(('route', None), [])
+        probe.routes6 = sections.get(('route6', None), [])
+        for (section, name), file_lines in sections.iteritems():
+            if section == 'file':
+                probe.files[name] = file_lines
+        return probe
+
+    def is_up(self, device):
+        """
+        Description:
+            True if the device exists and is administratively up.
+        """
+        return 'UP' in self.links.get(device, {}).get('flags', [])
+
+    def get_mac(self, device):
+        """
+        Description:
+            Return the MAC address of device, or None.
+        """
+        return self.links.get(device, {}).get('mac')
+
+    def get_ipv6_addr_line(self, device, index=1):
+        """
+        Description:
+            Return a line of the ip -6 addr show output for device,
+            stripped. Line 1 describes the first address of the device.
+        """
+        lines = self.addr6.get(device, [])
+        if index < len(lines):
+            return lines[index].strip()
+        return None
+
+    def get_default_routes(self, device=None, ipv6=False):
+        """
+        Description:
+            Return the default route lines, optionally only those going
+            through device.
+        """
+        routes = self.routes6 if ipv6 else self.routes
+        return [route for route in routes
+                if route.startswith('default via') and
+                (device is None or
+                 ' dev {0} '.format(device) in route + ' ')]
+
+    def grep_file(self, name, pattern):
+        """
+        Description:
+            Return the lines of a network script containing pattern.
+        """
+        return [line for line in self.files.get(name, [])
+                if pattern in line]
+
+    def to_dict(self):
+        """
+        Description:
+            Return the probe as a JSON serialisable dictionary.
+        """
+        return {'ifconfig': self.ifconfig,
+                'links': self.links,
+                'addr6': self.addr6,
+                'routes': self.routes,
+                'routes6': self.routes6,
+                'files': self.files}
@@ -15,9 +15,29 @@ from lxml import etree
 from redhat_cmd_utils import RHCmdUtils
 from libvirt_utils import LibvirtUtils
 from litp_generic_test import GenericTest, attr
+import copy
 import os
+import threading
 import test_constants
 import libvirt_test_data
+from libvirt_model_utils import ModelDiff, ModelSnapshot, \
+    ModelSnapshotCache, get_model_fingerprint_cmd, get_model_snapshot_cmd, \
+    get_run_id, lazy_property, resolve_pinned_properties
+from libvirt_model_builder import ModelBatch, ServiceGroupBuilder
+from libvirt_ssh_pool import VmSessionPool
+from libvirt_cmd_engine import CommandEngine
+from libvirt_file_cache import RemoteFileCache, find_fstab_entry
+from libvirt_cmd_memo import EpochMemo
+from libvirt_cluster_sim import ClusterSimulator
+from libvirt_latency_trace import LatencyTracer, trace_methods
+from libvirt_output_parsers import parse_hastatus_sum, parse_hosts_file, \
+    parse_virsh_vcpuinfo
+from libvirt_probe_cache import ProbeCache
+from libvirt_vcs_poller import VcsStatesCache
+from libvirt_fanout import KeyedLocks
+
+# Reason given to bump_verification_epoch when a plan is run.
+PLAN_RUN = 'plan run'
 
 
 class LibvirtGenericTest(GenericTest):
@@ -26,6 +46,561 @@ class LibvirtGenericTest(GenericTest):
         Common assert methods shared between testcases verifying the libvirt
         vcpu cpuset attributes
     """
+    _model_snapshot = None
+    _model_snapshot_cache = None
+    # (fingerprint, loader result) by (MS, loader name). The fingerprint
+    # covers every tree the loaders read, so results are dropped when the
+    # model was changed by anything, e.g. a plain GenericTest testset.
+    _model_info = {}
+    # Fingerprint of the model for this test, taken on first use and
+    # again after each change made through this class.
+    _model_info_fingerprint = None
+    # Model baselines are only read back by the run that stored them.
+    _run_id = get_run_id()
+    # Shared by every testset run in the same process, so VM sessions
+    # opened by one test are reused by the next.
+    _vm_session_pool = VmSessionPool()
+    _remote_file_cache = RemoteFileCache()
+    _command_memo = EpochMemo()
+    # Set by setUp when LIBVIRT_SIM_DIR names a simulated deployment to
+    # run against.
+    _cluster_simulator = None
+    # Records remote command latencies if LIBVIRT_TRACE_DIR is set.
+    _latency_tracer = LatencyTracer.from_environment()
+    _probe_cache = ProbeCache()
+    _vcs_states_cache = VcsStatesCache()
+    # The framework keeps one connection per node and one log, neither
+    # safe to share between threads: commands and log lines from worker
+    # threads are serialised per node and overall respectively.
+    _node_locks = KeyedLocks()
+    _log_lock = threading.RLock()
+
+    @lazy_property
+    def command_engine(self):
+        """ Engine running commands concurrently, started on first use """
+        return CommandEngine(self.run_command, self.run_command_via_node)
+
+    def setUp(self):
+        """
+        Description:
+            Resolve the simulated deployment, if LIBVIRT_SIM_DIR is set
+            when the test starts.
+        """
+        self._cluster_simulator = ClusterSimulator.from_environment()
+        super(LibvirtGenericTest, self).setUp()
+
+    def tearDown(self):
+        """
+        Description:
+            Stop the command engine workers, if the test has used it, and
+            write out the latency trace so far.
+        """
+        if 'command_engine' in self.__dict__:
+            self.command_engine.shutdown()
+        self._latency_tracer.write()
+        super(LibvirtGenericTest, self).tearDown()
+
+    def get_model_snapshot(self, ms_node=None):
+        """
+        Description:
+            Return a ModelSnapshot of the /deployments and /software trees.
+            The snapshot, and the item-type index built over it, are
+            fetched with a single recursive show and reused until the
+            model is changed through one of the execute_cli_* methods.
+            The last snapshot is also kept in a local cache file keyed by
+            the model fingerprint, so later testsets only receive the
+            model again from the MS once it has changed.
+        :param ms_node: The MS to query, defaults to the management node.
+        :type ms_node: str
+        :return: A ModelSnapshot of the current model.
+        """
+        if self._model_snapshot is None:
+            if ms_node is None:
+                ms_node = self.get_management_node_filename()
+            cache = ModelSnapshotCache(ms_node)
+            cached = cache.load()
+            known_fingerprint = cached.fingerprint if cached else None
+            out, err, rc = self.run_command(
+                ms_node, get_model_snapshot_cmd(
+                    known_fingerprint=known_fingerprint))
+            self.assertEqual(0, rc)
+            self.assertEqual([], err)
+            self.assertNotEqual([], out)
+            if out[0] == known_fingerprint:
+                self.log('info', 'Model fingerprint {0} unchanged, using '
+                         'cached snapshot {1}'.format(known_fingerprint,
+                                                      cache.path))
+                self._model_snapshot = cached
+            else:
+                self._model_snapshot = ModelSnapshot.from_show_output(
+                    out[1:], fingerprint=out[0])
+                cache.save(self._model_snapshot)
+            self._model_snapshot_cache = cache
+        return self._model_snapshot
+
+    def get_cached_model_info(self, loader, ms_node=None):
+        """
+        Description:
+            Return the result of a model information loader such as
+            get_litp_model_information or get_model_names_and_urls,
+            calling it again only once the fingerprint of the trees it
+            reads has changed. The fingerprint is taken once per test and
+            after every change made through the execute_cli_* methods, so
+            raw litp commands run by a test itself are not noticed until
+            the next test. The results are not saved with the snapshot
+            cache file, as the loaders read more of the model than the
+            snapshot fingerprint covers.
+        :param loader: The bound GenericTest method to call on a miss.
+        :type loader: function
+        :param ms_node: The MS to query, defaults to the management node.
+        :type ms_node: str
+        :return: A copy of the loader result, safe to modify.
+        """
+        if ms_node is None:
+            ms_node = self.get_management_node_filename()
+        if self._model_info_fingerprint is None:
+            out, err, rc = self.run_command(ms_node,
+                                            get_model_fingerprint_cmd())
+            self.assertEqual(0, rc)
+            self.assertEqual([], err)
+            self.assertNotEqual([], out)
+            self._model_info_fingerprint = out[0]
+        key = (ms_node, loader.__name__)
+        cached = self._model_info.get(key)
+        if cached is None or cached[0] != self._model_info_fingerprint:
+            cached = (self._model_info_fingerprint, loader())
+            self._model_info[key] = cached
+        return copy.deepcopy(cached[1])
+
+    def get_image_registry(self, ms_node=None):
+        """
+        Description:
+            Get the vm-image lookup of the current model snapshot, built
+            once per snapshot.
+        :param ms_node: The MS to query, defaults to the management node.
+        :type ms_node: str
+        :return: A VMImageRegistry mapping image names to VMImage items.
+        """
+        return self.get_model_snapshot(ms_node).get_image_registry(
+            test_constants.LIBVIRT_IMAGE_DIR, test_constants.VM_IMAGE_MS_DIR)
+
+    def save_model_baseline(self, name, ms_node=None):
+        """
+        Description:
+            Store the current model snapshot under name, for a later call
+            to get_model_diff_from_baseline.
+        :param name: The name of the baseline, e.g. "vcs_vm_verified".
+        :type name: str
+        :param ms_node: The MS to query, defaults to the management node.
+        :type ms_node: str
+        """
+        if ms_node is None:
+            ms_node = self.get_management_node_filename()
+        ModelSnapshotCache.baseline(ms_node, name, self._run_id).save(
+            self.get_model_snapshot(ms_node))
+
+    def clear_model_baseline(self, name, ms_node=None):
+        """
+        Description:
+            Remove the baseline stored under name, so the next call to
+            get_model_diff_from_baseline finds none.
+        :param name: The name of the baseline.
+        :type name: str
+        :param ms_node: The MS the baseline was taken from, defaults to
+                        the management node.
+        :type ms_node: str
+        """
+        if ms_node is None:
+            ms_node = self.get_management_node_filename()
+        ModelSnapshotCache.baseline(ms_node, name, self._run_id).clear()
+
+    def get_model_diff_from_baseline(self, name, ms_node=None):
+        """
+        Description:
+            Compare the baseline stored under name with the current model.
+            Baselines only cover model changes, so every baseline of the
+            run is dropped by bump_verification_epoch on anything else
+            that may change the deployment, e.g. a failover or a reboot.
+        :param name: The name of the baseline.
+        :type name: str
+        :param ms_node: The MS to query, defaults to the management node.
+        :type ms_node: str
+        :return: A ModelDiff, or None if no baseline has been stored.
+        """
+        if ms_node is None:
+            ms_node = self.get_management_node_filename()
+        baseline = ModelSnapshotCache.baseline(ms_node, name,
+                                               self._run_id).load()
+        if baseline is None:
+            self.log('info', 'No model baseline "{0}" found'.format(name))
+            return None
+        diff = ModelDiff.between(baseline, self.get_model_snapshot(ms_node))
+        self.log('info', 'Model changes since baseline "{0}":\n{1}'
+                 .format(name, diff))
+        return diff
+
+    def invalidate_model_snapshot(self):
+        """
+        Description:
+            Discard the cached ModelSnapshot so the next call to
+            get_model_snapshot fetches the model again. Pinned lazy
+            properties not read yet are computed first, so they still
+            describe the model from before the change.
+        """
+        resolve_pinned_properties(self)
+        self._model_snapshot = None
+        self._model_info_fingerprint = None
+
+    def execute_cli_create_cmd(self, *args, **kwargs):
+        """
+        Description:
+            Create an item and discard the now stale model snapshot.
+        """
+        self.invalidate_model_snapshot()
+        return super(LibvirtGenericTest, self).execute_cli_create_cmd(
+            *args, **kwargs)
+
+    def execute_cli_update_cmd(self, *args, **kwargs):
+        """
+        Description:
+            Update an item and discard the now stale model snapshot.
+        """
+        self.invalidate_model_snapshot()
+        return super(LibvirtGenericTest, self).execute_cli_update_cmd(
+            *args, **kwargs)
+
+    def execute_cli_remove_cmd(self, *args, **kwargs):
+        """
+        Description:
+            Remove an item and discard the now stale model snapshot.
+        """
+        self.invalidate_model_snapshot()
+        return super(LibvirtGenericTest, self).execute_cli_remove_cmd(
+            *args, **kwargs)
+
+    def execute_cli_inherit_cmd(self, *args, **kwargs):
+        """
+        Description:
+            Inherit an item and discard the now stale model snapshot.
+        """
+        self.invalidate_model_snapshot()
+        return super(LibvirtGenericTest, self).execute_cli_inherit_cmd(
+            *args, **kwargs)
+
+    def execute_cli_runplan_cmd(self, *args, **kwargs):
+        """
+        Description:
+            Run the plan and discard the model snapshot, as item states
+            and read-only properties change while the plan runs. Cached
+            remote files are discarded too, as the plan rewrites them.
+        """
+        self.invalidate_model_snapshot()
+        self._remote_file_cache.clear()
+        self.bump_verification_epoch(PLAN_RUN)
+        return super(LibvirtGenericTest, self).execute_cli_runplan_cmd(
+            *args, **kwargs)
+
+    def run_command(self, node, cmd, *args, **kwargs):
+        """
+        Description:
+            Run a command on a node, or on the simulated deployment if
+            LIBVIRT_SIM_DIR is set. At most one command runs on a node at
+            a time, whatever thread runs it.
+        """
+        with self._node_locks.get(node):
+            if self._cluster_simulator is not None:
+                return self._check_simulated_result(
+                    self._cluster_simulator.run_command(node, cmd),
+                    **kwargs)
+            return super(LibvirtGenericTest, self).run_command(
+                node, cmd, *args, **kwargs)
+
+    def _check_simulated_result(self, result, default_asserts=False, **_):
+        """
+        Description:
+            Apply the default asserts of run_command to the result of a
+            simulated command: return code 0 and nothing on stderr. The
+            simulated hosts have no users, so su_root, username and
+            password are not needed.
+        :param result: stdout, stderr and return code of the command.
+        :type result: tuple
+        :param default_asserts: Assert the command succeeded.
+        :type default_asserts: bool
+        :return: result.
+        """
+        if default_asserts:
+            self.assertEqual(0, result[2])
+            self.assertEqual([], result[1])
+        return result
+
+    def run_command_via_node(self, via_node, node, cmd, username=None,
+                             password=None, **kwargs):
+        """
+        Description:
+            Run a command on a VM reached through its peer node, using a
+            pooled SSH session from the peer node to the VM. Falls back to
+            a new connection for every command if any other option is
+            given, or if the session cannot be opened.
+        :param via_node: The peer node the VM is reached through.
+        :type via_node: str
+        :param node: The VM hostname or address.
+        :type node: str
+        :param cmd: The command to run on the VM.
+        :type cmd: str
+        :return: stdout, stderr and return code of the command.
+        """
+        if self._cluster_simulator is not None:
+            return self._check_simulated_result(
+                self._cluster_simulator.run_command_via_node(
+                    via_node, node, cmd), **kwargs)
+        if not kwargs:
+            result = self._vm_session_pool.run(
+                self.run_command, via_node, node,
+                username or test_constants.LIBVIRT_VM_USERNAME,
+                password or test_constants.LIBVIRT_VM_PASSWORD, cmd)
+            if result is not None:
+                return result
+            self.log('info', 'No pooled session to "{0}" via "{1}"'
+                     .format(node, via_node))
+        if username is not None:
+            kwargs['username'] = username
+        if password is not None:
+            kwargs['password'] = password
+        with self._node_locks.get(via_node):
+            return super(LibvirtGenericTest, self).run_command_via_node(
+                via_node, node, cmd, **kwargs)
+
+    def log(self, *args, **kwargs):
+        """
+        Description:
+            Log a message, one thread at a time, so lines logged by
+            worker threads are not interleaved.
+        """
+        with self._log_lock:
+            return super(LibvirtGenericTest, self).log(*args, **kwargs)
+
+    def run_probe(self, node, script, args=(), via_node=None, **kwargs):
+        """
+        Description:
+            Run a probe script from the probe cache of a node or VM,
+            sending the script only if the cached copy is missing or
+            stale.
+        :param node: The node, or VM, to run the probe on.
+        :type node: str
+        :param script: The probe.
+        :type script: ProbeScript
+        :param args: The arguments of the probe.
+        :type args: list
+        :param via_node: The peer node a VM is reached through.
+        :type via_node: str
+        :return: stdout, stderr and return code of the probe.
+        """
+        if via_node is None:
+            run = lambda cmd: self.run_command(node, cmd, **kwargs)
+        else:
+            run = lambda cmd: self.run_command_via_node(via_node, node, cmd,
+                                                        **kwargs)
+        return self._probe_cache.run(run, script, args)
+
+    def get_vcs_states(self, node, max_age=None):
+        """
+        Description:
+            Get the VCS states of the cluster of node from hastatus -sum,
+            indexed by group, system and state. The states are fetched
+            once per tick: they are reused for up to max_age seconds
+            within the same verification epoch.
+        :param node: The cluster node to run hastatus -sum on.
+        :type node: str
+        :param max_age: Seconds the last states may be reused for, 0 to
+                        fetch them again.
+        :type max_age: float
+        :return: The VcsStates of the cluster.
+        """
+        def fetch():
+            """ Run hastatus -sum on node """
+            stdout, stderr, exit_code = self.run_command(
+                node, self.vcs.get_hastatus_sum_cmd(), su_root=True)
+            self.assertEqual(0, exit_code)
+            self.assertEqual([], stderr)
+            return parse_hastatus_sum(stdout)
+        return self._vcs_states_cache.get(node, fetch,
+                                          self._command_memo.epoch, max_age)
+
+    def bump_verification_epoch(self, reason):
+        """
+        Description:
+            Start a new verification epoch, forgetting the memoized output
+            of read-only commands. Call it whenever the deployment may have
+            changed: a plan run, a reboot, a failover or a service restart.
+            The model baselines of the run are dropped too, unless the
+            reason is a plan run, whose changes a model diff shows.
+        :param reason: What may have changed the deployment.
+        :type reason: str
+        """
+        epoch = self._command_memo.bump()
+        if reason != PLAN_RUN:
+            ModelSnapshotCache.clear_baselines(self._run_id)
+        self.log('info', 'Verification epoch {0} started after {1}'
+                 .format(epoch, reason))
+
+    def run_command_memoized(self, node, cmd, via_node=None, **kwargs):
+        """
+        Description:
+            Run a read-only command at most once per verification epoch.
+            Only the output of commands returning 0 is kept.
+        :param node: The node, or VM, to run the command on.
+        :type node: str
+        :param cmd: The command to run.
+        :type cmd: str
+        :param via_node: The peer node a VM is reached through.
+        :type via_node: str
+        :return: stdout, stderr and return code of the command.
+        """
+        key = ('run_command', node, via_node, cmd,
+               tuple(sorted(kwargs.items())))
+        if via_node is None:
+            run = lambda: self.run_command(node, cmd, **kwargs)
+        else:
+            run = lambda: self.run_command_via_node(via_node, node, cmd,
+                                                    **kwargs)
+        out, err, rc = self._command_memo.get(
+            key, run, keep=lambda result: result[2] == 0)
+        return list(out), list(err), rc
+
+    def get_rhelver_used_on_node(self, *args, **kwargs):
+        """
+        Description:
+            Get the RHEL version of a node, once per verification epoch.
+        """
+        return self._command_memo.get(
+            ('get_rhelver_used_on_node', args,
+             tuple(sorted(kwargs.items()))),
+            lambda: super(LibvirtGenericTest, self).get_rhelver_used_on_node(
+                *args, **kwargs))
+
+    def execute_cli_get_rhelver_from_node(self, *args, **kwargs):
+        """
+        Description:
+            Get the RHEL version of a node, once per verification epoch.
+        """
+        return self._command_memo.get(
+            ('execute_cli_get_rhelver_from_node', args,
+             tuple(sorted(kwargs.items()))),
+            lambda: super(LibvirtGenericTest,
+                          self).execute_cli_get_rhelver_from_node(
+                              *args, **kwargs))
+
+    def get_timezone_on_node(self, *args, **kwargs):
+        """
+        Description:
+            Get the timezone of a node, once per verification epoch.
+        """
+        return self._command_memo.get(
+            ('get_timezone_on_node', args, tuple(sorted(kwargs.items()))),
+            lambda: super(LibvirtGenericTest, self).get_timezone_on_node(
+                *args, **kwargs))
+
+    def restart_litpd_service(self, *args, **kwargs):
+        """
+        Description:
+            Restart litpd and start a new verification epoch.
+        """
+        try:
+            return super(LibvirtGenericTest, self).restart_litpd_service(
+                *args, **kwargs)
+        finally:
+            self.bump_verification_epoch('litpd restart')
+
+    def get_remote_file(self, node, path, via_node=None, **kwargs):
+        """
+        Description:
+            Return the lines of a remote file. The file is cached for the
+            rest of the verification pass, and only sent back again if it
+            changed or its host rebooted since it was last read.
+        :param node: The node, or VM, holding the file.
+        :type node: str
+        :param path: The remote file.
+        :type path: str
+        :param via_node: The peer node a VM is reached through.
+        :type via_node: str
+        :return: The lines of the file.
+        """
+        if via_node is None:
+            run = lambda cmd: self.run_command(node, cmd, **kwargs)
+        else:
+            run = lambda cmd: self.run_command_via_node(via_node, node, cmd,
+                                                        **kwargs)
+        out, err, rc = self._remote_file_cache.read(run, node, path,
+                                                    via_node)
+        self.assertEqual(0, rc)
+        self.assertEqual([], err)
+        return out
+
+    def get_fstab_entry(self, node, path, via_node=None, **kwargs):
+        """
+        Description:
+            Return the /etc/fstab entry of the filesystem a path is on,
+            as findmnt -s -T does, from the cached /etc/fstab.
+        :param node: The node, or VM, to check.
+        :type node: str
+        :param path: The path to look for.
+        :type path: str
+        :return: The fstab line as a single item list, or an empty list.
+        """
+        entry = find_fstab_entry(
+            self.get_remote_file(node, '/etc/fstab', via_node, **kwargs),
+            path)
+        return [entry] if entry is not None else []
+
+    def apply_model_batch(self, batch, ms_node=None):
+        """
+        Description:
+            Apply every operation of a ModelBatch with a single remote
+            execution, and assert that all of them succeeded. A failure
+            is reported against the key of the operation that caused it.
+            The items created with add_to_cleanup are removed when the
+            test ends, even if a later operation of the batch failed.
+        :param batch: The model changes to apply.
+        :type batch: ModelBatch
+        :param ms_node: The MS to run on, defaults to the management node.
+        :type ms_node: str
+        :return: The list of ModelOperationResult.
+        """
+        if not batch:
+            return []
+        if ms_node is None:
+            ms_node = self.get_management_node_filename()
+        self.invalidate_model_snapshot()
+        out, _, rc = self.run_command(ms_node, batch.get_cmd())
+        results = batch.parse_output(out)
+        cleanup_urls = [result.operation.url for result in results
+                        if result.success and result.operation.add_to_cleanup]
+        if cleanup_urls:
+            self.addCleanup(self.remove_model_items, cleanup_urls, ms_node)
+        failed = [str(result) for result in results if not result.success]
+        self.assertEqual([], failed,
+                         "{0} of {1} model operations failed or did not "
+                         "run:\n{2}".format(len(failed), len(results),
+                                            "\n".join(failed)))
+        self.assertEqual(0, rc)
+        return results
+
+    def remove_model_items(self, urls, ms_node=None):
+        """
+        Description:
+            Remove the items created by a batch with add_to_cleanup, in
+            the reverse order of their creation, with a single remote
+            execution. Items already removed by the test are skipped.
+        :param urls: The urls of the items, in creation order.
+        :type urls: list
+        :param ms_node: The MS to run on, defaults to the management node.
+        :type ms_node: str
+        """
+        batch = ModelBatch()
+        for url in reversed(urls):
+            batch.remove(url, missing_ok=True)
+        self.apply_model_batch(batch, ms_node)
+
     def assert_domain_vcpuset(self, model_nodes, service_name, node_list,
                               expected_cpuset, standby=0,
                               vcs_name=None):
@@ -54,22 +629,15 @@ class LibvirtGenericTest(GenericTest):
         if standby != 0:
             # Get the active node
             cluster_node = idaliases[node_list[0]]
-            hagrp = '{0} {1}'.format(self.vcs.get_hagrp_state_cmd(), vcs_name)
-            hagrp += ' | {0} "|ONLINE|"'.format(self.rhc.grep_path)
-            hagrp_output, stderr, exit_code = self.run_command(
-                    cluster_node, hagrp, su_root=True)
-
-            self.assertEqual(0, exit_code)
-            self.assertEqual([], stderr)
-            self.assertNotEquals([], hagrp_output,
+            online_hosts = self.get_vcs_states(
+                cluster_node).online_systems(vcs_name)
+            self.assertNotEquals([], online_hosts,
                                  'There were no ONLINE instances of {0} '
                                  'found on nodes {1}'.format(vcs_name,
                                                              node_list))
 
             reverse_aliases = dict((v, k) for k, v in idaliases.iteritems())
-            sys_col_index = 2
-            online_host = hagrp_output[0].split()[sys_col_index]
-            node_list = [reverse_aliases[online_host]]
+            node_list = [reverse_aliases[online_hosts[0]]]
 
         command = LibvirtUtils.get_virsh_dumpxml_cmd(service_name)
         for nodeid in node_list:
@@ -112,12 +680,8 @@ class LibvirtGenericTest(GenericTest):
                     idaliases[nodeid], command, su_root=True)
             self.assertEqual(0, exit_code)
             self.assertEqual([], stderr)
-            actual_affinity = None
-            for _line in stdout:
-                if _line.startswith('CPU Affinity:'):
-                    actual_affinity = _line.replace('CPU Affinity:',
-                                                    '').strip()
-                    break
+            vcpus = parse_virsh_vcpuinfo(stdout)
+            actual_affinity = vcpus[0].get('CPU Affinity') if vcpus else None
             self.assertTrue(actual_affinity is not None)
             self.assertEqual(expected_affinity, actual_affinity)
 
@@ -159,31 +723,29 @@ class LibvirtGenericTest(GenericTest):
             username=test_constants.LIBVIRT_VM_USERNAME,
             password=test_constants.LIBVIRT_VM_PASSWORD)
 
-        cat_hosts_ipv6_alias_cmd = "{0} {1} {2} | {3} '{{print $1}}'". \
-            format(test_constants.GREP_PATH, alias_name,
-                   test_constants.ETC_HOSTS,
-                   test_constants.AWK_PATH)
+        hosts = self.get_remote_file(
+            vm_hostname, test_constants.ETC_HOSTS,
+            username=test_constants.LIBVIRT_VM_USERNAME,
+            password=test_constants.LIBVIRT_VM_PASSWORD)
 
+        hosts = parse_hosts_file(hosts)
         alias_ip_address = alias_ip_address.split("/")[0]
-        cat_hosts_alias_count_cmd = "{0} {1} {2} | wc -l".format(
-                test_constants.GREP_PATH, alias_ip_address,
-                test_constants.ETC_HOSTS)
-
-        ipaddress = self.run_command(vm_hostname, cat_hosts_ipv6_alias_cmd,
-                                     test_constants.LIBVIRT_VM_USERNAME,
-                                     test_constants.LIBVIRT_VM_PASSWORD,
-                                     default_asserts=True)[0]
-        count = self.run_command(vm_hostname, cat_hosts_alias_count_cmd,
-                                 test_constants.LIBVIRT_VM_USERNAME,
-                                 test_constants.LIBVIRT_VM_PASSWORD,
-                                 default_asserts=True)[0]
-        self.assertEqual(expected_value, count[0])
+        ipaddress = hosts.addresses_for(alias_name)
+        count = str(hosts.count(alias_ip_address))
+        self.assertEqual(expected_value, count)
 
         if expected_value != "0":
             self.assertEqual(alias_ip_address, ipaddress[0], "Expected IP "
                                 "address is not the same as actual IP address")
 
 
+trace_methods(LibvirtGenericTest,
+              ['run_command', 'run_command_via_node', 'wait_for_cmd',
+               'wait_for_plan_state'] +
+              [name for name in dir(GenericTest)
+               if name.startswith('execute_cli_') and name.endswith('_cmd')])
+
+
 class Libvirtsetup(LibvirtGenericTest):
     """
     Description:
@@ -200,8 +762,7 @@ class Libvirtsetup(LibvirtGenericTest):
         # 1. Call super class setup
         super(Libvirtsetup, self).setUp()
 
-        self.model = self.get_litp_model_information()
-        self.management_server = self.model["ms"][0]["name"]
+        self.management_server = self.get_management_node_filename()
 
         # Location where the rpms to be installed are stored
         self.rpm_src_dir = \
@@ -215,7 +776,6 @@ class Libvirtsetup(LibvirtGenericTest):
         self.scripts_src_dir = \
             os.path.dirname(os.path.realpath(__file__)) + "/vm_scripts"
 
-        self.libvirt_info = self.model["libvirt"]
         self.rhc = RHCmdUtils()
 
         #update startup retry limit
@@ -227,6 +787,17 @@ class Libvirtsetup(LibvirtGenericTest):
             print "Model change unneeded in expansion test. " + \
                   "Error: '{0}'".format(exception.message)
 
+    @lazy_property
+    def model(self):
+        """ LITP model information, loaded on first use """
+        return self.get_cached_model_info(
+            self.get_litp_model_information)
+
+    @lazy_property
+    def libvirt_info(self):
+        """ Libvirt paths in the LITP model """
+        return self.model["libvirt"]
+
     def tearDown(self):
         """
         Description:
@@ -472,6 +1043,7 @@ class Libvirtsetup(LibvirtGenericTest):
         """
         # description: Add five service groups.
         """
+        batch = ModelBatch()
         # Variables for the model paths
         vm_image_1_path = self.libvirt_info[
                               "software_images_path"] + "vm_image_1"
@@ -503,155 +1075,153 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Create vm image sles in the model
         #   result: vm image sles is created in the litp model
-        self.execute_cli_create_cmd(self.management_server, vm_sles_image_path,
-                                "vm-image",
-                                props="source_uri='{0}' name='{1}' ".format(
-                                    libvirt_test_data.VM_IMAGES[
-                                        "VM_IMAGE_SLES"]["image_url"],
-                                    libvirt_test_data.VM_IMAGES[
-                                        "VM_IMAGE_SLES"]["image_name"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_sles_image_path,
+                     "vm-image",
+                     props="source_uri='{0}' name='{1}' ".format(
+                         libvirt_test_data.VM_IMAGES[
+                             "VM_IMAGE_SLES"]["image_url"],
+                         libvirt_test_data.VM_IMAGES[
+                             "VM_IMAGE_SLES"]["image_name"]),
+                     add_to_cleanup=False)
 
         # description: Create a vm service
         # test_steps:
         #   step: Create a vm service under /software
         #   result: vm service is created in the model
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_sles_path, "vm-service",
-                            props="cpus={0} service_name={1} ram={2} "
-                                  "image_name={3} hostnames={4} "
-                                  "internal_status_check={5}".format(
-                            sles_vm["VM_SERVICE"]["cpus"],
-                            sles_vm["VM_SERVICE"]["service_name"],
-                            sles_vm["VM_SERVICE"]["ram"],
-                            sles_vm["VM_SERVICE"]["image_name"],
-                            sles_vm["VM_SERVICE"]["hostnames"],
-                            sles_vm["VM_SERVICE"]["internal_status_check"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_sles_path, "vm-service",
+                     props="cpus={0} service_name={1} ram={2} "
+                           "image_name={3} hostnames={4} "
+                           "internal_status_check={5}".format(
+                               sles_vm["VM_SERVICE"]["cpus"],
+                               sles_vm["VM_SERVICE"]["service_name"],
+                               sles_vm["VM_SERVICE"]["ram"],
+                               sles_vm["VM_SERVICE"]["image_name"],
+                               sles_vm["VM_SERVICE"]["hostnames"],
+                               sles_vm["VM_SERVICE"]["internal_status_check"]),
+                     add_to_cleanup=False)
 
         # description: Create a vcs clustered service
         # test_steps:
         #   step: Create a vcs clustered service in the model CS_SLES_VM
         #   result: CS_SLES_VM is created in model
-        self.execute_cli_create_cmd(self.management_server, sles_sg_path,
-                        "vcs-clustered-service",
-                        props="active={0} standby={1} name={2} " \
-                              "online_timeout={3} dependency_list='{4}' " \
-                              "node_list={5}".format(
-                            sles_vm["CLUSTER_SERVICE"]["active"],
-                            sles_vm["CLUSTER_SERVICE"]["standby"],
-                            sles_vm["CLUSTER_SERVICE"]["name"],
-                            sles_vm["CLUSTER_SERVICE"][
-                                "online_timeout"],
-                            sles_vm["CLUSTER_SERVICE"][
-                                "dependency_list"],
-                            sles_vm["CLUSTER_SERVICE"][
-                                "node_list"]), add_to_cleanup=False)
+        batch.create(sles_sg_path,
+                     "vcs-clustered-service",
+                     props="active={0} standby={1} name={2} " \
+                           "online_timeout={3} dependency_list='{4}' " \
+                           "node_list={5}".format(
+                               sles_vm["CLUSTER_SERVICE"]["active"],
+                               sles_vm["CLUSTER_SERVICE"]["standby"],
+                               sles_vm["CLUSTER_SERVICE"]["name"],
+                               sles_vm["CLUSTER_SERVICE"][
+                                   "online_timeout"],
+                               sles_vm["CLUSTER_SERVICE"][
+                                   "dependency_list"],
+                               sles_vm["CLUSTER_SERVICE"][
+                                   "node_list"]),
+                     add_to_cleanup=False)
 
         # description: Create a ha config
         # test_steps:
         #   step: Create a ha-service-config in the model CS_SLES_VM
         #   result: ha-service-config is created for CS_SLES_VM
-        self.execute_cli_create_cmd(self.management_server, sles_sg_path +
-                                    "/ha_configs/service_config",
-                                    "ha-service-config",
-                                    props="status_timeout={0}".format(
-                                    sles_vm["HA_CONFIG"]["status_timeout"]),
-                                    add_to_cleanup=False)
+        batch.create(sles_sg_path +
+                     "/ha_configs/service_config",
+                     "ha-service-config",
+                     props="status_timeout={0}".format(
+                     sles_vm["HA_CONFIG"]["status_timeout"]),
+                     add_to_cleanup=False)
 
         # description:  Add the service group to a vcs cluster
         # test_steps:
         #   step: Add service group to CS_SLES_VM
         #   result: Service group is inherited onto CS_SLES_VM
-        self.execute_cli_inherit_cmd(self.management_server,
-                                sles_sg_path + "/applications/sles",
-                                vm_service_sles_path, add_to_cleanup=False)
+        batch.inherit(sles_sg_path + "/applications/sles",
+                      vm_service_sles_path,
+                      add_to_cleanup=False)
 
         # description: Configure vm aliases
         # test_steps:
         #   step: Configure VM aliases for CS_SLES_VM
         #   result: VM aliases are added to CS_SLES_VM
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_sles_path + "/vm_aliases/ms",
-                                "vm-alias",
-                                props="alias_names='{0}' address='{1}'".format(
-                                    sles_vm["VM_ALIAS"]["MS1"][
-                                        "alias_names"],
-                                    sles_vm["VM_ALIAS"]["MS1"][
-                                        "address"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_sles_path + "/vm_aliases/ncm",
-                                "vm-alias",
-                                props="alias_names='{0}' address='{1}'".format(
-                                    sles_vm["VM_ALIAS"]["NCM"][
-                                        "alias_names"],
-                                    sles_vm["VM_ALIAS"]["NCM"][
-                                        "address"]), add_to_cleanup=False)
+        batch.create(vm_service_sles_path + "/vm_aliases/ms",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'".format(
+                         sles_vm["VM_ALIAS"]["MS1"][
+                             "alias_names"],
+                         sles_vm["VM_ALIAS"]["MS1"][
+                             "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_sles_path + "/vm_aliases/ncm",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'".format(
+                         sles_vm["VM_ALIAS"]["NCM"][
+                             "alias_names"],
+                         sles_vm["VM_ALIAS"]["NCM"][
+                             "address"]),
+                     add_to_cleanup=False)
 
         # description: Configure network interfaces
         # test_steps:
         #   step: Configure VM-network-interfaces for CS_SLES_VM
         #   result: VM-network-interfaces are added to CS_SLES_VM
         sles_vm_net1 = sles_vm["NETWORK_INTERFACES"]["NET1"]
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_sles_path +
-                            "/vm_network_interfaces/net1",
-                            "vm-network-interface",
-                            props="host_device='{0}' device_name='{1}' "
-                                  "ipaddresses='{2}' gateway='{3}' "
-                                  "network_name='{4}'".format(
-                            sles_vm_net1["host_device"],
-                            sles_vm_net1["device_name"],
-                            sles_vm_net1["ipaddresses"],
-                            sles_vm_net1["gateway"],
-                            sles_vm_net1["network_name"]),
-                            add_to_cleanup=False)
+        batch.create(vm_service_sles_path +
+                     "/vm_network_interfaces/net1",
+                     "vm-network-interface",
+                     props="host_device='{0}' device_name='{1}' "
+                           "ipaddresses='{2}' gateway='{3}' "
+                           "network_name='{4}'".format(
+                               sles_vm_net1["host_device"],
+                               sles_vm_net1["device_name"],
+                               sles_vm_net1["ipaddresses"],
+                               sles_vm_net1["gateway"],
+                               sles_vm_net1["network_name"]),
+                     add_to_cleanup=False)
 
         # TORF-404805
         # description: Configure zypper repos
         # test_steps:
         #   step: Create a zyppe repo for CS_SLES_VM
         #   result: Zypper repo is created for CS_SLES_VM
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_sles_path + "/vm_zypper_repos/repo_NCM",
-                            "vm-zypper-repo",
-                            props="name='{0}' base_url='{1}'".format(
-                                    sles_vm["ZYPPER_REPOS"]["NCM"]["name"],
-                                    sles_vm["ZYPPER_REPOS"]["NCM"][
-                                        "base_url"]), add_to_cleanup=False)
+        batch.create(vm_service_sles_path + "/vm_zypper_repos/repo_NCM",
+                     "vm-zypper-repo",
+                     props="name='{0}' base_url='{1}'".format(
+                         sles_vm["ZYPPER_REPOS"]["NCM"]["name"],
+                         sles_vm["ZYPPER_REPOS"]["NCM"][
+                             "base_url"]),
+                     add_to_cleanup=False)
 
         # description: Configure vm packages
         # test_steps:
         #   step: Configure vm packages for CS_SLES_VM
         #   result: VM packages are configured for CS_SLES_VM
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_sles_path +
-                                    "/vm_packages/pkg_empty_rpm",
-                                    "vm-package", props="name='{0}'".format(
-                sles_vm["PACKAGES"]["PKG1"]["name"]), add_to_cleanup=False)
+        batch.create(vm_service_sles_path +
+                     "/vm_packages/pkg_empty_rpm",
+                     "vm-package", props="name='{0}'".format(
+                sles_vm["PACKAGES"]["PKG1"]["name"]),
+                     add_to_cleanup=False)
 
         # description: Configure ssh keys
         # test_steps:
         #   step: Configure ssh keys for CS_SLES_VM
         #   result: ssh keys are created for CS_SLES_VM
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_sles_path +
-                                    "/vm_ssh_keys/ssh_key_rsa_21",
-                            "vm-ssh-key", props="ssh_key='{0}'".format(
-                sles_vm["SSH_KEYS"]["KEY21"]["ssh_key"]), add_to_cleanup=False)
+        batch.create(vm_service_sles_path +
+                     "/vm_ssh_keys/ssh_key_rsa_21",
+                     "vm-ssh-key", props="ssh_key='{0}'".format(
+                         sles_vm["SSH_KEYS"]["KEY21"]["ssh_key"]),
+                     add_to_cleanup=False)
 
         # TORF-406586
         # description: Configure custom scripts
         # test_steps:
         #   step: Configure custom scripts for CS_SLES_VM
         #   result: Custom scripts are created for CS_SLES_VM
-        self.execute_cli_create_cmd(self.management_server,
-                                vm_service_sles_path +
-                                "/vm_custom_script/vm_custom_script",
-                                "vm-custom-script",
-                                props="custom_script_names='{0}'".format(
-                        sles_vm["VM_CUSTOM_SCRIPT"]["custom_script_names"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_sles_path +
+                     "/vm_custom_script/vm_custom_script",
+                     "vm-custom-script",
+                     props="custom_script_names='{0}'".format(
+                         sles_vm["VM_CUSTOM_SCRIPT"]["custom_script_names"]),
+                     add_to_cleanup=False)
 
         #########################
         #                       #
@@ -664,268 +1234,259 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Create vm image 1 in the model
         #   result: vm image 1 is created in the litp model
-        self.execute_cli_create_cmd(self.management_server, vm_image_1_path,
-                                    "vm-image",
-                                    props="source_uri={0} name={1}".format(
-                                        lvtd_vm1["VM IMAGE"]["image_url"],
-                                        lvtd_vm1["VM IMAGE"]["image_name"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_image_1_path,
+                     "vm-image",
+                     props="source_uri={0} name={1}".format(
+                         lvtd_vm1["VM IMAGE"]["image_url"],
+                         lvtd_vm1["VM IMAGE"]["image_name"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7180
         # description: Create a vm service
         # test_steps:
         #   step: Create a vm service
         #   result: vm service is created in the model
-        self.execute_cli_create_cmd(self.management_server, vm_service_1_path,
-                                    "vm-service",
-                                    props="cpus={0} service_name={1} ram={2}" \
-                                          " cleanup_command='{3}' " \
-                                          "image_name={4} hostnames={5} " \
-                                          "internal_status_check={6}".format(
-                                        lvtd_vm1["VM_SERVICE"]["cpus"],
-                                        lvtd_vm1["VM_SERVICE"]["service_name"],
-                                        lvtd_vm1["VM_SERVICE"]["ram"],
-                                        lvtd_vm1["VM_SERVICE"][
-                                            "cleanup_command"],
-                                        lvtd_vm1["VM_SERVICE"]["image_name"],
-                                        lvtd_vm1["VM_SERVICE"]["hostnames"],
-                                        lvtd_vm1["VM_SERVICE"][
-                                            "internal_status_check"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_1_path,
+                     "vm-service",
+                     props="cpus={0} service_name={1} ram={2}" \
+                           " cleanup_command='{3}' " \
+                           "image_name={4} hostnames={5} " \
+                           "internal_status_check={6}".format(
+                         lvtd_vm1["VM_SERVICE"]["cpus"],
+                         lvtd_vm1["VM_SERVICE"]["service_name"],
+                         lvtd_vm1["VM_SERVICE"]["ram"],
+                         lvtd_vm1["VM_SERVICE"][
+                             "cleanup_command"],
+                         lvtd_vm1["VM_SERVICE"]["image_name"],
+                         lvtd_vm1["VM_SERVICE"]["hostnames"],
+                         lvtd_vm1["VM_SERVICE"][
+                             "internal_status_check"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7180
         # description: Create a vcs clustered service
         # test_steps:
         #   step: Create a vcs clustered service in the model CS_VM1
         #   result: CS_VM1 is created in model
-        self.execute_cli_create_cmd(self.management_server, sg1_path,
-                                    "vcs-clustered-service",
-                                    props="active={0} standby={1} name={2} " \
-                                          "online_timeout={3} dependency_list="
-                                          "'{4}' node_list={5}".format(
-                                        lvtd_vm1["CLUSTER_SERVICE"]["active"],
-                                        lvtd_vm1["CLUSTER_SERVICE"]["standby"],
-                                        lvtd_vm1["CLUSTER_SERVICE"]["name"],
-                                        lvtd_vm1["CLUSTER_SERVICE"][
-                                            "online_timeout"],
-                                        lvtd_vm1["CLUSTER_SERVICE"][
-                                            "dependency_list"],
-                                        lvtd_vm1["CLUSTER_SERVICE"][
-                                            "node_list"]),
-                                    add_to_cleanup=False)
+        batch.create(sg1_path,
+                     "vcs-clustered-service",
+                     props="active={0} standby={1} name={2} " \
+                           "online_timeout={3} dependency_list="
+                           "'{4}' node_list={5}".format(
+                         lvtd_vm1["CLUSTER_SERVICE"]["active"],
+                         lvtd_vm1["CLUSTER_SERVICE"]["standby"],
+                         lvtd_vm1["CLUSTER_SERVICE"]["name"],
+                         lvtd_vm1["CLUSTER_SERVICE"][
+                             "online_timeout"],
+                         lvtd_vm1["CLUSTER_SERVICE"][
+                             "dependency_list"],
+                         lvtd_vm1["CLUSTER_SERVICE"][
+                             "node_list"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7180
         # description: Create a ha config
         # test_steps:
         #   step: Create a ha-service-config in the model CS_VM1
         #   result: ha-service-config is created for CS_VM1
-        self.execute_cli_create_cmd(self.management_server,
-                                    sg1_path + "/ha_configs/service_config",
-                                    "ha-service-config",
-                                    props="restart_limit={0} "
-                                          "status_timeout={1}".format(
-                                        lvtd_vm1["HA_CONFIG"]["restart_limit"],
-                                        lvtd_vm1["HA_CONFIG"][
-                                            "status_timeout"]),
-                                    add_to_cleanup=False)
+        batch.create(sg1_path + "/ha_configs/service_config",
+                     "ha-service-config",
+                     props="restart_limit={0} "
+                           "status_timeout={1}".format(
+                         lvtd_vm1["HA_CONFIG"]["restart_limit"],
+                         lvtd_vm1["HA_CONFIG"][
+                             "status_timeout"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7180
         # description:  Add the service group to a vcs cluster
         # test_steps:
         #   step: Add service group to CS_VM1
         #   result: Service group is inherited onto CS_VM1
-        self.execute_cli_inherit_cmd(self.management_server,
-                                     sg1_path + "/applications/vm_service_1",
-                                     vm_service_1_path, add_to_cleanup=False)
+        batch.inherit(sg1_path + "/applications/vm_service_1",
+                      vm_service_1_path,
+                      add_to_cleanup=False)
 
         # id: litpcds-7184
         # description: Configure vm aliases
         # test_steps:
         #   step: Configure VM aliases for CS_VM1
         #   result: VM aliases are added to CS_VM1
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_1_path + "/vm_aliases/ms",
-                                    "vm-alias",
-                                    props="alias_names='{0}' address='{1}'"
-                                    .format(lvtd_vm1["VM_ALIAS"]["MS1"][
-                                            "alias_names"],
-                                        lvtd_vm1["VM_ALIAS"]["MS1"][
-                                            "address"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_1_path + "/vm_aliases/db1",
-                                    "vm-alias",
-                                    props="alias_names='{0}' address='{1}'"
-                                    .format(lvtd_vm1["VM_ALIAS"]["DB1"][
-                                            "alias_names"],
-                                        lvtd_vm1["VM_ALIAS"]["DB1"][
-                                            "address"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_1_path + "/vm_aliases/db2",
-                                    "vm-alias",
-                                    props="alias_names='{0}' address='{1}'"
-                                    .format(lvtd_vm1["VM_ALIAS"]["DB2"][
-                                            "alias_names"],
-                                        lvtd_vm1["VM_ALIAS"]["DB2"][
-                                            "address"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_1_path + "/vm_aliases/sfs",
-                                    "vm-alias",
-                                    props="alias_names='{0}' address='{1}'"
-                                    .format(lvtd_vm1["VM_ALIAS"]["SFS"][
-                                            "alias_names"],
-                                        lvtd_vm1["VM_ALIAS"]["SFS"][
-                                            "address"]), add_to_cleanup=False)
+        batch.create(vm_service_1_path + "/vm_aliases/ms",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'"
+                     .format(lvtd_vm1["VM_ALIAS"]["MS1"][
+                             "alias_names"],
+                         lvtd_vm1["VM_ALIAS"]["MS1"][
+                             "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_1_path + "/vm_aliases/db1",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'"
+                     .format(lvtd_vm1["VM_ALIAS"]["DB1"][
+                             "alias_names"],
+                         lvtd_vm1["VM_ALIAS"]["DB1"][
+                             "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_1_path + "/vm_aliases/db2",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'"
+                     .format(lvtd_vm1["VM_ALIAS"]["DB2"][
+                             "alias_names"],
+                         lvtd_vm1["VM_ALIAS"]["DB2"][
+                             "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_1_path + "/vm_aliases/sfs",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'"
+                     .format(lvtd_vm1["VM_ALIAS"]["SFS"][
+                             "alias_names"],
+                         lvtd_vm1["VM_ALIAS"]["SFS"][
+                             "address"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7179
         # description: Configure network interfaces
         # test_steps:
         #   step: Configure VM-network-interfaces for CS_VM1
         #   result: VM-network-interfaces are added to CS_VM1
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_1_path +
-                                    "/vm_network_interfaces/net1",
-                                    "vm-network-interface",
-                                props="host_device='{0}' network_name='{1}' " \
-                                          "device_name='{2}'".format(
-                                        lvtd_vm1["NETWORK_INTERFACES"]["NET1"][
-                                            "host_device"],
-                                        lvtd_vm1["NETWORK_INTERFACES"]["NET1"][
-                                            "network_name"],
-                                        lvtd_vm1["NETWORK_INTERFACES"]["NET1"][
-                                            "device_name"]),
-                                    add_to_cleanup=False)
-
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_1_path +
-                                    "/vm_network_interfaces/net_dhcp",
-                                    "vm-network-interface",
-                                props="host_device='{0}' network_name='{1}' " \
-                                          "device_name='{2}'".format(
-                                        lvtd_vm1["NETWORK_INTERFACES"][
-                                            "NET_DHCP"]["host_device"],
-                                        lvtd_vm1["NETWORK_INTERFACES"][
-                                            "NET_DHCP"]["network_name"],
-                                        lvtd_vm1["NETWORK_INTERFACES"][
-                                            "NET_DHCP"]["device_name"]),
-                                    add_to_cleanup=False)
-
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg1_path +
+        batch.create(vm_service_1_path +
+                     "/vm_network_interfaces/net1",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm1["NETWORK_INTERFACES"]["NET1"][
+                                   "host_device"],
+                               lvtd_vm1["NETWORK_INTERFACES"]["NET1"][
+                                   "network_name"],
+                               lvtd_vm1["NETWORK_INTERFACES"]["NET1"][
+                                   "device_name"]),
+                     add_to_cleanup=False)
+
+        batch.create(vm_service_1_path +
+                     "/vm_network_interfaces/net_dhcp",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm1["NETWORK_INTERFACES"][
+                                   "NET_DHCP"]["host_device"],
+                               lvtd_vm1["NETWORK_INTERFACES"][
+                                   "NET_DHCP"]["network_name"],
+                               lvtd_vm1["NETWORK_INTERFACES"][
+                                   "NET_DHCP"]["device_name"]),
+                     add_to_cleanup=False)
+
+        batch.update(sg1_path +
                 "/applications/vm_service_1/vm_network_interfaces/net1",
-                                    props="ipaddresses={0}".format(
-                                        lvtd_vm1["NETWORK_INTERFACES"]["NET1"][
-                                            "ipaddresses"]))
+                     props="ipaddresses={0}".format(
+                         lvtd_vm1["NETWORK_INTERFACES"]["NET1"][
+                             "ipaddresses"]))
 
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg1_path +
+        batch.update(sg1_path +
                 "/applications/vm_service_1/vm_network_interfaces/net_dhcp",
-                                    props="ipaddresses={0}".format(
-                                        lvtd_vm1["NETWORK_INTERFACES"][
-                                            "NET_DHCP"]["ipaddresses"]))
+                     props="ipaddresses={0}".format(
+                         lvtd_vm1["NETWORK_INTERFACES"][
+                             "NET_DHCP"]["ipaddresses"]))
 
         # id: litpcds-7185
         # description: Define gateway for vm service
         # test_steps:
         #   step: Define gateway for CS_VM1
         #   result: Gateway is defined for CS_VM1
-        self.execute_cli_update_cmd(self.management_server,
-                                    vm_service_1_path +
-                                    "/vm_network_interfaces/net1",
-                                    props="gateway=192.168.0.1".format(
-                                        lvtd_vm1["NETWORK_INTERFACES"]["NET1"][
-                                            "gateway"]))
+        batch.update(vm_service_1_path +
+                     "/vm_network_interfaces/net1",
+                     props="gateway=192.168.0.1".format(
+                         lvtd_vm1["NETWORK_INTERFACES"]["NET1"][
+                             "gateway"]))
 
         # id: litpcds-7186
         # description: Configure yum repos
         # test_steps:
         #   step: Create yum repos for CS_VM1
         #   result: Yum repos are created for CS_VM1
-        self.execute_cli_create_cmd(self.management_server,
-                                vm_service_1_path + "/vm_yum_repos/repo_3PP",
-                                    "vm-yum-repo",
-                                    props="name='{0}' base_url='{1}'".format(
-                                        lvtd_vm1["YUM_REPOS"]["3PP"]["name"],
-                                        lvtd_vm1["YUM_REPOS"]["3PP"][
-                                            "base_url"]), add_to_cleanup=False)
-
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_1_path +
-                                    "/vm_yum_repos/repo_LITP",
-                                    "vm-yum-repo",
-                                    props="name='{0}' base_url='{1}'".format(
-                                        lvtd_vm1["YUM_REPOS"]["LITP"]["name"],
-                                        lvtd_vm1["YUM_REPOS"]["LITP"][
-                                            "base_url"]), add_to_cleanup=False)
+        batch.create(vm_service_1_path + "/vm_yum_repos/repo_3PP",
+                     "vm-yum-repo",
+                     props="name='{0}' base_url='{1}'".format(
+                         lvtd_vm1["YUM_REPOS"]["3PP"]["name"],
+                         lvtd_vm1["YUM_REPOS"]["3PP"][
+                             "base_url"]),
+                     add_to_cleanup=False)
+
+        batch.create(vm_service_1_path +
+                     "/vm_yum_repos/repo_LITP",
+                     "vm-yum-repo",
+                     props="name='{0}' base_url='{1}'".format(
+                         lvtd_vm1["YUM_REPOS"]["LITP"]["name"],
+                         lvtd_vm1["YUM_REPOS"]["LITP"][
+                             "base_url"]),
+                     add_to_cleanup=False)
         # id: litpcds-7186
         # description: Configure vm packages
         # test_steps:
         #   step: Configure vm packages for CS_VM1
         #   result: VM packages are configured for CS_VM1
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_1_path + "/vm_packages/pkg_empty_rpm1",
-                                    "vm-package", props="name='{0}'".format(
-                lvtd_vm1["PACKAGES"]["PKG1"]["name"]), add_to_cleanup=False)
+        batch.create(vm_service_1_path + "/vm_packages/pkg_empty_rpm1",
+                     "vm-package", props="name='{0}'".format(
+                lvtd_vm1["PACKAGES"]["PKG1"]["name"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7815
         # description: Configure nfs mounts
         # test_steps:
         #   step: Configure nfs mounts for CS_VM1
         #   result: nfs mounts are created for CS_VM1
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_1_path +
-                                    "/vm_nfs_mounts/vm_nfs_mount_1",
-                                    "vm-nfs-mount",
-                                props="device_path='{0}' mount_point='{1}' " \
-                                          "mount_options='{2}' ".format(
-                                        lvtd_vm1["NFS_MOUNTS"]["VM_MOUNT1"][
-                                            "device_path"],
-                                        lvtd_vm1["NFS_MOUNTS"]["VM_MOUNT1"][
-                                            "mount_point"],
-                                        lvtd_vm1["NFS_MOUNTS"]["VM_MOUNT1"][
-                                            "mount_options"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_1_path +
+                     "/vm_nfs_mounts/vm_nfs_mount_1",
+                     "vm-nfs-mount",
+                     props="device_path='{0}' mount_point='{1}' " \
+                           "mount_options='{2}' ".format(
+                               lvtd_vm1["NFS_MOUNTS"]["VM_MOUNT1"][
+                                   "device_path"],
+                               lvtd_vm1["NFS_MOUNTS"]["VM_MOUNT1"][
+                                   "mount_point"],
+                               lvtd_vm1["NFS_MOUNTS"]["VM_MOUNT1"][
+                                   "mount_options"]),
+                     add_to_cleanup=False)
+
+        batch.create(vm_service_1_path +
+                     "/vm_nfs_mounts/vm_nfs_mount_2",
+                     "vm-nfs-mount",
+                     props="device_path='{0}' mount_point='{1}'"
+                     .format(lvtd_vm1["NFS_MOUNTS"]["VM_MOUNT2"]
+                             ["device_path"],
+                         lvtd_vm1["NFS_MOUNTS"]["VM_MOUNT2"][
+                             "mount_point"]),
+                     add_to_cleanup=False)
+
+        batch.create(vm_service_1_path +
+                     "/vm_nfs_mounts/vm_nfs_mount_3",
+                     "vm-nfs-mount",
+                     props="device_path='{0}' mount_point='{1}'"
+                     .format(lvtd_vm1["NFS_MOUNTS"]["VM_MOUNT3"]
+                             ["device_path"],
+                         lvtd_vm1["NFS_MOUNTS"]["VM_MOUNT3"][
+                             "mount_point"],
+                         lvtd_vm1["NFS_MOUNTS"]["VM_MOUNT3"][
+                             "mount_options"]),
+                     add_to_cleanup=False)
 
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_1_path +
-                                    "/vm_nfs_mounts/vm_nfs_mount_2",
-                                    "vm-nfs-mount",
-                                    props="device_path='{0}' mount_point='{1}'"
-                                    .format(lvtd_vm1["NFS_MOUNTS"]["VM_MOUNT2"]
-                                            ["device_path"],
-                                        lvtd_vm1["NFS_MOUNTS"]["VM_MOUNT2"][
-                                            "mount_point"]),
-                                    add_to_cleanup=False)
-
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_1_path +
-                                    "/vm_nfs_mounts/vm_nfs_mount_3",
-                                    "vm-nfs-mount",
-                                    props="device_path='{0}' mount_point='{1}'"
-                                    .format(lvtd_vm1["NFS_MOUNTS"]["VM_MOUNT3"]
-                                            ["device_path"],
-                                        lvtd_vm1["NFS_MOUNTS"]["VM_MOUNT3"][
-                                            "mount_point"],
-                                        lvtd_vm1["NFS_MOUNTS"]["VM_MOUNT3"][
-                                            "mount_options"]),
-                                    add_to_cleanup=False)
-
-        # id: litpcds-6627
-        # description: Configure ssh keys
-        # test_steps:
-        #   step: Configure ssh keys for CS_VM1
-        #   result: ssh keys are created for CS_VM1
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_1_path + "/vm_ssh_keys/ssh_key_rsa_11",
-                                    "vm-ssh-key", props="ssh_key='{0}'".format(
-                lvtd_vm1["SSH_KEYS"]["KEY1"]["ssh_key"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_1_path + "/vm_ssh_keys/ssh_key_rsa_12",
-                                    "vm-ssh-key", props="ssh_key='{0}'".format(
-                lvtd_vm1["SSH_KEYS"]["KEY2"]["ssh_key"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_1_path + "/vm_ssh_keys/ssh_key_rsa_13",
-                                    "vm-ssh-key", props="ssh_key='{0}'".format(
-                lvtd_vm1["SSH_KEYS"]["KEY3"]["ssh_key"]), add_to_cleanup=False)
+        # id: litpcds-6627
+        # description: Configure ssh keys
+        # test_steps:
+        #   step: Configure ssh keys for CS_VM1
+        #   result: ssh keys are created for CS_VM1
+        batch.create(vm_service_1_path + "/vm_ssh_keys/ssh_key_rsa_11",
+                     "vm-ssh-key", props="ssh_key='{0}'".format(
+                lvtd_vm1["SSH_KEYS"]["KEY1"]["ssh_key"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_1_path + "/vm_ssh_keys/ssh_key_rsa_12",
+                     "vm-ssh-key", props="ssh_key='{0}'".format(
+                lvtd_vm1["SSH_KEYS"]["KEY2"]["ssh_key"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_1_path + "/vm_ssh_keys/ssh_key_rsa_13",
+                     "vm-ssh-key", props="ssh_key='{0}'".format(
+                lvtd_vm1["SSH_KEYS"]["KEY3"]["ssh_key"]),
+                     add_to_cleanup=False)
 
         # id: torf-107476
         # title: test_02_p_create_vm_ram_mount_RH7_tmpfs
@@ -935,15 +1496,15 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Create VM with new vm-ram-mount item with a RHEL 7 system
         #   result: vm-ram-mount is created successfully with RHEL 7 system
-        self.execute_cli_create_cmd(self.management_server, vm_service_1_path
-                                    + "/vm_ram_mounts/vm_ram_mount_1",
-                                    "vm-ram-mount",
-                                    props="type='{0}' mount_point='{1}' "
-                                    .format(
-                                        lvtd_vm1["VM_RAM_MOUNT"]["type"],
-                                        lvtd_vm1["VM_RAM_MOUNT"]
-                                        ["mount_point"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_1_path
+                     + "/vm_ram_mounts/vm_ram_mount_1",
+                     "vm-ram-mount",
+                     props="type='{0}' mount_point='{1}' "
+                     .format(
+                         lvtd_vm1["VM_RAM_MOUNT"]["type"],
+                         lvtd_vm1["VM_RAM_MOUNT"]
+                         ["mount_point"]),
+                     add_to_cleanup=False)
 
         # id: torf-180365, torf-180367
         # title: test_03_p_create_vm_scripts_runtime
@@ -955,13 +1516,13 @@ class Libvirtsetup(LibvirtGenericTest):
         # custom_script_names="csfname1.sh,csfname2.sh,csfname3.sh,
         # csfname4.sh,csfname7.sh"
 
-        self.execute_cli_create_cmd(self.management_server, vm_service_1_path
-                                    + "/vm_custom_script/vm_custom_script_1",
-                                    "vm-custom-script",
-                                    props="custom_script_names='{0}'"
-                                    .format(lvtd_vm1["VM_CUSTOM_SCRIPT"]
-                                            ["custom_script_names"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_1_path
+                     + "/vm_custom_script/vm_custom_script_1",
+                     "vm-custom-script",
+                     props="custom_script_names='{0}'"
+                     .format(lvtd_vm1["VM_CUSTOM_SCRIPT"]
+                             ["custom_script_names"]),
+                     add_to_cleanup=False)
 
         #########################
         #                       #
@@ -980,170 +1541,167 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Create vm image 2 in the model
         #   result: vm image 2 is created in the litp model successfully
-        self.execute_cli_create_cmd(self.management_server, vm_image_2_path,
-                                "vm-image",
-                                props="source_uri='{0}' name='{1}' ".format(
-                                    libvirt_test_data.VM_IMAGES[
-                                        "VM_IMAGE2"]["image_url"],
-                                    libvirt_test_data.VM_IMAGES[
-                                        "VM_IMAGE2"]["image_name"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_image_2_path,
+                     "vm-image",
+                     props="source_uri='{0}' name='{1}' ".format(
+                         libvirt_test_data.VM_IMAGES[
+                             "VM_IMAGE2"]["image_url"],
+                         libvirt_test_data.VM_IMAGES[
+                             "VM_IMAGE2"]["image_name"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7180
         # description: Create CS_VM2 vcs clustered service in litp model
         # test_steps:
         #   step: Create CS_VM2 in the model
         #   result: CS_VM2 is created in the litp model successfully
-        self.execute_cli_create_cmd(self.management_server, sg2_path,
-                                    "vcs-clustered-service",
-                            props="active={0} standby={1} name='{2}' " \
-                                  "online_timeout={3} dependency_list={4} " \
-                                  "node_list='{5}' ".format(
-                                lvtd_vm2["CLUSTER_SERVICE"]["active"],
-                                lvtd_vm2["CLUSTER_SERVICE"]["standby"],
-                                lvtd_vm2["CLUSTER_SERVICE"]["name"],
-                                lvtd_vm2["CLUSTER_SERVICE"][
-                                    "online_timeout"],
-                                lvtd_vm2["CLUSTER_SERVICE"][
-                                    "dependency_list"],
-                                lvtd_vm2["CLUSTER_SERVICE"][
-                                    "node_list"]), add_to_cleanup=False)
+        batch.create(sg2_path,
+                     "vcs-clustered-service",
+                     props="active={0} standby={1} name='{2}' " \
+                           "online_timeout={3} dependency_list={4} " \
+                           "node_list='{5}' ".format(
+                               lvtd_vm2["CLUSTER_SERVICE"]["active"],
+                               lvtd_vm2["CLUSTER_SERVICE"]["standby"],
+                               lvtd_vm2["CLUSTER_SERVICE"]["name"],
+                               lvtd_vm2["CLUSTER_SERVICE"][
+                                   "online_timeout"],
+                               lvtd_vm2["CLUSTER_SERVICE"][
+                                   "dependency_list"],
+                               lvtd_vm2["CLUSTER_SERVICE"][
+                                   "node_list"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7180
         # description: Create vm service 2 in litp model
         # test_steps:
         #   step: Create vm-service 2 in the model
         #   result: vm-service 2 is created in the litp model successfully
-        self.execute_cli_create_cmd(self.management_server, vm_service_2_path,
-                            "vm-service",
-                            props="cleanup_command='{0}' " \
-                                  "status_command='{1}' hostnames='{2}' " \
-                                  "internal_status_check='{3}' " \
-                                  "start_command='{4}' service_name='{5}' " \
-                                  "stop_command='{6}' ram='{7}' " \
-                                  "image_name='{8}' cpus='{9}' "
-                                  "cpuset={10}".format(
-                                lvtd_vm2["VM_SERVICE"][
-                                    "cleanup_command"],
-                                lvtd_vm2["VM_SERVICE"][
-                                    "status_command"],
-                                lvtd_vm2["VM_SERVICE"]["hostnames"],
-                                lvtd_vm2["VM_SERVICE"][
-                                    "internal_status_check"],
-                                lvtd_vm2["VM_SERVICE"][
-                                    "start_command"],
-                                lvtd_vm2["VM_SERVICE"]["service_name"],
-                                lvtd_vm2["VM_SERVICE"]["stop_command"],
-                                lvtd_vm2["VM_SERVICE"]["ram"],
-                                lvtd_vm2["VM_SERVICE"]["image_name"],
-                                lvtd_vm2["VM_SERVICE"]["cpus"],
-                                lvtd_vm2["VM_SERVICE"]["cpuset"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_2_path,
+                     "vm-service",
+                     props="cleanup_command='{0}' " \
+                           "status_command='{1}' hostnames='{2}' " \
+                           "internal_status_check='{3}' " \
+                           "start_command='{4}' service_name='{5}' " \
+                           "stop_command='{6}' ram='{7}' " \
+                           "image_name='{8}' cpus='{9}' "
+                           "cpuset={10}".format(
+                               lvtd_vm2["VM_SERVICE"][
+                                   "cleanup_command"],
+                               lvtd_vm2["VM_SERVICE"][
+                                   "status_command"],
+                               lvtd_vm2["VM_SERVICE"]["hostnames"],
+                               lvtd_vm2["VM_SERVICE"][
+                                   "internal_status_check"],
+                               lvtd_vm2["VM_SERVICE"][
+                                   "start_command"],
+                               lvtd_vm2["VM_SERVICE"]["service_name"],
+                               lvtd_vm2["VM_SERVICE"]["stop_command"],
+                               lvtd_vm2["VM_SERVICE"]["ram"],
+                               lvtd_vm2["VM_SERVICE"]["image_name"],
+                               lvtd_vm2["VM_SERVICE"]["cpus"],
+                               lvtd_vm2["VM_SERVICE"]["cpuset"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7180
         # description: Create ha service config for CS_VM2 in litp model
         # test_steps:
         #   step: Create ha service config for CS_VM2 in litp model
         #   result: ha service config is created in the litp successfully
-        self.execute_cli_create_cmd(self.management_server,
+        batch.create(
             sg2_path + "/ha_configs/service_config", "ha-service-config",
             props="restart_limit={0} status_timeout={1} ".format(
                 lvtd_vm2["HA_CONFIG"]["restart_limit"],
                 lvtd_vm2["HA_CONFIG"]["status_timeout"]),
-                                    add_to_cleanup=False)
+                     add_to_cleanup=False)
 
         # id: litpcds-7180
         # description: Add service group to CS_VM2 vcs clustered service
         # test_steps:
         #   step: Inherit vm-service 2 onto CS_VM2
         #   result: vm-service 2 is inherited onto CS_VM2 clustered service
-        self.execute_cli_inherit_cmd(self.management_server,
-                                     sg2_path + "/applications/vm_service_2",
-                                     vm_service_2_path, add_to_cleanup=False)
+        batch.inherit(sg2_path + "/applications/vm_service_2",
+                      vm_service_2_path,
+                      add_to_cleanup=False)
 
         # id: litpcds-7184
         # description: Configure vm aliases
         # test_steps:
         #   step: Configure vm aliases for CS_VM2
         #   result: vm aliases are created for CS_VM2 successfully
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_2_path + "/vm_aliases/db1",
-                            "vm-alias",
-                            props="alias_names='{0}' address='{1}'".format(
-                                lvtd_vm2["VM_ALIAS"]["DB1"][
-                                    "alias_names"],
-                                lvtd_vm2["VM_ALIAS"]["DB1"][
-                                    "address"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_2_path + "/vm_aliases/ms",
-                            "vm-alias",
-                            props="alias_names='{0}' address='{1}'".format(
-                                lvtd_vm2["VM_ALIAS"]["MS1"][
-                                    "alias_names"],
-                                lvtd_vm2["VM_ALIAS"]["MS1"][
-                                    "address"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_2_path + "/vm_aliases/sfs",
-                            "vm-alias",
-                            props="alias_names='{0}' address='{1}'".format(
-                                lvtd_vm2["VM_ALIAS"]["SFS"][
-                                    "alias_names"],
-                                lvtd_vm2["VM_ALIAS"]["SFS"][
-                                    "address"]), add_to_cleanup=False)
+        batch.create(vm_service_2_path + "/vm_aliases/db1",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'".format(
+                         lvtd_vm2["VM_ALIAS"]["DB1"][
+                             "alias_names"],
+                         lvtd_vm2["VM_ALIAS"]["DB1"][
+                             "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_2_path + "/vm_aliases/ms",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'".format(
+                         lvtd_vm2["VM_ALIAS"]["MS1"][
+                             "alias_names"],
+                         lvtd_vm2["VM_ALIAS"]["MS1"][
+                             "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_2_path + "/vm_aliases/sfs",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'".format(
+                         lvtd_vm2["VM_ALIAS"]["SFS"][
+                             "alias_names"],
+                         lvtd_vm2["VM_ALIAS"]["SFS"][
+                             "address"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7179
         # description: Configure network interfaces
         # test_steps:
         #   step: Configure network interfaces for CS_VM2
         #   result: vm aliases are created for CS_VM2 successfully
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_2_path + "/vm_network_interfaces/net2",
-                            "vm-network-interface",
-                            props="host_device='{0}' network_name='{1}' " \
-                                  "device_name='{2}'".format(
-                                lvtd_vm2["NETWORK_INTERFACES"]["NET2"][
-                                    "host_device"],
-                                lvtd_vm2["NETWORK_INTERFACES"]["NET2"][
-                                    "network_name"],
-                                lvtd_vm2["NETWORK_INTERFACES"]["NET2"][
-                                    "device_name"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_2_path + "/vm_network_interfaces/net3",
-                            "vm-network-interface",
-                            props="host_device='{0}' network_name='{1}' " \
-                                  "device_name='{2}'".format(
-                                lvtd_vm2["NETWORK_INTERFACES"]["NET3"][
-                                    "host_device"],
-                                lvtd_vm2["NETWORK_INTERFACES"]["NET3"][
-                                    "network_name"],
-                                lvtd_vm2["NETWORK_INTERFACES"]["NET3"][
-                                    "device_name"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                        vm_service_2_path + "/vm_network_interfaces/net_dhcp",
-                        "vm-network-interface",
-                        props="host_device='{0}' network_name='{1}' " \
-                              "device_name='{2}'".format(
-                            lvtd_vm2["NETWORK_INTERFACES"][
-                                "NET_DHCP"]["host_device"],
-                            lvtd_vm2["NETWORK_INTERFACES"][
-                                "NET_DHCP"]["network_name"],
-                            lvtd_vm2["NETWORK_INTERFACES"][
-                                "NET_DHCP"]["device_name"]),
-                                    add_to_cleanup=False)
-        self.execute_cli_update_cmd(self.management_server,
-                sg2_path +
+        batch.create(vm_service_2_path + "/vm_network_interfaces/net2",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm2["NETWORK_INTERFACES"]["NET2"][
+                                   "host_device"],
+                               lvtd_vm2["NETWORK_INTERFACES"]["NET2"][
+                                   "network_name"],
+                               lvtd_vm2["NETWORK_INTERFACES"]["NET2"][
+                                   "device_name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_2_path + "/vm_network_interfaces/net3",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm2["NETWORK_INTERFACES"]["NET3"][
+                                   "host_device"],
+                               lvtd_vm2["NETWORK_INTERFACES"]["NET3"][
+                                   "network_name"],
+                               lvtd_vm2["NETWORK_INTERFACES"]["NET3"][
+                                   "device_name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_2_path + "/vm_network_interfaces/net_dhcp",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm2["NETWORK_INTERFACES"][
+                                   "NET_DHCP"]["host_device"],
+                               lvtd_vm2["NETWORK_INTERFACES"][
+                                   "NET_DHCP"]["network_name"],
+                               lvtd_vm2["NETWORK_INTERFACES"][
+                                   "NET_DHCP"]["device_name"]),
+                     add_to_cleanup=False)
+        batch.update(sg2_path +
                     "/applications/vm_service_2/vm_network_interfaces/net2",
                 props="ipaddresses={0}".format(
                     lvtd_vm2["NETWORK_INTERFACES"]["NET2"][
                         "ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-                sg2_path +
+        batch.update(sg2_path +
                     "/applications/vm_service_2/vm_network_interfaces/net3",
                 props="ipaddresses={0}".format(
                     lvtd_vm2["NETWORK_INTERFACES"]["NET3"][
                         "ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-            sg2_path +
+        batch.update(sg2_path +
                 "/applications/vm_service_2/vm_network_interfaces/net_dhcp",
             props="ipaddresses={0}".format(
                 lvtd_vm2["NETWORK_INTERFACES"][
@@ -1154,7 +1712,7 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Define default gateway for CS_VM2
         #   result: Default gateway is defined for CS_VM2
-        self.execute_cli_update_cmd(self.management_server,
+        batch.update(
             sg2_path + "/applications/vm_service_2/vm_network_interfaces/net3",
             props="gateway={0}".format(
                 lvtd_vm2["NETWORK_INTERFACES"]["NET3"][
@@ -1165,34 +1723,33 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Configure yum repos for CS_VM2
         #   result: YUM repos are configured for CS_VM2
-        self.execute_cli_create_cmd(self.management_server,
-                                vm_service_2_path + "/vm_yum_repos/repo_3PP",
-                                "vm-yum-repo",
-                                props="name='{0}' base_url='{1}'".format(
-                                    lvtd_vm2["YUM_REPOS"]["3PP"]["name"],
-                                    lvtd_vm2["YUM_REPOS"]["3PP"]["base_url"]),
-                                    add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                                vm_service_2_path + "/vm_yum_repos/repo_LITP",
-                                "vm-yum-repo",
-                                props="name='{0}' base_url='{1}'".format(
-                                    lvtd_vm2["YUM_REPOS"]["LITP"]["name"],
-                                    lvtd_vm2["YUM_REPOS"]["LITP"][
-                                        "base_url"]), add_to_cleanup=False)
+        batch.create(vm_service_2_path + "/vm_yum_repos/repo_3PP",
+                     "vm-yum-repo",
+                     props="name='{0}' base_url='{1}'".format(
+                         lvtd_vm2["YUM_REPOS"]["3PP"]["name"],
+                         lvtd_vm2["YUM_REPOS"]["3PP"]["base_url"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_2_path + "/vm_yum_repos/repo_LITP",
+                     "vm-yum-repo",
+                     props="name='{0}' base_url='{1}'".format(
+                         lvtd_vm2["YUM_REPOS"]["LITP"]["name"],
+                         lvtd_vm2["YUM_REPOS"]["LITP"][
+                             "base_url"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7186
         # description: Configure VM packages
         # test_steps:
         #   step: Configure VM Packages for CS_VM2
         #   result: VM packages are configured for CS_VM2
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_2_path + "/vm_packages/pkg_empty_rpm2",
-                            "vm-package", props="name='{0}'".format(
-                lvtd_vm2["PACKAGES"]["PKG2"]["name"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_2_path + "/vm_packages/pkg_empty_rpm3",
-                            "vm-package", props="name='{0}'".format(
-                lvtd_vm2["PACKAGES"]["PKG3"]["name"]), add_to_cleanup=False)
+        batch.create(vm_service_2_path + "/vm_packages/pkg_empty_rpm2",
+                     "vm-package", props="name='{0}'".format(
+                         lvtd_vm2["PACKAGES"]["PKG2"]["name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_2_path + "/vm_packages/pkg_empty_rpm3",
+                     "vm-package", props="name='{0}'".format(
+                         lvtd_vm2["PACKAGES"]["PKG3"]["name"]),
+                     add_to_cleanup=False)
 
         # id: torf-107476
         # title: test_01_p_create_vm_ram_mount_RH6_tmpfs
@@ -1202,18 +1759,18 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Create VM with new vm-ram-mount item with a RHEL 6 system
         #   result: vm-ram-mount is created successfully with RHEL 6 system
-        self.execute_cli_create_cmd(self.management_server, vm_service_2_path
-                                    + "/vm_ram_mounts/vm_ram_mount_2",
-                                    "vm-ram-mount",
-                                    props="type='{0}' mount_point='{1}' "
-                                    "mount_options='{2}' "
-                                    .format(
-                                      lvtd_vm2["VM_RAM_MOUNT"]["type"],
-                                      lvtd_vm2["VM_RAM_MOUNT"]
-                                      ["mount_point"],
-                                      lvtd_vm2["VM_RAM_MOUNT"]["mount_options"]
-                                      ),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_2_path
+                     + "/vm_ram_mounts/vm_ram_mount_2",
+                     "vm-ram-mount",
+                     props="type='{0}' mount_point='{1}' "
+                     "mount_options='{2}' "
+                     .format(
+                       lvtd_vm2["VM_RAM_MOUNT"]["type"],
+                       lvtd_vm2["VM_RAM_MOUNT"]
+                       ["mount_point"],
+                       lvtd_vm2["VM_RAM_MOUNT"]["mount_options"]
+                       ),
+                     add_to_cleanup=False)
 
         #########################
         #                       #
@@ -1232,253 +1789,251 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Define VM-image-3 in the litp model for CS_VM3
         #   result: VM-image-3 is created in the litp model
-        self.execute_cli_create_cmd(self.management_server, vm_image_3_path,
-                                    "vm-image",
-                                    props="source_uri='{0}' name='{1}'".format(
-                                        lvtd_vm3["VM IMAGE"]["image_url"],
-                                        lvtd_vm3["VM IMAGE"]["image_name"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_image_3_path,
+                     "vm-image",
+                     props="source_uri='{0}' name='{1}'".format(
+                         lvtd_vm3["VM IMAGE"]["image_url"],
+                         lvtd_vm3["VM IMAGE"]["image_name"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7180
         # description: Create CS_VM3 vcs-clustered service
         # test_steps:
         #   step: Create CS_VM3 clustered service
         #   result: CS_VM3 is created in the litp model
-        self.execute_cli_create_cmd(self.management_server, sg3_path,
-                            "vcs-clustered-service",
-                            props="active={0} standby={1} name='{2}' " \
-                                  "online_timeout={3} dependency_list='{4}' " \
-                                  "node_list='{5}'".format(
-                                lvtd_vm3["CLUSTER_SERVICE"]["active"],
-                                lvtd_vm3["CLUSTER_SERVICE"]["standby"],
-                                lvtd_vm3["CLUSTER_SERVICE"]["name"],
-                                lvtd_vm3["CLUSTER_SERVICE"][
-                                    "online_timeout"],
-                                lvtd_vm3["CLUSTER_SERVICE"][
-                                    "dependency_list"],
-                                lvtd_vm3["CLUSTER_SERVICE"][
-                                    "node_list"]), add_to_cleanup=False)
+        batch.create(sg3_path,
+                     "vcs-clustered-service",
+                     props="active={0} standby={1} name='{2}' " \
+                           "online_timeout={3} dependency_list='{4}' " \
+                           "node_list='{5}'".format(
+                               lvtd_vm3["CLUSTER_SERVICE"]["active"],
+                               lvtd_vm3["CLUSTER_SERVICE"]["standby"],
+                               lvtd_vm3["CLUSTER_SERVICE"]["name"],
+                               lvtd_vm3["CLUSTER_SERVICE"][
+                                   "online_timeout"],
+                               lvtd_vm3["CLUSTER_SERVICE"][
+                                   "dependency_list"],
+                               lvtd_vm3["CLUSTER_SERVICE"][
+                                   "node_list"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7180
         # description: Create vm-service-3 in the litp model
         # test_steps:
         #   step: Create vm-service-3 in the litp model
         #   result: vm-service-3 is created in the litp model
-        self.execute_cli_create_cmd(self.management_server, vm_service_3_path,
-                            "vm-service",
-                            props="cpus='{0}' service_name='{1}' ram='{2}' " \
-                                  "cleanup_command='{3}' image_name='{4}' " \
-                                  "hostnames='{5}' " \
-                                  "internal_status_check='{6}' " \
-                                  "cpunodebind={7}".format(
-                                lvtd_vm3["VM_SERVICE"]["cpus"],
-                                lvtd_vm3["VM_SERVICE"]["service_name"],
-                                lvtd_vm3["VM_SERVICE"]["ram"],
-                                lvtd_vm3["VM_SERVICE"][
-                                    "cleanup_command"],
-                                lvtd_vm3["VM_SERVICE"]["image_name"],
-                                lvtd_vm3["VM_SERVICE"]["hostnames"],
-                                lvtd_vm3["VM_SERVICE"][
-                                    "internal_status_check"],
-                                lvtd_vm3['VM_SERVICE']["cpunodebind"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_3_path,
+                     "vm-service",
+                     props="cpus='{0}' service_name='{1}' ram='{2}' " \
+                           "cleanup_command='{3}' image_name='{4}' " \
+                           "hostnames='{5}' " \
+                           "internal_status_check='{6}' " \
+                           "cpunodebind={7}".format(
+                               lvtd_vm3["VM_SERVICE"]["cpus"],
+                               lvtd_vm3["VM_SERVICE"]["service_name"],
+                               lvtd_vm3["VM_SERVICE"]["ram"],
+                               lvtd_vm3["VM_SERVICE"][
+                                   "cleanup_command"],
+                               lvtd_vm3["VM_SERVICE"]["image_name"],
+                               lvtd_vm3["VM_SERVICE"]["hostnames"],
+                               lvtd_vm3["VM_SERVICE"][
+                                   "internal_status_check"],
+                               lvtd_vm3['VM_SERVICE']["cpunodebind"]),
+                     add_to_cleanup=False)
         # id: litpcds-7180
         # description: Create ha-service-config in the litp model
         # test_steps:
         #   step: Create ha-service-config in the litp model
         #   result: ha-service-config is created in the litp model
-        self.execute_cli_create_cmd(self.management_server,
-                                    sg3_path + "/ha_configs/service_config",
-                                    "ha-service-config", add_to_cleanup=False)
+        batch.create(sg3_path + "/ha_configs/service_config",
+                     "ha-service-config",
+                     add_to_cleanup=False)
 
         # id: litpcds-7180
         # description: Inherit vm-service-3 onto CS_VM3
         # test_steps:
         #   step: Inherit vm-service-3 onto CS_VM3
         #   result: vm-service-3 is inherited onto CS_VM3 in litp model
-        self.execute_cli_inherit_cmd(self.management_server,
-                                     sg3_path + "/applications/vm_service_3",
-                                     vm_service_3_path, add_to_cleanup=False)
+        batch.inherit(sg3_path + "/applications/vm_service_3",
+                      vm_service_3_path,
+                      add_to_cleanup=False)
 
         # id: litpcds-7184
         # description: Configure VM aliases for CS_VM3
         # test_steps:
         #   step: Configure VM aliases for CS_VM3
         #   result: VM aliases are created for CS_VM3
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_3_path + "/vm_aliases/db1",
-                            "vm-alias",
-                            props="alias_names='{0}' address='{1}'".format(
-                                lvtd_vm3["VM_ALIAS"]["DB1"][
-                                    "alias_names"],
-                                lvtd_vm3["VM_ALIAS"]["DB1"][
-                                    "address"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_3_path + "/vm_aliases/db2",
-                            "vm-alias",
-                            props="alias_names='{0}' address='{1}'".format(
-                                lvtd_vm3["VM_ALIAS"]["DB2"][
-                                    "alias_names"],
-                                lvtd_vm3["VM_ALIAS"]["DB2"][
-                                    "address"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_3_path + "/vm_aliases/db3",
-                            "vm-alias",
-                            props="alias_names='{0}' address='{1}'".format(
-                                lvtd_vm3["VM_ALIAS"]["DB3"][
-                                    "alias_names"],
-                                lvtd_vm3["VM_ALIAS"]["DB3"][
-                                    "address"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_3_path + "/vm_aliases/db4",
-                            "vm-alias",
-                            props="alias_names='{0}' address='{1}'".format(
-                                lvtd_vm3["VM_ALIAS"]["DB4"][
-                                    "alias_names"],
-                                lvtd_vm3["VM_ALIAS"]["DB4"][
-                                    "address"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_3_path + "/vm_aliases/ms",
-                            "vm-alias",
-                            props="alias_names='{0}' address='{1}'".format(
-                                lvtd_vm3["VM_ALIAS"]["MS1"][
-                                    "alias_names"],
-                                lvtd_vm3["VM_ALIAS"]["MS1"][
-                                    "address"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_3_path + "/vm_aliases/sfs",
-                            "vm-alias",
-                            props="alias_names='{0}' address='{1}'".format(
-                                lvtd_vm3["VM_ALIAS"]["SFS"][
-                                    "alias_names"],
-                                lvtd_vm3["VM_ALIAS"]["SFS"][
-                                    "address"]), add_to_cleanup=False)
+        batch.create(vm_service_3_path + "/vm_aliases/db1",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'".format(
+                         lvtd_vm3["VM_ALIAS"]["DB1"][
+                             "alias_names"],
+                         lvtd_vm3["VM_ALIAS"]["DB1"][
+                             "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_3_path + "/vm_aliases/db2",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'".format(
+                         lvtd_vm3["VM_ALIAS"]["DB2"][
+                             "alias_names"],
+                         lvtd_vm3["VM_ALIAS"]["DB2"][
+                             "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_3_path + "/vm_aliases/db3",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'".format(
+                         lvtd_vm3["VM_ALIAS"]["DB3"][
+                             "alias_names"],
+                         lvtd_vm3["VM_ALIAS"]["DB3"][
+                             "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_3_path + "/vm_aliases/db4",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'".format(
+                         lvtd_vm3["VM_ALIAS"]["DB4"][
+                             "alias_names"],
+                         lvtd_vm3["VM_ALIAS"]["DB4"][
+                             "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_3_path + "/vm_aliases/ms",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'".format(
+                         lvtd_vm3["VM_ALIAS"]["MS1"][
+                             "alias_names"],
+                         lvtd_vm3["VM_ALIAS"]["MS1"][
+                             "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_3_path + "/vm_aliases/sfs",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'".format(
+                         lvtd_vm3["VM_ALIAS"]["SFS"][
+                             "alias_names"],
+                         lvtd_vm3["VM_ALIAS"]["SFS"][
+                             "address"]),
+                     add_to_cleanup=False)
         # id: litpcds-7179
         # description: Configure network interfaces for CS_VM3
         # test_steps:
         #   step: Configure network interfaces for CS_VM3
         #   result: network interfaces are created for CS_VM3
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_3_path + "/vm_network_interfaces/net4",
-                            "vm-network-interface",
-                            props="host_device='{0}' network_name='{1}' " \
-                                  "device_name='{2}'".format(
-                                lvtd_vm3["NETWORK_INTERFACES"]["NET4"][
-                                    "host_device"],
-                                lvtd_vm3["NETWORK_INTERFACES"]["NET4"][
-                                    "network_name"],
-                                lvtd_vm3["NETWORK_INTERFACES"]["NET4"][
-                                    "device_name"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_3_path + "/vm_network_interfaces/net5",
-                            "vm-network-interface",
-                            props="host_device='{0}' network_name='{1}' " \
-                                  "device_name='{2}'".format(
-                                lvtd_vm3["NETWORK_INTERFACES"]["NET5"][
-                                    "host_device"],
-                                lvtd_vm3["NETWORK_INTERFACES"]["NET5"][
-                                    "network_name"],
-                                lvtd_vm3["NETWORK_INTERFACES"]["NET5"][
-                                    "device_name"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_3_path + "/vm_network_interfaces/net6",
-                            "vm-network-interface",
-                            props="host_device='{0}' network_name='{1}' " \
-                                  "device_name='{2}'".format(
-                                lvtd_vm3["NETWORK_INTERFACES"]["NET6"][
-                                    "host_device"],
-                                lvtd_vm3["NETWORK_INTERFACES"]["NET6"][
-                                    "network_name"],
-                                lvtd_vm3["NETWORK_INTERFACES"]["NET6"][
-                                    "device_name"]), add_to_cleanup=False)
+        batch.create(vm_service_3_path + "/vm_network_interfaces/net4",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm3["NETWORK_INTERFACES"]["NET4"][
+                                   "host_device"],
+                               lvtd_vm3["NETWORK_INTERFACES"]["NET4"][
+                                   "network_name"],
+                               lvtd_vm3["NETWORK_INTERFACES"]["NET4"][
+                                   "device_name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_3_path + "/vm_network_interfaces/net5",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm3["NETWORK_INTERFACES"]["NET5"][
+                                   "host_device"],
+                               lvtd_vm3["NETWORK_INTERFACES"]["NET5"][
+                                   "network_name"],
+                               lvtd_vm3["NETWORK_INTERFACES"]["NET5"][
+                                   "device_name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_3_path + "/vm_network_interfaces/net6",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm3["NETWORK_INTERFACES"]["NET6"][
+                                   "host_device"],
+                               lvtd_vm3["NETWORK_INTERFACES"]["NET6"][
+                                   "network_name"],
+                               lvtd_vm3["NETWORK_INTERFACES"]["NET6"][
+                                   "device_name"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7185
         # description: Configure default gateway CS_VM3
         # test_steps:
         #   step: Define default gateway for CS_VM3
         #   result: default gateway is created for CS_VM3
-        self.execute_cli_create_cmd(self.management_server,
-                        vm_service_3_path + "/vm_network_interfaces/net_dhcp",
-                        "vm-network-interface",
-                        props="host_device='{0}' network_name='{1}' " \
-                              "device_name='{2}' gateway6='{3}'".format(
-                            lvtd_vm3["NETWORK_INTERFACES"][
-                                "NET_DHCP"]["host_device"],
-                            lvtd_vm3["NETWORK_INTERFACES"][
-                                "NET_DHCP"]["network_name"],
-                            lvtd_vm3["NETWORK_INTERFACES"][
-                                "NET_DHCP"]["device_name"],
-                            lvtd_vm3["NETWORK_INTERFACES"][
-                                "NET_DHCP"]["gateway6"]), add_to_cleanup=False)
+        batch.create(vm_service_3_path + "/vm_network_interfaces/net_dhcp",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}' gateway6='{3}'".format(
+                               lvtd_vm3["NETWORK_INTERFACES"][
+                                   "NET_DHCP"]["host_device"],
+                               lvtd_vm3["NETWORK_INTERFACES"][
+                                   "NET_DHCP"]["network_name"],
+                               lvtd_vm3["NETWORK_INTERFACES"][
+                                   "NET_DHCP"]["device_name"],
+                               lvtd_vm3["NETWORK_INTERFACES"][
+                                   "NET_DHCP"]["gateway6"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-12817
         # description: Configure network interfaces for CS_VM3
         # test_steps:
         #   step: Configure network interfaces for CS_VM3
         #   result: Network interfaces are created for CS_VM3
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_3_path + "/vm_network_interfaces/net32",
-                            "vm-network-interface",
-                            props="host_device='{0}' network_name='{1}' " \
-                                  "device_name='{2}'".format(
-                                lvtd_vm3["NETWORK_INTERFACES"]["NET32"][
-                                    "host_device"],
-                                lvtd_vm3["NETWORK_INTERFACES"]["NET32"][
-                                    "network_name"],
-                                lvtd_vm3["NETWORK_INTERFACES"]["NET32"][
-                                    "device_name"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_3_path + "/vm_network_interfaces/net33",
-                            "vm-network-interface",
-                            props="host_device='{0}' network_name='{1}' " \
-                                  "device_name='{2}'".format(
-                                lvtd_vm3["NETWORK_INTERFACES"]["NET33"][
-                                    "host_device"],
-                                lvtd_vm3["NETWORK_INTERFACES"]["NET33"][
-                                    "network_name"],
-                                lvtd_vm3["NETWORK_INTERFACES"]["NET33"][
-                                    "device_name"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_3_path + "/vm_network_interfaces/net34",
-                            "vm-network-interface",
-                            props="host_device='{0}' network_name='{1}' " \
-                                  "device_name='{2}'".format(
-                                lvtd_vm3["NETWORK_INTERFACES"]["NET34"][
-                                    "host_device"],
-                                lvtd_vm3["NETWORK_INTERFACES"]["NET34"][
-                                    "network_name"],
-                                lvtd_vm3["NETWORK_INTERFACES"]["NET34"][
-                                    "device_name"]), add_to_cleanup=False)
+        batch.create(vm_service_3_path + "/vm_network_interfaces/net32",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm3["NETWORK_INTERFACES"]["NET32"][
+                                   "host_device"],
+                               lvtd_vm3["NETWORK_INTERFACES"]["NET32"][
+                                   "network_name"],
+                               lvtd_vm3["NETWORK_INTERFACES"]["NET32"][
+                                   "device_name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_3_path + "/vm_network_interfaces/net33",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm3["NETWORK_INTERFACES"]["NET33"][
+                                   "host_device"],
+                               lvtd_vm3["NETWORK_INTERFACES"]["NET33"][
+                                   "network_name"],
+                               lvtd_vm3["NETWORK_INTERFACES"]["NET33"][
+                                   "device_name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_3_path + "/vm_network_interfaces/net34",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm3["NETWORK_INTERFACES"]["NET34"][
+                                   "host_device"],
+                               lvtd_vm3["NETWORK_INTERFACES"]["NET34"][
+                                   "network_name"],
+                               lvtd_vm3["NETWORK_INTERFACES"]["NET34"][
+                                   "device_name"]),
+                     add_to_cleanup=False)
         # Update vm net interfaces
-        self.execute_cli_update_cmd(self.management_server,
+        batch.update(
             sg3_path + "/applications/vm_service_3/vm_network_interfaces/net4",
             props="ipaddresses={0}".format(
                 lvtd_vm3["NETWORK_INTERFACES"]["NET4"][
                     "ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
+        batch.update(
             sg3_path + "/applications/vm_service_3/vm_network_interfaces/net5",
             props="ipaddresses={0}".format(
                 lvtd_vm3["NETWORK_INTERFACES"]["NET5"][
                     "ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
+        batch.update(
             sg3_path + "/applications/vm_service_3/vm_network_interfaces/net6",
             props="ipaddresses={0}".format(
                 lvtd_vm3["NETWORK_INTERFACES"]["NET6"][
                     "ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-            sg3_path + "/applications/vm_service_3/" \
+        batch.update(sg3_path + "/applications/vm_service_3/" \
                        "vm_network_interfaces/net32",
             props="ipaddresses={0} ipv6addresses={1}".format(
                 lvtd_vm3["NETWORK_INTERFACES"]["NET32"]["ipaddresses"],
                 lvtd_vm3["NETWORK_INTERFACES"]["NET32"]["ipv6addresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-            sg3_path + "/applications/vm_service_3/" \
+        batch.update(sg3_path + "/applications/vm_service_3/" \
                        "vm_network_interfaces/net33",
             props="ipaddresses={0} ipv6addresses={1}".format(
                 lvtd_vm3["NETWORK_INTERFACES"]["NET33"]["ipaddresses"],
                 lvtd_vm3["NETWORK_INTERFACES"]["NET33"]["ipv6addresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-            sg3_path + "/applications/vm_service_3/" \
+        batch.update(sg3_path + "/applications/vm_service_3/" \
                        "vm_network_interfaces/net34",
             props="ipaddresses={0} ipv6addresses={1}".format(
                 lvtd_vm3["NETWORK_INTERFACES"]["NET34"]["ipaddresses"],
@@ -1489,8 +2044,7 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Configure vm with ipv6 addresses for CS_VM3
         #   result: CS_VM3 is configured with ipv6 addresses
-        self.execute_cli_update_cmd(self.management_server,
-            sg3_path +
+        batch.update(sg3_path +
                 "/applications/vm_service_3/vm_network_interfaces/net_dhcp",
             props="ipv6addresses='{0}' ipaddresses={1}".format(
                 lvtd_vm3["NETWORK_INTERFACES"][
@@ -1503,72 +2057,71 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Define default gateway for CS_VM3
         #   result: default gateway is defined for CS_VM3
-        self.execute_cli_update_cmd(self.management_server,
-            vm_service_3_path + "/vm_network_interfaces/net6",
+        batch.update(vm_service_3_path + "/vm_network_interfaces/net6",
             props="gateway={0}".format(
                 lvtd_vm3["NETWORK_INTERFACES"]["NET6"][
                     "gateway"]))
 
         # id: litpcds-7186
         # description: Configure yum repos for CS_VM3
-        # test_steps:
-        #   step: Create yum repos for CS_VM3
-        #   result: Yum repos are defined for CS_VM3
-        self.execute_cli_create_cmd(self.management_server,
-                                vm_service_3_path + "/vm_yum_repos/repo_3PP ",
-                                "vm-yum-repo",
-                                props="name='{0}' base_url='{1}'".format(
-                                    lvtd_vm3["YUM_REPOS"]["3PP"]["name"],
-                                    lvtd_vm3["YUM_REPOS"]["3PP"][
-                                        "base_url"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                                vm_service_3_path + "/vm_yum_repos/repo_LITP ",
-                                "vm-yum-repo",
-                                props="name='{0}' base_url='{1}'".format(
-                                    lvtd_vm3["YUM_REPOS"]["LITP"]["name"],
-                                    lvtd_vm3["YUM_REPOS"]["LITP"][
-                                        "base_url"]), add_to_cleanup=False)
+        # test_steps:
+        #   step: Create yum repos for CS_VM3
+        #   result: Yum repos are defined for CS_VM3
+        batch.create(vm_service_3_path + "/vm_yum_repos/repo_3PP ",
+                     "vm-yum-repo",
+                     props="name='{0}' base_url='{1}'".format(
+                         lvtd_vm3["YUM_REPOS"]["3PP"]["name"],
+                         lvtd_vm3["YUM_REPOS"]["3PP"][
+                             "base_url"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_3_path + "/vm_yum_repos/repo_LITP ",
+                     "vm-yum-repo",
+                     props="name='{0}' base_url='{1}'".format(
+                         lvtd_vm3["YUM_REPOS"]["LITP"]["name"],
+                         lvtd_vm3["YUM_REPOS"]["LITP"][
+                             "base_url"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7186
         # description: Configure vm packages for CS_VM3
         # test_steps:
         #   step: Create vm packages for CS_VM3
         #   result: VM packages are defined for CS_VM3
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_3_path + "/vm_packages/pkg_empty_rpm4",
-                            "vm-package", props="name='{0}'".format(
-                lvtd_vm3["PACKAGES"]["PKG4"]["name"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_3_path + "/vm_packages/pkg_empty_rpm5",
-                            "vm-package", props="name='{0}'".format(
-                lvtd_vm3["PACKAGES"]["PKG5"]["name"]), add_to_cleanup=False)
+        batch.create(vm_service_3_path + "/vm_packages/pkg_empty_rpm4",
+                     "vm-package", props="name='{0}'".format(
+                         lvtd_vm3["PACKAGES"]["PKG4"]["name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_3_path + "/vm_packages/pkg_empty_rpm5",
+                     "vm-package", props="name='{0}'".format(
+                         lvtd_vm3["PACKAGES"]["PKG5"]["name"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7815
         # description: Configure nfs mounts for CS_VM3
         # test_steps:
         #   step: Create nfs mounts for CS_VM3
         #   result: NFS mounts are created for CS_VM3
-        self.execute_cli_create_cmd(self.management_server,
-                        vm_service_3_path + "/vm_nfs_mounts/vm_nfs_mount_4",
-                        "vm-nfs-mount",
-                        props="device_path='{0}' mount_point='{1}' " \
-                              "mount_options='{2}'".format(
-                            lvtd_vm3["NFS_MOUNTS"]["VM_MOUNT4"][
-                                "device_path"],
-                            lvtd_vm3["NFS_MOUNTS"]["VM_MOUNT4"][
-                                "mount_point"],
-                            lvtd_vm3["NFS_MOUNTS"]["VM_MOUNT4"][
-                                "mount_options"]), add_to_cleanup=False)
+        batch.create(vm_service_3_path + "/vm_nfs_mounts/vm_nfs_mount_4",
+                     "vm-nfs-mount",
+                     props="device_path='{0}' mount_point='{1}' " \
+                           "mount_options='{2}'".format(
+                               lvtd_vm3["NFS_MOUNTS"]["VM_MOUNT4"][
+                                   "device_path"],
+                               lvtd_vm3["NFS_MOUNTS"]["VM_MOUNT4"][
+                                   "mount_point"],
+                               lvtd_vm3["NFS_MOUNTS"]["VM_MOUNT4"][
+                                   "mount_options"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-6627
         # description: Configure ssh keys for CS_VM3
         # test_steps:
         #   step: Create ssh keys for CS_VM3
         #   result: SSH keys are created for CS_VM3
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_3_path + "/vm_ssh_keys/ssh_key_rsa_14",
-                            "vm-ssh-key", props="ssh_key='{0}'".format(
-                lvtd_vm3["SSH_KEYS"]["KEY4"]["ssh_key"]), add_to_cleanup=False)
+        batch.create(vm_service_3_path + "/vm_ssh_keys/ssh_key_rsa_14",
+                     "vm-ssh-key", props="ssh_key='{0}'".format(
+                         lvtd_vm3["SSH_KEYS"]["KEY4"]["ssh_key"]),
+                     add_to_cleanup=False)
 
         # id: torf-107476
         # title: test_03_p_create_vm_ram_mount_RH6_ramfs
@@ -1578,15 +2131,15 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Create VM with new vm-ram-mount item with a RHEL 6 system
         #   result: vm-ram-mount is created successfully with RHEL 6 system
-        self.execute_cli_create_cmd(self.management_server, vm_service_3_path
-                                    + "/vm_ram_mounts/vm_ram_mount_3",
-                                    "vm-ram-mount",
-                                    props="type='{0}' mount_point='{1}' "
-                                    .format(
-                                      lvtd_vm3["VM_RAM_MOUNT"]["type"],
-                                      lvtd_vm3["VM_RAM_MOUNT"]
-                                      ["mount_point"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_3_path
+                     + "/vm_ram_mounts/vm_ram_mount_3",
+                     "vm-ram-mount",
+                     props="type='{0}' mount_point='{1}' "
+                     .format(
+                       lvtd_vm3["VM_RAM_MOUNT"]["type"],
+                       lvtd_vm3["VM_RAM_MOUNT"]
+                       ["mount_point"]),
+                     add_to_cleanup=False)
 
         # id: torf-180365, torf-180367
         # title: test_03_p_create_vm_scripts_runtime
@@ -1598,13 +2151,13 @@ class Libvirtsetup(LibvirtGenericTest):
         # step: Create a VM with vm-custom-script item with
         # custom_script_names="csfname2.sh,csfname3.sh,csfname1.sh,
         # csfname4.sh,csfname5.sh""
-        self.execute_cli_create_cmd(self.management_server, vm_service_3_path
-                                    + "/vm_custom_script/vm_custom_script_1",
-                                    "vm-custom-script",
-                                    props="custom_script_names='{0}'"
-                                    .format(lvtd_vm3["VM_CUSTOM_SCRIPT"]
-                                      ["custom_script_names"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_3_path
+                     + "/vm_custom_script/vm_custom_script_1",
+                     "vm-custom-script",
+                     props="custom_script_names='{0}'"
+                     .format(lvtd_vm3["VM_CUSTOM_SCRIPT"]
+                       ["custom_script_names"]),
+                     add_to_cleanup=False)
 
         #########################
         #                       #
@@ -1622,173 +2175,172 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Create VCS-clustered-service CS_VM4
         #   result: CS_VM4 is created in the litp model
-        self.execute_cli_create_cmd(self.management_server, sg4_path,
-                        "vcs-clustered-service",
-                        props="active={0} standby={1} name='{2}' " \
-                              "online_timeout={3} dependency_list='{4}' " \
-                              "node_list='{5}'".format(
-                            lvtd_vm4["CLUSTER_SERVICE"]["active"],
-                            lvtd_vm4["CLUSTER_SERVICE"]["standby"],
-                            lvtd_vm4["CLUSTER_SERVICE"]["name"],
-                            lvtd_vm4["CLUSTER_SERVICE"][
-                                "online_timeout"],
-                            lvtd_vm4["CLUSTER_SERVICE"][
-                                "dependency_list"],
-                            lvtd_vm4["CLUSTER_SERVICE"][
-                                "node_list"]), add_to_cleanup=False)
+        batch.create(sg4_path,
+                     "vcs-clustered-service",
+                     props="active={0} standby={1} name='{2}' " \
+                           "online_timeout={3} dependency_list='{4}' " \
+                           "node_list='{5}'".format(
+                               lvtd_vm4["CLUSTER_SERVICE"]["active"],
+                               lvtd_vm4["CLUSTER_SERVICE"]["standby"],
+                               lvtd_vm4["CLUSTER_SERVICE"]["name"],
+                               lvtd_vm4["CLUSTER_SERVICE"][
+                                   "online_timeout"],
+                               lvtd_vm4["CLUSTER_SERVICE"][
+                                   "dependency_list"],
+                               lvtd_vm4["CLUSTER_SERVICE"][
+                                   "node_list"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7180
         # description: Create vm-service-4 for CS_VM4
         # test_steps:
         #   step: Create vm-service-4 in the litp model
         #   result: vm-service-4 is created in the litp model
-        self.execute_cli_create_cmd(self.management_server, vm_service_4_path,
-                        "vm-service",
-                        props="cleanup_command='{0}' status_command='{1}' " \
-                              "hostnames='{2}' internal_status_check='{3}' " \
-                              "start_command='{4}' service_name='{5}' " \
-                              "stop_command='{6}' ram='{7}' image_name='{8}' "\
-                              "cpus='{9}'".format(
-                            lvtd_vm4["VM_SERVICE"][
-                                "cleanup_command"],
-                            lvtd_vm4["VM_SERVICE"][
-                                "status_command"],
-                            lvtd_vm4["VM_SERVICE"]["hostnames"],
-                            lvtd_vm4["VM_SERVICE"][
-                                "internal_status_check"],
-                            lvtd_vm4["VM_SERVICE"][
-                                "start_command"],
-                            lvtd_vm4["VM_SERVICE"]["service_name"],
-                            lvtd_vm4["VM_SERVICE"]["stop_command"],
-                            lvtd_vm4["VM_SERVICE"]["ram"],
-                            lvtd_vm4["VM_SERVICE"]["image_name"],
-                            lvtd_vm4["VM_SERVICE"]["cpus"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_4_path,
+                     "vm-service",
+                     props="cleanup_command='{0}' status_command='{1}' " \
+                           "hostnames='{2}' internal_status_check='{3}' " \
+                           "start_command='{4}' service_name='{5}' " \
+                           "stop_command='{6}' ram='{7}' image_name='{8}' "\
+                           "cpus='{9}'".format(
+                               lvtd_vm4["VM_SERVICE"][
+                                   "cleanup_command"],
+                               lvtd_vm4["VM_SERVICE"][
+                                   "status_command"],
+                               lvtd_vm4["VM_SERVICE"]["hostnames"],
+                               lvtd_vm4["VM_SERVICE"][
+                                   "internal_status_check"],
+                               lvtd_vm4["VM_SERVICE"][
+                                   "start_command"],
+                               lvtd_vm4["VM_SERVICE"]["service_name"],
+                               lvtd_vm4["VM_SERVICE"]["stop_command"],
+                               lvtd_vm4["VM_SERVICE"]["ram"],
+                               lvtd_vm4["VM_SERVICE"]["image_name"],
+                               lvtd_vm4["VM_SERVICE"]["cpus"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7180
         # description: Create ha-service-config for CS_VM4 in litp model
         # test_steps:
         #   step: Create ha-service-config for CS_VM4
         #   result: ha-service-config is created for CS_VM4
-        self.execute_cli_create_cmd(self.management_server,
-                                    sg4_path + "/ha_configs/service_config",
-                                    "ha-service-config", add_to_cleanup=False)
+        batch.create(sg4_path + "/ha_configs/service_config",
+                     "ha-service-config",
+                     add_to_cleanup=False)
 
         # id: litpcds-7180
         # description: Inheirit vm-service-4 onto CS_VM4
         # test_steps:
         #   step: Inherit vm-service-4 onto CS_VM4 clustered service
         #   result: vm-service-4 is inherited onto CS_VM4
-        self.execute_cli_inherit_cmd(self.management_server,
-                             sg4_path + "/applications/vm_service_4",
-                             vm_service_4_path, add_to_cleanup=False)
+        batch.inherit(sg4_path + "/applications/vm_service_4",
+                      vm_service_4_path,
+                      add_to_cleanup=False)
 
         # id: litpcds-7184
         # description: Configure VM aliases for CS_VM4
         # test_steps:
         #   step: Configure VM aliases for CS_VM4
         #   result: VM aliases are created for CS_VM4
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_4_path + "/vm_aliases/ms",
-                            "vm-alias",
-                            props="alias_names='{0}' address='{1}'".format(
-                                lvtd_vm4["VM_ALIAS"]["MS1"][
-                                    "alias_names"],
-                                lvtd_vm4["VM_ALIAS"]["MS1"][
-                                    "address"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_4_path + "/vm_aliases/sfs",
-                            "vm-alias",
-                            props="alias_names='{0}' address='{1}'".format(
-                                lvtd_vm4["VM_ALIAS"]["SFS"][
-                                    "alias_names"],
-                                lvtd_vm4["VM_ALIAS"]["SFS"][
-                                    "address"]), add_to_cleanup=False)
+        batch.create(vm_service_4_path + "/vm_aliases/ms",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'".format(
+                         lvtd_vm4["VM_ALIAS"]["MS1"][
+                             "alias_names"],
+                         lvtd_vm4["VM_ALIAS"]["MS1"][
+                             "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_4_path + "/vm_aliases/sfs",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'".format(
+                         lvtd_vm4["VM_ALIAS"]["SFS"][
+                             "alias_names"],
+                         lvtd_vm4["VM_ALIAS"]["SFS"][
+                             "address"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7179
         # description: Configure network interfaces for CS_VM4
         # test_steps:
         #   step: Configure network interfaces for CS_VM4
         #   result: Network interfaces are created for CS_VM4
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_4_path + "/vm_network_interfaces/net7",
-                            "vm-network-interface",
-                            props="host_device='{0}' network_name='{1}' " \
-                                  "device_name='{2}'".format(
-                                lvtd_vm4["NETWORK_INTERFACES"]["NET7"][
-                                    "host_device"],
-                                lvtd_vm4["NETWORK_INTERFACES"]["NET7"][
-                                    "network_name"],
-                                lvtd_vm4["NETWORK_INTERFACES"]["NET7"][
-                                    "device_name"]), add_to_cleanup=False)
-
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_4_path + "/vm_network_interfaces/net8",
-                            "vm-network-interface",
-                            props="host_device='{0}' network_name='{1}' " \
-                                  "device_name='{2}'".format(
-                                lvtd_vm4["NETWORK_INTERFACES"]["NET8"][
-                                    "host_device"],
-                                lvtd_vm4["NETWORK_INTERFACES"]["NET8"][
-                                    "network_name"],
-                                lvtd_vm4["NETWORK_INTERFACES"]["NET8"][
-                                    "device_name"]), add_to_cleanup=False)
-
-        self.execute_cli_create_cmd(self.management_server,
-                        vm_service_4_path + "/vm_network_interfaces/net9",
-                        "vm-network-interface",
-                        props="host_device='{0}' network_name='{1}' " \
-                              "device_name='{2}'".format(
-                            lvtd_vm4["NETWORK_INTERFACES"]["NET9"][
-                                "host_device"],
-                            lvtd_vm4["NETWORK_INTERFACES"]["NET9"][
-                                "network_name"],
-                            lvtd_vm4["NETWORK_INTERFACES"]["NET9"][
-                                "device_name"]), add_to_cleanup=False)
-
-        self.execute_cli_create_cmd(self.management_server,
-                        vm_service_4_path + "/vm_network_interfaces/net10",
-                        "vm-network-interface",
-                        props="host_device='{0}' network_name='{1}' " \
-                              "device_name='{2}'".format(
-                            lvtd_vm4["NETWORK_INTERFACES"][
-                                "NET10"]["host_device"],
-                            lvtd_vm4["NETWORK_INTERFACES"][
-                                "NET10"]["network_name"],
-                            lvtd_vm4["NETWORK_INTERFACES"][
-                                "NET10"]["device_name"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                        vm_service_4_path + "/vm_network_interfaces/net_dhcp",
-                        "vm-network-interface",
-                        props="host_device='{0}' network_name='{1}' " \
-                              "device_name='{2}' gateway6='{3}'".format(
-                            lvtd_vm4["NETWORK_INTERFACES"][
-                                "NET_DHCP"]["host_device"],
-                            lvtd_vm4["NETWORK_INTERFACES"][
-                                "NET_DHCP"]["network_name"],
-                            lvtd_vm4["NETWORK_INTERFACES"][
-                                "NET_DHCP"]["device_name"],
-                            lvtd_vm4["NETWORK_INTERFACES"][
-                                "NET_DHCP"]["gateway6"]), add_to_cleanup=False)
-
-        self.execute_cli_update_cmd(self.management_server,
-                sg4_path +
+        batch.create(vm_service_4_path + "/vm_network_interfaces/net7",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm4["NETWORK_INTERFACES"]["NET7"][
+                                   "host_device"],
+                               lvtd_vm4["NETWORK_INTERFACES"]["NET7"][
+                                   "network_name"],
+                               lvtd_vm4["NETWORK_INTERFACES"]["NET7"][
+                                   "device_name"]),
+                     add_to_cleanup=False)
+
+        batch.create(vm_service_4_path + "/vm_network_interfaces/net8",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm4["NETWORK_INTERFACES"]["NET8"][
+                                   "host_device"],
+                               lvtd_vm4["NETWORK_INTERFACES"]["NET8"][
+                                   "network_name"],
+                               lvtd_vm4["NETWORK_INTERFACES"]["NET8"][
+                                   "device_name"]),
+                     add_to_cleanup=False)
+
+        batch.create(vm_service_4_path + "/vm_network_interfaces/net9",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm4["NETWORK_INTERFACES"]["NET9"][
+                                   "host_device"],
+                               lvtd_vm4["NETWORK_INTERFACES"]["NET9"][
+                                   "network_name"],
+                               lvtd_vm4["NETWORK_INTERFACES"]["NET9"][
+                                   "device_name"]),
+                     add_to_cleanup=False)
+
+        batch.create(vm_service_4_path + "/vm_network_interfaces/net10",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm4["NETWORK_INTERFACES"][
+                                   "NET10"]["host_device"],
+                               lvtd_vm4["NETWORK_INTERFACES"][
+                                   "NET10"]["network_name"],
+                               lvtd_vm4["NETWORK_INTERFACES"][
+                                   "NET10"]["device_name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_4_path + "/vm_network_interfaces/net_dhcp",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}' gateway6='{3}'".format(
+                               lvtd_vm4["NETWORK_INTERFACES"][
+                                   "NET_DHCP"]["host_device"],
+                               lvtd_vm4["NETWORK_INTERFACES"][
+                                   "NET_DHCP"]["network_name"],
+                               lvtd_vm4["NETWORK_INTERFACES"][
+                                   "NET_DHCP"]["device_name"],
+                               lvtd_vm4["NETWORK_INTERFACES"][
+                                   "NET_DHCP"]["gateway6"]),
+                     add_to_cleanup=False)
+
+        batch.update(sg4_path +
                     "/applications/vm_service_4/vm_network_interfaces/net7",
                 props="ipaddresses={0}".format(
                     lvtd_vm4["NETWORK_INTERFACES"]["NET7"][
                         "ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
+        batch.update(
             sg4_path + "/applications/vm_service_4/vm_network_interfaces/net8",
             props="ipaddresses={0}".format(
                 lvtd_vm4["NETWORK_INTERFACES"]["NET8"][
                     "ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
+        batch.update(
             sg4_path + "/applications/vm_service_4/vm_network_interfaces/net9",
             props="ipaddresses={0}".format(
                 lvtd_vm4["NETWORK_INTERFACES"]["NET9"][
                     "ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-            sg4_path +
+        batch.update(sg4_path +
                 "/applications/vm_service_4/vm_network_interfaces/net10",
             props="ipaddresses={0}".format(
                 lvtd_vm4["NETWORK_INTERFACES"][
@@ -1799,8 +2351,7 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Configure vm with ipv6 addresses for CS_VM4
         #   result: CS_VM4 is configured with ipv6 addresses
-        self.execute_cli_update_cmd(self.management_server,
-            sg4_path +
+        batch.update(sg4_path +
                 "/applications/vm_service_4/vm_network_interfaces/net_dhcp",
             props="ipv6addresses='{0}'".format(
                 lvtd_vm4["NETWORK_INTERFACES"][
@@ -1811,8 +2362,7 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Configure default gateway for my VM service CS_VM4
         #   result: Default gateway is created for CS_VM4
-        self.execute_cli_update_cmd(self.management_server,
-            sg4_path +
+        batch.update(sg4_path +
                 "/applications/vm_service_4/vm_network_interfaces/net10",
             props="gateway={0}".format(
                 lvtd_vm4["NETWORK_INTERFACES"][
@@ -1822,125 +2372,125 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Create yum repos for CS_VM4
         #   result: Yum repos are defined for CS_VM4
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_4_path + "/vm_yum_repos/repo_3PP",
-                            "vm-yum-repo",
-                            props="name='{0}' base_url='{1}' ".format(
-                                lvtd_vm4["YUM_REPOS"]["3PP"]["name"],
-                                lvtd_vm4["YUM_REPOS"]["3PP"][
-                                    "base_url"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_4_path + "/vm_yum_repos/repo_LITP",
-                            "vm-yum-repo",
-                            props="name='{0}' base_url='{1}'".format(
-                                lvtd_vm4["YUM_REPOS"]["LITP"]["name"],
-                                lvtd_vm4["YUM_REPOS"]["LITP"][
-                                    "base_url"]), add_to_cleanup=False)
+        batch.create(vm_service_4_path + "/vm_yum_repos/repo_3PP",
+                     "vm-yum-repo",
+                     props="name='{0}' base_url='{1}' ".format(
+                         lvtd_vm4["YUM_REPOS"]["3PP"]["name"],
+                         lvtd_vm4["YUM_REPOS"]["3PP"][
+                             "base_url"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_4_path + "/vm_yum_repos/repo_LITP",
+                     "vm-yum-repo",
+                     props="name='{0}' base_url='{1}'".format(
+                         lvtd_vm4["YUM_REPOS"]["LITP"]["name"],
+                         lvtd_vm4["YUM_REPOS"]["LITP"][
+                             "base_url"]),
+                     add_to_cleanup=False)
         # id: litpcds-7186
         # description: Configure vm packages for CS_VM4
         # test_steps:
         #   step: Create vm packages for CS_VM4
         #   result: VM packages are defined for CS_VM4
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_4_path + "/vm_packages/pkg_empty_rpm6",
-                            "vm-package", props="name='{0}'".format(
-                lvtd_vm4["PACKAGES"]["PKG6"]["name"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_4_path + "/vm_packages/pkg_empty_rpm7",
-                            "vm-package", props="name='{0}'".format(
-                lvtd_vm4["PACKAGES"]["PKG7"]["name"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_4_path + "/vm_packages/pkg_empty_rpm8",
-                            "vm-package", props="name='{0}'".format(
-                lvtd_vm4["PACKAGES"]["PKG8"]["name"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_4_path + "/vm_packages/pkg_empty_rpm9",
-                            "vm-package", props="name='{0}'".format(
-                lvtd_vm4["PACKAGES"]["PKG9"]["name"]), add_to_cleanup=False)
+        batch.create(vm_service_4_path + "/vm_packages/pkg_empty_rpm6",
+                     "vm-package", props="name='{0}'".format(
+                         lvtd_vm4["PACKAGES"]["PKG6"]["name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_4_path + "/vm_packages/pkg_empty_rpm7",
+                     "vm-package", props="name='{0}'".format(
+                         lvtd_vm4["PACKAGES"]["PKG7"]["name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_4_path + "/vm_packages/pkg_empty_rpm8",
+                     "vm-package", props="name='{0}'".format(
+                         lvtd_vm4["PACKAGES"]["PKG8"]["name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_4_path + "/vm_packages/pkg_empty_rpm9",
+                     "vm-package", props="name='{0}'".format(
+                         lvtd_vm4["PACKAGES"]["PKG9"]["name"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7815
         # description: Configure nfs mounts for CS_VM4
         # test_steps:
         #   step: Create nfs mounts for CS_VM4
         #   result: NFS mounts are created for CS_VM4
-        self.execute_cli_create_cmd(self.management_server,
-                        vm_service_4_path + "/vm_nfs_mounts/vm_nfs_mount_5",
-                        "vm-nfs-mount",
-                        props="device_path='{0}' mount_point='{1}' " \
-                              "mount_options='{2}'".format(
-                            lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT5"][
-                                "device_path"],
-                            lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT5"][
-                                "mount_point"],
-                            lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT5"][
-                                "mount_options"]), add_to_cleanup=False)
-
-        self.execute_cli_create_cmd(self.management_server,
-                        vm_service_4_path + "/vm_nfs_mounts/vm_nfs_mount_6",
-                        "vm-nfs-mount",
-                        props="device_path='{0}' mount_point='{1}'".format(
-                            lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT6"][
-                                "device_path"],
-                            lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT6"][
-                                "mount_point"]), add_to_cleanup=False)
-
-        self.execute_cli_create_cmd(self.management_server,
-                        vm_service_4_path + "/vm_nfs_mounts/vm_nfs_mount_7",
-                        "vm-nfs-mount",
-                        props="device_path='{0}' mount_point='{1}' " \
-                              "mount_options='{2}'".format(
-                            lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT7"][
-                                "device_path"],
-                            lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT7"][
-                                "mount_point"],
-                            lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT7"][
-                                "mount_options"]), add_to_cleanup=False)
-
-        self.execute_cli_create_cmd(self.management_server,
-                        vm_service_4_path + "/vm_nfs_mounts/vm_nfs_mount_8",
-                        "vm-nfs-mount",
-                        props="device_path='{0}' mount_point='{1}' "
-                              "mount_options='{2}'".format(
-                            lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT8"][
-                                "device_path"],
-                            lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT8"][
-                                "mount_point"],
-                            lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT8"][
-                                "mount_options"]), add_to_cleanup=False)
-
-        self.execute_cli_create_cmd(self.management_server,
-                        vm_service_4_path + "/vm_nfs_mounts/vm_nfs_mount_9",
-                        "vm-nfs-mount",
-                        props="device_path='{0}' mount_point='{1}'".format(
-                            lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT9"][
-                                "device_path"],
-                            lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT9"][
-                                "mount_point"]), add_to_cleanup=False)
+        batch.create(vm_service_4_path + "/vm_nfs_mounts/vm_nfs_mount_5",
+                     "vm-nfs-mount",
+                     props="device_path='{0}' mount_point='{1}' " \
+                           "mount_options='{2}'".format(
+                               lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT5"][
+                                   "device_path"],
+                               lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT5"][
+                                   "mount_point"],
+                               lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT5"][
+                                   "mount_options"]),
+                     add_to_cleanup=False)
+
+        batch.create(vm_service_4_path + "/vm_nfs_mounts/vm_nfs_mount_6",
+                     "vm-nfs-mount",
+                     props="device_path='{0}' mount_point='{1}'".format(
+                         lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT6"][
+                             "device_path"],
+                         lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT6"][
+                             "mount_point"]),
+                     add_to_cleanup=False)
+
+        batch.create(vm_service_4_path + "/vm_nfs_mounts/vm_nfs_mount_7",
+                     "vm-nfs-mount",
+                     props="device_path='{0}' mount_point='{1}' " \
+                           "mount_options='{2}'".format(
+                               lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT7"][
+                                   "device_path"],
+                               lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT7"][
+                                   "mount_point"],
+                               lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT7"][
+                                   "mount_options"]),
+                     add_to_cleanup=False)
+
+        batch.create(vm_service_4_path + "/vm_nfs_mounts/vm_nfs_mount_8",
+                     "vm-nfs-mount",
+                     props="device_path='{0}' mount_point='{1}' "
+                           "mount_options='{2}'".format(
+                               lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT8"][
+                                   "device_path"],
+                               lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT8"][
+                                   "mount_point"],
+                               lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT8"][
+                                   "mount_options"]),
+                     add_to_cleanup=False)
+
+        batch.create(vm_service_4_path + "/vm_nfs_mounts/vm_nfs_mount_9",
+                     "vm-nfs-mount",
+                     props="device_path='{0}' mount_point='{1}'".format(
+                         lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT9"][
+                             "device_path"],
+                         lvtd_vm4["NFS_MOUNTS"]["VM_MOUNT9"][
+                             "mount_point"]),
+                     add_to_cleanup=False)
         # id: litpcds-6627
         # description: Configure ssh keys for CS_VM4
         # test_steps:
         #   step: Create ssh keys for CS_VM4
         #   result: SSH keys are created for CS_VM4
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_4_path + "/vm_ssh_keys/ssh_key_rsa_15",
-                            "vm-ssh-key", props="ssh_key='{0}'".format(
-                lvtd_vm4["SSH_KEYS"]["KEY5"]["ssh_key"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_4_path + "/vm_ssh_keys/ssh_key_rsa_16",
-                            "vm-ssh-key", props="ssh_key='{0}'".format(
-                lvtd_vm4["SSH_KEYS"]["KEY6"]["ssh_key"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_4_path + "/vm_ssh_keys/ssh_key_rsa_17",
-                            "vm-ssh-key", props="ssh_key='{0}'".format(
-                lvtd_vm4["SSH_KEYS"]["KEY7"]["ssh_key"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_4_path + "/vm_ssh_keys/ssh_key_rsa_18",
-                            "vm-ssh-key", props="ssh_key='{0}'".format(
-                lvtd_vm4["SSH_KEYS"]["KEY8"]["ssh_key"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_4_path + "/vm_ssh_keys/ssh_key_rsa_19",
-                            "vm-ssh-key", props="ssh_key='{0}'".format(
-                lvtd_vm4["SSH_KEYS"]["KEY9"]["ssh_key"]), add_to_cleanup=False)
+        batch.create(vm_service_4_path + "/vm_ssh_keys/ssh_key_rsa_15",
+                     "vm-ssh-key", props="ssh_key='{0}'".format(
+                         lvtd_vm4["SSH_KEYS"]["KEY5"]["ssh_key"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_4_path + "/vm_ssh_keys/ssh_key_rsa_16",
+                     "vm-ssh-key", props="ssh_key='{0}'".format(
+                         lvtd_vm4["SSH_KEYS"]["KEY6"]["ssh_key"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_4_path + "/vm_ssh_keys/ssh_key_rsa_17",
+                     "vm-ssh-key", props="ssh_key='{0}'".format(
+                         lvtd_vm4["SSH_KEYS"]["KEY7"]["ssh_key"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_4_path + "/vm_ssh_keys/ssh_key_rsa_18",
+                     "vm-ssh-key", props="ssh_key='{0}'".format(
+                         lvtd_vm4["SSH_KEYS"]["KEY8"]["ssh_key"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_4_path + "/vm_ssh_keys/ssh_key_rsa_19",
+                     "vm-ssh-key", props="ssh_key='{0}'".format(
+                         lvtd_vm4["SSH_KEYS"]["KEY9"]["ssh_key"]),
+                     add_to_cleanup=False)
 
         # id: torf-180365
         # title: test_03_p_create_vm_scripts_runtime
@@ -1952,13 +2502,13 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         # step: Create a VM with vm-custom-script item with
         # custom_script_names="csfname5.sh,csfname6.sh"
-        self.execute_cli_create_cmd(self.management_server, vm_service_4_path
-                                    + "/vm_custom_script/vm_custom_script_1",
-                                    "vm-custom-script",
-                                    props="custom_script_names='{0}'"
-                                    .format(lvtd_vm4["VM_CUSTOM_SCRIPT"]
-                                      ["custom_script_names"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_4_path
+                     + "/vm_custom_script/vm_custom_script_1",
+                     "vm-custom-script",
+                     props="custom_script_names='{0}'"
+                     .format(lvtd_vm4["VM_CUSTOM_SCRIPT"]
+                       ["custom_script_names"]),
+                     add_to_cleanup=False)
 
         #########################
         #                       #
@@ -1977,210 +2527,200 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Create VCS-clustered-service CS_VM5
         #   result: CS_VM5 is created in the litp model
-        self.execute_cli_create_cmd(self.management_server, sg5_path,
-                            "vcs-clustered-service",
-                            props="active={0} standby={1} name='{2}' " \
-                                  "online_timeout={3} dependency_list='{4}' " \
-                                  "node_list='{5}'".format(
-                                lvtd_vm5["CLUSTER_SERVICE"]["active"],
-                                lvtd_vm5["CLUSTER_SERVICE"]["standby"],
-                                lvtd_vm5["CLUSTER_SERVICE"]["name"],
-                                lvtd_vm5["CLUSTER_SERVICE"][
-                                    "online_timeout"],
-                                lvtd_vm5["CLUSTER_SERVICE"][
-                                    "dependency_list"],
-                                lvtd_vm5["CLUSTER_SERVICE"][
-                                    "node_list"]), add_to_cleanup=False)
+        batch.create(sg5_path,
+                     "vcs-clustered-service",
+                     props="active={0} standby={1} name='{2}' " \
+                           "online_timeout={3} dependency_list='{4}' " \
+                           "node_list='{5}'".format(
+                               lvtd_vm5["CLUSTER_SERVICE"]["active"],
+                               lvtd_vm5["CLUSTER_SERVICE"]["standby"],
+                               lvtd_vm5["CLUSTER_SERVICE"]["name"],
+                               lvtd_vm5["CLUSTER_SERVICE"][
+                                   "online_timeout"],
+                               lvtd_vm5["CLUSTER_SERVICE"][
+                                   "dependency_list"],
+                               lvtd_vm5["CLUSTER_SERVICE"][
+                                   "node_list"]),
+                     add_to_cleanup=False)
         # id: litpcds-7180
         # description: Create vm-service-5 for CS_VM5
         # test_steps:
         #   step: Create vm-service-5 in the litp model
         #   result: vm-service-5 is created in the litp model
-        self.execute_cli_create_cmd(self.management_server,
-                        vm_service_5_path + "", "vm-service",
-                        props="cleanup_command='{0}' status_command='{1}' " \
-                              "hostnames='{2}' internal_status_check='{3}' " \
-                              "start_command='{4}' service_name='{5}' " \
-                              "stop_command='{6}' ram='{7}' " \
-                              "image_name='{8}' cpus='{9}' " \
-                              "cpuset={10}".format(
-                            lvtd_vm5["VM_SERVICE"][
-                                "cleanup_command"],
-                            lvtd_vm5["VM_SERVICE"][
-                                "status_command"],
-                            lvtd_vm5["VM_SERVICE"]["hostnames"],
-                            lvtd_vm5["VM_SERVICE"][
-                                "internal_status_check"],
-                            lvtd_vm5["VM_SERVICE"][
-                                "start_command"],
-                            lvtd_vm5["VM_SERVICE"]["service_name"],
-                            lvtd_vm5["VM_SERVICE"]["stop_command"],
-                            lvtd_vm5["VM_SERVICE"]["ram"],
-                            lvtd_vm5["VM_SERVICE"]["image_name"],
-                            lvtd_vm5["VM_SERVICE"]["cpus"],
-                            lvtd_vm5["VM_SERVICE"]["cpuset"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_5_path + "", "vm-service",
+                     props="cleanup_command='{0}' status_command='{1}' " \
+                           "hostnames='{2}' internal_status_check='{3}' " \
+                           "start_command='{4}' service_name='{5}' " \
+                           "stop_command='{6}' ram='{7}' " \
+                           "image_name='{8}' cpus='{9}' " \
+                           "cpuset={10}".format(
+                               lvtd_vm5["VM_SERVICE"][
+                                   "cleanup_command"],
+                               lvtd_vm5["VM_SERVICE"][
+                                   "status_command"],
+                               lvtd_vm5["VM_SERVICE"]["hostnames"],
+                               lvtd_vm5["VM_SERVICE"][
+                                   "internal_status_check"],
+                               lvtd_vm5["VM_SERVICE"][
+                                   "start_command"],
+                               lvtd_vm5["VM_SERVICE"]["service_name"],
+                               lvtd_vm5["VM_SERVICE"]["stop_command"],
+                               lvtd_vm5["VM_SERVICE"]["ram"],
+                               lvtd_vm5["VM_SERVICE"]["image_name"],
+                               lvtd_vm5["VM_SERVICE"]["cpus"],
+                               lvtd_vm5["VM_SERVICE"]["cpuset"]),
+                     add_to_cleanup=False)
         # id: litpcds-7180
         # description: Create ha-service-config for CS_VM5 in litp model
         # test_steps:
         #   step: Create ha-service-config for CS_VM5
         #   result: ha-service-config is created for CS_VM5
-        self.execute_cli_create_cmd(self.management_server,
-                                    sg5_path + "/ha_configs/service_config",
-                                    "ha-service-config",
-                                    props="restart_limit={0}".format(
-                                        lvtd_vm5["HA_CONFIG"][
-                                            "restart_limit"]),
-                                    add_to_cleanup=False)
+        batch.create(sg5_path + "/ha_configs/service_config",
+                     "ha-service-config",
+                     props="restart_limit={0}".format(
+                         lvtd_vm5["HA_CONFIG"][
+                             "restart_limit"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7180
         # description: Inheirit vm-service-5 onto CS_VM5
         # test_steps:
         #   step: Inherit vm-service-5 onto CS_VM5 clustered service
         #   result: vm-service-5 is inherited onto CS_VM5
-        self.execute_cli_inherit_cmd(self.management_server,
-                             sg5_path + "/applications/vm_service_5",
-                             vm_service_5_path, add_to_cleanup=False)
+        batch.inherit(sg5_path + "/applications/vm_service_5",
+                      vm_service_5_path,
+                      add_to_cleanup=False)
 
         # id: litpcds-7184
         # description: Configure VM aliases for CS_VM5
         # test_steps:
         #   step: Configure VM aliases for CS_VM5
         #   result: VM aliases are created for CS_VM5
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_5_path + "/vm_aliases/db1",
-                            "vm-alias",
-                            props="alias_names='{0}' address='{1}'".format(
-                                lvtd_vm5["VM_ALIAS"]["DB1"][
-                                    "alias_names"],
-                                lvtd_vm5["VM_ALIAS"]["DB1"][
-                                    "address"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_5_path + "/vm_aliases/db4",
-                            "vm-alias",
-                            props="alias_names='{0}' address='{1}'".format(
-                                lvtd_vm5["VM_ALIAS"]["DB4"][
-                                    "alias_names"],
-                                lvtd_vm5["VM_ALIAS"]["DB4"][
-                                    "address"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_5_path + "/vm_aliases/db2",
-                            "vm-alias",
-                            props="alias_names='{0}' address='{1}'".format(
-                                lvtd_vm5["VM_ALIAS"]["DB2"][
-                                    "alias_names"],
-                                lvtd_vm5["VM_ALIAS"]["DB2"][
-                                    "address"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_5_path + "/vm_aliases/ms",
-                            "vm-alias",
-                            props="alias_names='{0}' address='{1}'".format(
-                                lvtd_vm5["VM_ALIAS"]["MS1"][
-                                    "alias_names"],
-                                lvtd_vm5["VM_ALIAS"]["MS1"][
-                                    "address"]), add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_5_path + "/vm_aliases/sfs",
-                            "vm-alias",
-                            props="alias_names='{0}' address='{1}'".format(
-                                lvtd_vm5["VM_ALIAS"]["SFS"][
-                                    "alias_names"],
-                                lvtd_vm5["VM_ALIAS"]["SFS"][
-                                    "address"]), add_to_cleanup=False)
+        batch.create(vm_service_5_path + "/vm_aliases/db1",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'".format(
+                         lvtd_vm5["VM_ALIAS"]["DB1"][
+                             "alias_names"],
+                         lvtd_vm5["VM_ALIAS"]["DB1"][
+                             "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_5_path + "/vm_aliases/db4",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'".format(
+                         lvtd_vm5["VM_ALIAS"]["DB4"][
+                             "alias_names"],
+                         lvtd_vm5["VM_ALIAS"]["DB4"][
+                             "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_5_path + "/vm_aliases/db2",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'".format(
+                         lvtd_vm5["VM_ALIAS"]["DB2"][
+                             "alias_names"],
+                         lvtd_vm5["VM_ALIAS"]["DB2"][
+                             "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_5_path + "/vm_aliases/ms",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'".format(
+                         lvtd_vm5["VM_ALIAS"]["MS1"][
+                             "alias_names"],
+                         lvtd_vm5["VM_ALIAS"]["MS1"][
+                             "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_5_path + "/vm_aliases/sfs",
+                     "vm-alias",
+                     props="alias_names='{0}' address='{1}'".format(
+                         lvtd_vm5["VM_ALIAS"]["SFS"][
+                             "alias_names"],
+                         lvtd_vm5["VM_ALIAS"]["SFS"][
+                             "address"]),
+                     add_to_cleanup=False)
         # id: litpcds-7179
         # description: Configure network interfaces for CS_VM5
         # test_steps:
         #   step: Configure network interfaces for CS_VM5
         #   result: Network interfaces are created for CS_VM5
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_5_path + "/vm_network_interfaces/net11",
-                            "vm-network-interface",
-                            props="host_device='{0}' network_name='{1}' " \
-                                  "device_name='{2}'".format(
-                                lvtd_vm5["NETWORK_INTERFACES"][
-                                    "NET11"]["host_device"],
-                                lvtd_vm5["NETWORK_INTERFACES"][
-                                    "NET11"]["network_name"],
-                                lvtd_vm5["NETWORK_INTERFACES"][
-                                    "NET11"]["device_name"]),
-                                    add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_5_path + "/vm_network_interfaces/net12",
-                            "vm-network-interface",
-                            props="host_device='{0}' network_name='{1}' " \
-                                  "device_name='{2}'".format(
-                                lvtd_vm5["NETWORK_INTERFACES"][
-                                    "NET12"]["host_device"],
-                                lvtd_vm5["NETWORK_INTERFACES"][
-                                    "NET12"]["network_name"],
-                                lvtd_vm5["NETWORK_INTERFACES"][
-                                    "NET12"]["device_name"]),
-                                    add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_5_path + "/vm_network_interfaces/net13",
-                            "vm-network-interface",
-                            props="host_device='{0}' network_name='{1}' " \
-                                  "device_name='{2}'".format(
-                                lvtd_vm5["NETWORK_INTERFACES"][
-                                    "NET13"]["host_device"],
-                                lvtd_vm5["NETWORK_INTERFACES"][
-                                    "NET13"]["network_name"],
-                                lvtd_vm5["NETWORK_INTERFACES"][
-                                    "NET13"]["device_name"]),
-                                    add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_5_path + "/vm_network_interfaces/net14",
-                            "vm-network-interface",
-                            props="host_device='{0}' network_name='{1}' " \
-                                  "device_name='{2}'".format(
-                                lvtd_vm5["NETWORK_INTERFACES"][
-                                    "NET14"]["host_device"],
-                                lvtd_vm5["NETWORK_INTERFACES"][
-                                    "NET14"]["network_name"],
-                                lvtd_vm5["NETWORK_INTERFACES"][
-                                    "NET14"]["device_name"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_5_path + "/vm_network_interfaces/net11",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm5["NETWORK_INTERFACES"][
+                                   "NET11"]["host_device"],
+                               lvtd_vm5["NETWORK_INTERFACES"][
+                                   "NET11"]["network_name"],
+                               lvtd_vm5["NETWORK_INTERFACES"][
+                                   "NET11"]["device_name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_5_path + "/vm_network_interfaces/net12",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm5["NETWORK_INTERFACES"][
+                                   "NET12"]["host_device"],
+                               lvtd_vm5["NETWORK_INTERFACES"][
+                                   "NET12"]["network_name"],
+                               lvtd_vm5["NETWORK_INTERFACES"][
+                                   "NET12"]["device_name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_5_path + "/vm_network_interfaces/net13",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm5["NETWORK_INTERFACES"][
+                                   "NET13"]["host_device"],
+                               lvtd_vm5["NETWORK_INTERFACES"][
+                                   "NET13"]["network_name"],
+                               lvtd_vm5["NETWORK_INTERFACES"][
+                                   "NET13"]["device_name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_5_path + "/vm_network_interfaces/net14",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}'".format(
+                               lvtd_vm5["NETWORK_INTERFACES"][
+                                   "NET14"]["host_device"],
+                               lvtd_vm5["NETWORK_INTERFACES"][
+                                   "NET14"]["network_name"],
+                               lvtd_vm5["NETWORK_INTERFACES"][
+                                   "NET14"]["device_name"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7185
         # description: Configure default gateway for my VM service CS_VM5
         # test_steps:
         #   step: Configure default gateway for my VM service CS_VM5
         #   result: Default gateway is created for CS_VM5
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_5_path + "/vm_network_interfaces/net15",
-                            "vm-network-interface",
-                            props="host_device='{0}' network_name='{1}' " \
-                                  "device_name='{2}' gateway6='{3}'".format(
-                                lvtd_vm5["NETWORK_INTERFACES"][
-                                    "NET15"]["host_device"],
-                                lvtd_vm5["NETWORK_INTERFACES"][
-                                    "NET15"]["network_name"],
-                                lvtd_vm5["NETWORK_INTERFACES"][
-                                    "NET15"]["device_name"],
-                                lvtd_vm5["NETWORK_INTERFACES"][
-                                    "NET15"]["gateway6"]),
-                                    add_to_cleanup=False)
-
-        self.execute_cli_update_cmd(self.management_server,
-            sg5_path +
+        batch.create(vm_service_5_path + "/vm_network_interfaces/net15",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' " \
+                           "device_name='{2}' gateway6='{3}'".format(
+                               lvtd_vm5["NETWORK_INTERFACES"][
+                                   "NET15"]["host_device"],
+                               lvtd_vm5["NETWORK_INTERFACES"][
+                                   "NET15"]["network_name"],
+                               lvtd_vm5["NETWORK_INTERFACES"][
+                                   "NET15"]["device_name"],
+                               lvtd_vm5["NETWORK_INTERFACES"][
+                                   "NET15"]["gateway6"]),
+                     add_to_cleanup=False)
+
+        batch.update(sg5_path +
                 "/applications/vm_service_5/vm_network_interfaces/net11",
             props="ipaddresses={0}".format(
                 lvtd_vm5["NETWORK_INTERFACES"][
                     "NET11"]["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-            sg5_path +
+        batch.update(sg5_path +
                 "/applications/vm_service_5/vm_network_interfaces/net12",
             props="ipaddresses={0}".format(
                 lvtd_vm5["NETWORK_INTERFACES"][
                     "NET12"]["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-            sg5_path +
+        batch.update(sg5_path +
                 "/applications/vm_service_5/vm_network_interfaces/net13",
             props="ipaddresses={0}".format(
                 lvtd_vm5["NETWORK_INTERFACES"][
                     "NET13"]["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-            sg5_path +
+        batch.update(sg5_path +
                 "/applications/vm_service_5/vm_network_interfaces/net14",
             props="ipaddresses={0}".format(
                 lvtd_vm5["NETWORK_INTERFACES"][
@@ -2191,8 +2731,7 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Configure vm with ipv6 addresses for CS_VM4
         #   result: CS_VM4 is configured with ipv6 addresses
-        self.execute_cli_update_cmd(self.management_server,
-            sg5_path +
+        batch.update(sg5_path +
                 "/applications/vm_service_5/vm_network_interfaces/net15",
             props="ipv6addresses='{0}' ipaddresses='{1}'".format(
                 lvtd_vm5["NETWORK_INTERFACES"][
@@ -2205,8 +2744,7 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Configure default gateway for my VM service CS_VM5
         #   result: Default gateway is created for CS_VM5
-        self.execute_cli_update_cmd(self.management_server,
-            vm_service_5_path + "/vm_network_interfaces/net13",
+        batch.update(vm_service_5_path + "/vm_network_interfaces/net13",
             props="gateway={0}".format(
                 lvtd_vm5["NETWORK_INTERFACES"][
                     "NET13"]["gateway"]))
@@ -2216,64 +2754,62 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         #   step: Create yum repos for CS_VM5
         #   result: Yum repos are defined for CS_VM5
-        self.execute_cli_create_cmd(self.management_server,
-                        vm_service_5_path + "/vm_yum_repos/repo_3PP",
-                        "vm-yum-repo",
-                        props="name='{0}' base_url='{1}'".format(
-                            lvtd_vm5["YUM_REPOS"]["3PP"]["name"],
-                            lvtd_vm5["YUM_REPOS"]["3PP"][
-                                "base_url"]), add_to_cleanup=False)
+        batch.create(vm_service_5_path + "/vm_yum_repos/repo_3PP",
+                     "vm-yum-repo",
+                     props="name='{0}' base_url='{1}'".format(
+                         lvtd_vm5["YUM_REPOS"]["3PP"]["name"],
+                         lvtd_vm5["YUM_REPOS"]["3PP"][
+                             "base_url"]),
+                     add_to_cleanup=False)
 
         # id: litpcds-7815
         # description: Configure nfs mounts for CS_VM5
         # test_steps:
         #   step: Create nfs mounts for CS_VM5
         #   result: NFS mounts are created for CS_VM5
-        self.execute_cli_create_cmd(self.management_server,
-                        vm_service_5_path + "/vm_nfs_mounts/vm_nfs_mount_10",
-                        "vm-nfs-mount",
-                        props="device_path='{0}' mount_point='{1}'".format(
-                            lvtd_vm5["NFS_MOUNTS"]["VM_MOUNT10"][
-                                "device_path"],
-                            lvtd_vm5["NFS_MOUNTS"]["VM_MOUNT10"][
-                                "mount_point"]), add_to_cleanup=False)
-
-        self.execute_cli_create_cmd(self.management_server,
-                        vm_service_5_path + "/vm_nfs_mounts/vm_nfs_mount_11",
-                        "vm-nfs-mount",
-                        props="device_path='{0}' mount_point='{1}' " \
-                              "mount_options='{2}'".format(
-                            lvtd_vm5["NFS_MOUNTS"]["VM_MOUNT11"][
-                                "device_path"],
-                            lvtd_vm5["NFS_MOUNTS"]["VM_MOUNT11"][
-                                "mount_point"],
-                            lvtd_vm5["NFS_MOUNTS"]["VM_MOUNT11"][
-                                "mount_options"]),
-                                    add_to_cleanup=False)
-
-        self.execute_cli_create_cmd(self.management_server,
-                        vm_service_5_path + "/vm_nfs_mounts/vm_nfs_mount_12",
-                        "vm-nfs-mount",
-                        props="device_path='{0}' mount_point='{1}' " \
-                              "mount_options='{2}'".format(
-                            lvtd_vm5["NFS_MOUNTS"]["VM_MOUNT12"][
-                                "device_path"],
-                            lvtd_vm5["NFS_MOUNTS"]["VM_MOUNT12"][
-                                "mount_point"],
-                            lvtd_vm5["NFS_MOUNTS"]["VM_MOUNT12"][
-                                "mount_options"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_5_path + "/vm_nfs_mounts/vm_nfs_mount_10",
+                     "vm-nfs-mount",
+                     props="device_path='{0}' mount_point='{1}'".format(
+                         lvtd_vm5["NFS_MOUNTS"]["VM_MOUNT10"][
+                             "device_path"],
+                         lvtd_vm5["NFS_MOUNTS"]["VM_MOUNT10"][
+                             "mount_point"]),
+                     add_to_cleanup=False)
+
+        batch.create(vm_service_5_path + "/vm_nfs_mounts/vm_nfs_mount_11",
+                     "vm-nfs-mount",
+                     props="device_path='{0}' mount_point='{1}' " \
+                           "mount_options='{2}'".format(
+                               lvtd_vm5["NFS_MOUNTS"]["VM_MOUNT11"][
+                                   "device_path"],
+                               lvtd_vm5["NFS_MOUNTS"]["VM_MOUNT11"][
+                                   "mount_point"],
+                               lvtd_vm5["NFS_MOUNTS"]["VM_MOUNT11"][
+                                   "mount_options"]),
+                     add_to_cleanup=False)
+
+        batch.create(vm_service_5_path + "/vm_nfs_mounts/vm_nfs_mount_12",
+                     "vm-nfs-mount",
+                     props="device_path='{0}' mount_point='{1}' " \
+                           "mount_options='{2}'".format(
+                               lvtd_vm5["NFS_MOUNTS"]["VM_MOUNT12"][
+                                   "device_path"],
+                               lvtd_vm5["NFS_MOUNTS"]["VM_MOUNT12"][
+                                   "mount_point"],
+                               lvtd_vm5["NFS_MOUNTS"]["VM_MOUNT12"][
+                                   "mount_options"]),
+                     add_to_cleanup=False)
         # id: litpcds-6627
         # description: Configure ssh keys for CS_VM5
         # test_steps:
         #   step: Create ssh keys for CS_VM5
         #   result: SSH keys are created for CS_VM5
-        self.execute_cli_create_cmd(self.management_server,
-                            vm_service_5_path + "/vm_ssh_keys/ssh_key_rsa_10",
-                            "vm-ssh-key",
-                            props="ssh_key='{0}'".format(
-                                lvtd_vm5["SSH_KEYS"]["KEY10"][
-                                    "ssh_key"]), add_to_cleanup=False)
+        batch.create(vm_service_5_path + "/vm_ssh_keys/ssh_key_rsa_10",
+                     "vm-ssh-key",
+                     props="ssh_key='{0}'".format(
+                         lvtd_vm5["SSH_KEYS"]["KEY10"][
+                             "ssh_key"]),
+                     add_to_cleanup=False)
 
         # id: torf-180365
         # title: test_03_p_create_vm_scripts_runtime
@@ -2282,13 +2818,13 @@ class Libvirtsetup(LibvirtGenericTest):
         # test_steps:
         # step: Create a VM with vm-custom-script item with
         # custom_script_names="system_memory.sh"
-        self.execute_cli_create_cmd(self.management_server, vm_service_5_path
-                                    + "/vm_custom_script/vm_custom_script_1",
-                                    "vm-custom-script",
-                                    props="custom_script_names='{0}'"
-                                    .format(lvtd_vm5["VM_CUSTOM_SCRIPT"]
-                                      ["custom_script_names"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_5_path
+                     + "/vm_custom_script/vm_custom_script_1",
+                     "vm-custom-script",
+                     props="custom_script_names='{0}'"
+                     .format(lvtd_vm5["VM_CUSTOM_SCRIPT"]
+                       ["custom_script_names"]),
+                     add_to_cleanup=False)
 
         # TORF-271798: As a LITP engineer I want to update the Libvirt
         # plugin and adapter to create the network-config V1 file to be
@@ -2301,151 +2837,15 @@ class Libvirtsetup(LibvirtGenericTest):
         #                       #
         #########################
         lvtd_vm6 = libvirt_test_data.INITIAL_SERVICE_GROUP_6_DATA
-        rhel7_4_image_path = \
-            self.libvirt_info["software_images_path"] + "vm_image_5"
-
-        # Create RHEL7.4 vm image in the model
-        vm6_image = lvtd_vm6["VM_IMAGE"]
-        self.execute_cli_create_cmd(self.management_server,
-                                    url=rhel7_4_image_path,
-                                    class_type="vm-image",
-                                    props="source_uri={0} name={1}".format(
-                                        vm6_image["image_url"],
-                                        vm6_image["image_name"]),
-                                    add_to_cleanup=False)
-
-        # Create a vm service based on rhel7.4 image
-        vm6_service = lvtd_vm6["VM_SERVICE"]
-        vm_service_6_path = self.libvirt_info[
-                                "software_services_path"] + "vm_service_6"
-        self.execute_cli_create_cmd(self.management_server,
-                                    url=vm_service_6_path,
-                                    class_type="vm-service",
-                                    props="cpus={0} service_name={1} ram={2} "
-                                          "cleanup_command='{3}' "
-                                          "image_name={4} hostnames={5} "
-                                          "internal_status_check={6}".
-                                    format(vm6_service["cpus"],
-                                           vm6_service["service_name"],
-                                           vm6_service["ram"],
-                                           vm6_service["cleanup_command"],
-                                           vm6_service["image_name"],
-                                           vm6_service["hostnames"],
-                                           vm6_service["internal_status_check"]
-                                           ), add_to_cleanup=False)
-
-        # Create a FO vcs clustered service
-        vm6_cluster_srv = lvtd_vm6["CLUSTER_SERVICE"]
-        sg6_path = \
-            self.libvirt_info["cluster_services_path"] + "/CS_VM6"
-        self.execute_cli_create_cmd(self.management_server,
-                                    url=sg6_path,
-                                    class_type="vcs-clustered-service",
-                                    props="active={0} standby={1} name={2} "
-                                          "node_list={3} online_timeout={4} "
-                                          "dependency_list={5}".
-                                    format(vm6_cluster_srv["active"],
-                                           vm6_cluster_srv["standby"],
-                                           vm6_cluster_srv["name"],
-                                           vm6_cluster_srv["node_list"],
-                                           vm6_cluster_srv["online_timeout"],
-                                           vm6_cluster_srv["dependency_list"]),
-                                    add_to_cleanup=False)
-
-        # Create ha service config for CS_VM6 in the model
-        self.execute_cli_create_cmd(self.management_server,
-                                    sg6_path + "/ha_configs/service_config",
-                                    "ha-service-config", add_to_cleanup=False)
-
-        # Add the service group to a vcs cluster
-        sg6_applications_path = sg6_path + "/applications/vm_service_6"
-        self.execute_cli_inherit_cmd(self.management_server,
-                                     sg6_applications_path,
-                                     vm_service_6_path, add_to_cleanup=False)
-
-        # Configure vm aliases
-        for alias_name, alias_props in lvtd_vm6["VM_ALIAS"].items():
-            vm_alias_path = "/vm_aliases/{0}".format(alias_name)
-            self.execute_cli_create_cmd(self.management_server,
-                                        url=vm_service_6_path + vm_alias_path,
-                                        class_type="vm-alias",
-                                        props="alias_names='{0}' address='{1}'"
-                                        .format(
-                                            alias_props["alias_names"],
-                                            alias_props["address"]),
-                                        add_to_cleanup=False)
-
-        # Configure vm network interfaces
-        vm_net1_path = vm_service_6_path + "/vm_network_interfaces/net1"
-        vm_net1_props = lvtd_vm6["NETWORK_INTERFACES"]["NET1"]
-        self.execute_cli_create_cmd(self.management_server,
-                                    url=vm_net1_path,
-                                    class_type="vm-network-interface",
-                                    props="host_device={0} device_name={1} "
-                                          "network_name={2}".
-                                    format(vm_net1_props["host_device"],
-                                           vm_net1_props["device_name"],
-                                           vm_net1_props["network_name"]),
-                                    add_to_cleanup=False)
-
-        vm_net2_path = vm_service_6_path + "/vm_network_interfaces/net2"
-        vm_net2_props = lvtd_vm6["NETWORK_INTERFACES"]["NET2"]
-        self.execute_cli_create_cmd(self.management_server,
-                                    url=vm_net2_path,
-                                    class_type="vm-network-interface",
-                                    props="host_device={0} device_name={1} "
-                                          "network_name={2}".
-                                    format(vm_net2_props["host_device"],
-                                           vm_net2_props["device_name"],
-                                           vm_net2_props["network_name"]),
-                                    add_to_cleanup=False)
-
-        vm_net3_path = vm_service_6_path + "/vm_network_interfaces/net_dhcp"
-        vm_net3_props = lvtd_vm6["NETWORK_INTERFACES"]["NET_DHCP"]
-        self.execute_cli_create_cmd(self.management_server,
-                                    url=vm_net3_path,
-                                    class_type="vm-network-interface",
-                                    props="host_device={0} device_name={1} "
-                                          "network_name={2}".
-                                    format(vm_net3_props["host_device"],
-                                           vm_net3_props["device_name"],
-                                           vm_net3_props["network_name"]),
-                                    add_to_cleanup=False)
-
-        # Update vm net interfaces
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg6_applications_path +
-                                    "/vm_network_interfaces/net1",
-                                    props="ipaddresses={0}".format(
-                                        vm_net1_props["ipaddresses"]))
-
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg6_applications_path +
-                                    "/vm_network_interfaces/net2",
-                                    props="ipv6addresses={0}".format(
-                                        vm_net2_props["ipv6addresses"]))
-
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg6_applications_path +
-                                    "/vm_network_interfaces/net_dhcp",
-                                    props="ipaddresses={0}".format(
-                                        vm_net3_props["ipaddresses"]))
-
-        # Define gateway on the vm network interface
-        self.execute_cli_update_cmd(self.management_server,
-                                    url=vm_net1_path,
-                                    props="gateway={0}".format(
-                                        vm_net1_props["gateway"]))
+        sg6_builder = ServiceGroupBuilder(
+            lvtd_vm6, "vm_service_6", image_id="vm_image_5",
+            names={"VM_CUSTOM_SCRIPT": "vm_custom_script_1"})
+        sg6_builder.compile(batch,
+                            self.libvirt_info["software_images_path"],
+                            self.libvirt_info["software_services_path"],
+                            self.libvirt_info["cluster_services_path"])
 
-        # Configure vm custom scripts
-        self.execute_cli_create_cmd(self.management_server,
-                                    url=vm_service_6_path +
-                                    "/vm_custom_script/vm_custom_script_1",
-                                    class_type="vm-custom-script",
-                                    props="custom_script_names='{0}'".format(
-                                        lvtd_vm6["VM_CUSTOM_SCRIPT"][
-                                            "custom_scripts"]),
-                                    add_to_cleanup=False)
+        self.apply_model_batch(batch)
 
     def add_ms_service_group(self):
         """
@@ -3508,19 +3908,15 @@ class Libvirtsetup(LibvirtGenericTest):
         Returns: Nothing
         """
 
-        target_cmd = 'findmnt -s -l -n -T {0}'.format(mnt_point)
-
         self.add_vm_to_node_list(hostname,
                                  username=test_constants.LIBVIRT_VM_USERNAME,
                                  password=test_constants.LIBVIRT_VM_PASSWORD,
                                  ipv4=ipaddr)
 
-        actual, _, _ = self.run_command(hostname, target_cmd,
-                                        username=test_constants.
-                                        LIBVIRT_VM_USERNAME,
-                                        password=test_constants.
-                                        LIBVIRT_VM_PASSWORD,
-                                        execute_timeout=60)
+        actual = self.get_fstab_entry(
+            hostname, mnt_point,
+            username=test_constants.LIBVIRT_VM_USERNAME,
+            password=test_constants.LIBVIRT_VM_PASSWORD)
         mnt_pnt_flag = self.is_text_in_list(mnt_point, actual)
 
         if mnt_pnt_flag:
@@ -3542,7 +3938,7 @@ class Libvirtsetup(LibvirtGenericTest):
         """
         filename = '/var/lib/libvirt/instances/{0}/user-data'.format(
                                                               service_name)
-        file_contents = self.get_file_contents(node, filename)
+        file_contents = self.get_remote_file(node, filename)
         return self.is_text_in_list(vm_custom_script, file_contents)
 
     def _confirm_vm_custom_script_ran(self, vm_hostname, vm_ip,
@@ -4078,10 +4474,8 @@ class Libvirtsetup(LibvirtGenericTest):
 
         # TORF-271798 TC_07: assert rhel7.4 based vm service is up and running
         sg6_name = 'Grp_CS_c1_CS_VM6'
-        sg6_states = self.run_vcs_hagrp_display_command(primary_node, sg6_name,
-                                                        "State")
-        online_nodes = [sg_state['SYSTEM'] for sg_state in sg6_states['State']
-                        if "|ONLINE|" in sg_state['VALUE']]
+        online_nodes = self.get_vcs_states(primary_node).online_systems(
+            sg6_name)
         self.assertEqual(len(online_nodes), int(lvtd_vm6['CLUSTER_SERVICE'][
             'active']), 'Service Group {0} is not ONLINE on all active nodes'.
                          format(sg6_name))
@@ -16,6 +16,8 @@ from litp_generic_test import attr
 import test_constants
 import libvirt_test_data
 from testset_libvirt_initial_setup import LibvirtGenericTest
+from libvirt_model_utils import lazy_property
+from libvirt_model_builder import ModelBatch
 
 
 class Libvirtupdate1(LibvirtGenericTest):
@@ -33,12 +35,7 @@ class Libvirtupdate1(LibvirtGenericTest):
         # 1. Call super class setup
         super(Libvirtupdate1, self).setUp()
 
-        self.model = self.get_litp_model_information()
-        self.management_server = self.model["ms"][0]["name"]
-
-        self.srvc_path = self.model["libvirt"]["software_services_path"]
-        self.clus_srvs = self.model["libvirt"]["cluster_services_path"]
-        self.sw_image = self.model["libvirt"]["software_images_path"]
+        self.management_server = self.get_management_node_filename()
 
         self.up_dict1 = libvirt_test_data.UPDATED_SERVICE_GROUP_1_DATA
         self.up_dict2 = libvirt_test_data.UPDATED_SERVICE_GROUP_2_DATA
@@ -50,15 +47,51 @@ class Libvirtupdate1(LibvirtGenericTest):
         self.disk1_dict = libvirt_test_data.DISK1_DATA
         self.up_ms_serv_dict = libvirt_test_data.UPDATE1_MS_VM1_DATA
 
-        self.vm_service_urls = self.find(self.management_server,
-                                         self.clus_srvs, "vm-service")
         self.stored_macs_dir = "/tmp/stored_mac_addresses/"
-        self.vm_rule_coll_paths = self.find(self.management_server,
-                                        '/software',
-                                        'collection-of-vm-firewall-rule')
-        self.rule_coll_path = [rule_coll_path for rule_coll_path in
+
+    @lazy_property
+    def model(self):
+        """ LITP model information, loaded on first use """
+        return self.get_cached_model_info(
+            self.get_litp_model_information)
+
+    @lazy_property
+    def srvc_path(self):
+        """ Path of the software services """
+        return self.model["libvirt"]["software_services_path"]
+
+    @lazy_property
+    def clus_srvs(self):
+        """ Path of the cluster services """
+        return self.model["libvirt"]["cluster_services_path"]
+
+    @lazy_property
+    def sw_image(self):
+        """ Path of the software images """
+        return self.model["libvirt"]["software_images_path"]
+
+    @lazy_property.pinned
+    def vm_service_urls(self):
+        """ Urls of the clustered vm-services """
+        return self.get_model_snapshot(self.management_server).find(
+            self.clus_srvs, "vm-service")
+
+    @lazy_property.pinned
+    def vm_rule_coll_paths(self):
+        """ Urls of the vm firewall rule collections """
+        return self.get_model_snapshot(self.management_server).find(
+            '/software', 'collection-of-vm-firewall-rule')
+
+    @lazy_property.pinned
+    def rule_coll_path(self):
+        """ Firewall rule collection of vm_service_1 """
+        return [rule_coll_path for rule_coll_path in
         self.vm_rule_coll_paths if 'vm_service_1' in rule_coll_path][0]
-        self.sles_rule_coll_path = [rule_coll_path for rule_coll_path in
+
+    @lazy_property.pinned
+    def sles_rule_coll_path(self):
+        """ Firewall rule collection of the sles VM """
+        return [rule_coll_path for rule_coll_path in
                     self.vm_rule_coll_paths if self.up_dict7["VM_SERVICE"]
                                     ["service_name"] in rule_coll_path][0]
 
@@ -86,20 +119,18 @@ class Libvirtupdate1(LibvirtGenericTest):
         Get all running VMs
         """
         vms = []
+        snapshot = self.get_model_snapshot(self.management_server)
         for vm_service_url in self.vm_service_urls:
             cs_item_id = vm_service_url.rsplit('/', 3)[-3]
 
             # Select the first interface to ssh into node
-            vm_ifaces = self.find(self.management_server, vm_service_url,
-                                  'vm-network-interface',
-                                  assert_not_empty=False)
+            vm_ifaces = snapshot.find(vm_service_url, 'vm-network-interface')
             if not vm_ifaces:
                 # VM has no interface on which we can ssh into it
                 continue
 
             for iface in sorted(vm_ifaces):
-                vm_ipaddrs = self.get_props_from_url(
-                                        self.management_server,
+                vm_ipaddrs = snapshot.get_props(
                                         iface, 'ipaddresses').split(',')
                 if vm_ipaddrs[0] != "dhcp":
                     break
@@ -133,7 +164,7 @@ class Libvirtupdate1(LibvirtGenericTest):
         """
 
         if "SLES" in v_m:
-            os_vers, _, _ = self.run_command(v_m, "{0} {1}".format(
+            os_vers, _, _ = self.run_command_memoized(v_m, "{0} {1}".format(
                 test_constants.TAIL_PATH, test_constants.SLES_RELEASE_FILE),
                                          password=test_constants.
                                              LIBVIRT_SLES_VM_PASSWORD,
@@ -141,7 +172,7 @@ class Libvirtupdate1(LibvirtGenericTest):
                                          default_asserts=True)
             os_vers = os_vers[3]
         else:
-            os_vers, _, _ = self.run_command(v_m, "{0} {1}".format(
+            os_vers, _, _ = self.run_command_memoized(v_m, "{0} {1}".format(
                 test_constants.TAIL_PATH, test_constants.RH_RELEASE_FILE),
                                          add_to_cleanup=False,
                                          default_asserts=True)
@@ -320,6 +351,7 @@ class Libvirtupdate1(LibvirtGenericTest):
         Description:
             Update properties of the five service groups.
         """
+        batch = ModelBatch()
         #URL variables
         sg1_vm = self.clus_srvs + \
                             "/CS_VM1/applications/vm_service_1"
@@ -363,182 +395,167 @@ class Libvirtupdate1(LibvirtGenericTest):
             item_path = '{0}/{1}'.format(self.rule_coll_path,
                                          rule["item_name"])
 
-            self.execute_cli_create_cmd(self.management_server, item_path,
-                                        'vm-firewall-rule',
-                                        props=rule["props"],
-                                        add_to_cleanup=False)
+            batch.create(item_path,
+                         'vm-firewall-rule',
+                         props=rule["props"],
+                         add_to_cleanup=False)
 
         #LITPCDS-7179 - Update vm hostnames
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg1_vm,
-                                    props="hostnames='{0}'"
-                                    .format(dict_1_vms["hostnames"]))
+        batch.update(sg1_vm,
+                     props="hostnames='{0}'"
+                     .format(dict_1_vms["hostnames"]))
         #LITPCDS-7179 - Create vm network interfaces
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_1_path + \
-                                    "/vm_network_interfaces/net20",
-                                    "vm-network-interface",
-                                    props=prop_net.format(net20[
-                                                          "host_device"],
-                                                      net20[
-                                                          "network_name"],
-                                                      net20[
-                                                          "device_name"]),
-                                    add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_1_path + \
-                                    "/vm_network_interfaces/net21",
-                                    "vm-network-interface",
-                                    props=prop_net.format(net21[
-                                                          "host_device"],
-                                                      net21[
-                                                          "network_name"],
-                                                      net21[
-                                                          "device_name"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_1_path + \
+                     "/vm_network_interfaces/net20",
+                     "vm-network-interface",
+                     props=prop_net.format(net20[
+                                           "host_device"],
+                                       net20[
+                                           "network_name"],
+                                       net20[
+                                           "device_name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_1_path + \
+                     "/vm_network_interfaces/net21",
+                     "vm-network-interface",
+                     props=prop_net.format(net21[
+                                           "host_device"],
+                                       net21[
+                                           "network_name"],
+                                       net21[
+                                           "device_name"]),
+                     add_to_cleanup=False)
         # Update ip addresses of inherited vm network interfaces
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg1_vm + \
-                                    "/vm_network_interfaces/net20",
-                                    props="ipaddresses='{0}'".format(
-                                    net20["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg1_vm + \
-                                    "/vm_network_interfaces/net21",
-                                    props="ipaddresses='{0}'".format(
-                                    net21["ipaddresses"]))
+        batch.update(sg1_vm + \
+                     "/vm_network_interfaces/net20",
+                     props="ipaddresses='{0}'".format(
+                     net20["ipaddresses"]))
+        batch.update(sg1_vm + \
+                     "/vm_network_interfaces/net21",
+                     props="ipaddresses='{0}'".format(
+                     net21["ipaddresses"]))
 
         #LITPCDS-7184 - Create vm aliases
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_1_path + \
-                                    "/vm_aliases/db20",
-                                    "vm-alias",
-                                    props=prop_ali.format(dict_1_ali["DB20"][
-                                                          "alias_names"],
-                                                     dict_1_ali["DB20"][
-                                                         "address"]),
-                                    add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_1_path + \
-                                    "/vm_aliases/db21",
-                                    "vm-alias",
-                                    props=prop_ali.format(dict_1_ali["DB21"][
-                                                          "alias_names"],
-                                                           dict_1_ali["DB21"][
-                                                               "address"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_1_path + \
+                     "/vm_aliases/db20",
+                     "vm-alias",
+                     props=prop_ali.format(dict_1_ali["DB20"][
+                                           "alias_names"],
+                                      dict_1_ali["DB20"][
+                                          "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_1_path + \
+                     "/vm_aliases/db21",
+                     "vm-alias",
+                     props=prop_ali.format(dict_1_ali["DB21"][
+                                           "alias_names"],
+                                            dict_1_ali["DB21"][
+                                                "address"]),
+                     add_to_cleanup=False)
 
         # TORF-349676 - Create vm aliases with IPv6 address containing prefix
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_1_path + \
-                                    "/vm_aliases/ipv6a",
-                                    "vm-alias",
-                                    props=prop_ali.format(dict_1_ali["IPV6a"][
-                                                              "alias_names"],
-                                                          dict_1_ali["IPV6a"][
-                                                              "address"]),
-                                    add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_1_path + \
-                                    "/vm_aliases/ipv6b",
-                                    "vm-alias",
-                                    props=prop_ali.format(dict_1_ali["IPV6b"][
-                                                              "alias_names"],
-                                                          dict_1_ali["IPV6b"][
-                                                              "address"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_1_path + \
+                     "/vm_aliases/ipv6a",
+                     "vm-alias",
+                     props=prop_ali.format(dict_1_ali["IPV6a"][
+                                               "alias_names"],
+                                           dict_1_ali["IPV6a"][
+                                               "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_1_path + \
+                     "/vm_aliases/ipv6b",
+                     "vm-alias",
+                     props=prop_ali.format(dict_1_ali["IPV6b"][
+                                               "alias_names"],
+                                           dict_1_ali["IPV6b"][
+                                               "address"]),
+                     add_to_cleanup=False)
 
         #LITPCDS-7186 - Create vm packages
-        self.execute_cli_create_cmd(self.management_server,
-                                vm_service_1_path + \
-                                "/vm_packages/empty_testrepo1_rpm1",
-                                "vm-package",
-                                props="name='{0}'".format(dict_1_pkgs["PKG1"][
-                                                      "name"]),
-                                add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                                vm_service_1_path + \
-                                "/vm_packages/empty_rpm3",
-                                "vm-package",
-                                props="name='{0}'".format(dict_1_pkgs["PKG2"][
-                                                      "name"]),
-                                add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                                vm_service_1_path + \
-                                "/vm_packages/empty_testrepo2_rpm1",
-                                "vm-package",
-                                props="name='{0}'".format(dict_1_pkgs["PKG3"][
-                                                      "name"]),
-                                add_to_cleanup=False)
+        batch.create(vm_service_1_path + \
+                     "/vm_packages/empty_testrepo1_rpm1",
+                     "vm-package",
+                     props="name='{0}'".format(dict_1_pkgs["PKG1"][
+                         "name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_1_path + \
+                     "/vm_packages/empty_rpm3",
+                     "vm-package",
+                     props="name='{0}'".format(dict_1_pkgs["PKG2"][
+                         "name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_1_path + \
+                     "/vm_packages/empty_testrepo2_rpm1",
+                     "vm-package",
+                     props="name='{0}'".format(dict_1_pkgs["PKG3"][
+                         "name"]),
+                     add_to_cleanup=False)
         #LITPCDS-7186 - Create vm repos
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_1_path + \
-                                    "/vm_yum_repos/libvirt_repo1",
-                                    "vm-yum-repo",
-                                    props="name='{0}' base_url='{1}'".format(
-                                        dict_1_rpo["libvirt_repo1"]["name"],
-                                        dict_1_rpo[
-                                            "libvirt_repo1"]["base_url"]),
-                                    add_to_cleanup=False)
-
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_1_path + \
-                                    "/vm_yum_repos/libvirt_repo2",
-                                    "vm-yum-repo",
-                                    props="name='{0}' base_url='{1}'".format(
-                                        dict_1_rpo["libvirt_repo2"]["name"],
-                                        dict_1_rpo[
-                                            "libvirt_repo2"]["base_url"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_1_path + \
+                     "/vm_yum_repos/libvirt_repo1",
+                     "vm-yum-repo",
+                     props="name='{0}' base_url='{1}'".format(
+                         dict_1_rpo["libvirt_repo1"]["name"],
+                         dict_1_rpo[
+                             "libvirt_repo1"]["base_url"]),
+                     add_to_cleanup=False)
+
+        batch.create(vm_service_1_path + \
+                     "/vm_yum_repos/libvirt_repo2",
+                     "vm-yum-repo",
+                     props="name='{0}' base_url='{1}'".format(
+                         dict_1_rpo["libvirt_repo2"]["name"],
+                         dict_1_rpo[
+                             "libvirt_repo2"]["base_url"]),
+                     add_to_cleanup=False)
         #LITPCDS-585 - Update vm properties
-        self.execute_cli_update_cmd(self.management_server,
-                                    vm_service_1_path,
-                                    props="cpus='{0}' ram='{1}'".format(
-                                        dict_1_vms["cpus"], dict_1_vms["ram"]))
+        batch.update(vm_service_1_path,
+                     props="cpus='{0}' ram='{1}'".format(
+                         dict_1_vms["cpus"], dict_1_vms["ram"]))
 
         #LITPCDS-7535 - Update internal status check
-        self.execute_cli_update_cmd(self.management_server, vm_service_1_path,
-                                    props="internal_status_check={0}"
-                                    .format(
-                                        dict_1_vms["internal_status_check"]
-                                    ))
+        batch.update(vm_service_1_path,
+                     props="internal_status_check={0}"
+                     .format(
+                         dict_1_vms["internal_status_check"]
+                     ))
         # TORF-107476 - TC06 & TC15 - update vm_ram_mount RH7 to ramfs,
         # different mount point and mount options
-        self.execute_cli_update_cmd(self.management_server, vm_service_1_path +
-                                    "/vm_ram_mounts/vm_ram_mount_1",
-                                    props="type='{0}' mount_point='{1}' "
-                                          "mount_options='{2}'"
-                                    .format(dict1_vm_ram_mount["type"],
-                                            dict1_vm_ram_mount["mount_point"],
-                                            dict1_vm_ram_mount["mount_options"]
-                                            ))
+        batch.update(vm_service_1_path +
+                     "/vm_ram_mounts/vm_ram_mount_1",
+                     props="type='{0}' mount_point='{1}' "
+                           "mount_options='{2}'"
+                     .format(dict1_vm_ram_mount["type"],
+                             dict1_vm_ram_mount["mount_point"],
+                             dict1_vm_ram_mount["mount_options"]
+                             ))
 
         # TORF-107476 - TC06 & TC15 - update vm_ram_mount RH7 to ramfs,
         # different mount point and mount options
-        self.execute_cli_update_cmd(self.management_server, vm_service_1_path +
-                                    "/vm_ram_mounts/vm_ram_mount_1",
-                                    props="type='{0}' mount_point='{1}' "
-                                          "mount_options='{2}'"
-                                    .format(dict1_vm_ram_mount["type"],
-                                            dict1_vm_ram_mount["mount_point"],
-                                            dict1_vm_ram_mount["mount_options"]
-                                            ))
+        batch.update(vm_service_1_path +
+                     "/vm_ram_mounts/vm_ram_mount_1",
+                     props="type='{0}' mount_point='{1}' "
+                           "mount_options='{2}'"
+                     .format(dict1_vm_ram_mount["type"],
+                             dict1_vm_ram_mount["mount_point"],
+                             dict1_vm_ram_mount["mount_options"]
+                             ))
 
         # TORF-180365 - TC05
         # update vm custom script names
-        self.execute_cli_update_cmd(self.management_server, vm_service_1_path +
-                                    "/vm_custom_script/vm_custom_script_1",
-                                    props="custom_script_names='{0}' "
-                                    .format(
-                                        dict1["VM_CUSTOM_SCRIPT"][
-                                            "custom_script_names"]))
+        batch.update(vm_service_1_path +
+                     "/vm_custom_script/vm_custom_script_1",
+                     props="custom_script_names='{0}' "
+                     .format(
+                         dict1["VM_CUSTOM_SCRIPT"][
+                             "custom_script_names"]))
 
         # TORF-195147 - TC03
         # update status_timeout to be a valid timeout value
-        self.execute_cli_update_cmd(self.management_server, self.clus_srvs +
-                                    "/CS_VM1/ha_configs/service_config",
-                                    props="status_timeout='{0}'".format(
-                                        dict1["HA_CONFIG"]["status_timeout"]))
+        batch.update(self.clus_srvs +
+                     "/CS_VM1/ha_configs/service_config",
+                     props="status_timeout='{0}'".format(
+                         dict1["HA_CONFIG"]["status_timeout"]))
 
         #############################
         #                           #
@@ -553,33 +570,30 @@ class Libvirtupdate1(LibvirtGenericTest):
         sles_fw_path = vm_service_sles_path + "/vm_firewall_rules/"
 
         # TORF-406586 update vm custom script names
-        self.execute_cli_update_cmd(self.management_server,
-                                    vm_service_sles_path +
-                                    "/vm_custom_script/vm_custom_script",
-                                    props="custom_script_names='{0}' "
-                                    .format(dict7_cs["custom_script_names"]))
+        batch.update(vm_service_sles_path +
+                     "/vm_custom_script/vm_custom_script",
+                     props="custom_script_names='{0}' "
+                     .format(dict7_cs["custom_script_names"]))
 
         # TORF-404805 update vm zypper repo base_url
-        self.execute_cli_update_cmd(self.management_server,
-                                    vm_service_sles_path +
-                                    "/vm_zypper_repos/repo_NCM",
-                                    props="base_url='{0}' "
-                                    .format(dict7_zp["NCM"]["base_url"]))
+        batch.update(vm_service_sles_path +
+                     "/vm_zypper_repos/repo_NCM",
+                     props="base_url='{0}' "
+                     .format(dict7_zp["NCM"]["base_url"]))
 
         # TORF-404805 update package under zypper repo
-        self.execute_cli_update_cmd(self.management_server,
-                                    vm_service_sles_path +
-                                    "/vm_packages/pkg_empty_rpm",
-                                    props="name='{0}' "
-                                    .format(dict7_pk["PKG1"]["name"]))
+        batch.update(vm_service_sles_path +
+                     "/vm_packages/pkg_empty_rpm",
+                     props="name='{0}' "
+                     .format(dict7_pk["PKG1"]["name"]))
 
         # TORF-422322 - Create IPv4 & IPv6 vm-firewall-rules for sles
         for rule in libvirt_test_data.VM_FIREWALL_RULES_SLES_1:
-            self.execute_cli_create_cmd(self.management_server, sles_fw_path
-                                        + rule["item_name"],
-                                        'vm-firewall-rule',
-                                        props=rule["props"],
-                                        add_to_cleanup=False)
+            batch.create(sles_fw_path
+                         + rule["item_name"],
+                         'vm-firewall-rule',
+                         props=rule["props"],
+                         add_to_cleanup=False)
 
         #########################
         #                       #
@@ -595,66 +609,60 @@ class Libvirtupdate1(LibvirtGenericTest):
         dict2_vm_ram_mount = dict2["VM_RAM_MOUNT"]
 
         #LITPCDS-7179 - Update vm hostnames
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg2_vm,
-                                    props="hostnames='{0}'"
-                                    .format(dict2["VM_SERVICE"]["hostnames"]))
+        batch.update(sg2_vm,
+                     props="hostnames='{0}'"
+                     .format(dict2["VM_SERVICE"]["hostnames"]))
         #LITPCDS-7179 - Create vm network interfaces
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_2_path + \
-                                    "/vm_network_interfaces/net22",
-                                    "vm-network-interface",
-                                    props=prop_net.format(net22[
-                                                          "host_device"],
-                                                      net22[
-                                                          "network_name"],
-                                                      net22[
-                                                          "device_name"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_2_path + \
+                     "/vm_network_interfaces/net22",
+                     "vm-network-interface",
+                     props=prop_net.format(net22[
+                                           "host_device"],
+                                       net22[
+                                           "network_name"],
+                                       net22[
+                                           "device_name"]),
+                     add_to_cleanup=False)
         #LITPCDS-7179 - Update network interface ip address
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg2_vm + \
-                                    "/vm_network_interfaces/net22",
-                                    props="ipaddresses='{0}'".format(net23_ip))
+        batch.update(sg2_vm + \
+                     "/vm_network_interfaces/net22",
+                     props="ipaddresses='{0}'".format(net23_ip))
         #LITPCDS-7184 - Create vm aliases
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_2_path + \
-                                    "/vm_aliases/db22",
-                                    "vm-alias",
-                                    props=prop_ali.format(dict2_ali["DB22"][
-                                                          "alias_names"],
-                                                           dict2_ali["DB22"][
-                                                               "address"]),
-                                    add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_2_path + \
-                                    "/vm_aliases/db23",
-                                    "vm-alias",
-                                    props=prop_ali.format(dict2_ali["DB23"][
-                                                          "alias_names"],
-                                                           dict2_ali["DB23"][
-                                                               "address"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_2_path + \
+                     "/vm_aliases/db22",
+                     "vm-alias",
+                     props=prop_ali.format(dict2_ali["DB22"][
+                                           "alias_names"],
+                                            dict2_ali["DB22"][
+                                                "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_2_path + \
+                     "/vm_aliases/db23",
+                     "vm-alias",
+                     props=prop_ali.format(dict2_ali["DB23"][
+                                           "alias_names"],
+                                            dict2_ali["DB23"][
+                                                "address"]),
+                     add_to_cleanup=False)
         #LITPCDS-7186 - Create vm yum repos
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_2_path + \
-                                    "/vm_yum_repos/libvirt_repo1",
-                                    "vm-yum-repo",
-                                    props="name='{0}' base_url='{1}'".format(
-                                        dict2_rpo["libvirt_repo1"]["name"],
-                                        dict2_rpo[
-                                            "libvirt_repo1"]["base_url"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_2_path + \
+                     "/vm_yum_repos/libvirt_repo1",
+                     "vm-yum-repo",
+                     props="name='{0}' base_url='{1}'".format(
+                         dict2_rpo["libvirt_repo1"]["name"],
+                         dict2_rpo[
+                             "libvirt_repo1"]["base_url"]),
+                     add_to_cleanup=False)
         # TORF-107476 - TC05 & TC14 - update vm_ram_mount RH6 to ramfs,
         # different mount point and mount options
-        self.execute_cli_update_cmd(self.management_server, vm_service_2_path +
-                                    "/vm_ram_mounts/vm_ram_mount_2",
-                                    props="type='{0}' mount_point='{1}' "
-                                          "mount_options='{2}'"
-                                    .format(dict2_vm_ram_mount["type"],
-                                            dict2_vm_ram_mount["mount_point"],
-                                            dict2_vm_ram_mount["mount_options"]
-                                            ))
+        batch.update(vm_service_2_path +
+                     "/vm_ram_mounts/vm_ram_mount_2",
+                     props="type='{0}' mount_point='{1}' "
+                           "mount_options='{2}'"
+                     .format(dict2_vm_ram_mount["type"],
+                             dict2_vm_ram_mount["mount_point"],
+                             dict2_vm_ram_mount["mount_options"]
+                             ))
 
         #########################
         #                       #
@@ -673,95 +681,81 @@ class Libvirtupdate1(LibvirtGenericTest):
         dict3_ali = self.up_dict3["VM_ALIAS"]
 
         #LITPCDS-7179 - Update vm hostnames
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg3_vm,
-                                    props="hostnames='{0}'".format(
-                                    self.up_dict3["VM_SERVICE"]["hostnames"]))
+        batch.update(sg3_vm,
+                     props="hostnames='{0}'".format(
+                     self.up_dict3["VM_SERVICE"]["hostnames"]))
         #LITPCDS-7179 - Create vm network interfaces
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_3_path + \
-                                    "/vm_network_interfaces/net23",
-                                    "vm-network-interface",
-                                    props=prop_net.format(dict3_net23[
-                                                          "host_device"],
-                                                      dict3_net23[
-                                                          "network_name"],
-                                                      dict3_net23[
-                                                          "device_name"]),
-                                    add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_3_path + \
-                                    "/vm_network_interfaces/net24",
-                                    "vm-network-interface",
-                                    props=prop_net.format(dict3_net24[
-                                                          "host_device"],
-                                                      dict3_net24[
-                                                          "network_name"],
-                                                      dict3_net24[
-                                                          "device_name"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_3_path + \
+                     "/vm_network_interfaces/net23",
+                     "vm-network-interface",
+                     props=prop_net.format(dict3_net23[
+                                           "host_device"],
+                                       dict3_net23[
+                                           "network_name"],
+                                       dict3_net23[
+                                           "device_name"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_3_path + \
+                     "/vm_network_interfaces/net24",
+                     "vm-network-interface",
+                     props=prop_net.format(dict3_net24[
+                                           "host_device"],
+                                       dict3_net24[
+                                           "network_name"],
+                                       dict3_net24[
+                                           "device_name"]),
+                     add_to_cleanup=False)
         #LITPCDS-7179 - Update network interfaces
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg3_vm + \
-                                    "/vm_network_interfaces/net23",
-                                    props="ipaddresses='{0}'"
-                                    .format(d3_nt23_ip))
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg3_vm + \
-                                    "/vm_network_interfaces/net24",
-                                    props="ipaddresses='{0}'"
-                                    .format(d3_nt24_ip))
+        batch.update(sg3_vm + \
+                     "/vm_network_interfaces/net23",
+                     props="ipaddresses='{0}'"
+                     .format(d3_nt23_ip))
+        batch.update(sg3_vm + \
+                     "/vm_network_interfaces/net24",
+                     props="ipaddresses='{0}'"
+                     .format(d3_nt24_ip))
         #LITPCDS-12817 - Remove network interface
-        self.execute_cli_remove_cmd(self.management_server, vm_service_3_path \
-                                              + "/vm_network_interfaces/net33")
+        batch.remove(vm_service_3_path \
+                     + "/vm_network_interfaces/net33")
         #LITPCDS-12817 - Update network interface device_name to preserve
         #consecutiveness of device names
-        self.execute_cli_update_cmd(self.management_server, vm_service_3_path \
-                                    + "/vm_network_interfaces/net34",
-                                    props="device_name='{0}'"
-                                    .format(self.up_dict3["NETWORK_INTERFACES"]
-                                                     ["NET34"]['device_name']))
+        batch.update(vm_service_3_path \
+                     + "/vm_network_interfaces/net34",
+                     props="device_name='{0}'"
+                     .format(self.up_dict3["NETWORK_INTERFACES"]
+                             ["NET34"]['device_name']))
         #LITPCDS-7184 - Create vm aliases
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_3_path + \
-                                    "/vm_aliases/db24",
-                                    "vm-alias",
-                                    props=prop_ali.format(dict3_ali["DB24"][
-                                                          "alias_names"],
-                                                           dict3_ali["DB24"][
-                                                               "address"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_3_path + \
+                     "/vm_aliases/db24",
+                     "vm-alias",
+                     props=prop_ali.format(
+                         dict3_ali["DB24"]["alias_names"],
+                         dict3_ali["DB24"]["address"]),
+                     add_to_cleanup=False)
         #LITPCDS-7815 - Create vm nfs mounts
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_3_path + \
-                                    "/vm_nfs_mounts/vm_nfs_mount_16",\
-                                    "vm-nfs-mount",\
-                                    props="device_path='{0}' mount_point='{1}'"
-                                    .format(dict3_mt16["device_path"],\
-                                    dict3_mt16["mount_point"]),
-                                    add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                                vm_service_3_path + \
-                                "/vm_nfs_mounts/vm_nfs_mount_17",
-                                    "vm-nfs-mount",
-                                props="device_path='{0}' mount_point='{1}' "
-                                      "mount_options='{2}'".format(dict3_mt17[
-                                                      "device_path"],
-                                                  dict3_mt17[
-                                                      "mount_point"],
-                                                  dict3_mt17[
-                                                      "mount_options"]),
-                                add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                                vm_service_3_path + \
-                                "/vm_nfs_mounts/vm_nfs_mount_18",
-                                "vm-nfs-mount",
-                                props="device_path='{0}' mount_point='{1}'"
-                                    .format(dict3_mt18[
-                                                      "device_path"],
-                                                  dict3_mt18[
-                                                      "mount_point"]),
-                                add_to_cleanup=False)
+        batch.create(vm_service_3_path + \
+                     "/vm_nfs_mounts/vm_nfs_mount_16",\
+                     "vm-nfs-mount",\
+                     props="device_path='{0}' mount_point='{1}'"
+                     .format(dict3_mt16["device_path"],
+                             dict3_mt16["mount_point"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_3_path + \
+                     "/vm_nfs_mounts/vm_nfs_mount_17",
+                     "vm-nfs-mount",
+                     props="device_path='{0}' mount_point='{1}' "
+                           "mount_options='{2}'".format(
+                               dict3_mt17["device_path"],
+                               dict3_mt17["mount_point"],
+                               dict3_mt17["mount_options"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_3_path + \
+                     "/vm_nfs_mounts/vm_nfs_mount_18",
+                     "vm-nfs-mount",
+                     props="device_path='{0}' mount_point='{1}'"
+                     .format(dict3_mt18["device_path"],
+                             dict3_mt18["mount_point"]),
+                     add_to_cleanup=False)
 
         #########################
         #                       #
@@ -779,95 +773,85 @@ class Libvirtupdate1(LibvirtGenericTest):
         dict4_vm_custom_script = self.up_dict4["VM_CUSTOM_SCRIPT"]
 
         #LITPCDS-7179 - Update vm hostnames
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg4_vm,
-                                    props="hostnames='{0}'".format(
-                                    self.up_dict4["VM_SERVICE"]["hostnames"]))
+        batch.update(sg4_vm,
+                     props="hostnames='{0}'".format(
+                     self.up_dict4["VM_SERVICE"]["hostnames"]))
         #LITPCDS-7179 - Create vm network interfaces
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_4_path + \
-                                    "/vm_network_interfaces/net25",
-                                    "vm-network-interface",
-                                    props=prop_net.format(dict4_net25[
-                                                          "host_device"],
-                                                      dict4_net25[
-                                                          "network_name"],
-                                                      dict4_net25[
-                                                          "device_name"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_4_path + \
+                     "/vm_network_interfaces/net25",
+                     "vm-network-interface",
+                     props=prop_net.format(dict4_net25[
+                                           "host_device"],
+                                       dict4_net25[
+                                           "network_name"],
+                                       dict4_net25[
+                                           "device_name"]),
+                     add_to_cleanup=False)
         #LITPCDS-7179 - Update net interface ip
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg4_vm + \
-                                    "/vm_network_interfaces/net25",
-                                    props="ipaddresses='{0}'"
-                                    .format(d4_nt25_ip))
+        batch.update(sg4_vm + \
+                     "/vm_network_interfaces/net25",
+                     props="ipaddresses='{0}'"
+                     .format(d4_nt25_ip))
         #LITPCDS-7184 - Create vm aliases
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_4_path + \
-                                    "/vm_aliases/db25",
-                                    "vm-alias",
-                                    props=prop_ali.format(dict4_ali["DB25"][
-                                                          "alias_names"],
-                                                           dict4_ali["DB25"][
-                                                               "address"]),
-                                    add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_4_path + \
-                                    "/vm_aliases/db26",
-                                    "vm-alias",
-                                    props=prop_ali.format(dict4_ali["DB26"][
-                                                          "alias_names"],
-                                                           dict4_ali["DB26"][
-                                                               "address"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_4_path + \
+                     "/vm_aliases/db25",
+                     "vm-alias",
+                     props=prop_ali.format(dict4_ali["DB25"][
+                                           "alias_names"],
+                                            dict4_ali["DB25"][
+                                                "address"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_4_path + \
+                     "/vm_aliases/db26",
+                     "vm-alias",
+                     props=prop_ali.format(dict4_ali["DB26"][
+                                           "alias_names"],
+                                            dict4_ali["DB26"][
+                                                "address"]),
+                     add_to_cleanup=False)
         #LITPCDS-7186 - Create vm packages
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_4_path + \
-                                    "/vm_packages/empty_rpm1",\
-                                    "vm-package",\
-                                    props="name='{0}'"
-                                    .format(dict4_pkgs["EMPTY_RPM1"]["name"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_4_path + \
+                     "/vm_packages/empty_rpm1",\
+                     "vm-package",\
+                     props="name='{0}'"
+                     .format(dict4_pkgs["EMPTY_RPM1"]["name"]),
+                     add_to_cleanup=False)
 
         #LITPCDS-7188 - Update package names
-        self.execute_cli_update_cmd(self.management_server,
-                                    vm_service_4_path + \
-                                    "/vm_packages/pkg_empty_rpm7",
-                                    props="name='{0}'"
-                                    .format(
-                                        dict4_pkgs["PKG_EMPTY_RPM7"]["name"]))
-
-        self.execute_cli_update_cmd(self.management_server,
-                                    vm_service_4_path + \
-                                    "/vm_packages/pkg_empty_rpm6",
-                                    props="name='{0}'"
-                                    .format(
-                                        dict4_pkgs["PKG_EMPTY_RPM6"]["name"]))
+        batch.update(vm_service_4_path + \
+                     "/vm_packages/pkg_empty_rpm7",
+                     props="name='{0}'"
+                     .format(
+                         dict4_pkgs["PKG_EMPTY_RPM7"]["name"]))
+
+        batch.update(vm_service_4_path + \
+                     "/vm_packages/pkg_empty_rpm6",
+                     props="name='{0}'"
+                     .format(
+                         dict4_pkgs["PKG_EMPTY_RPM6"]["name"]))
         #LITPCDS-7186 - Create vm yum repos
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_4_path + \
-                                    "/vm_yum_repos/libvirt_repo1",
-                                    "vm-yum-repo",
-                                    props="name='{0}' base_url='{1}'"
-                                    .format(dict4_rpo["libvirt_repo1"]["name"],
-                                            dict4_rpo["libvirt_repo1"][
-                                                "base_url"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_4_path + \
+                     "/vm_yum_repos/libvirt_repo1",
+                     "vm-yum-repo",
+                     props="name='{0}' base_url='{1}'"
+                     .format(dict4_rpo["libvirt_repo1"]["name"],
+                             dict4_rpo["libvirt_repo1"][
+                                 "base_url"]),
+                     add_to_cleanup=False)
         #LITPCDS-585 - Update cpu and ram properties
-        self.execute_cli_update_cmd(self.management_server,
-                                    vm_service_4_path,
-                                    props="cpus='{0}' ram='{1}'".format(
-                                        dict4_vms["cpus"],
-                                        dict4_vms["ram"]))
+        batch.update(vm_service_4_path,
+                     props="cpus='{0}' ram='{1}'".format(
+                         dict4_vms["cpus"],
+                         dict4_vms["ram"]))
 
         # TORF-180365 - TC05, TORF - 180367 - TC22
         # update vm custom script names
-        self.execute_cli_update_cmd(self.management_server, vm_service_4_path +
-                                    "/vm_custom_script/vm_custom_script_1",
-                                    props="custom_script_names='{0}' "
-                                    .format(
-                                        dict4_vm_custom_script[
-                                            "custom_script_names"]))
+        batch.update(vm_service_4_path +
+                     "/vm_custom_script/vm_custom_script_1",
+                     props="custom_script_names='{0}' "
+                     .format(
+                         dict4_vm_custom_script[
+                             "custom_script_names"]))
 
         #########################
         #                       #
@@ -886,157 +870,142 @@ class Libvirtupdate1(LibvirtGenericTest):
         dict5_vm_custom_script = dict5["VM_CUSTOM_SCRIPT"]
 
         # TORF-107476 - TC13 - Contract Service group and add VM_RAM_MOUNT
-        self.execute_cli_update_cmd(self.management_server,
-                                    self.clus_srvs + "/CS_VM5",
-                                    props="active={0} standby={1} "
-                                          "node_list={2}"
-                                    .format(
-                                        dict5["CLUSTER_SERVICE"]["active"],
-                                        dict5["CLUSTER_SERVICE"]["standby"],
-                                        dict5["CLUSTER_SERVICE"]["node_list"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg5_vm + "/vm_network_interfaces/net11",
-                                    props="ipaddresses='{0}'".format(
-                                        dict5["NETWORK_INTERFACES"]["NET11"]
-                                        ["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg5_vm + "/vm_network_interfaces/net12",
-                                    props="ipaddresses='{0}'".format(
-                                        dict5["NETWORK_INTERFACES"]["NET12"]
-                                        ["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg5_vm + "/vm_network_interfaces/net13",
-                                    props="ipaddresses='{0}'".format(
-                                        dict5["NETWORK_INTERFACES"]["NET13"]
-                                        ["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg5_vm + "/vm_network_interfaces/net14",
-                                    props="ipaddresses='{0}'".format(
-                                        dict5["NETWORK_INTERFACES"]["NET14"]
-                                        ["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg5_vm + "/vm_network_interfaces/net15",
-                                    props="ipv6addresses='{0}'"
-                                          " ipaddresses='{1}'".format(
-                                        dict5["NETWORK_INTERFACES"]["NET15"]
-                                        ["ipv6addresses"], dict5
-                                        ["NETWORK_INTERFACES"]["NET15"]
-                                        ["ipaddresses"]))
+        batch.update(self.clus_srvs + "/CS_VM5",
+                     props="active={0} standby={1} "
+                           "node_list={2}"
+                     .format(
+                         dict5["CLUSTER_SERVICE"]["active"],
+                         dict5["CLUSTER_SERVICE"]["standby"],
+                         dict5["CLUSTER_SERVICE"]["node_list"]))
+        batch.update(sg5_vm + "/vm_network_interfaces/net11",
+                     props="ipaddresses='{0}'".format(
+                         dict5["NETWORK_INTERFACES"]["NET11"]
+                         ["ipaddresses"]))
+        batch.update(sg5_vm + "/vm_network_interfaces/net12",
+                     props="ipaddresses='{0}'".format(
+                         dict5["NETWORK_INTERFACES"]["NET12"]
+                         ["ipaddresses"]))
+        batch.update(sg5_vm + "/vm_network_interfaces/net13",
+                     props="ipaddresses='{0}'".format(
+                         dict5["NETWORK_INTERFACES"]["NET13"]
+                         ["ipaddresses"]))
+        batch.update(sg5_vm + "/vm_network_interfaces/net14",
+                     props="ipaddresses='{0}'".format(
+                         dict5["NETWORK_INTERFACES"]["NET14"]
+                         ["ipaddresses"]))
+        batch.update(sg5_vm + "/vm_network_interfaces/net15",
+                     props="ipv6addresses='{0}'"
+                           " ipaddresses='{1}'".format(
+                         dict5["NETWORK_INTERFACES"]["NET15"]
+                         ["ipv6addresses"], dict5
+                         ["NETWORK_INTERFACES"]["NET15"]
+                         ["ipaddresses"]))
 
         #LITPCDS-7179 - Update vm hostnames
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg5_vm,
-                                    props="hostnames='{0}'"
-                                    .format(dict5["VM_SERVICE"]["hostnames"]))
+        batch.update(sg5_vm,
+                     props="hostnames='{0}'"
+                     .format(dict5["VM_SERVICE"]["hostnames"]))
         #LITPCDS-7179 - Create vm network interface
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_5_path + \
-                                    "/vm_network_interfaces/net26",
-                                    "vm-network-interface",
-                                    props=prop_net.format(dict5_net26[
-                                                          "host_device"],
-                                                      dict5_net26[
-                                                          "network_name"],
-                                                      dict5_net26[
-                                                          "device_name"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_5_path + \
+                     "/vm_network_interfaces/net26",
+                     "vm-network-interface",
+                     props=prop_net.format(dict5_net26[
+                                           "host_device"],
+                                       dict5_net26[
+                                           "network_name"],
+                                       dict5_net26[
+                                           "device_name"]),
+                     add_to_cleanup=False)
         #LITPCDS-7179 - Update ip of vm net interface
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg5_vm + \
-                                    "/vm_network_interfaces/net26",
-                                    props="ipaddresses='{0}'"
-                                    .format(dict5_nt26_ip))
+        batch.update(sg5_vm + \
+                     "/vm_network_interfaces/net26",
+                     props="ipaddresses='{0}'"
+                     .format(dict5_nt26_ip))
         #LITPCDS-7184 - Create vm aliases
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_5_path + \
-                                    "/vm_aliases/db27",
-                                    "vm-alias",
-                                    props=prop_ali.format(dict5_ali["DB27"][
-                                                          "alias_names"],
-                                                            dict5_ali["DB27"][
-                                                               "address"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_5_path + \
+                     "/vm_aliases/db27",
+                     "vm-alias",
+                     props=prop_ali.format(dict5_ali["DB27"][
+                                           "alias_names"],
+                                             dict5_ali["DB27"][
+                                                "address"]),
+                     add_to_cleanup=False)
         #LITPCDS-7186 - Create vm packages
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_5_path + \
-                                    "/vm_packages/empty_testrepo1_rpm1",
-                                    "vm-package",
-                                    props="name='{0}'"
-                                    .format(
-                                        dict5_pkgs["EMPTY_TESTREPO1_RPM1"][
-                                            "name"]),
-                                    add_to_cleanup=False)
-
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_5_path + \
-                                    "/vm_packages/empty_rpm3",
-                                    "vm-package",
-                                    props="name='{0}'"
-                                    .format(dict5_pkgs["EMPTY_RPM3"]["name"]),
-                                    add_to_cleanup=False)
-
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_5_path + \
-                                    "/vm_packages/empty_rpm2",
-                                    "vm-package",
-                                    props="name='{0}'"
-                                    .format(dict5_pkgs["EMPTY_RPM2"]["name"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_5_path + \
+                     "/vm_packages/empty_testrepo1_rpm1",
+                     "vm-package",
+                     props="name='{0}'"
+                     .format(
+                         dict5_pkgs["EMPTY_TESTREPO1_RPM1"][
+                             "name"]),
+                     add_to_cleanup=False)
+
+        batch.create(vm_service_5_path + \
+                     "/vm_packages/empty_rpm3",
+                     "vm-package",
+                     props="name='{0}'"
+                     .format(dict5_pkgs["EMPTY_RPM3"]["name"]),
+                     add_to_cleanup=False)
+
+        batch.create(vm_service_5_path + \
+                     "/vm_packages/empty_rpm2",
+                     "vm-package",
+                     props="name='{0}'"
+                     .format(dict5_pkgs["EMPTY_RPM2"]["name"]),
+                     add_to_cleanup=False)
 
         #LITPCDS-7186 - Create vm yum repos
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_5_path + \
-                                    "/vm_yum_repos/libvirt_repo1",
-                                    "vm-yum-repo",
-                                    props="name='{0}' base_url='{1}'"
-                                    .format(
-                                        dict5_rpo["libvirt_repo1"]["name"],
-                                        dict5_rpo["libvirt_repo1"][
-                                                "base_url"]),
-                                    add_to_cleanup=False)
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_5_path + \
-                                    "/vm_yum_repos/libvirt_repo2",
-                                    "vm-yum-repo",
-                                    props="name='{0}' base_url='{1}'"
-                                    .format(
-                                        dict5_rpo["libvirt_repo2"]["name"],
-                                        dict5_rpo["libvirt_repo2"][
-                                                "base_url"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_5_path + \
+                     "/vm_yum_repos/libvirt_repo1",
+                     "vm-yum-repo",
+                     props="name='{0}' base_url='{1}'"
+                     .format(
+                         dict5_rpo["libvirt_repo1"]["name"],
+                         dict5_rpo["libvirt_repo1"][
+                                 "base_url"]),
+                     add_to_cleanup=False)
+        batch.create(vm_service_5_path + \
+                     "/vm_yum_repos/libvirt_repo2",
+                     "vm-yum-repo",
+                     props="name='{0}' base_url='{1}'"
+                     .format(
+                         dict5_rpo["libvirt_repo2"]["name"],
+                         dict5_rpo["libvirt_repo2"][
+                                 "base_url"]),
+                     add_to_cleanup=False)
         # TORF-107476 - TC13 - Add VM_RAM_MOUNT to CS_VM5
-        self.execute_cli_create_cmd(self.management_server,
-                                    vm_service_5_path + \
-                                    "/vm_ram_mounts/vm_ram_mount_5",
-                                    "vm-ram-mount",
-                                    props="type='{0}' mount_point='{1}' "
-                                    .format(
-                                      dict5_vm_ram_mnt["type"],
-                                      dict5_vm_ram_mnt["mount_point"]),
-                                    add_to_cleanup=False)
+        batch.create(vm_service_5_path + \
+                     "/vm_ram_mounts/vm_ram_mount_5",
+                     "vm-ram-mount",
+                     props="type='{0}' mount_point='{1}' "
+                     .format(
+                       dict5_vm_ram_mnt["type"],
+                       dict5_vm_ram_mnt["mount_point"]),
+                     add_to_cleanup=False)
 
         #LITPCDS-585 - Update cpu no. and RAM
-        self.execute_cli_update_cmd(self.management_server,
-                                    vm_service_5_path,
-                                    props="cpus='{0}' ram='{1}'".format(
-                                        dict5_vms["cpus"], dict5_vms["ram"]))
+        batch.update(vm_service_5_path,
+                     props="cpus='{0}' ram='{1}'".format(
+                         dict5_vms["cpus"], dict5_vms["ram"]))
 
         # TORF-113124: test_04_p_update_vm_image_on_vm_service: Update the
         # VM-Image used from VM-service-5 to vm_image_2
-        self.execute_cli_update_cmd(self.management_server, vm_service_5_path,
-                                    props="image_name={0}".format(
-                                        self.up_dict5["VM_SERVICE"]
-                                        ["image_name"]))
+        batch.update(vm_service_5_path,
+                     props="image_name={0}".format(
+                         self.up_dict5["VM_SERVICE"]
+                         ["image_name"]))
 
         # TORF-180365 - TC05
         # TORF-180367 - TC22, TC12
         # update vm custom script names
-        self.execute_cli_update_cmd(self.management_server, vm_service_5_path +
-                                    "/vm_custom_script/vm_custom_script_1",
-                                    props="custom_script_names='{0}' "
-                                    .format(
-                                        dict5_vm_custom_script[
-                                            "custom_script_names"]))
+        batch.update(vm_service_5_path +
+                     "/vm_custom_script/vm_custom_script_1",
+                     props="custom_script_names='{0}' "
+                     .format(
+                         dict5_vm_custom_script[
+                             "custom_script_names"]))
+
+        self.apply_model_batch(batch)
 
     def update_vm_software_images(self):
         """
@@ -1140,19 +1109,15 @@ class Libvirtupdate1(LibvirtGenericTest):
         Returns: Nothing
         """
 
-        target_cmd = 'findmnt -s -l -n -T {0}'.format(mnt_point)
-
         self.add_vm_to_node_list(hostname,
                                  username=test_constants.LIBVIRT_VM_USERNAME,
                                  password=test_constants.LIBVIRT_VM_PASSWORD,
                                  ipv4=ipaddr)
 
-        actual, _, _ = self.run_command(hostname, target_cmd,
-                                        username=test_constants.
-                                        LIBVIRT_VM_USERNAME,
-                                        password=test_constants.
-                                        LIBVIRT_VM_PASSWORD,
-                                        execute_timeout=60)
+        actual = self.get_fstab_entry(
+            hostname, mnt_point,
+            username=test_constants.LIBVIRT_VM_USERNAME,
+            password=test_constants.LIBVIRT_VM_PASSWORD)
         mnt_pnt_flag = self.is_text_in_list(mnt_point, actual)
 
         if mnt_pnt_flag:
@@ -1189,7 +1154,7 @@ class Libvirtupdate1(LibvirtGenericTest):
         """
         filename = '/var/lib/libvirt/instances/{0}/user-data'.format(
                                                               service_name)
-        file_contents = self.get_file_contents(node, filename)
+        file_contents = self.get_remote_file(node, filename)
         return self.is_text_in_list(vm_custom_script, file_contents)
 
     def _confirm_vm_custom_script_ran(self, vm_hostname, vm_ip,
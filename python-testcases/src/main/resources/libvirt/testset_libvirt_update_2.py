@@ -13,6 +13,8 @@ program(s) have been supplied.
 import os
 from litp_generic_test import attr
 from testset_libvirt_initial_setup import LibvirtGenericTest
+from libvirt_model_utils import lazy_property
+from libvirt_model_builder import ModelBatch
 import test_constants
 import libvirt_test_data
 
@@ -32,13 +34,7 @@ class Libvirtupdate2(LibvirtGenericTest):
         # 1. Call super class setup
         super(Libvirtupdate2, self).setUp()
 
-        self.model = self.get_litp_model_information()
-        self.ms_node = self.model["ms"][0]["name"]
-        self.srvc_path = self.model["libvirt"]["software_services_path"]
-        self.clus_srvs = self.model["libvirt"]["cluster_services_path"]
-        self.srvc_urls = self.find(self.ms_node, '/software/', "vm-service")
-        self.srvc_urls.extend(
-            self.find(self.ms_node, '/deployments/', "vm-service"))
+        self.ms_node = self.get_management_node_filename()
         self.up_dict1 = libvirt_test_data.UPDATED2_SERVICE_GROUP_1_DATA
         self.up_dict2 = libvirt_test_data.UPDATED2_SERVICE_GROUP_2_DATA
         self.up_dict3 = libvirt_test_data.UPDATED2_SERVICE_GROUP_3_DATA
@@ -47,22 +43,66 @@ class Libvirtupdate2(LibvirtGenericTest):
         self.up_sg6_dict = libvirt_test_data.UPDATED_SERVICE_GROUP_6_DATA
         self.up_dict7 = libvirt_test_data.UPDATED2_SERVICE_GROUP_SLES_DATA
 
-        self.sg1_path = "{0}/CS_VM1".format(self.clus_srvs)
-        self.sg6_path = "{0}/CS_VM6".format(self.clus_srvs)
-        self.sg6_net_ifs_path = self.find(self.ms_node, self.sg6_path,
-                                    'collection-of-vm-network-interface')[0]
-
-        self.vm_rule_coll_paths = self.find(self.ms_node,
-                                        '/software',
-                                        'collection-of-vm-firewall-rule')
+        self.vm1_firewall_rules = libvirt_test_data.VM_FIREWALL_RULES_2
+        self.vm_image_2 = libvirt_test_data.VM_IMAGE_FILE_NAME["VM_IMAGE2"]
 
-        self.vm1_rule_coll_path = [rule_coll_path for rule_coll_path in
+    @lazy_property
+    def model(self):
+        """ LITP model information, loaded on first use """
+        return self.get_cached_model_info(
+            self.get_litp_model_information)
+
+    @lazy_property
+    def srvc_path(self):
+        """ Path of the software services """
+        return self.model["libvirt"]["software_services_path"]
+
+    @lazy_property
+    def clus_srvs(self):
+        """ Path of the cluster services """
+        return self.model["libvirt"]["cluster_services_path"]
+
+    @lazy_property
+    def sg1_path(self):
+        """ Path of CS_VM1 """
+        return "{0}/CS_VM1".format(self.clus_srvs)
+
+    @lazy_property
+    def sg6_path(self):
+        """ Path of CS_VM6 """
+        return "{0}/CS_VM6".format(self.clus_srvs)
+
+    @lazy_property.pinned
+    def srvc_urls(self):
+        """ Urls of all vm-services """
+        srvc_urls = self.find(self.ms_node, '/software/', "vm-service")
+        srvc_urls.extend(
+            self.find(self.ms_node, '/deployments/', "vm-service"))
+        return srvc_urls
+
+    @lazy_property.pinned
+    def sg6_net_ifs_path(self):
+        """ Network interface collection of CS_VM6 """
+        return self.find(self.ms_node, self.sg6_path,
+                         'collection-of-vm-network-interface')[0]
+
+    @lazy_property.pinned
+    def vm_rule_coll_paths(self):
+        """ Urls of the vm firewall rule collections """
+        return self.find(self.ms_node, '/software',
+                         'collection-of-vm-firewall-rule')
+
+    @lazy_property.pinned
+    def vm1_rule_coll_path(self):
+        """ Firewall rule collection of vm_service_1 """
+        return [rule_coll_path for rule_coll_path in
                 self.vm_rule_coll_paths if 'vm_service_1' in rule_coll_path][0]
 
-        self.sles_rule_coll_path = [rule_coll_path for rule_coll_path in
+    @lazy_property.pinned
+    def sles_rule_coll_path(self):
+        """ Firewall rule collection of the sles VM """
+        return [rule_coll_path for rule_coll_path in
                 self.vm_rule_coll_paths if 'sles' in rule_coll_path][0]
-        self.vm1_firewall_rules = libvirt_test_data.VM_FIREWALL_RULES_2
-        self.vm_image_2 = libvirt_test_data.VM_IMAGE_FILE_NAME["VM_IMAGE2"]
 
     def tearDown(self):
         """
@@ -170,6 +210,7 @@ class Libvirtupdate2(LibvirtGenericTest):
         Description:
             Update properties of the five service groups.
         """
+        batch = ModelBatch()
         # Set up the variables for the service group urls
 
         sg2_path = self.clus_srvs + "/CS_VM2"
@@ -192,88 +233,85 @@ class Libvirtupdate2(LibvirtGenericTest):
 
         #TORF-279479 & TORF-297880 - Update vm-firewall-rule v4 & v6
         for rule in update_rules:
-            self.execute_cli_update_cmd(self.ms_node, '{0}/{1}'.format(
-                                        self.vm1_rule_coll_path,
-                                        rule["item_name"]),
-                                        props=rule["props"])
+            batch.update('{0}/{1}'.format(
+                         self.vm1_rule_coll_path,
+                         rule["item_name"]),
+                         props=rule["props"])
 
         #TORF-279479 & TORF-297880 - Remove vm-firewall-rule v4 & v6
         remove_rules = libvirt_test_data.VM_FIREWALL_RULES_TO_REMOVE
         for rule in remove_rules:
-            self.execute_cli_remove_cmd(self.ms_node, '{0}/{1}'.format(
-                                        self.vm1_rule_coll_path,
-                                        rule["item_name"]))
+            batch.remove('{0}/{1}'.format(
+                         self.vm1_rule_coll_path,
+                         rule["item_name"]))
 
         #LITPCDS-7179 - Update ips of vm network interfaces
-        self.execute_cli_update_cmd(self.ms_node, self.sg1_path + \
+        batch.update(self.sg1_path + \
             "/applications/vm_service_1/vm_network_interfaces/net1",\
             props='ipaddresses={0}'.format(self.up_dict1
                                 ["NETWORK_INTERFACES"]["NET1"]["ipaddresses"]))
 
         #Update alias names
-        self.execute_cli_update_cmd(self.ms_node, vm_srvc_1_path + \
+        batch.update(vm_srvc_1_path + \
             "/vm_aliases/db1", props='alias_names={0}'.format(self.up_dict1
-                                        ["VM_ALIAS"]["DB1"]["alias_names"]))
+                         ["VM_ALIAS"]["DB1"]["alias_names"]))
 
-        self.execute_cli_update_cmd(self.ms_node, vm_srvc_1_path + \
+        batch.update(vm_srvc_1_path + \
             "/vm_aliases/db20", props='alias_names={0}'.format(
             self.up_dict1["VM_ALIAS"]["DB20"]["alias_names"]))
 
         #Update alias addresses
-        self.execute_cli_update_cmd(self.ms_node, vm_srvc_1_path + \
+        batch.update(vm_srvc_1_path + \
             "/vm_aliases/db2", props='address={0}'.format(
             self.up_dict1["VM_ALIAS"]["DB2"]["address"]))
 
-        self.execute_cli_update_cmd(self.ms_node, vm_srvc_1_path + \
+        batch.update(vm_srvc_1_path + \
             "/vm_aliases/db21", props='address={0}'.format(
             self.up_dict1["VM_ALIAS"]["DB21"]["address"]))
 
         # TORF-349676 - update vm aliases with IPv6 address containing prefix
-        self.execute_cli_update_cmd(self.ms_node,
-                                    vm_srvc_1_path + "/vm_aliases/ipv6a",
-                                    props='address={0}'.format
-                            (self.up_dict1["VM_ALIAS"]["IPV6a"]["address"]))
+        batch.update(vm_srvc_1_path + "/vm_aliases/ipv6a",
+                     props='address={0}'.format(
+                         self.up_dict1["VM_ALIAS"]["IPV6a"]["address"]))
 
-        self.execute_cli_update_cmd(self.ms_node,
-                                    vm_srvc_1_path + "/vm_aliases/ipv6b",
-                                    props='address={0}'.format
-                            (self.up_dict1["VM_ALIAS"]["IPV6b"]["address"]))
+        batch.update(vm_srvc_1_path + "/vm_aliases/ipv6b",
+                     props='address={0}'.format(
+                         self.up_dict1["VM_ALIAS"]["IPV6b"]["address"]))
 
         #LITPCDS-585 - Update vm service properties; no. of cpu, ram
         rep29 = self.up_dict1["VM_SERVICE"]["cpus"]
-        self.execute_cli_update_cmd(self.ms_node, self.sg1_path + \
+        batch.update(self.sg1_path + \
             "/applications/vm_service_1", props='cpus={0}'.format(rep29))
 
         #TORF-219762 - Update cpuset
         rep30 = self.up_dict1["VM_SERVICE"]["cpuset"]
-        self.execute_cli_update_cmd(self.ms_node, self.sg1_path +
+        batch.update(self.sg1_path +
             "/applications/vm_service_1", props='cpuset={0}'.format(rep30))
 
         rep32 = self.up_dict1["VM_SERVICE"]["ram"]
-        self.execute_cli_update_cmd(self.ms_node, self.sg1_path + \
+        batch.update(self.sg1_path + \
             "/applications/vm_service_1", props='ram={0}'.format(rep32))
 
         #LITPCDS-7188 - Update package name
         rep35 = self.up_dict1["PACKAGES"]["PKG_EMPTY_RPM1"]["name"]
-        self.execute_cli_update_cmd(self.ms_node, vm_srvc_1_path + \
+        batch.update(vm_srvc_1_path + \
             "/vm_packages/pkg_empty_rpm1", props='name={0}'.format(rep35))
 
         #LITPCDS-7815 - Update device path of vm nfs mount
         rep38 = self.up_dict1["NFS_MOUNTS"]["VM_MOUNT1"]["device_path"]
-        self.execute_cli_update_cmd(self.ms_node,\
-            vm_srvc_1_path + "/vm_nfs_mounts/vm_nfs_mount_1",\
+        batch.update(vm_srvc_1_path + "/vm_nfs_mounts/vm_nfs_mount_1",\
             props='device_path={0}'.format(rep38))
 
         #LITPCDS-7182 - Update vm image name
         # TORF-113124 test_06_p_update_multiple_vm_images_during_idemp
         rep39 = self.up_dict1["VM_SERVICE"]["image_name"]
-        self.execute_cli_update_cmd(self.ms_node, vm_srvc_1_path,\
+        batch.update(vm_srvc_1_path,\
             props='image_name={0}'.format(rep39))
 
         # TORF-107476 - TC21 - Remove vm-ram-mount item from CS RH7
-        self.execute_cli_remove_cmd(self.ms_node, self.sg1_path +
-                                    '/applications/vm_service_1/vm_ram_mounts/'
-                                    'vm_ram_mount_1')
+        batch.remove(self.sg1_path +
+                     '/applications/vm_service_1/vm_ram_mounts/'
+                     'vm_ram_mount_1')
 
         #############################
         #                           #
@@ -283,31 +321,32 @@ class Libvirtupdate2(LibvirtGenericTest):
         # TORF-279479 & TORF-297880 - Create IPv4 & IPv6 vm-firewall-rules
         sles_fw_path = vm_srvc_sles_path + "/vm_firewall_rules/"
         for rule in libvirt_test_data.VM_FIREWALL_RULES_SLES_2:
-            self.execute_cli_update_cmd(self.ms_node, sles_fw_path
-                                        + rule["item_name"],
-                                        props=rule["props"])
+            batch.update(sles_fw_path
+                         + rule["item_name"],
+                         props=rule["props"])
 
         # TORF-404805
         # description: Configure zypper repos
         # test_steps:
         #   step: Create a second zypper repo for CS_SLES_VM
         #   result: Zypper repo is created for CS_SLES_VM
-        self.execute_cli_create_cmd(self.ms_node,
-                            vm_srvc_sles_path + "/vm_zypper_repos/repo_NCM2",
-                            "vm-zypper-repo",
-                            props="name='{0}' base_url='{1}'".format(
-                                self.up_dict7["ZYPPER_REPOS"]["NCM"]["name"],
-                                self.up_dict7["ZYPPER_REPOS"]["NCM"][
-                                        "base_url"]), add_to_cleanup=False)
+        batch.create(vm_srvc_sles_path + "/vm_zypper_repos/repo_NCM2",
+                     "vm-zypper-repo",
+                     props="name='{0}' base_url='{1}'".format(
+                         self.up_dict7["ZYPPER_REPOS"]["NCM"]["name"],
+                         self.up_dict7["ZYPPER_REPOS"]["NCM"][
+                             "base_url"]),
+                     add_to_cleanup=False)
 
         # description: Configure vm packages
         # test_steps:
         #   step: Configure vm packages for CS_SLES_VM
         #   result: VM packages are configured for CS_SLES_VM
-        self.execute_cli_create_cmd(self.ms_node, vm_srvc_sles_path +
-                        "/vm_packages/pkg_empty_rpm9", "vm-package",
-                                props="name='{0}'".format(self.up_dict7
-                        ["PACKAGES"]["PKG1"]["name"]), add_to_cleanup=False)
+        batch.create(vm_srvc_sles_path +
+                     "/vm_packages/pkg_empty_rpm9", "vm-package",
+                     props="name='{0}'".format(
+                         self.up_dict7["PACKAGES"]["PKG1"]["name"]),
+                     add_to_cleanup=False)
 
         #########################
         #                       #
@@ -316,96 +355,91 @@ class Libvirtupdate2(LibvirtGenericTest):
         #########################
         #LITPCDS-7179 - Create 2 new vm network interfaces
         rep42 = self.up_dict2["NETWORK_INTERFACES"]["NET30"]
-        self.execute_cli_create_cmd(self.ms_node, vm_srvc_2_path + \
+        batch.create(vm_srvc_2_path + \
              "/vm_network_interfaces/net30", "vm-network-interface",
              props="host_device='{0}' network_name='{1}' device_name='{2}'"
-                                    .format(rep42["host_device"],
-                                            rep42["network_name"],
-                                            rep42["device_name"]),
-                                    add_to_cleanup=False)
+                     .format(rep42["host_device"],
+                             rep42["network_name"],
+                             rep42["device_name"]),
+                     add_to_cleanup=False)
 
         rep43 = self.up_dict2["NETWORK_INTERFACES"]["NET31"]
-        self.execute_cli_create_cmd(self.ms_node, vm_srvc_2_path + \
+        batch.create(vm_srvc_2_path + \
              "/vm_network_interfaces/net31",\
              "vm-network-interface",
              props="host_device='{0}' network_name='{1}' device_name='{2}'"
-                                    .format(rep43["host_device"],
-                                            rep43["network_name"],
-                                            rep43["device_name"]),
-                                    add_to_cleanup=False)
+                     .format(rep43["host_device"],
+                             rep43["network_name"],
+                             rep43["device_name"]),
+                     add_to_cleanup=False)
 
         #LITPCDS-7179 - Update the ip addresses of 4 vm network interfaces
-        self.execute_cli_update_cmd(self.ms_node, sg2_path + \
+        batch.update(sg2_path + \
             "/applications/vm_service_2/vm_network_interfaces/net30",\
             props='ipaddresses={0}'.format(rep42["ipaddresses"]))
 
-        self.execute_cli_update_cmd(self.ms_node, sg2_path + \
+        batch.update(sg2_path + \
             "/applications/vm_service_2/vm_network_interfaces/net31",\
             props='ipaddresses={0}'.format(rep43["ipaddresses"]))
 
         rep6 = self.up_dict2["NETWORK_INTERFACES"]["NET2"]["ipaddresses"]
-        self.execute_cli_update_cmd(self.ms_node, sg2_path + \
+        batch.update(sg2_path + \
             "/applications/vm_service_2/vm_network_interfaces/net2",\
             props='ipaddresses={0}'.format(rep6))
 
         rep7 = self.up_dict2["NETWORK_INTERFACES"]["NET3"]["ipaddresses"]
-        self.execute_cli_update_cmd(self.ms_node, sg2_path + \
+        batch.update(sg2_path + \
             "/applications/vm_service_2/vm_network_interfaces/net3",\
             props='ipaddresses={0}'.format(rep7))
 
         #Update the alias names and address of 2 vm aliases
         rep8a = self.up_dict2["VM_ALIAS"]["DB1"]["alias_names"]
         rep8b = self.up_dict2["VM_ALIAS"]["DB1"]["address"]
-        self.execute_cli_update_cmd(self.ms_node,\
-            vm_srvc_2_path + "/vm_aliases/db1",\
+        batch.update(vm_srvc_2_path + "/vm_aliases/db1",\
             props='alias_names={0} address={1}'.format(rep8a, rep8b))
 
         rep9a = self.up_dict2["VM_ALIAS"]["DB22"]["alias_names"]
         rep9b = self.up_dict2["VM_ALIAS"]["DB22"]["address"]
-        self.execute_cli_update_cmd(self.ms_node,\
-            sg2_path + "/applications/vm_service_2/vm_aliases/db22",\
+        batch.update(sg2_path + "/applications/vm_service_2/vm_aliases/db22",\
             props='alias_names={0} address={1}'.format(rep9a, rep9b))
 
         #LITPCDS-7815 - Create 3 new vm nfs mounts
         rep44 = self.up_dict2["NFS_MOUNTS"]["VM_MOUNT13"]
-        self.execute_cli_create_cmd(self.ms_node,
-            vm_srvc_2_path + "/vm_nfs_mounts/vm_nfs_mount_13",\
+        batch.create(vm_srvc_2_path + "/vm_nfs_mounts/vm_nfs_mount_13",\
             "vm-nfs-mount",\
             props="device_path='{0}' mount_point='{1}'"
-                                    .format(rep44["device_path"],\
-                                            rep44["mount_point"]),
-                                    add_to_cleanup=False)
+                     .format(rep44["device_path"],\
+                             rep44["mount_point"]),
+                     add_to_cleanup=False)
 
         rep45 = self.up_dict2["NFS_MOUNTS"]["VM_MOUNT14"]
-        self.execute_cli_create_cmd(self.ms_node,
-            vm_srvc_2_path + "/vm_nfs_mounts/vm_nfs_mount_14",
+        batch.create(vm_srvc_2_path + "/vm_nfs_mounts/vm_nfs_mount_14",
             "vm-nfs-mount",
             props="device_path='{0}' mount_point='{1}'"
-                                    .format(rep45["device_path"],\
-                                            rep45["mount_point"]),
-                                    add_to_cleanup=False)
+                     .format(rep45["device_path"],\
+                             rep45["mount_point"]),
+                     add_to_cleanup=False)
 
         rep46 = self.up_dict2["NFS_MOUNTS"]["VM_MOUNT15"]
-        self.execute_cli_create_cmd(self.ms_node,
-            vm_srvc_2_path + "/vm_nfs_mounts/vm_nfs_mount_15",
+        batch.create(vm_srvc_2_path + "/vm_nfs_mounts/vm_nfs_mount_15",
             "vm-nfs-mount",
             props="device_path='{0}' mount_point='{1}'"
-                                    .format(rep46["device_path"],
-                                            rep46["mount_point"]),
-                                    add_to_cleanup=False)
+                     .format(rep46["device_path"],
+                             rep46["mount_point"]),
+                     add_to_cleanup=False)
         #LITPCDS-7182 - Update the vm image
-        self.execute_cli_update_cmd(self.ms_node, vm_srvc_2_path,\
+        batch.update(vm_srvc_2_path,\
             props='image_name={0}'.format(
                 self.up_dict2["VM_SERVICE"]["image_name"]))
 
         #TORF-219762 - Update cpuset
-        self.execute_cli_update_cmd(self.ms_node, vm_srvc_2_path,\
+        batch.update(vm_srvc_2_path,\
             props='cpuset={0}'.format(self.up_dict2["VM_SERVICE"]["cpuset"]))
 
         # TORF-107476 - TC20 - Remove vm-ram-mount item from CS RH6
-        self.execute_cli_remove_cmd(self.ms_node, sg2_path +
-                                    '/applications/vm_service_2/vm_ram_mounts/'
-                                    'vm_ram_mount_2')
+        batch.remove(sg2_path +
+                     '/applications/vm_service_2/vm_ram_mounts/'
+                     'vm_ram_mount_2')
 
         #########################
         #                       #
@@ -416,106 +450,100 @@ class Libvirtupdate2(LibvirtGenericTest):
         sg3_nets = self.up_dict3["NETWORK_INTERFACES"]
 
         # TORF-107476: TC10 -  remove a vm-ram-mount during fo to parallel
-        self.execute_cli_remove_cmd(self.ms_node, sg3_path +
-                                    '/applications/vm_service_3/vm_ram_mounts/'
-                                    'vm_ram_mount_3')
-
-        self.execute_cli_update_cmd(self.ms_node, sg3_path,
-                                    props='active={0} standby={1} '
-                                          'node_list={2}'
-                                    .format(
-                                        self.up_dict3["CLUSTER_SERVICE"]
-                                        ["active"], self.up_dict3
-                                        ["CLUSTER_SERVICE"]["standby"],
-                                        self.up_dict3["CLUSTER_SERVICE"]
-                                        ["node_list"]))
-
-        self.execute_cli_update_cmd(self.ms_node, sg3_path +
-                                    '/applications/vm_service_3/'
-                                    'vm_network_interfaces/net4',
-                                    props="ipaddresses={0}".format(
-                                        sg3_nets["NET4"]["ipaddresses"]))
+        batch.remove(sg3_path +
+                     '/applications/vm_service_3/vm_ram_mounts/'
+                     'vm_ram_mount_3')
+
+        batch.update(sg3_path,
+                     props='active={0} standby={1} '
+                           'node_list={2}'
+                     .format(
+                         self.up_dict3["CLUSTER_SERVICE"]
+                         ["active"], self.up_dict3
+                         ["CLUSTER_SERVICE"]["standby"],
+                         self.up_dict3["CLUSTER_SERVICE"]
+                         ["node_list"]))
+
+        batch.update(sg3_path +
+                     '/applications/vm_service_3/'
+                     'vm_network_interfaces/net4',
+                     props="ipaddresses={0}".format(
+                         sg3_nets["NET4"]["ipaddresses"]))
         # LITPCDS-7179 - Update ip address of network interface
-        self.execute_cli_update_cmd(self.ms_node, sg3_path +
-                                    '/applications/vm_service_3/'
-                                    'vm_network_interfaces/net5',
-                                    props="ipaddresses={0}".format(
-                                        sg3_nets["NET5"]["ipaddresses"]))
-        self.execute_cli_update_cmd(self.ms_node, sg3_path +
-                                    '/applications/vm_service_3/'
-                                    'vm_network_interfaces/net6',
-                                    props="ipaddresses={0}".format(
-                                        sg3_nets["NET6"]["ipaddresses"]))
-        self.execute_cli_update_cmd(self.ms_node, sg3_path +
-                                    '/applications/vm_service_3/'
-                                    'vm_network_interfaces/net_dhcp',
-                                    props="ipv6addresses={0}".format(
-                                        sg3_nets["NET_DHCP"]["ipv6addresses"]
-                                    ))
-        self.execute_cli_update_cmd(self.ms_node, sg3_path +
-                                    '/applications/vm_service_3/'
-                                    'vm_network_interfaces/net32',
-                                    props="ipaddresses={0} ipv6addresses={1}"
-                                    .format(sg3_nets["NET32"]["ipaddresses"],
-                                            sg3_nets["NET32"]["ipv6addresses"]
-                                    ))
-        self.execute_cli_update_cmd(self.ms_node, sg3_path +
-                                    '/applications/vm_service_3/'
-                                    'vm_network_interfaces/net23',
-                                    props="ipaddresses={0}"
-                                    .format(sg3_nets["NET23"]["ipaddresses"]))
-        self.execute_cli_update_cmd(self.ms_node, sg3_path +
-                                    '/applications/vm_service_3/'
-                                    'vm_network_interfaces/net24',
-                                    props="ipaddresses={0}"
-                                    .format(sg3_nets["NET24"]["ipaddresses"]))
+        batch.update(sg3_path +
+                     '/applications/vm_service_3/'
+                     'vm_network_interfaces/net5',
+                     props="ipaddresses={0}".format(
+                         sg3_nets["NET5"]["ipaddresses"]))
+        batch.update(sg3_path +
+                     '/applications/vm_service_3/'
+                     'vm_network_interfaces/net6',
+                     props="ipaddresses={0}".format(
+                         sg3_nets["NET6"]["ipaddresses"]))
+        batch.update(sg3_path +
+                     '/applications/vm_service_3/'
+                     'vm_network_interfaces/net_dhcp',
+                     props="ipv6addresses={0}".format(
+                         sg3_nets["NET_DHCP"]["ipv6addresses"]
+                     ))
+        batch.update(sg3_path +
+                     '/applications/vm_service_3/'
+                     'vm_network_interfaces/net32',
+                     props="ipaddresses={0} ipv6addresses={1}"
+                     .format(sg3_nets["NET32"]["ipaddresses"],
+                             sg3_nets["NET32"]["ipv6addresses"]
+                     ))
+        batch.update(sg3_path +
+                     '/applications/vm_service_3/'
+                     'vm_network_interfaces/net23',
+                     props="ipaddresses={0}"
+                     .format(sg3_nets["NET23"]["ipaddresses"]))
+        batch.update(sg3_path +
+                     '/applications/vm_service_3/'
+                     'vm_network_interfaces/net24',
+                     props="ipaddresses={0}"
+                     .format(sg3_nets["NET24"]["ipaddresses"]))
 
         # LITPCDS-12817 - update device names to preserve consecutiveness
-        self.execute_cli_update_cmd(self.ms_node,
-                            vm_srvc_3_path + "/vm_network_interfaces/net23",
-                            props="device_name={0}"
-                            .format(sg3_nets["NET23"]['device_name']))
-        self.execute_cli_update_cmd(self.ms_node,
-                            vm_srvc_3_path + "/vm_network_interfaces/net24",
-                            props="device_name={0}"
-                            .format(sg3_nets["NET24"]['device_name']))
+        batch.update(vm_srvc_3_path + "/vm_network_interfaces/net23",
+                     props="device_name={0}"
+                     .format(sg3_nets["NET23"]['device_name']))
+        batch.update(vm_srvc_3_path + "/vm_network_interfaces/net24",
+                     props="device_name={0}"
+                     .format(sg3_nets["NET24"]['device_name']))
 
         #LITPCDS-12817 - remove vm network interface
-        self.execute_cli_remove_cmd(self.ms_node,
-                            vm_srvc_3_path + "/vm_network_interfaces/net34")
+        batch.remove(vm_srvc_3_path + "/vm_network_interfaces/net34")
 
         #Update properties of vm aliases
         rep11 = self.up_dict3["VM_ALIAS"]["DB1"]["alias_names"]
-        self.execute_cli_update_cmd(self.ms_node, vm_srvc_3_path + \
+        batch.update(vm_srvc_3_path + \
             "/vm_aliases/db1", props='alias_names={0}'.format(rep11))
 
         rep12 = self.up_dict3["VM_ALIAS"]["DB2"]["address"]
-        self.execute_cli_update_cmd(self.ms_node, vm_srvc_3_path + \
+        batch.update(vm_srvc_3_path + \
             "/vm_aliases/db2", props='address={0}'.format(rep12))
 
         rep13 = self.up_dict3["VM_ALIAS"]["DB3"]["alias_names"]
-        self.execute_cli_update_cmd(self.ms_node,\
-            sg3_path + "/applications/vm_service_3/vm_aliases/db3",\
+        batch.update(sg3_path + "/applications/vm_service_3/vm_aliases/db3",\
             props='alias_names={0}'.format(rep13))
 
         rep14 = self.up_dict3["VM_ALIAS"]["DB4"]["address"]
-        self.execute_cli_update_cmd(self.ms_node,\
-            sg3_path + "/applications/vm_service_3/vm_aliases/db4",\
+        batch.update(sg3_path + "/applications/vm_service_3/vm_aliases/db4",\
             props='address={0}'.format(rep14))
 
         #LITPCDS-7188 - Update package name
         rep36 = self.up_dict3["PACKAGES"]["pkg_empty_rpm4"]["name"]
-        self.execute_cli_update_cmd(self.ms_node, vm_srvc_3_path + \
+        batch.update(vm_srvc_3_path + \
             "/vm_packages/pkg_empty_rpm4", props='name={0}'.format(rep36))
 
         #LITPCDS-7182 - Update vm image name
         rep40 = self.up_dict3["VM_SERVICE"]["image_name"]
-        self.execute_cli_update_cmd(self.ms_node,\
-            vm_srvc_3_path, props='image_name={0}'.format(rep40))
+        batch.update(vm_srvc_3_path, props='image_name={0}'.format(rep40))
 
         # TORF-291089 - Unset cpunodebind
-        self.execute_cli_update_cmd(self.ms_node, vm_srvc_3_path,
-                                    'cpunodebind', action_del=True)
+        batch.update(vm_srvc_3_path,
+                     'cpunodebind', action_del=True)
 
         #########################
         #                       #
@@ -525,45 +553,43 @@ class Libvirtupdate2(LibvirtGenericTest):
 
         #LITPCDS-7179 - Update the ip addresses of 3 vm network interfaces
         rep15 = self.up_dict4["NETWORK_INTERFACES"]["NET8"]["ipaddresses"]
-        self.execute_cli_update_cmd(self.ms_node, sg4_path + \
+        batch.update(sg4_path + \
             "/applications/vm_service_4/vm_network_interfaces/net8",\
             props='ipaddresses={0}'.format(rep15))
 
         rep16 = self.up_dict4["NETWORK_INTERFACES"]["NET9"]["ipaddresses"]
-        self.execute_cli_update_cmd(self.ms_node, sg4_path + \
+        batch.update(sg4_path + \
             "/applications/vm_service_4/vm_network_interfaces/net9",\
             props='ipaddresses={0}'.format(rep16))
 
         rep17 = self.up_dict4["NETWORK_INTERFACES"]["NET10"]["ipaddresses"]
-        self.execute_cli_update_cmd(self.ms_node, sg4_path + \
+        batch.update(sg4_path + \
             "/applications/vm_service_4/vm_network_interfaces/net10",\
             props='ipaddresses={0}'.format(rep17))
 
         #Update the alias names and address of 2 vm aliases
         rep18a = self.up_dict4["VM_ALIAS"]["DB25"]["alias_names"]
         rep18b = self.up_dict4["VM_ALIAS"]["DB25"]["address"]
-        self.execute_cli_update_cmd(self.ms_node,\
-            vm_srvc_4_path + "/vm_aliases/db25",\
+        batch.update(vm_srvc_4_path + "/vm_aliases/db25",\
             props='alias_names={0} address={1}'.format(rep18a, rep18b))
 
         rep19a = self.up_dict4["VM_ALIAS"]["DB26"]["alias_names"]
         rep19b = self.up_dict4["VM_ALIAS"]["DB26"]["address"]
-        self.execute_cli_update_cmd(self.ms_node,\
-            sg4_path + "/applications/vm_service_4/vm_aliases/db26",\
+        batch.update(sg4_path + "/applications/vm_service_4/vm_aliases/db26",\
             props='alias_names={0} address={1}'.format(rep19a, rep19b))
 
         #LITPCDS-585 - Update vm service properties; cpu no. and ram
         rep30 = self.up_dict4["VM_SERVICE"]["cpus"]
-        self.execute_cli_update_cmd(self.ms_node, sg4_path + \
+        batch.update(sg4_path + \
             "/applications/vm_service_4", props='cpus={0}'.format(rep30))
 
         rep33 = self.up_dict4["VM_SERVICE"]["ram"]
-        self.execute_cli_update_cmd(self.ms_node, sg4_path + \
+        batch.update(sg4_path + \
             "/applications/vm_service_4", props='ram={0}'.format(rep33))
 
         # TORF-113124 test_06_p_update_multiple_vm_images_during_idemp
         rep36 = self.up_dict4["VM_SERVICE"]["image_name"]
-        self.execute_cli_update_cmd(self.ms_node, sg4_path + \
+        batch.update(sg4_path + \
             "/applications/vm_service_4", props='image_name={0}'.format(rep36))
 
         ########################
@@ -574,77 +600,75 @@ class Libvirtupdate2(LibvirtGenericTest):
 
         #LITPCDS-7179 - Update the ipaddresses of 2 vm network interfaces
         rep20 = self.up_dict5["NETWORK_INTERFACES"]["NET11"]["ipaddresses"]
-        self.execute_cli_update_cmd(self.ms_node, sg5_path + \
+        batch.update(sg5_path + \
             "/applications/vm_service_5/vm_network_interfaces/net11",\
             props='ipaddresses={0}'.format(rep20))
 
         rep21 = self.up_dict5["NETWORK_INTERFACES"]["NET13"]["ipaddresses"]
-        self.execute_cli_update_cmd(self.ms_node, sg5_path + \
+        batch.update(sg5_path + \
             "/applications/vm_service_5/vm_network_interfaces/net13",\
             props='ipaddresses={0}'.format(rep21))
 
         #LITPCDS-7179 - Delete the ipv6addresses, and gateway,
         # of vm network interface
-        self.execute_cli_update_cmd(self.ms_node, sg5_path + \
+        batch.update(sg5_path + \
             "/applications/vm_service_5/vm_network_interfaces/net15",\
             'ipv6addresses', action_del=True)
 
-        self.execute_cli_update_cmd(self.ms_node, vm_srvc_5_path + \
+        batch.update(vm_srvc_5_path + \
             "/vm_network_interfaces/net15", 'gateway6', action_del=True)
 
         #LITPCDS-7179 - Update the ip addresses of the same network interface
         rep24 = self.up_dict5["NETWORK_INTERFACES"]["NET15"]["ipaddresses"]
-        self.execute_cli_update_cmd(self.ms_node, sg5_path + \
+        batch.update(sg5_path + \
             "/applications/vm_service_5/vm_network_interfaces/net15",\
             props='ipaddresses={0}'.format(rep24))
 
         #Update the alias names and addresses of vm aliases
         rep25 = self.up_dict5["VM_ALIAS"]["DB1"]["alias_names"]
-        self.execute_cli_update_cmd(self.ms_node, vm_srvc_5_path + \
+        batch.update(vm_srvc_5_path + \
             "/vm_aliases/db1", props='alias_names={0}'.format(rep25))
 
         rep26 = self.up_dict5["VM_ALIAS"]["DB2"]["address"]
-        self.execute_cli_update_cmd(self.ms_node, vm_srvc_5_path + \
+        batch.update(vm_srvc_5_path + \
             "/vm_aliases/db2", props='address={0}'.format(rep26))
 
         rep27 = self.up_dict5["VM_ALIAS"]["DB4"]["alias_names"]
-        self.execute_cli_update_cmd(self.ms_node,\
-            sg5_path + "/applications/vm_service_5/vm_aliases/db4",\
+        batch.update(sg5_path + "/applications/vm_service_5/vm_aliases/db4",\
             props='alias_names={0}'.format(rep27))
 
         rep28 = self.up_dict5["VM_ALIAS"]["DB27"]["address"]
-        self.execute_cli_update_cmd(self.ms_node,\
-            sg5_path + "/applications/vm_service_5/vm_aliases/db27",\
+        batch.update(sg5_path + "/applications/vm_service_5/vm_aliases/db27",\
             props='address={0}'.format(rep28))
 
         #LITPCDS-585 - Update vm service properties; cpu and ram
         rep31 = self.up_dict5["VM_SERVICE"]["cpus"]
-        self.execute_cli_update_cmd(self.ms_node, sg5_path + \
+        batch.update(sg5_path + \
             "/applications/vm_service_5", props='cpus={0}'.format(rep31))
 
-        self.execute_cli_update_cmd(self.ms_node, sg5_path + \
+        batch.update(sg5_path + \
             "/applications/vm_service_5", props='ram={0}'.format(
                 self.up_dict5["VM_SERVICE"]["ram"]))
 
         #LITPCDS-7188 - Update package name
-        self.execute_cli_update_cmd(self.ms_node, vm_srvc_5_path + \
+        batch.update(vm_srvc_5_path + \
             "/vm_packages/empty_rpm3", props='name={0}'.format(
             self.up_dict5["PACKAGES"]["pkg_empty_rpm3"]["name"]))
 
         # LITPCDS-7182 - Update vm image name
-        self.execute_cli_update_cmd(self.ms_node, vm_srvc_5_path,\
+        batch.update(vm_srvc_5_path,\
         props='image_name={0}'.format(
             self.up_dict5["VM_SERVICE"]["image_name"]))
 
         # TORF-219762 - Unset cpuset
-        self.execute_cli_update_cmd(self.ms_node, vm_srvc_5_path,
-                                    'cpuset', action_del=True)
+        batch.update(vm_srvc_5_path,
+                     'cpuset', action_del=True)
 
         #LITPCDS-12817 - Add vm-network-interfaces for removal in next update
         for vm_net_id in self.up_dict5["NETWORK_INTERFACES"]:
             if vm_net_id in ["NET35", "NET36", "NET37"]:
                 vm_net = self.up_dict5["NETWORK_INTERFACES"][vm_net_id]
-                self.execute_cli_create_cmd(self.ms_node, vm_srvc_5_path + \
+                batch.create(vm_srvc_5_path + \
                             "/vm_network_interfaces/" + vm_net_id.lower(),
                             "vm-network-interface",
                             props="host_device='{0}' network_name='{1}' "
@@ -653,7 +677,7 @@ class Libvirtupdate2(LibvirtGenericTest):
                                vm_net["host_device"], vm_net["network_name"],
                                vm_net["device_name"], vm_net["ipaddresses"],
                                vm_net["ipv6addresses"]),
-                                        add_to_cleanup=False)
+                             add_to_cleanup=False)
 
         # TORF-271798 - update vm service based on a rhel7.4 image
         #########################
@@ -662,50 +686,49 @@ class Libvirtupdate2(LibvirtGenericTest):
         #                       #
         #########################
         # TORF-271798 TC_06: update vcs clustered service from FO to PL
-        self.execute_cli_update_cmd(
-            self.ms_node, self.sg6_path, props='active={0} standby={1}'.format(
+        batch.update(
+            self.sg6_path, props='active={0} standby={1}'.format(
                 self.up_sg6_dict["CLUSTER_SERVICE"]["active"],
                 self.up_sg6_dict["CLUSTER_SERVICE"]["standby"]))
 
         # TORF-271798 TC_11: update IPv4 addresses of vm network interface
-        self.execute_cli_update_cmd(
-            self.ms_node, "{0}/net1".format(self.sg6_net_ifs_path),
+        batch.update(
+            "{0}/net1".format(self.sg6_net_ifs_path),
             props='ipaddresses={0}'.format(
                 self.up_sg6_dict["NETWORK_INTERFACES"]["NET1"]["ipaddresses"]))
 
         # TORF-271798 TC_12: update IPv6 addresses of vm network interface
-        self.execute_cli_update_cmd(
-            self.ms_node, "{0}/net2".format(self.sg6_net_ifs_path),
+        batch.update(
+            "{0}/net2".format(self.sg6_net_ifs_path),
             props='ipv6addresses={0}'.format(
             self.up_sg6_dict["NETWORK_INTERFACES"]["NET2"]["ipv6addresses"]))
 
         # TORF-271798 TC_13: create new vm network interface
-        self.execute_cli_create_cmd(self.ms_node,
-                '{0}vm_service_6/vm_network_interfaces/net3'.format(
+        batch.create('{0}vm_service_6/vm_network_interfaces/net3'.format(
                     self.srvc_path),
                 class_type="vm-network-interface",
                 props="host_device={0} network_name={1} device_name={2}".format
                 (self.up_sg6_dict["NETWORK_INTERFACES"]["NET3"]["host_device"],
                 self.up_sg6_dict["NETWORK_INTERFACES"]["NET3"]["network_name"],
                 self.up_sg6_dict["NETWORK_INTERFACES"]["NET3"]["device_name"]),
-                add_to_cleanup=False)
+                     add_to_cleanup=False)
 
         # TORF-271798 TC_08: deploy vm service with IPv6
-        self.execute_cli_update_cmd(
-            self.ms_node, "{0}/net3".format(self.sg6_net_ifs_path),
+        batch.update(
+            "{0}/net3".format(self.sg6_net_ifs_path),
             props='ipv6addresses={0} ipaddresses={1}'.format(
             self.up_sg6_dict["NETWORK_INTERFACES"]["NET3"]["ipv6addresses"],
             self.up_sg6_dict["NETWORK_INTERFACES"]["NET3"]["ipaddresses"]))
 
-        self.execute_cli_update_cmd(self.ms_node,
-                url=self.srvc_path + 'vm_service_6/vm_network_interfaces/net3',
-                props="gateway6={0}".format(
+        batch.update(
+            url=self.srvc_path + 'vm_service_6/vm_network_interfaces/net3',
+            props="gateway6={0}".format(
                 self.up_sg6_dict["NETWORK_INTERFACES"]["NET3"]["gateway6"]))
 
         # TORF-271798 TC_14: update vm service properties: ram, hostnames,
         # internal_status_check
-        self.execute_cli_update_cmd(
-            self.ms_node, "{0}vm_service_6".format(self.srvc_path),
+        batch.update(
+            "{0}vm_service_6".format(self.srvc_path),
             props='ram={0} hostnames={1} internal_status_check={2}'.format(
                 self.up_sg6_dict["VM_SERVICE"]["ram"],
                 self.up_sg6_dict["VM_SERVICE"]["hostnames"],
@@ -716,10 +739,12 @@ class Libvirtupdate2(LibvirtGenericTest):
             item_path = '{0}/{1}'.format(
                 self.srvc_path + "vm_service_6/vm_firewall_rules",
                 fw_rule["item_name"])
-            self.execute_cli_create_cmd(self.ms_node, item_path,
-                                        class_type='vm-firewall-rule',
-                                        props=fw_rule["props"],
-                                        add_to_cleanup=False)
+            batch.create(item_path,
+                         class_type='vm-firewall-rule',
+                         props=fw_rule["props"],
+                         add_to_cleanup=False)
+
+        self.apply_model_batch(batch)
 
     def setup_add_pkgs(self):
         """
@@ -806,19 +831,15 @@ class Libvirtupdate2(LibvirtGenericTest):
         Returns: Nothing
         """
 
-        target_cmd = 'findmnt -s -l -n -T {0}'.format(mnt_point)
-
         self.add_vm_to_node_list(hostname,
                                  username=test_constants.LIBVIRT_VM_USERNAME,
                                  password=test_constants.LIBVIRT_VM_PASSWORD,
                                  ipv4=ipaddr)
 
-        actual, _, _ = self.run_command(hostname, target_cmd,
-                                        username=test_constants.
-                                        LIBVIRT_VM_USERNAME,
-                                        password=test_constants.
-                                        LIBVIRT_VM_PASSWORD,
-                                        execute_timeout=60)
+        actual = self.get_fstab_entry(
+            hostname, mnt_point,
+            username=test_constants.LIBVIRT_VM_USERNAME,
+            password=test_constants.LIBVIRT_VM_PASSWORD)
         mnt_pnt_flag = self.is_text_in_list(mnt_point, actual)
 
         if mnt_pnt_flag:
@@ -884,6 +905,7 @@ class Libvirtupdate2(LibvirtGenericTest):
                         LIBVIRT_VM_USERNAME,
                         password=vm_password,
                         execute_timeout=60)
+        self.bump_verification_epoch('reboot of "{0}"'.format(service_name))
 
         if "sles" == service_name:
             status = self.wait_for_node_up(service_name)
@@ -1276,12 +1298,8 @@ class Libvirtupdate2(LibvirtGenericTest):
         # TORF-271798: verify updated vm service based on rhel7.4 image is up
         # and running with all configurations applied
         sg6_name = 'Grp_CS_c1_CS_VM6'
-        sg6_states = self.run_vcs_hagrp_display_command(primary_node,
-                                                        sg6_name,
-                                                        "State")
-        online_nodes = [sg_state['SYSTEM'] for sg_state in
-                        sg6_states['State']
-                        if "|ONLINE|" in sg_state['VALUE']]
+        online_nodes = self.get_vcs_states(primary_node).online_systems(
+            sg6_name)
         self.assertEqual(len(online_nodes), int(vm6_cs['active']),
                          'Service Group {0} is not ONLINE on all active nodes'.
                          format(sg6_name))
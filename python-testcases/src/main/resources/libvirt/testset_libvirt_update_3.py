@@ -13,6 +13,8 @@ program(s) have been supplied.
 
 from litp_generic_test import attr
 from testset_libvirt_initial_setup import LibvirtGenericTest
+from libvirt_model_utils import lazy_property
+from libvirt_model_builder import ModelBatch
 import os
 import test_constants
 import libvirt_test_data
@@ -34,22 +36,41 @@ class Libvirtupdate3(LibvirtGenericTest):
         # 1. Call super class setup
         super(Libvirtupdate3, self).setUp()
 
-        self.model = self.get_model_names_and_urls()
-        self.management_server = self.model["ms"][0]["name"]
+        self.management_server = self.get_management_node_filename()
 
         # Location where the rpms to be installed are stored
         self.rpm_src_dir = \
             os.path.dirname(os.path.realpath(__file__)) + "/rpms"
 
-        self.libvirt_info = self.get_litp_model_information()
-        self.vm_ip = self.get_ip_for_vms(self.management_server)
         self.ms_hostname = self.get_node_att(self.management_server,
                                              "hostname")
 
-        # LITPCDS-7848 setup
-        self.clus_srvs = self.libvirt_info["libvirt"]["cluster_services_path"]
-        self.vm_service_urls = self.find(self.management_server,
-                                         self.clus_srvs, "vm-service")
+    @lazy_property
+    def model(self):
+        """ LITP model names and urls, loaded on first use """
+        return self.get_cached_model_info(self.get_model_names_and_urls)
+
+    @lazy_property
+    def libvirt_info(self):
+        """ LITP model information, loaded on first use """
+        return self.get_cached_model_info(
+            self.get_litp_model_information)
+
+    @lazy_property
+    def clus_srvs(self):
+        """ Path of the cluster services """
+        return self.libvirt_info["libvirt"]["cluster_services_path"]
+
+    @lazy_property.pinned
+    def vm_ip(self):
+        """ IP addresses of the VMs """
+        return self.get_ip_for_vms(self.management_server)
+
+    @lazy_property.pinned
+    def vm_service_urls(self):
+        """ Urls of the clustered vm-services (LITPCDS-7848) """
+        return self.find(self.management_server, self.clus_srvs,
+                         "vm-service")
 
     def tearDown(self):
         """
@@ -212,6 +233,7 @@ class Libvirtupdate3(LibvirtGenericTest):
         Description:
             This test involves updates to all service groups.
         """
+        batch = ModelBatch()
         sg1 = self.libvirt_info["libvirt"][
                                 "software_services_path"] + "vm_service_1"
         sg2 = self.libvirt_info["libvirt"][
@@ -256,62 +278,53 @@ class Libvirtupdate3(LibvirtGenericTest):
         #                       #
         #########################
         #Update VM Aliases
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg1 + "/vm_aliases/db1",
-                                    "alias_names='{0}'".format(
-                                        update3_sg1["VM_ALIAS"]["DB1"][
-                                            "alias_names"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg1 + "/vm_aliases/db2",
-                                    "address='{0}'".format(
-                                        update3_sg1["VM_ALIAS"]["DB2"][
-                                            "address"]))
+        batch.update(sg1 + "/vm_aliases/db1",
+                     "alias_names='{0}'".format(
+                         update3_sg1["VM_ALIAS"]["DB1"][
+                             "alias_names"]))
+        batch.update(sg1 + "/vm_aliases/db2",
+                     "address='{0}'".format(
+                         update3_sg1["VM_ALIAS"]["DB2"][
+                             "address"]))
         #LITPCDS-7188 - Update VM packages
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs1 + "/vm_packages/pkg_empty_rpm1",
-                                    "name='{0}'".format(
-                                        update3_sg1["VM_PACKAGE"][
-                                            "PKG_EMPTY_1"]["name"]))
+        batch.update(cs1 + "/vm_packages/pkg_empty_rpm1",
+                     "name='{0}'".format(
+                         update3_sg1["VM_PACKAGE"][
+                             "PKG_EMPTY_1"]["name"]))
         #LITPCDS-12817 - Remove vm aliases
-        self.execute_cli_remove_cmd(self.management_server,
-                                    sg1 + "/vm_aliases/db21")
+        batch.remove(sg1 + "/vm_aliases/db21")
 
         # TORF-349676 - remove vm aliases with IPv6 address containing prefix
-        self.execute_cli_remove_cmd(self.management_server,
-                                    sg1 + "/vm_aliases/ipv6a")
-        self.execute_cli_remove_cmd(self.management_server,
-                                    sg1 + "/vm_aliases/ipv6b")
+        batch.remove(sg1 + "/vm_aliases/ipv6a")
+        batch.remove(sg1 + "/vm_aliases/ipv6b")
 
         # TORF-107476 -  Test case 11
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs1 + "/vm_network_interfaces/net1",
-                                    "ipaddresses={0}".format(
-                                        update3_sg1["NETWORK_INTERFACES"][
-                                            "NET1"]["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs1 + "/vm_network_interfaces/net20",
-                                    "ipaddresses={0}".format(
-                                        update3_sg1["NETWORK_INTERFACES"][
-                                            "NET20"]["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs1 + "/vm_network_interfaces/net21",
-                                    "ipaddresses={0}".format(
-                                        update3_sg1["NETWORK_INTERFACES"][
-                                            "NET21"]["ipaddresses"]))
+        batch.update(cs1 + "/vm_network_interfaces/net1",
+                     "ipaddresses={0}".format(
+                         update3_sg1["NETWORK_INTERFACES"][
+                             "NET1"]["ipaddresses"]))
+        batch.update(cs1 + "/vm_network_interfaces/net20",
+                     "ipaddresses={0}".format(
+                         update3_sg1["NETWORK_INTERFACES"][
+                             "NET20"]["ipaddresses"]))
+        batch.update(cs1 + "/vm_network_interfaces/net21",
+                     "ipaddresses={0}".format(
+                         update3_sg1["NETWORK_INTERFACES"][
+                             "NET21"]["ipaddresses"]))
         # Update cluster service
-        self.execute_cli_update_cmd(self.management_server, cs_vm1,
-                                    "active={0} standby={1} node_list={2}".
-                                    format(update3_sg1
-                                           ["CLUSTER_SERVICE"]["active"],
-                                           update3_sg1["CLUSTER_SERVICE"]
-                                           ["standby"],
-                                           update3_sg1["CLUSTER_SERVICE"]
-                                           ["node_list"]))
-        self.execute_cli_remove_cmd(self.management_server, sg1 +
-                                    '/vm_ram_mounts/vm_ram_mount_1')
+        batch.update(cs_vm1,
+                     "active={0} standby={1} node_list={2}".
+                     format(update3_sg1
+                            ["CLUSTER_SERVICE"]["active"],
+                            update3_sg1["CLUSTER_SERVICE"]
+                            ["standby"],
+                            update3_sg1["CLUSTER_SERVICE"]
+                            ["node_list"]))
+        batch.remove(sg1 +
+                     '/vm_ram_mounts/vm_ram_mount_1')
         # TORF-180365 - Remove vm custom script
-        self.execute_cli_remove_cmd(self.management_server, sg1 +
-                                    '/vm_custom_script/vm_custom_script_1')
+        batch.remove(sg1 +
+                     '/vm_custom_script/vm_custom_script_1')
 
         #############################
         #                           #
@@ -319,19 +332,19 @@ class Libvirtupdate3(LibvirtGenericTest):
         #                           #
         #############################
         # TORF-404805 remove zypper repo and package
-        self.execute_cli_remove_cmd(self.management_server, sg7 +
-                                    '/vm_packages/pkg_empty_rpm')
-        self.execute_cli_remove_cmd(self.management_server, sg7 +
-                                    '/vm_zypper_repos/repo_NCM')
+        batch.remove(sg7 +
+                     '/vm_packages/pkg_empty_rpm')
+        batch.remove(sg7 +
+                     '/vm_zypper_repos/repo_NCM')
 
         # TORF-422322 remove vm-firewall-rule(s) for sles v4 & v6
         for rule in libvirt_test_data.VM_FIREWALL_RULES_SLES_1:
-            self.execute_cli_remove_cmd(self.management_server, sg7 +
-                                    '/vm_firewall_rules/' + rule["item_name"])
+            batch.remove(sg7 +
+                         '/vm_firewall_rules/' + rule["item_name"])
 
         # TORF-406586 remove vm custom scripts
-        self.execute_cli_remove_cmd(self.management_server, sg7 +
-                                    '/vm_custom_script/vm_custom_script')
+        batch.remove(sg7 +
+                     '/vm_custom_script/vm_custom_script')
 
         #########################
         #                       #
@@ -339,67 +352,59 @@ class Libvirtupdate3(LibvirtGenericTest):
         #                       #
         #########################
         # Update VM aliases
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg2 + "/vm_aliases/db1",
-                                    "alias_names='{0}' address='{1}'".format(
-                                        update3_sg2["VM_ALIAS"]["DB1"][
-                                            "alias_names"],
-                                        update3_sg2["VM_ALIAS"]["DB1"][
-                                            "address"]))
+        batch.update(sg2 + "/vm_aliases/db1",
+                     "alias_names='{0}' address='{1}'".format(
+                         update3_sg2["VM_ALIAS"]["DB1"][
+                             "alias_names"],
+                         update3_sg2["VM_ALIAS"]["DB1"][
+                             "address"]))
 
         # LITPCDS-8851 Update the number of nodes and interfaces
         # for a clustered service
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs2 + "/vm_network_interfaces/net31",
-                                    "ipaddresses={0}".format(
-                                        update3_sg2["NETWORK_INTERFACE"][
-                                            "NET31"]["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs2 + "/vm_network_interfaces/net22",
-                                    "ipaddresses={0}".format(
-                                        update3_sg2["NETWORK_INTERFACE"][
-                                            "NET22"]["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs2 + "/vm_network_interfaces/net2",
-                                    "ipaddresses={0}".format(
-                                        update3_sg2["NETWORK_INTERFACE"][
-                                            "NET2"]["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs2 + "/vm_network_interfaces/net3",
-                                    "ipaddresses={0}".format(
-                                        update3_sg2["NETWORK_INTERFACE"][
-                                            "NET3"]["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs2 + "/vm_network_interfaces/net30",
-                                    "ipaddresses={0}".format(
-                                        update3_sg2["NETWORK_INTERFACE"][
-                                            "NET30"]["ipaddresses"]))
+        batch.update(cs2 + "/vm_network_interfaces/net31",
+                     "ipaddresses={0}".format(
+                         update3_sg2["NETWORK_INTERFACE"][
+                             "NET31"]["ipaddresses"]))
+        batch.update(cs2 + "/vm_network_interfaces/net22",
+                     "ipaddresses={0}".format(
+                         update3_sg2["NETWORK_INTERFACE"][
+                             "NET22"]["ipaddresses"]))
+        batch.update(cs2 + "/vm_network_interfaces/net2",
+                     "ipaddresses={0}".format(
+                         update3_sg2["NETWORK_INTERFACE"][
+                             "NET2"]["ipaddresses"]))
+        batch.update(cs2 + "/vm_network_interfaces/net3",
+                     "ipaddresses={0}".format(
+                         update3_sg2["NETWORK_INTERFACE"][
+                             "NET3"]["ipaddresses"]))
+        batch.update(cs2 + "/vm_network_interfaces/net30",
+                     "ipaddresses={0}".format(
+                         update3_sg2["NETWORK_INTERFACE"][
+                             "NET30"]["ipaddresses"]))
         #Update cluster service
-        self.execute_cli_update_cmd(self.management_server, cs_vm2,
-                                "active={0} standby={1} node_list={2}".format(
-                                    update3_sg2["CLUSTER_SERVICE"][
-                                        "active"],
-                                    update3_sg2["CLUSTER_SERVICE"][
-                                        "standby"],
-                                    update3_sg2["CLUSTER_SERVICE"][
-                                        "node_list"]))
+        batch.update(cs_vm2,
+                     "active={0} standby={1} node_list={2}".format(
+                         update3_sg2["CLUSTER_SERVICE"][
+                             "active"],
+                         update3_sg2["CLUSTER_SERVICE"][
+                             "standby"],
+                         update3_sg2["CLUSTER_SERVICE"][
+                             "node_list"]))
         #LITPCDS-12817 - Remove vm aliases
-        self.execute_cli_remove_cmd(self.management_server,
-                                    sg2 + "/vm_aliases/db22")
-        self.execute_cli_remove_cmd(self.management_server,
-                                    sg2 + "/vm_aliases/db23")
+        batch.remove(sg2 + "/vm_aliases/db22")
+        batch.remove(sg2 + "/vm_aliases/db23")
         # TORF-107476 -  Test case 9 & 18
-        self.execute_cli_update_cmd(self.management_server, sg2 +
-                                    "/vm_ram_mounts/vm_ram_mount_2",
-                                    props="type='{0}' mount_point='{1}' "
-                                    "mount_options='{2}'"
-                                    .format(
-                                      update3_sg2["VM_RAM_MOUNT"]["type"],
-                                      update3_sg2["VM_RAM_MOUNT"]
-                                      ["mount_point"],
-                                      update3_sg2["VM_RAM_MOUNT"]
-                                      ["mount_options"]
-                                      ))
+        batch.update(sg2 +
+                     "/vm_ram_mounts/vm_ram_mount_2",
+                     props="type='{0}' mount_point='{1}' "
+                     "mount_options='{2}'"
+                     .format(
+                       update3_sg2["VM_RAM_MOUNT"]["type"],
+                       update3_sg2["VM_RAM_MOUNT"]
+                       ["mount_point"],
+                       update3_sg2["VM_RAM_MOUNT"]
+                       ["mount_options"]
+                       ))
 
         #########################
         #                       #
@@ -408,58 +413,49 @@ class Libvirtupdate3(LibvirtGenericTest):
         #########################
 
         # Update vm aliases
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg3 + "/vm_aliases/db1",
-                                    "alias_names='{0}'".format(
-                                        update3_sg3["VM_ALIAS"]["DB1"][
-                                            "alias_names"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg3 + "/vm_aliases/db2",
-                                    "address='{0}'".format(
-                                        update3_sg3["VM_ALIAS"]["DB2"][
-                                            "address"]))
+        batch.update(sg3 + "/vm_aliases/db1",
+                     "alias_names='{0}'".format(
+                         update3_sg3["VM_ALIAS"]["DB1"][
+                             "alias_names"]))
+        batch.update(sg3 + "/vm_aliases/db2",
+                     "address='{0}'".format(
+                         update3_sg3["VM_ALIAS"]["DB2"][
+                             "address"]))
         #LITPCDS-7188 - Update vm packages
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs3 + "/vm_packages/pkg_empty_rpm4",
-                                    "name='{0}'".format(
-                                        update3_sg3["VM_PACKAGE"][
-                                            "PKG_EMPTY_4"]["name"]))
+        batch.update(cs3 + "/vm_packages/pkg_empty_rpm4",
+                     "name='{0}'".format(
+                         update3_sg3["VM_PACKAGE"][
+                             "PKG_EMPTY_4"]["name"]))
         #LITPCDS-7815 - Update NFS mount
-        self.execute_cli_update_cmd(self.management_server,
-                                sg3 + "/vm_nfs_mounts/vm_nfs_mount_16",
-                                "device_path='{0}' mount_point='{1}'".format(
-                                    update3_sg3["NFS_MOUNT"]["MOUNT_16"][
-                                        "device_path"],
-                                    update3_sg3["NFS_MOUNT"]["MOUNT_16"][
-                                        "mount_point"]))
+        batch.update(sg3 + "/vm_nfs_mounts/vm_nfs_mount_16",
+                     "device_path='{0}' mount_point='{1}'".format(
+                         update3_sg3["NFS_MOUNT"]["MOUNT_16"][
+                             "device_path"],
+                         update3_sg3["NFS_MOUNT"]["MOUNT_16"][
+                             "mount_point"]))
         #LITPCDS-12817 - Add back vm network interface
         net33 = update3_sg3["NETWORK_INTERFACE"]["NET33"]
-        self.execute_cli_create_cmd(self.management_server,
-                                sg3 + "/vm_network_interfaces/net33",
-                                "vm-network-interface",
-                                props="host_device='{0}' network_name='{1}' "
-                                   "device_name='{2}' ipaddresses='{3}' "
-                                   "ipv6addresses='{4}'".format(
-                                   net33["host_device"], net33["network_name"],
-                                   net33["device_name"], net33["ipaddresses"],
-                                   net33["ipv6addresses"]),
-                                    add_to_cleanup=False)
+        batch.create(sg3 + "/vm_network_interfaces/net33",
+                     "vm-network-interface",
+                     props="host_device='{0}' network_name='{1}' "
+                           "device_name='{2}' ipaddresses='{3}' "
+                           "ipv6addresses='{4}'".format(
+                               net33["host_device"], net33["network_name"],
+                               net33["device_name"], net33["ipaddresses"],
+                               net33["ipv6addresses"]),
+                     add_to_cleanup=False)
 
         #LITPCDS-13197 - Remove vm ssh key
-        self.execute_cli_remove_cmd(self.management_server,
-                                    sg3 + "/vm_ssh_keys/ssh_key_rsa_14")
+        batch.remove(sg3 + "/vm_ssh_keys/ssh_key_rsa_14")
         #LITPCDS-13197 - Remove vm package
-        self.execute_cli_remove_cmd(self.management_server,
-                                    sg3 + "/vm_packages/pkg_empty_rpm5")
+        batch.remove(sg3 + "/vm_packages/pkg_empty_rpm5")
         #LITPCDS-13197 - Remove vm nfs mount
-        self.execute_cli_remove_cmd(self.management_server,
-                                    sg3 + "/vm_nfs_mounts/vm_nfs_mount_18")
+        batch.remove(sg3 + "/vm_nfs_mounts/vm_nfs_mount_18")
         #LITPCDS-13197 - Remove vm yum repo
-        self.execute_cli_remove_cmd(self.management_server,
-                                    sg3 + "/vm_yum_repos/repo_LITP ")
+        batch.remove(sg3 + "/vm_yum_repos/repo_LITP ")
         # TORF-180365 - Remove vm custom script
-        self.execute_cli_remove_cmd(self.management_server, sg3 +
-                                    '/vm_custom_script/vm_custom_script_1')
+        batch.remove(sg3 +
+                     '/vm_custom_script/vm_custom_script_1')
 
         #########################
         #                       #
@@ -468,86 +464,76 @@ class Libvirtupdate3(LibvirtGenericTest):
         #########################
 
         # Update vm aliases
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg4 + "/vm_aliases/db25",
-                                    "alias_names='{0}' address='{1}'".format(
-                                        update3_sg4["VM_ALIAS"]["DB25"][
-                                            "alias_names"],
-                                        update3_sg4["VM_ALIAS"]["DB25"][
-                                            "address"]))
+        batch.update(sg4 + "/vm_aliases/db25",
+                     "alias_names='{0}' address='{1}'".format(
+                         update3_sg4["VM_ALIAS"]["DB25"][
+                             "alias_names"],
+                         update3_sg4["VM_ALIAS"]["DB25"][
+                             "address"]))
         #LITPCDS-7179 - Configure network interfaces
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs4 + "/vm_network_interfaces/net10",
-                                    "ipaddresses={0}".format(
-                                        update3_sg4["NETWORK_INTERFACE"][
-                                            "NET10"]["ipaddresses"]))
+        batch.update(cs4 + "/vm_network_interfaces/net10",
+                     "ipaddresses={0}".format(
+                         update3_sg4["NETWORK_INTERFACE"][
+                             "NET10"]["ipaddresses"]))
         # LITPCDS-7516 Configure vm with ipv6 addresses
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs4 + "/vm_network_interfaces/net_dhcp",
-                                    "ipv6addresses='{0}'".format(
-                                        update3_sg4["NETWORK_INTERFACE"][
-                                            "DHCP"]["ipv6addresses"]))
+        batch.update(cs4 + "/vm_network_interfaces/net_dhcp",
+                     "ipv6addresses='{0}'".format(
+                         update3_sg4["NETWORK_INTERFACE"][
+                             "DHCP"]["ipv6addresses"]))
         # LITPCDS-8968 Configure network interfaces for parallel CS
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg4 + "/vm_network_interfaces/net_dhcp",
-                                    "gateway6='{0}'".format(
-                                        update3_sg4["NETWORK_INTERFACE"][
-                                            "DHCP"]["gateway6"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs4 + "/vm_network_interfaces/net9",
-                                    "ipaddresses={0}".format(
-                                        update3_sg4["NETWORK_INTERFACE"][
-                                            "NET9"]["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs4 + "/vm_network_interfaces/net8",
-                                    "ipaddresses={0}".format(
-                                        update3_sg4["NETWORK_INTERFACE"][
-                                            "NET8"]["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs4 + "/vm_network_interfaces/net7",
-                                    "ipaddresses={0}".format(
-                                        update3_sg4["NETWORK_INTERFACE"][
-                                            "NET7"]["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs4 + "/vm_network_interfaces/net25",
-                                    "ipaddresses={0}".format(
-                                        update3_sg4["NETWORK_INTERFACE"][
-                                            "NET25"]["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs4 + "/vm_network_interfaces/"
-                                          "prefix_iface",
-                                    "ipaddresses={0}".format(
-                                        update3_sg4["NETWORK_INTERFACE"][
-                                            "IF_PREFIX"]["ipaddresses"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs4 + "/vm_network_interfaces/net_dhcp",
-                                    "ipv6addresses='{0}'".format(
-                                        update3_sg4["NETWORK_INTERFACE"][
-                                            "DHCP"]["ipv6addresses"]))
+        batch.update(sg4 + "/vm_network_interfaces/net_dhcp",
+                     "gateway6='{0}'".format(
+                         update3_sg4["NETWORK_INTERFACE"][
+                             "DHCP"]["gateway6"]))
+        batch.update(cs4 + "/vm_network_interfaces/net9",
+                     "ipaddresses={0}".format(
+                         update3_sg4["NETWORK_INTERFACE"][
+                             "NET9"]["ipaddresses"]))
+        batch.update(cs4 + "/vm_network_interfaces/net8",
+                     "ipaddresses={0}".format(
+                         update3_sg4["NETWORK_INTERFACE"][
+                             "NET8"]["ipaddresses"]))
+        batch.update(cs4 + "/vm_network_interfaces/net7",
+                     "ipaddresses={0}".format(
+                         update3_sg4["NETWORK_INTERFACE"][
+                             "NET7"]["ipaddresses"]))
+        batch.update(cs4 + "/vm_network_interfaces/net25",
+                     "ipaddresses={0}".format(
+                         update3_sg4["NETWORK_INTERFACE"][
+                             "NET25"]["ipaddresses"]))
+        batch.update(cs4 + "/vm_network_interfaces/"
+                           "prefix_iface",
+                     "ipaddresses={0}".format(
+                         update3_sg4["NETWORK_INTERFACE"][
+                             "IF_PREFIX"]["ipaddresses"]))
+        batch.update(cs4 + "/vm_network_interfaces/net_dhcp",
+                     "ipv6addresses='{0}'".format(
+                         update3_sg4["NETWORK_INTERFACE"][
+                             "DHCP"]["ipv6addresses"]))
         # LITPCDS-8968 Convert CS from failover to parallel
-        self.execute_cli_update_cmd(self.management_server, cs_vm4,
-                                    "active={0} standby={1}".format(
-                                        update3_sg4["CLUSTER_SERVICE"][
-                                            "active"],
-                                        update3_sg4["CLUSTER_SERVICE"][
-                                            "standby"]))
+        batch.update(cs_vm4,
+                     "active={0} standby={1}".format(
+                         update3_sg4["CLUSTER_SERVICE"][
+                             "active"],
+                         update3_sg4["CLUSTER_SERVICE"][
+                             "standby"]))
         # TORF-107476 - Test Case 07 - Create a tmpfs on VM4
-        self.execute_cli_create_cmd(self.management_server, sg4 +
-                                    "/vm_ram_mounts/vm_ram_mount_4",
-                                    "vm-ram-mount",
-                                    props="type='{0}' mount_point='{1}' "
-                                    "mount_options='{2}' "
-                                    .format(
-                                      update3_sg4["VM_RAM_MOUNT"]["type"],
-                                      update3_sg4["VM_RAM_MOUNT"]
-                                      ["mount_point"],
-                                      update3_sg4["VM_RAM_MOUNT"]
-                                      ["mount_options"]
-                                      ),
-                                    add_to_cleanup=False)
+        batch.create(sg4 +
+                     "/vm_ram_mounts/vm_ram_mount_4",
+                     "vm-ram-mount",
+                     props="type='{0}' mount_point='{1}' "
+                     "mount_options='{2}' "
+                     .format(
+                       update3_sg4["VM_RAM_MOUNT"]["type"],
+                       update3_sg4["VM_RAM_MOUNT"]
+                       ["mount_point"],
+                       update3_sg4["VM_RAM_MOUNT"]
+                       ["mount_options"]
+                       ),
+                     add_to_cleanup=False)
         # TORF-180365 - Remove vm custom script
-        self.execute_cli_remove_cmd(self.management_server, sg4 +
-                                    '/vm_custom_script/vm_custom_script_1')
+        batch.remove(sg4 +
+                     '/vm_custom_script/vm_custom_script_1')
 
         #########################
         #                       #
@@ -556,70 +542,65 @@ class Libvirtupdate3(LibvirtGenericTest):
         #########################
 
         # Update vm aliases
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg5 + "/vm_aliases/db1",
-                                    "alias_names='{0}'".format(
-                                        update3_sg5["VM_ALIAS"]["DB1"][
-                                            "alias_names"]))
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg5 + "/vm_aliases/db2",
-                                    "address='{0}'".format(
-                                        update3_sg5["VM_ALIAS"]["DB2"][
-                                            "address"]))
+        batch.update(sg5 + "/vm_aliases/db1",
+                     "alias_names='{0}'".format(
+                         update3_sg5["VM_ALIAS"]["DB1"][
+                             "alias_names"]))
+        batch.update(sg5 + "/vm_aliases/db2",
+                     "address='{0}'".format(
+                         update3_sg5["VM_ALIAS"]["DB2"][
+                             "address"]))
         # LITPCDS-7188 - Update vm packages
-        self.execute_cli_update_cmd(self.management_server,
-                                    cs5 + "/vm_packages/empty_rpm3",
-                                    "name='{0}'".format(
-                                        update3_sg5["VM_PACKAGE"]["PKG_3"][
-                                            "name"]))
+        batch.update(cs5 + "/vm_packages/empty_rpm3",
+                     "name='{0}'".format(
+                         update3_sg5["VM_PACKAGE"]["PKG_3"][
+                             "name"]))
         # LITPCDS-7815 - Update NFS mounts
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg5 + "/vm_nfs_mounts/vm_nfs_mount_10",
-                                    "mount_options='{0}'".format(
-                                        update3_sg5["NFS_MOUNT"]["MOUNT_10"][
-                                            "mount_options"]))
+        batch.update(sg5 + "/vm_nfs_mounts/vm_nfs_mount_10",
+                     "mount_options='{0}'".format(
+                         update3_sg5["NFS_MOUNT"]["MOUNT_10"][
+                             "mount_options"]))
         # LITPCDS-12817 - Remove vm-network-interfaces from software path
-        self.execute_cli_remove_cmd(self.management_server,
-                                sg5 + "/vm_network_interfaces/net35")
-        self.execute_cli_remove_cmd(self.management_server,
-                                sg5 + "/vm_network_interfaces/net36")
-        self.execute_cli_remove_cmd(self.management_server,
-                                sg5 + "/vm_network_interfaces/net37")
+        batch.remove(sg5 + "/vm_network_interfaces/net35")
+        batch.remove(sg5 + "/vm_network_interfaces/net36")
+        batch.remove(sg5 + "/vm_network_interfaces/net37")
         # TORF-180365 - Remove vm custom script
-        self.execute_cli_remove_cmd(self.management_server, sg5 +
-                                    '/vm_custom_script/vm_custom_script_1')
+        batch.remove(sg5 +
+                     '/vm_custom_script/vm_custom_script_1')
 
         #################################
         # IMAGE update for LITPCDS-7182 #
         #################################
         # Add a new image to the litp model and switch a service to use it
         # LITPCDS-7182 - changing images on inherited service
-        self.execute_cli_create_cmd(self.management_server, vm_image_4,
-                                    "vm-image",
-                                    "name={0} source_uri={1}".format(
-                                        vm_images["VM_IMAGE4"]["image_name"],
-                                        vm_images["VM_IMAGE4"]["image_url"]),
-                                    add_to_cleanup=False)
-        self.execute_cli_update_cmd(self.management_server, cs1,
-                                    "image_name={0}".format(
-                                        update3_sg1["CLUSTER_SERVICE"]
-                                        ["image_name"]))
-        self.execute_cli_update_cmd(self.management_server, cs3,
-                                    "image_name={0}".format(
-                                        update3_sg3["CLUSTER_SERVICE"][
-                                            "image_name"]))
-        self.execute_cli_update_cmd(self.management_server, cs5,
-                                    "image_name={0}".format(
-                                        update3_sg5["CLUSTER_SERVICE"][
-                                            "image_name"]))
+        batch.create(vm_image_4,
+                     "vm-image",
+                     "name={0} source_uri={1}".format(
+                         vm_images["VM_IMAGE4"]["image_name"],
+                         vm_images["VM_IMAGE4"]["image_url"]),
+                     add_to_cleanup=False)
+        batch.update(cs1,
+                     "image_name={0}".format(
+                         update3_sg1["CLUSTER_SERVICE"]
+                         ["image_name"]))
+        batch.update(cs3,
+                     "image_name={0}".format(
+                         update3_sg3["CLUSTER_SERVICE"][
+                             "image_name"]))
+        batch.update(cs5,
+                     "image_name={0}".format(
+                         update3_sg5["CLUSTER_SERVICE"][
+                             "image_name"]))
         ####################################
         # IMAGE update for TORF-113124     #
         ####################################
         # test_05_p_update_vm_image_under_deployments breaking the inheritence
-        self.execute_cli_update_cmd(self.management_server, cs4,
-                                    "image_name={0}".format(
-                                        update3_sg4["CLUSTER_SERVICE"][
-                                            "image_name"]))
+        batch.update(cs4,
+                     "image_name={0}".format(
+                         update3_sg4["CLUSTER_SERVICE"][
+                             "image_name"]))
+
+        self.apply_model_batch(batch)
 
     def ms_srv_update(self):
         """
@@ -762,19 +743,15 @@ class Libvirtupdate3(LibvirtGenericTest):
         Returns: Nothing
         """
 
-        target_cmd = 'findmnt -s -l -n -T {0}'.format(mnt_point)
-
         self.add_vm_to_node_list(hostname,
                                  username=test_constants.LIBVIRT_VM_USERNAME,
                                  password=test_constants.LIBVIRT_VM_PASSWORD,
                                  ipv4=ipaddr)
 
-        actual, _, _ = self.run_command(hostname, target_cmd,
-                                        username=test_constants.
-                                        LIBVIRT_VM_USERNAME,
-                                        password=test_constants.
-                                        LIBVIRT_VM_PASSWORD,
-                                        execute_timeout=60)
+        actual = self.get_fstab_entry(
+            hostname, mnt_point,
+            username=test_constants.LIBVIRT_VM_USERNAME,
+            password=test_constants.LIBVIRT_VM_PASSWORD)
         mnt_pnt_flag = self.is_text_in_list(mnt_point, actual)
 
         if mnt_pnt_flag:
@@ -810,7 +787,7 @@ class Libvirtupdate3(LibvirtGenericTest):
         """
         filename = '/var/lib/libvirt/instances/{0}/user-data'.format(
                                                               service_name)
-        file_contents = self.get_file_contents(node, filename)
+        file_contents = self.get_remote_file(node, filename)
         return self.is_text_in_list(vm_custom_script, file_contents)
 
     def _confirm_vm_custom_script_not_ran(self, vm_hostname, vm_ip):
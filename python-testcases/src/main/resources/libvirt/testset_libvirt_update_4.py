@@ -10,13 +10,16 @@ program(s) have been supplied.
 @author:    Aileen Henry
 @summary:   Testset to deploy libvirt vcs functionality
 """
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
 from libvirt_utils import LibvirtUtils
 import test_constants
 import libvirt_test_data
+from testset_libvirt_initial_setup import LibvirtGenericTest
+from libvirt_model_utils import lazy_property
+from libvirt_model_builder import ModelBatch
 
 
-class Libvirtupdate4(GenericTest):
+class Libvirtupdate4(LibvirtGenericTest):
     """
     Description:
         This Test class is a combination of multiple user stories related
@@ -32,18 +35,34 @@ class Libvirtupdate4(GenericTest):
         # 1. Call super class setup
         super(Libvirtupdate4, self).setUp()
 
-        self.model = self.get_litp_model_information()
-        self.management_server = self.model["ms"][0]["name"]
-
-        self.srvc_path = self.model["libvirt"]["software_services_path"]
-        self.clus_srvs = self.model["libvirt"]["cluster_services_path"]
+        self.management_server = self.get_management_node_filename()
 
         self.up_dict2 = libvirt_test_data.UPDATED4_SERVICE_GROUP_2_DATA
         self.up_dict4 = libvirt_test_data.UPDATED4_SERVICE_GROUP_4_DATA
 
         self.libvirt = LibvirtUtils()
-        self.vcs_cluster_url = self.find(self.management_server,
-                                         "/deployments", "vcs-cluster")[-1]
+
+    @lazy_property
+    def model(self):
+        """ LITP model information, loaded on first use """
+        return self.get_cached_model_info(
+            self.get_litp_model_information)
+
+    @lazy_property
+    def srvc_path(self):
+        """ Path of the software services """
+        return self.model["libvirt"]["software_services_path"]
+
+    @lazy_property
+    def clus_srvs(self):
+        """ Path of the cluster services """
+        return self.model["libvirt"]["cluster_services_path"]
+
+    @lazy_property.pinned
+    def vcs_cluster_url(self):
+        """ Url of the last vcs-cluster """
+        return self.get_model_snapshot(self.management_server).find(
+            "/deployments", "vcs-cluster")[-1]
 
     def tearDown(self):
         """
@@ -92,6 +111,7 @@ class Libvirtupdate4(GenericTest):
             This test involves the removal of service group 1, and updating
             service group 2.
         """
+        batch = ModelBatch()
         # Set up the variables for the urls
         vcs_sg1 = self.clus_srvs + "/CS_VM1"
         vcs_sg2 = self.clus_srvs + "/CS_VM2"
@@ -105,7 +125,7 @@ class Libvirtupdate4(GenericTest):
         #                       #
         #########################
         #LITPCDS-11247 - Remove VCS clustered service group
-        self.execute_cli_remove_cmd(self.management_server, vcs_sg1)
+        batch.remove(vcs_sg1)
 
         #########################
         #                       #
@@ -123,45 +143,38 @@ class Libvirtupdate4(GenericTest):
 
         # LITPCDS-11750 - contract my parallel VCS Service Group
         # which is running VMs
-        self.execute_cli_update_cmd(self.management_server,
-                                    vcs_sg2,
-                                    props="active='{0}' node_list='{1}'"
-                                    .format(fmt1["active"],
-                                            fmt1["node_list"]))
+        batch.update(vcs_sg2,
+                     props="active='{0}' node_list='{1}'"
+                     .format(fmt1["active"],
+                             fmt1["node_list"]))
 
         # LITPCDS-7179 - Update the ip addresses of the vm network interfaces
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg2_vm + \
-                                    "/vm_network_interfaces/net2",
-                                    props="ipaddresses='{0}'".format(fmt2))
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg2_vm + \
-                                    "/vm_network_interfaces/net3",
-                                    props="ipaddresses='{0}'".format(fmt3))
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg2_vm + \
-                                    "/vm_network_interfaces/net22",
-                                    props="ipaddresses='{0}'".format(fmt22))
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg2_vm + \
-                                    "/vm_network_interfaces/net30",
-                                    props="ipaddresses='{0}'".format(fmt30))
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg2_vm + \
-                                    "/vm_network_interfaces/net31",
-                                    props="ipaddresses='{0}'".format(fmt31))
+        batch.update(sg2_vm + \
+                     "/vm_network_interfaces/net2",
+                     props="ipaddresses='{0}'".format(fmt2))
+        batch.update(sg2_vm + \
+                     "/vm_network_interfaces/net3",
+                     props="ipaddresses='{0}'".format(fmt3))
+        batch.update(sg2_vm + \
+                     "/vm_network_interfaces/net22",
+                     props="ipaddresses='{0}'".format(fmt22))
+        batch.update(sg2_vm + \
+                     "/vm_network_interfaces/net30",
+                     props="ipaddresses='{0}'".format(fmt30))
+        batch.update(sg2_vm + \
+                     "/vm_network_interfaces/net31",
+                     props="ipaddresses='{0}'".format(fmt31))
         # LITPCDS-8187 - Configure VM network interface with an IP allocated
         # from a DHCP server
-        self.execute_cli_update_cmd(self.management_server,
-                                    sg2_vm + \
-                                    "/vm_network_interfaces/net_dhcp",
-                                    props="ipaddresses='{0}'".format(fmtd))
+        batch.update(sg2_vm + \
+                     "/vm_network_interfaces/net_dhcp",
+                     props="ipaddresses='{0}'".format(fmtd))
 
         # TORF-107476 - TC12 -Remove VM-RAM-MOUNT from CS_VM2 on the software
         # level
-        self.execute_cli_remove_cmd(self.management_server, self.srvc_path +
-                                    'vm_service_2/vm_ram_mounts/'
-                                    'vm_ram_mount_2')
+        batch.remove(self.srvc_path +
+                     'vm_service_2/vm_ram_mounts/'
+                     'vm_ram_mount_2')
 
         #########################
         #                       #
@@ -170,11 +183,13 @@ class Libvirtupdate4(GenericTest):
         #########################
 
         # TORF-107476 - TC19- Update CS_VM4 mount options to default value
-        self.execute_cli_update_cmd(self.management_server, sg4_vm +
-                                    '/vm_ram_mounts/vm_ram_mount_4',
-                                    props='mount_options={0}'
-                                    .format(self.up_dict4["VM_RAM_MOUNT"]
-                                        ["mount_options"]))
+        batch.update(sg4_vm +
+                     '/vm_ram_mounts/vm_ram_mount_4',
+                     props='mount_options={0}'
+                     .format(self.up_dict4["VM_RAM_MOUNT"]
+                         ["mount_options"]))
+
+        self.apply_model_batch(batch)
 
     def _check_image_on_node(self, img_name, node):
         """
@@ -336,19 +351,15 @@ class Libvirtupdate4(GenericTest):
         Returns: Nothing
         """
 
-        target_cmd = 'findmnt -s -l -n -T {0}'.format(mnt_point)
-
         self.add_vm_to_node_list(hostname,
                                  username=test_constants.LIBVIRT_VM_USERNAME,
                                  password=test_constants.LIBVIRT_VM_PASSWORD,
                                  ipv4=ipaddr)
 
-        actual, _, _ = self.run_command(hostname, target_cmd,
-                                        username=test_constants.
-                                        LIBVIRT_VM_USERNAME,
-                                        password=test_constants.
-                                        LIBVIRT_VM_PASSWORD,
-                                        execute_timeout=60)
+        actual = self.get_fstab_entry(
+            hostname, mnt_point,
+            username=test_constants.LIBVIRT_VM_USERNAME,
+            password=test_constants.LIBVIRT_VM_PASSWORD)
         mnt_pnt_flag = self.is_text_in_list(mnt_point, actual)
 
         if mount_options != '':
@@ -385,7 +396,8 @@ class Libvirtupdate4(GenericTest):
                                 service_name)
         path_to_etc_init_file = ('/etc/init.d/' + service_name)
 
-        node_urls = self.find(self.management_server, '/deployments', 'node')
+        node_urls = self.get_model_snapshot(
+            self.management_server).find('/deployments', 'node')
         for url in node_urls:
             node_to_exe = self.get_node_filename_from_url(
                 self.management_server, url)
@@ -441,7 +453,7 @@ class Libvirtupdate4(GenericTest):
                                       cs_name,
                                       self.vcs_cluster_url)
         if cs_url is not None:
-            path_to_node_image_file = self._get_vm_image_filename(cs_url)
+            image = self._get_vm_image(cs_url)
 
             contracted_node = self._get_contracted_node()
             not_contracted_node = self._get_non_contracted_node()
@@ -452,25 +464,23 @@ class Libvirtupdate4(GenericTest):
                              'Instance directory is still present')
             self.assertFalse(self.
                              remote_path_exists(contracted_node,
-                                                path_to_node_image_file,
+                                                image.node_path,
                                                 su_root=True),
                              'Main image file is still present')
             self.assertFalse(self.
                              remote_path_exists(contracted_node,
-                                                path_to_node_image_file +
-                                                '_checksum.md5',
+                                                image.checksum_path,
                                                 su_root=True),
                              'Main image checksum file is still present')
             # Check image is not removed in not contracted node
             self.assertTrue(self.
                             remote_path_exists(not_contracted_node,
-                                               path_to_node_image_file,
+                                               image.node_path,
                                                su_root=True),
                             'Main image file is removed')
             self.assertTrue(self.
                             remote_path_exists(not_contracted_node,
-                                               path_to_node_image_file +
-                                               '_checksum.md5',
+                                               image.checksum_path,
                                                su_root=True),
                             'Main image checksum file is removed')
             # Step 4
@@ -540,32 +550,21 @@ class Libvirtupdate4(GenericTest):
                             self.management_server),
                         'Image file is still present')
 
-    def _get_vm_image_filename(self, cs_url):
+    def _get_vm_image(self, cs_url):
         """
-
-        :param cs_url:
-        :return:
+        Get the vm-image used by the vm-service of a clustered service
+        :param cs_url: The url of the clustered service
+        :return: The VMImage used by the vm-service
         """
-        vm_service_url = self.find(self.management_server,
-                                   cs_url + '/applications',
-                                   'reference-to-vm-service')
-        image_name = self.get_props_from_url(self.management_server,
-                                             vm_service_url[0],
-                                             'image_name')
-        image_urls = self.find(self.management_server,
-                               '/software/images', 'vm-image')
-        for image_url in image_urls:
-            ref_image_name = self.get_props_from_url(
-                self.management_server, image_url, 'name')
-            if ref_image_name == image_name:
-                image_file = \
-                    self.get_props_from_url(self.management_server,
-                                            image_url,
-                                            'source_uri').rsplit('/')[-1]
-                break
-        path_to_node_image_file = test_constants.LIBVIRT_IMAGE_DIR + '/' + \
-                                  image_file
-        return path_to_node_image_file
+        snapshot = self.get_model_snapshot(self.management_server)
+        vm_service_url = snapshot.find(cs_url + '/applications',
+                                       'reference-to-vm-service',
+                                       exact_match=True)
+        self.assertNotEqual([], vm_service_url)
+        image_name = snapshot.get_props(vm_service_url[0], 'image_name')
+        images = self.get_image_registry(self.management_server)
+        self.assertTrue(image_name in images)
+        return images.get(image_name)
 
     def _get_contracted_node(self):
         """
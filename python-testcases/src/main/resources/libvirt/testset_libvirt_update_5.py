@@ -10,12 +10,14 @@ program(s) have been supplied.
 @author:    Iacopo Isimbaldi
 @summary:   Testset to deploy libvirt vcs functionality
 """
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
 import test_constants
 import libvirt_test_data
+from testset_libvirt_initial_setup import LibvirtGenericTest
+from libvirt_model_utils import lazy_property
 
 
-class Libvirtupdate5(GenericTest):
+class Libvirtupdate5(LibvirtGenericTest):
     """
     TORF-159934: As a LITP user I want to be able to modify subnet
     definition in the model and have the Libvirt plugin act accordingly
@@ -25,14 +27,24 @@ class Libvirtupdate5(GenericTest):
         super(Libvirtupdate5, self).setUp()
 
         self.management_server = self.get_management_node_filename()
-        self.vcs_cluster_url = self.find(self.management_server,
-                                         '/deployments', 'vcs-cluster')[-1]
-        self.nodes_urls = self.find(self.management_server,
-                                    self.vcs_cluster_url,
-                                    'node')
-        self.networks_url = self.find(self.management_server,
-                                      '/infrastructure',
-                                      'collection-of-network')[-1]
+
+    @lazy_property.pinned
+    def vcs_cluster_url(self):
+        """ Url of the last vcs-cluster """
+        return self.find(self.management_server, '/deployments',
+                         'vcs-cluster')[-1]
+
+    @lazy_property.pinned
+    def nodes_urls(self):
+        """ Urls of the nodes of the vcs-cluster """
+        return self.find(self.management_server, self.vcs_cluster_url,
+                         'node')
+
+    @lazy_property.pinned
+    def networks_url(self):
+        """ Url of the network collection """
+        return self.find(self.management_server, '/infrastructure',
+                         'collection-of-network')[-1]
 
     def tearDown(self):
         super(Libvirtupdate5, self).tearDown()
@@ -11,19 +11,32 @@ program(s) have been supplied.
 @summary:   Testset to deploy libvirt vcs functionality
 """
 
-from litp_generic_test import GenericTest, attr
+import threading
+import time
+from litp_generic_test import attr
+import test_constants
 from libvirt_utils import LibvirtUtils
+from testset_libvirt_initial_setup import LibvirtGenericTest
+from libvirt_model_utils import lazy_property
+from libvirt_vcs_poller import VcsStatePoller
+from libvirt_failover_scenarios import FailoverScenario, ScenarioRunner
+from libvirt_failover_timing import FailoverTimings
+from libvirt_failover_soak import FailoverSoak, LeakSample, LEAK_PROBE, \
+    write_soak_summary
 import libvirt_test_data
-import time
 
 
-class LibvirtFailover(GenericTest):
+class LibvirtFailover(LibvirtGenericTest):
     """
     Description:
         This Test class is a combination of multiple user stories related
         to the libvirt module. The test stories that are covered in this
         file are described below
     """
+    # Writes the failover transition timings if LIBVIRT_TIMING_DIR is set.
+    _failover_timings = FailoverTimings.from_environment()
+    # The FailoverTimer of the scenario run last by the test, if any.
+    failover_timer = None
 
     def setUp(self):
         """
@@ -33,10 +46,8 @@ class LibvirtFailover(GenericTest):
         # 1. Call super class setup
         super(LibvirtFailover, self).setUp()
 
-        self.model = self.get_model_names_and_urls()
-        self.management_server = self.model["ms"][0]["name"]
+        self.management_server = self.get_management_node_filename()
 
-        self.managed_nodes = [n["name"] for n in self.model["nodes"]]
         self.libvirt = LibvirtUtils()
         self.sg3_name = "Grp_CS_c1_CS_VM3"
         self.sg4_name = "Grp_CS_c1_CS_VM4"
@@ -53,6 +64,34 @@ class LibvirtFailover(GenericTest):
         self.cs4_online_timeout_mins = int(self.cs4["online_timeout"]) / 60
         self.cs5_online_timeout_mins = int(self.cs5["online_timeout"]) / 60
 
+        self.vm3_ip = libvirt_test_data.INITIAL_SERVICE_GROUP_3_DATA[
+            "NETWORK_INTERFACES"]["NET4"]["ipaddresses"]
+
+        self.sg_online_times = {self.sg3_name: self.cs3_online_timeout_mins,
+                                self.sg4_name: self.cs4_online_timeout_mins,
+                                self.sg5_name: self.cs5_online_timeout_mins}
+        self.sg_vm_names = {
+            self.sg3_name: "test-vm-service-3",
+            self.sg4_name: "test-vm-service-4",
+            self.sg5_name: "test-vm-service-5"}
+
+    @lazy_property
+    def model(self):
+        """ LITP model names and urls, loaded on first use """
+        return self.get_cached_model_info(self.get_model_names_and_urls)
+
+    @lazy_property
+    def managed_nodes(self):
+        """ Names of the managed nodes in the model """
+        return [n["name"] for n in self.model["nodes"]]
+
+    @lazy_property
+    def vcs_poller(self):
+        """ Poller of the VCS states of the cluster, shared by waiters """
+        return VcsStatePoller(
+            lambda node, cmd: self.run_command(node, cmd, su_root=True),
+            self.managed_nodes, self.vcs.get_hastatus_sum_cmd())
+
     def tearDown(self):
         """
         Description:
@@ -60,19 +99,83 @@ class LibvirtFailover(GenericTest):
         Results:
             The super class prints out diagnostics and variables
         """
+        self._failover_timings.write()
         super(LibvirtFailover, self).tearDown()
 
-    @staticmethod
-    def filter_by_state(vcs_info, state):
+    def start_failover_timer(self, scenario):
+        """
+        Description:
+            Start timing the transitions of a failover scenario.
+        :param scenario: The name of the scenario
+        :return: The FailoverTimer, whose mark(transition) records and
+            logs the seconds since the scenario started
+        """
+        self.failover_timer = self._failover_timings.start(scenario,
+                                                           self.log)
+        return self.failover_timer
+
+    def wait_for_vm_ssh(self, node, vm_ip, timeout_mins):
+        """
+        Description:
+            Wait for a VM to answer SSH on its IP address, from a node.
+        :param node: The node to reach the VM from
+        :param vm_ip: The IP address of the VM
+        :param timeout_mins: Timeout in minutes before breaking
+        :return: True or false depending on success
+        """
+        deadline = time.time() + timeout_mins * 60
+        while True:
+            _, _, exit_code = self.run_command_via_node(node, vm_ip,
+                                                        '/bin/true')
+            if exit_code == 0:
+                return True
+            if time.time() >= deadline:
+                return False
+            time.sleep(1)
+
+    @lazy_property
+    def _scenario_local(self):
+        """ Cleanups of the failover scenario running on each thread """
+        return threading.local()
+
+    def add_failover_cleanup(self, func, *args):
+        """
+        Description:
+            Register a cleanup restoring the service groups once the
+            failover test, or the failover scenario running on this
+            thread, is done, whether it passed or not.
+        :param func: The cleanup, e.g. clean_node.
+        :type func: function
+        """
+        add_cleanup = getattr(self._scenario_local, 'add_cleanup', None)
+        (add_cleanup or self.addCleanup)(func, *args)
+
+    def failover_scenario(self, test, groups=(), nodes=(), exclusive=False):
         """
-        :param vcs_info: A list of hastatus dictionaries
-        :param state: All dictionaries with the subkey "STATE"
-                    matching this argument are returned as a list
-        :return: A list of nodenames that match the provided state
+        Description:
+            Declare a failover test as a scenario of the ScenarioRunner.
+        :param test: The failover test method.
+        :type test: function
+        :param groups: The service groups the test fails over, including
+                       the groups depending on them.
+        :type groups: list
+        :param nodes: The nodes the test may leave a group faulted on.
+        :type nodes: list
+        :param exclusive: True if the test takes whole nodes down.
+        :type exclusive: bool
+        :return: The FailoverScenario.
         """
-        matching_node_dictionaries = [x for x in vcs_info
-                                        if x["STATE"] == state]
-        return [n["SYSTEM"] for n in matching_node_dictionaries]
+        scenario_local = self._scenario_local
+
+        def run(add_cleanup):
+            """ Run the test, its cleanups registered with the runner """
+            scenario_local.add_cleanup = add_cleanup
+            try:
+                test()
+            finally:
+                scenario_local.add_cleanup = None
+        return FailoverScenario(test.__name__, run, groups=groups,
+                                nodes=nodes, exclusive=exclusive)
 
     def get_virsh_vm_state(self, vm_name, node):
         """
@@ -92,44 +195,66 @@ class LibvirtFailover(GenericTest):
                 state = data1[1]
         return state
 
-    def get_sg_vcs_info(self, target_node, target_sg_name):
+    def get_cluster_vcs_states(self, node):
+        """
+        Description:
+            Get the VCS states of the cluster, indexed by group, system
+            and state. The states are fetched once per tick, from node if
+            it is up, otherwise from any node answering, and the states
+            the poller last woke a waiter with are reused.
+        :param node: The node to sample the hastatus command on first
+        :return: The VcsStates of the cluster
+        """
+        def fetch():
+            """ Sample the states with the poller """
+            states = self.vcs_poller.sample(prefer=node)
+            self.assertNotEqual(None, states,
+                                'No node answered "hastatus -sum"')
+            return states
+        return self._vcs_states_cache.get(self.cluster_states_key, fetch,
+                                          self._command_memo.epoch)
+
+    @lazy_property
+    def cluster_states_key(self):
+        """ Key of the VCS states of the cluster in the states cache """
+        return tuple(sorted(self.managed_nodes))
+
+    def wait_for_vcs_states(self, predicate, timeout, prefer=None):
         """
         Description:
-            This is a convenience method to return a list of nodes for
-                a named service group
-        :param target_node: The node on which to run the vcs hastatus command
-        :param target_sg_name: The name of the service group to filter for
-        :return: A list of dictionaries representing the nodes for vcs service
-            groups. This is a filtered run_vcs_hastatus_sum_command list
-        """
-        node1_hastatus = self.run_vcs_hastatus_sum_command(
-            target_node)
-        test_sg_info = [sg for sg in node1_hastatus["SERVICE_GROUPS"]
-                        if sg["GROUP"] == target_sg_name]
-        return test_sg_info
+            Wait with the shared VCS state poller until the states of the
+            cluster match predicate, keeping the matching states as the
+            latest snapshot of the cluster. Once a failover is being
+            timed, the poller samples at its shortest interval so the
+            transitions are not marked late.
+        :return: The matching VcsStates, or None on timeout
+        """
+        max_interval = None
+        if self.failover_timer is not None:
+            max_interval = self.vcs_poller.min_interval
+        states = self.vcs_poller.wait_for(predicate, timeout, prefer,
+                                          max_interval)
+        if states is not None:
+            self._vcs_states_cache.put(self.cluster_states_key, states,
+                                       self._command_memo.epoch)
+        return states
 
     def check_node_status(self, node, query_node, target_sg_name,
                           expected_status, timeout_mins=5):
         """
         Description:
-            Repeatedly checks for a node to enter a status.
-        :param node: The node on which to execute the hastatus command
+            Wait for a service group to enter a status on a node, as
+            reported by the shared VCS state poller.
+        :param node: The node to sample the hastatus command on first
         :param query_node: The node to query for online/offline
         :param target_sg_name: The service group to query
         :param expected_status: The expected response to wait for
         :param timeout_mins: Timeout in minutes before breaking
         :return: True or false depending on success
         """
-        status_cmd = self.vcs.get_hastatus_sum_cmd() + \
-                     " | grep ^B | grep {0} " \
-                     "| grep {1} | tr -s ' ' " \
-                     "| cut -d ' ' -f 6"
-        return self.wait_for_cmd(node,
-                                 status_cmd.format(target_sg_name,
-                                                   query_node), 0,
-                                 expected_stdout=expected_status,
-                                 timeout_mins=timeout_mins,
-                                 su_root=True)
+        return self.wait_for_vcs_states(
+            lambda states: states.state(target_sg_name, query_node) ==
+            expected_status, timeout_mins * 60, prefer=node) is not None
 
     def run_destroy_command(self, target_node, vm_to_destroy):
         """
@@ -142,35 +267,46 @@ class LibvirtFailover(GenericTest):
         destroy_cmd = self.libvirt.get_virsh_destroy_cmd(vm_to_destroy)
         stdout, _, _ = self.run_command(target_node, destroy_cmd,
                                               su_root=True)
+        self.bump_verification_epoch('destroy of "{0}" on "{1}"'
+                                     .format(vm_to_destroy, target_node))
         return stdout[0]
 
     def run_multiple_destroy_cmd(self, target_node, target_vm, sg_name):
         """
         Description:
             Runs virsh destroy command on specified node until
-            the service group is no longer running on the node.
+            the service group is FAULTED on the node.
             A loop is used to repeat the virsh destroy command
-            if the vm is brought back up on the same node.
+            if the vm is brought back up on the same node, i.e. if the
+            service group is not OFFLINE|FAULTED on the node once
+            libvirt_test_data.SLEEP seconds have passed. Transient states
+            such as PARTIAL or STARTING are waited through. The test fails
+            if the service group is still not FAULTED once its online
+            timeout has passed.
         :param target_node: The node on which the vm sg is running
         :param target_vm: The name of the vm as it appears in virsh console
         :param sg_name: The service group name
         """
-        # Run destroy command to kill vm on specified node
-        self.run_destroy_command(target_node, target_vm)
         seconds = libvirt_test_data.SLEEP
-        time.sleep(seconds)
-        # Check if service group is online
-        status_cmd = self.vcs.get_hagrp_value_cmd(sg_name, 'State',
-                                                  target_node)
-        stdout, _, _ = self.run_command(target_node, status_cmd, su_root=True)
-        # While the target node is listed as Online
-        while stdout[0] == "|ONLINE|":
+        deadline = time.time() + self.sg_online_times[sg_name] * 60
+        faulted = lambda states: \
+            target_node in states.faulted_systems(sg_name)
+        # Run destroy command to kill vm on specified node, until the
+        # service group is FAULTED on the target node
+        self.run_destroy_command(target_node, target_vm)
+        destroys = 1
+        while self.wait_for_vcs_states(faulted, seconds,
+                                       prefer=target_node) is None:
+            if time.time() >= deadline:
+                last = self.vcs_poller.states
+                self.fail('{0} not FAULTED on {1} after {2} virsh destroy '
+                          'commands, last seen {3}'.format(
+                              sg_name, target_node, destroys,
+                              last.state(sg_name, target_node)
+                              if last is not None else 'no state'))
             # Run virsh destroy on the node again
             self.run_destroy_command(target_node, target_vm)
-            time.sleep(seconds)
-            # Check status of the target node
-            stdout, _, _ = self.run_command(target_node, status_cmd,
-                                            su_root=True)
+            destroys += 1
         # Check the virsh list to ensure vm is no longer running
         vm5_state = self.get_virsh_vm_state(target_vm, target_node)
         self.assertNotEqual(vm5_state, "running")
@@ -182,9 +318,8 @@ class LibvirtFailover(GenericTest):
         :param state: The state to filter on ONLINE or OFFLINE
         :return: A list of node-names that match the provided state
         """
-        sg4_info = self.get_sg_vcs_info(node, sg_name)
-        sg4_nodes = self.filter_by_state(sg4_info, state)
-        return sg4_nodes
+        return self.get_cluster_vcs_states(node).systems_in_state(sg_name,
+                                                                  state)
 
     def clean_node(self, faulted_node, sg_name, bring_online):
         """
@@ -199,10 +334,8 @@ class LibvirtFailover(GenericTest):
         # Clean the faulted node
         clear_cmd = self.vcs.get_hagrp_cs_clear_cmd(sg_name, faulted_node)
         self.run_command(faulted_node, clear_cmd, su_root=True)
-
-        sg_online_times = {self.sg3_name: self.cs3_online_timeout_mins,
-                           self.sg4_name: self.cs4_online_timeout_mins,
-                           self.sg5_name: self.cs5_online_timeout_mins}
+        self.bump_verification_epoch('clear of "{0}" on "{1}"'
+                                     .format(sg_name, faulted_node))
 
         # Bring service group online
         if bring_online:
@@ -214,7 +347,7 @@ class LibvirtFailover(GenericTest):
                                                  faulted_node,
                                                  sg_name,
                                                  "ONLINE",
-                                                 sg_online_times[sg_name])
+                                                 self.sg_online_times[sg_name])
             self.assertTrue(node_status)
 
     def run_switch_command(self, from_node, to_node, sg_name):
@@ -230,6 +363,87 @@ class LibvirtFailover(GenericTest):
         self.run_command(from_node,
                          command,
                          su_root=True)
+        self.bump_verification_epoch('switch of "{0}" to "{1}"'
+                                     .format(sg_name, to_node))
+
+    def wait_for_sg_ready(self, sg_name):
+        """
+        Description:
+            Wait for a service group to be ONLINE on a node and faulted on
+            none, as after the previous soak step its faulted node may
+            still be clearing.
+        :param sg_name: The service group to wait for
+        :return: The VcsStates of the cluster
+        """
+        vcs_states = self.wait_for_vcs_states(
+            lambda states: states.active_system(sg_name) is not None and
+            not states.faulted_systems(sg_name),
+            self.sg_online_times[sg_name] * 60, prefer=self.managed_nodes[0])
+        self.assertNotEqual(None, vcs_states,
+                            '{0} is not ready to fail over'.format(sg_name))
+        return vcs_states
+
+    def soak_switch(self, sg_name):
+        """
+        Description:
+            Soak step switching a failover service group to its standby
+            node, and waiting for it to be ONLINE there and OFFLINE on the
+            formerly active node.
+        :param sg_name: The service group to switch
+        """
+        vcs_states = self.wait_for_sg_ready(sg_name)
+        active_node = vcs_states.active_system(sg_name)
+        standby_node = vcs_states.systems_in_state(sg_name, "OFFLINE")[0]
+        self.run_switch_command(active_node, standby_node, sg_name)
+        for node, state in [(standby_node, "ONLINE"),
+                            (active_node, "OFFLINE")]:
+            self.assertTrue(self.check_node_status(
+                self.managed_nodes[0], node, sg_name, state,
+                self.sg_online_times[sg_name]),
+                '{0} is not {1} on {2}'.format(sg_name, state, node))
+
+    def soak_destroy(self, sg_name):
+        """
+        Description:
+            Soak step destroying the VM of a service group on an active
+            node, waiting for the group to fault there and, for a failover
+            group, to come ONLINE on the standby node, then cleaning the
+            faulted node, whether the step passed or not.
+        :param sg_name: The service group whose VM is destroyed
+        """
+        vcs_states = self.wait_for_sg_ready(sg_name)
+        active_node = vcs_states.active_system(sg_name)
+        standby_nodes = vcs_states.systems_in_state(sg_name, "OFFLINE")
+        try:
+            self.run_multiple_destroy_cmd(active_node,
+                                          self.sg_vm_names[sg_name], sg_name)
+            self.assertTrue(self.check_node_status(
+                self.managed_nodes[0], active_node, sg_name,
+                "OFFLINE|FAULTED", self.sg_online_times[sg_name]),
+                '{0} is not FAULTED on {1}'.format(sg_name, active_node))
+            for node in standby_nodes[:1]:
+                self.assertTrue(self.check_node_status(
+                    self.managed_nodes[0], node, sg_name, "ONLINE",
+                    self.sg_online_times[sg_name]),
+                    '{0} is not ONLINE on {1}'.format(sg_name, node))
+        finally:
+            self.clean_node(active_node, sg_name, not standby_nodes)
+
+    def sample_soak_leaks(self):
+        """
+        Description:
+            Sample every managed node for failover leaks.
+        :return: A LeakSample by node
+        """
+        samples = {}
+        for node in self.managed_nodes:
+            stdout, _, _ = self.run_probe(
+                node, LEAK_PROBE, args=(test_constants.LIBVIRT_INSTANCES_DIR,
+                                        test_constants.LIBVIRT_IMAGE_DIR),
+                su_root=True)
+            samples[node] = LeakSample.from_output(
+                stdout, test_constants.LIBVIRT_INSTANCES_DIR)
+        return samples
 
     @attr('all', 'non-revert', 'libvirt_handover')
     def test_01_libvirt_handover(self):
@@ -271,15 +485,18 @@ class LibvirtFailover(GenericTest):
         """
 
         # 1. Obtain the hastatus -sum info for the target sg
-        vcs_info = self.get_sg_vcs_info(self.managed_nodes[0], self.sg3_name)
+        vcs_states = self.get_cluster_vcs_states(self.managed_nodes[0])
 
         # 2. Get the names of the online and offline nodes
-        initial_online_node = self.filter_by_state(vcs_info, 'ONLINE')[0]
-        initial_offline_node = self.filter_by_state(vcs_info, 'OFFLINE')[0]
+        initial_online_node = vcs_states.active_system(self.sg3_name)
+        initial_offline_node = vcs_states.systems_in_state(self.sg3_name,
+                                                           'OFFLINE')[0]
 
         # 3. Execute the switch command to cause handover to the inactive node
+        timer = self.start_failover_timer('handover')
         self.run_switch_command(initial_online_node, initial_offline_node,
                                 self.sg3_name)
+        timer.mark('switch_issued')
 
         # 4. Wait for the formerly offline node becomes online
         self.assertTrue(self.check_node_status(self.managed_nodes[0],
@@ -289,6 +506,7 @@ class LibvirtFailover(GenericTest):
                         '{0} is not ONLINE on {1}'.format(self.sg3_name,
                                                           initial_offline_node)
                         )
+        timer.mark('standby_online', self.vcs_poller.sample_gap)
         self.assertTrue(self.check_node_status(self.managed_nodes[0],
                                                initial_online_node,
                                                self.sg3_name, "OFFLINE",
@@ -296,14 +514,16 @@ class LibvirtFailover(GenericTest):
                         '{0} is not OFFLINE on {1}'.format(self.sg3_name,
                                                            initial_online_node)
                         )
+        timer.mark('active_offline', self.vcs_poller.sample_gap)
 
         # 5. Obtain the currently active node by querying hastatus -sum
-        after_switch_vcs_info = self.get_sg_vcs_info(initial_offline_node,
-                                                     self.sg3_name)
+        after_switch_vcs_states = self.get_cluster_vcs_states(
+            initial_offline_node)
         after_switch_online_node = \
-            self.filter_by_state(after_switch_vcs_info, "ONLINE")[0]
+            after_switch_vcs_states.active_system(self.sg3_name)
         after_switch_offline_node = \
-            self.filter_by_state(after_switch_vcs_info, "OFFLINE")[0]
+            after_switch_vcs_states.systems_in_state(self.sg3_name,
+                                                     "OFFLINE")[0]
 
         # 6. Verify that the initial offline and current online
         #   node are the same
@@ -337,6 +557,9 @@ class LibvirtFailover(GenericTest):
             standby state, using virsh command
             @result: VM is now running on previously offline node
 
+            @step: Wait for the VM to answer SSH on its IP address
+            @result: VM is reachable on the previously offline node
+
             @step: Clear and restore faulted node
             @result: Faulted node is cleared
 
@@ -350,19 +573,25 @@ class LibvirtFailover(GenericTest):
         """
 
         # 1. Obtain the hastatus -sum info for the target sg
-        vcs_info = self.get_sg_vcs_info(self.managed_nodes[0], self.sg3_name)
+        vcs_states = self.get_cluster_vcs_states(self.managed_nodes[0])
 
         # 2. Find out which node VM3 is running on
-        initial_online_node = self.filter_by_state(vcs_info, 'ONLINE')[0]
-        initial_offline_node = self.filter_by_state(vcs_info, 'OFFLINE')[0]
+        initial_online_node = vcs_states.active_system(self.sg3_name)
+        initial_offline_node = vcs_states.systems_in_state(self.sg3_name,
+                                                           'OFFLINE')[0]
 
         # 3. Destroy the vm on the node on which it's running
         target_vm_name = "test-vm-service-3"
+        timer = self.start_failover_timer('sg_failover')
         destroy_output = self.run_destroy_command(initial_online_node,
                                                   target_vm_name)
+        timer.mark('destroy_issued')
         # Assert vm was destroyed
         exp_destroy_output = "Domain " + target_vm_name + " destroyed"
         self.assertEqual(destroy_output, exp_destroy_output)
+        # Restore faulted node once the test is done
+        self.add_failover_cleanup(self.clean_node, initial_online_node,
+                                  self.sg3_name, False)
 
         # 4. Wait for failover from initial online node to initial offline
         #    node
@@ -372,19 +601,27 @@ class LibvirtFailover(GenericTest):
                                              "OFFLINE|FAULTED",
                                              self.cs3_online_timeout_mins)
         self.assertTrue(node_status)
+        timer.mark('vcs_faulted', self.vcs_poller.sample_gap)
         node_status = self.check_node_status(self.managed_nodes[0],
                                              initial_offline_node,
                                              self.sg3_name, "ONLINE",
                                              self.cs3_online_timeout_mins)
         self.assertTrue(node_status)
+        timer.mark('standby_online', self.vcs_poller.sample_gap)
 
         # 5. Verify that vm3 is running state on final online node
         final_vm_state = self.get_virsh_vm_state(target_vm_name,
                                                  initial_offline_node)
         self.assertEqual(final_vm_state, "running")
+        timer.mark('virsh_running')
 
-        # 6. Restore faulted node
-        self.clean_node(initial_online_node, self.sg3_name, False)
+        # 6. Verify that vm3 answers SSH on its IP address
+        self.assertTrue(self.wait_for_vm_ssh(initial_offline_node,
+                                             self.vm3_ip,
+                                             self.cs3_online_timeout_mins),
+                        'VM {0} is not reachable on {1}'.format(
+                            target_vm_name, self.vm3_ip))
+        timer.mark('ssh_reachable')
 
     @attr('all', 'non-revert', 'libvirt_parallel_failure')
     def test_03_libvirt_parallel_failure(self):
@@ -425,17 +662,22 @@ class LibvirtFailover(GenericTest):
         """
 
         # 1. Obtain the hastatus -sum info for the target sg
-        vcs_info = self.get_sg_vcs_info(self.managed_nodes[0], self.sg5_name)
+        vcs_states = self.get_cluster_vcs_states(self.managed_nodes[0])
 
         # 2. Get list of the online nodes
-        initial_online_nodes = self.filter_by_state(vcs_info, 'ONLINE')
+        initial_online_nodes = vcs_states.online_systems(self.sg5_name)
         online_node_1 = initial_online_nodes[0]
         online_node_2 = initial_online_nodes[1]
 
         # 3. Virsh destroy vm5 on one node
         target_vm_name = "test-vm-service-5"
+        timer = self.start_failover_timer('parallel_failure')
         self.run_multiple_destroy_cmd(online_node_1, target_vm_name,
                                       self.sg5_name)
+        timer.mark('destroy_issued')
+        # Restore faulted node and bring up vm once the test is done
+        self.add_failover_cleanup(self.clean_node, online_node_1,
+                                  self.sg5_name, True)
 
         # 4. Wait for the node to go offline on which the vm was destroyed
         node_status = self.check_node_status(self.managed_nodes[0],
@@ -444,15 +686,13 @@ class LibvirtFailover(GenericTest):
                                              "OFFLINE|FAULTED",
                                              self.cs5_online_timeout_mins)
         self.assertTrue(node_status)
+        timer.mark('vcs_faulted', self.vcs_poller.sample_gap)
 
         # 5. Check that vm5 is still running on other online node virsh console
         node_2_vm5_state = self.get_virsh_vm_state(target_vm_name,
                                                    online_node_2)
         self.assertEqual(node_2_vm5_state, "running")
 
-        # 6. Restore faulted node and bring up vm
-        self.clean_node(online_node_1, self.sg5_name, True)
-
     @attr('all', 'non-revert', 'libvirt_failover_reboot')
     def test_04_libvirt_failover_reboot(self):
         """
@@ -527,7 +767,10 @@ class LibvirtFailover(GenericTest):
                                                    self.sg3_name, "OFFLINE")[0]
 
         # Issue the reboot command on active_node
+        timer = self.start_failover_timer('failover_reboot')
         self.run_command(active_node, "/usr/sbin/reboot", su_root=True)
+        self.bump_verification_epoch('reboot of "{0}"'.format(active_node))
+        timer.mark('reboot_issued')
 
         # Wait for indication that failover has occurred:
         #   CS_VM3 should fail over to standby node
@@ -542,6 +785,8 @@ class LibvirtFailover(GenericTest):
                                                    sg_name, "ONLINE", timeout),
                             '{0} is not ONLINE on {1}'.format(sg_name,
                                                               failover_node))
+            timer.mark('{0}_online'.format(sg_name),
+                       self.vcs_poller.sample_gap)
 
         # Wait for the first node to restart
         self.wait_for_node_up(active_node)
@@ -647,7 +892,9 @@ class LibvirtFailover(GenericTest):
                                                    self.sg3_name, "OFFLINE")[0]
 
         # Issue the power off command on active_node
+        timer = self.start_failover_timer('failover_hard_reboot')
         self.poweroff_peer_node(self.management_server, initial_active_node)
+        timer.mark('poweroff_issued')
 
         # Wait for indication that failover has occurred:
         #   CS_VM3 and CS_VM4 should fail over to standby node
@@ -665,6 +912,8 @@ class LibvirtFailover(GenericTest):
                                                    sg_name, "ONLINE", timeout),
                             '{0} is not ONLINE on {1}'.format(sg_name,
                                                               failover_node))
+            timer.mark('{0}_online'.format(sg_name),
+                       self.vcs_poller.sample_gap)
 
         # Check that there is one node active in each service group
         sg4_nodes = self.get_sg_nodes_in_state(failover_node, self.sg4_name,
@@ -717,3 +966,125 @@ class LibvirtFailover(GenericTest):
         sg4_nodes = self.get_sg_nodes_in_state(initial_active_node,
                                                self.sg4_name, "ONLINE")
         self.assertEqual(len(sg4_nodes), 1)
+
+    @attr('all', 'non-revert', 'libvirt_concurrent_failovers')
+    def test_06_libvirt_concurrent_failovers(self):
+        """
+        @tms_id: litpcds_libvirt_concurrent_failovers_tc06
+        @tms_requirements_id: LITPCDS-7180
+        @tms_title: Libvirt failover scenarios run concurrently
+
+        @tms_description: This test runs the failover scenarios of tests
+        01 to 05, the scenarios on independent service groups at the same
+        time
+
+        @tms_test_steps:
+            @step: Run the handover scenario of CS_VM3, and CS_VM4
+            depending on it, and the parallel failure scenario of CS_VM5
+            at the same time
+            @result: CS_VM3 is handed over and CS_VM5 recovers on the
+            faulted node
+
+            @step: Run the service group failover scenario of CS_VM3 once
+            both are done, as it may fault the same node as the parallel
+            failure scenario
+            @result: CS_VM3 fails over
+
+            @step: Run the reboot and hard reboot scenarios alone
+            @result: The service groups fail over and resume on both nodes
+
+            @step: Restore the faulted nodes of each scenario
+            @result: Faults are cleared whether the scenario passed or not
+
+        @tms_test_precondition:
+            - testset_libvirt_initial_setup has run
+            - A 2 node LITP cluster installed
+            - A network with a bridge setup
+            - A network with DHCP setup
+            - VM images are present on the MS
+        @tms_execution_type: Automated
+        """
+        sg3_groups = [self.sg3_name, self.sg4_name]
+        runner = ScenarioRunner(self.log)
+        # Tests 02 and 03 fault their group on whichever node it is
+        # online on, so both are declared to disturb every node
+        runner.run([
+            self.failover_scenario(self.test_01_libvirt_handover,
+                                   sg3_groups),
+            self.failover_scenario(self.test_03_libvirt_parallel_failure,
+                                   [self.sg5_name], self.managed_nodes),
+            self.failover_scenario(self.test_02_libvirt_sg_failover,
+                                   sg3_groups, self.managed_nodes),
+            self.failover_scenario(self.test_04_libvirt_failover_reboot,
+                                   exclusive=True),
+            self.failover_scenario(
+                self.test_05_libvirt_failover_hard_reboot, exclusive=True),
+        ])
+
+    @attr('non-revert', 'libvirt_failover_soak')
+    def test_07_libvirt_failover_soak(self):
+        """
+        @tms_id: litpcds_libvirt_failover_soak_tc07
+        @tms_requirements_id: LITPCDS-7180
+        @tms_title: Libvirt repeated failover soak
+
+        @tms_description: This test cycles switches and VM destroys across
+        CS_VM3, CS_VM4 and CS_VM5 for LIBVIRT_SOAK_ITERATIONS iterations,
+        or LIBVIRT_SOAK_MINUTES minutes, and reports the throughput,
+        failure rate, latency and leaks of the libvirt adaptor
+
+        @tms_test_steps:
+            @step: Sample the peer nodes for .live files, defined domains
+            and the size of the images directory
+            @result: The baseline of the leak checks is taken
+
+            @step: Switch and destroy the VMs of CS_VM3, CS_VM4 and
+            CS_VM5 in turn, waiting for each failover and cleaning the
+            faulted nodes
+            @result: Every iteration is timed and its failure recorded
+
+            @step: Sample the peer nodes for leaks again
+            @result: No .live file is left for a VM that is not running,
+            no domain is left defined and not running
+
+        @tms_test_precondition:
+            - testset_libvirt_initial_setup has run
+            - A 2 node LITP cluster installed
+            - VM images are present on the MS
+        @tms_execution_type: Automated
+        """
+        iterations, minutes = FailoverSoak.limits_from_environment()
+        soak = FailoverSoak(
+            [('switch {0}'.format(self.sg3_name),
+              lambda: self.soak_switch(self.sg3_name)),
+             ('destroy {0}'.format(self.sg4_name),
+              lambda: self.soak_destroy(self.sg4_name)),
+             ('switch {0}'.format(self.sg4_name),
+              lambda: self.soak_switch(self.sg4_name)),
+             ('destroy {0}'.format(self.sg3_name),
+              lambda: self.soak_destroy(self.sg3_name)),
+             ('destroy {0}'.format(self.sg5_name),
+              lambda: self.soak_destroy(self.sg5_name))],
+            self.sample_soak_leaks, self.log, iterations, minutes)
+        summary = soak.run()
+        summary['adaptor_version'], _, _ = self.run_command_memoized(
+            self.managed_nodes[0], '/bin/rpm -q ERIClitpmnlibvirt_CXP9031529')
+        write_soak_summary(summary)
+
+        self.log('info', 'Soak: {0} iterations in {1:.0f}s, {2:.1f} per '
+                 'hour, {3:.1%} failed'.format(
+                     summary['iterations'], summary['duration'],
+                     summary['iterations_per_hour'],
+                     summary['failure_rate']))
+        for step, latency in sorted(summary['latency'].iteritems()):
+            self.log('info', 'Soak step "{0}": {1}'.format(step, latency))
+        self.assertEqual(0, summary['failures'],
+                         '{0} of {1} soak iterations failed'.format(
+                             summary['failures'], summary['iterations']))
+        for node, leaks in sorted(summary['leaks'].iteritems()):
+            self.assertEqual([], leaks['leftover_live_files'],
+                             'Leftover .live files on {0}'.format(node))
+            self.assertEqual([], leaks['stale_domains'],
+                             'Stale domains on {0}'.format(node))
+            self.log('info', 'Images directory growth on {0}: {1}KB'
+                     .format(node, leaks['images_growth_kb']))
@@ -12,15 +12,17 @@ program(s) have been supplied.
             Agile: STORY-159934
 """
 
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
 import copy
 import libvirt_test_data
 import test_constants
 import os
 import re
+from testset_libvirt_initial_setup import LibvirtGenericTest
+from libvirt_model_utils import lazy_property
 
 
-class Story159934(GenericTest):
+class Story159934(LibvirtGenericTest):
     """
     TORF-159934: As a LITP user I want to be able to modify subnet definition
     in the model and have the Libvirt plugin act accordingly
@@ -31,20 +33,30 @@ class Story159934(GenericTest):
 
         # 2. Set up variables used in the test
         self.management_server = self.get_management_node_filename()
-        self.vcs_cluster_url = self.find(self.management_server,
-                                         '/deployments', 'vcs-cluster')[-1]
-        self.nodes_urls = self.find(self.management_server,
-                                    self.vcs_cluster_url,
-                                    'node')
-        self.networks_url = self.find(self.management_server,
-                                      '/infrastructure',
-                                      'collection-of-network')[-1]
 
         self.ms_props_mgmt = copy.deepcopy(libvirt_test_data.MGMT_MS_DATA)
         self.ms_props_ovlp = copy.deepcopy(libvirt_test_data.OVLP_MS_DATA)
         self.n_props = copy.deepcopy(libvirt_test_data.OVLP_N_DATA)
         self.vm_props = copy.deepcopy(libvirt_test_data.OVLP_VM_DATA)
 
+    @lazy_property.pinned
+    def vcs_cluster_url(self):
+        """ Url of the last vcs-cluster """
+        return self.find(self.management_server, '/deployments',
+                         'vcs-cluster')[-1]
+
+    @lazy_property.pinned
+    def nodes_urls(self):
+        """ Urls of the nodes of the vcs-cluster """
+        return self.find(self.management_server, self.vcs_cluster_url,
+                         'node')
+
+    @lazy_property.pinned
+    def networks_url(self):
+        """ Url of the network collection """
+        return self.find(self.management_server, '/infrastructure',
+                         'collection-of-network')[-1]
+
     def tearDown(self):
         super(Story159934, self).tearDown()
 
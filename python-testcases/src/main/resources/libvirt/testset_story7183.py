@@ -15,11 +15,13 @@ import os
 import re
 
 import test_constants
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
 import libvirt_test_data
+from testset_libvirt_initial_setup import LibvirtGenericTest
+from libvirt_model_utils import lazy_property
 
 
-class Story7183(GenericTest):
+class Story7183(LibvirtGenericTest):
     """
     As a LITP User I want to upgrade the libvirt adaptor package so that I can
     keep up to date with the latest delivery
@@ -51,11 +53,6 @@ class Story7183(GenericTest):
 
         self.adaptor_package = 'ERIClitpmnlibvirt_CXP9031529'
 
-        # Current assumption is that only 1 VCS cluster will exist
-        self.vcs_cluster_url = self.find(self.management_server,
-                                    "/deployments", "vcs-cluster")[-1]
-        self.cluster_id = self.vcs_cluster_url.split("/")[-1]
-
         # Get version of adaptor package installed on the primary node
         self.primary_initial_version = self._get_versions()[0]
         self.primary_initial_package = (self.adaptor_package + '-' +
@@ -76,6 +73,18 @@ class Story7183(GenericTest):
 
         self.rpmrebuild_package = "rpmrebuild-2.11-1.noarch.rpm"
 
+    @lazy_property.pinned
+    def vcs_cluster_url(self):
+        """ Url of the vcs-cluster """
+        # Current assumption is that only 1 VCS cluster will exist
+        return self.find(self.management_server, "/deployments",
+                         "vcs-cluster")[-1]
+
+    @lazy_property
+    def cluster_id(self):
+        """ Id of the vcs-cluster """
+        return self.vcs_cluster_url.split("/")[-1]
+
     def tearDown(self):
         """
         Description:
@@ -220,31 +229,23 @@ class Story7183(GenericTest):
         """
         cs_grp_name = self.vcs.generate_clustered_service_name(cs_id,
                                                                self.cluster_id)
-        # Get output from the hagrp -state command
-        cmd = self.vcs.get_hagrp_state_cmd()
-        hagrp_output, stderr, return_code = self.run_command(self.primary_node,
-                                                             cmd, su_root=True)
-
-        self.assertEqual(0, return_code)
-        self.assertEqual([], stderr)
-
-        # Search in the output from hagrp and count
-        # the number of times that it is online
-        reg_ex = cs_grp_name + r'\s+State\s+\w+\s+\|ONLINE\|$'
-        online_cnt = 0
-        for line in hagrp_output:
-            if re.search(reg_ex, line):
-                online_cnt = online_cnt + 1
+        # Count the number of times the group is online, the cluster
+        # states being fetched once for all the groups checked
+        online_cnt = self.get_vcs_states(self.primary_node).count(
+            cs_grp_name, 'ONLINE')
         # Check that the group is online the correct number of times
         self.assertEqual(int(expected), online_cnt)
 
     def _import_package(self, pkg_to_add):
         """
-        Run the cli import command to import the given package
+        Run the cli import command to import the given package.
+        The adaptor upgraded by the next plan is not in the model, so the
+        verification epoch is bumped to drop the model baselines.
         """
         self.execute_cli_import_cmd(self.management_server,
                                     '/tmp/noarch/' + pkg_to_add,
                                     self.repo_dir_litp)
+        self.bump_verification_epoch('import of "{0}"'.format(pkg_to_add))
 
     def _get_package_version_yum(self, package_type, node):
         """
@@ -12,17 +12,18 @@ program(s) have been supplied.
 @summary:   Afile: LITPCDS-7535
 """
 
-import re
 from time import sleep
 import test_constants
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
 from test_constants import RH_RELEASE_FILE, RH_VERSION_6, RH_VERSION_6_10,\
     RH_VERSION_7, RH_VERSION_7_4
 
 import libvirt_test_data
+from testset_libvirt_initial_setup import LibvirtGenericTest
+from libvirt_model_utils import lazy_property
 
 
-class Story7535(GenericTest):
+class Story7535(LibvirtGenericTest):
     """
     As a LITP User I want the libvirt adaptor to check the internal
     status of the VM so that application faults can be detected
@@ -45,13 +46,17 @@ class Story7535(GenericTest):
         self.list_managed_nodes = self.get_managed_node_filenames()
         self.primary_node = self.list_managed_nodes[0]
         self.max_vm_startup_time = 600
-        self.vcs_cluster_url = self.find(self.management_server,
-                                         "/deployments", "vcs-cluster")[-1]
 
         self.vm_ip = self.get_ip_for_vms(self.management_server)
 
         self.init_nodes()
 
+    @lazy_property.pinned
+    def vcs_cluster_url(self):
+        """ Url of the last vcs-cluster """
+        return self.find(self.management_server, "/deployments",
+                         "vcs-cluster")[-1]
+
     def tearDown(self):
         super(Story7535, self).tearDown()
 
@@ -134,7 +139,7 @@ class Story7535(GenericTest):
 
     def _verify_group_is_online(self, cs_name, expected):
         """
-        Execute the hagrp command and verify that the clusters-
+        Verify from the VCS states of the cluster that the clusters-
         service is online
         args:
             cs_name (str): clustered-service name
@@ -146,21 +151,9 @@ class Story7535(GenericTest):
         cluster_id = self.vcs_cluster_url.split("/")[-1]
         cs_grp_name = self.vcs.generate_clustered_service_name(cs_name,
                                                                cluster_id)
-        cmd = self.vcs.get_hagrp_state_cmd()
-        hagrp_output, stderr, return_code = self.run_command(
-            self.primary_node,
-            cmd,
-            su_root=True)
-        self.assertEqual(0, return_code)
-        self.assertEqual([], stderr)
-
-        # Search in the output from hagrp and count
-        # the number of times that it is online
-        reg_ex = cs_grp_name + r'\s+State\s+\w+\s+\|ONLINE\|$'
-        online_cnt = 0
-        for line in hagrp_output:
-            if re.search(reg_ex, line):
-                online_cnt = online_cnt + 1
+        # Count the number of times the group is online
+        online_cnt = self.get_vcs_states(self.primary_node).count(
+            cs_grp_name, 'ONLINE')
         # Is group online the correct number of times
         self.assertEqual(expected,
                          online_cnt)
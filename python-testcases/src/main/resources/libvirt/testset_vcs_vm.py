@@ -10,7 +10,7 @@ program(s) have been supplied.
 @author:    Marco Gibboni / Bryan O'Neill/ Ciaran Reilly
 """
 
-from litp_generic_test import GenericTest, attr
+from litp_generic_test import attr
 from redhat_cmd_utils import RHCmdUtils
 from networking_utils import NetworkingUtils
 from vcs_utils import VCSUtils
@@ -19,10 +19,20 @@ import test_constants
 import simplejson
 import re
 import libvirt_test_data
-import ast
+from testset_libvirt_initial_setup import LibvirtGenericTest
+from libvirt_fanout import FanOutExecutor
+from libvirt_vm_probe import VmNetworkProbe, VM_NETWORK_PROBE
+from libvirt_output_parsers import parse_fstab, parse_hosts_file, \
+    parse_virsh_dominfo
+from libvirt_sg_records import FrozenDict, SERVICE_GROUP_ITEMS, \
+    ServiceGroup, VcsClusteredService, VmAddressingPlan, VmService, \
+    get_vm_hostname_map
 
+# Name of the model baseline saved once the vm service groups are verified.
+VERIFIED_MODEL = 'vcs_vm_verified'
 
-class VCSVM(GenericTest):
+
+class VCSVM(LibvirtGenericTest):
     """
     This test has been created merging VCS functionality regression test
         with VCS KGB stories.
@@ -43,14 +53,16 @@ class VCSVM(GenericTest):
         """ Setup Variables for every test """
 
         super(VCSVM, self).setUp()
-        self.model = self.get_model_names_and_urls()
+        self.model = self.get_cached_model_info(
+            self.get_model_names_and_urls)
         self.ms_node = self.model["ms"][0]["name"]
         self.rhc = RHCmdUtils()
         self.vcs = VCSUtils()
         self.net = NetworkingUtils()
         self.stor = StorageUtils()
-        self.dhcp_ranges = self.find(self.ms_node, '/software/services',
-                                     'dhcp-range', assert_not_empty=False)
+        self.fan_out = FanOutExecutor()
+        self.dhcp_ranges = self.get_model_snapshot(self.ms_node).find(
+            '/software/services', 'dhcp-range')
 
     def tearDown(self):
         """ Teardown run after every test """
@@ -61,8 +73,8 @@ class VCSVM(GenericTest):
         """
         Get all information relating to VMs from the litp model.
         This information returned is a list of Service Groups. Each Service
-        group is a dict. including details for the following types under the
-        Service Group:
+        group is an immutable ServiceGroup record including details for the
+        following types under the Service Group:
             * vm-image
             * vm-service
             * vcs-clustered-service
@@ -72,91 +84,100 @@ class VCSVM(GenericTest):
             * vm-network-interface
             * vm-yum-repo
             * vm-ssh-key
+        All lookups are answered from the cached model snapshot,
+        so building the list does not make any further calls to the MS.
+        The list is built once per snapshot.
+        """
+        return self.get_model_snapshot(self.ms_node).get_derived(
+            'vcs_vm_model_info', self._load_vcs_vm_model_info)
+
+    def _load_vcs_vm_model_info(self):
+        """
+        Build the list of Service Groups returned by get_vcs_vm_model_info.
         """
         service_groups = []
-        type_list = ['vm-alias', 'vm-yum-repo', 'vm-zypper-repo', 'vm-package',
-                     'vm-nfs-mount', 'vm-network-interface', 'vm-ssh-key',
-                     'vm-service']
-        service_group = {}
-        infra_dict = {}
-
-        urls = self.find(self.ms_node, '/software', 'vm-image',
-                         assert_not_empty=False)
-        for url in urls:
-            prop_dict = {}
-            props = self.get_props_from_url(self.ms_node, url)
-            prop_dict['url'] = url
-            for prop in props:
-                prop_dict[prop] = props[prop]
-            infra_dict[props['name']] = prop_dict
-        prop_dict = {}
+
+        snapshot = self.get_model_snapshot(self.ms_node)
+        images = self.get_image_registry(self.ms_node)
+        nodename_list = [node["url"].split("/")[-1]
+                         for node in self.model["nodes"]]
 
         for cluster in self.model['clusters']:
-            clus_servs = self.find(self.ms_node, cluster['url'],
-                                   'vcs-clustered-service',
-                                   assert_not_empty=False)
+            cluster_id = cluster['url'].split('/')[-1]
+            clus_servs = snapshot.find(cluster['url'],
+                                       'vcs-clustered-service')
             for serv in clus_servs:
                 # Check if this clustered service is a vm service
-                check = self.find(self.ms_node, serv, 'vm-service',
-                                  assert_not_empty=False)
-                if not check:
+                vm_service_urls = snapshot.find(serv, 'vm-service')
+                if not vm_service_urls:
                     continue
 
                 # This clustered service is a vm-service.
-                props = self.get_props_from_url(self.ms_node, serv)
-                for prop in props:
-                    prop_dict[prop] = props[prop]
-                prop_dict['url'] = serv
-
                 # TORF-184632: vmmonitord response timeout should be aligned
                 # with VCS monitor timeout for the service
-                ha_config_url = self.find(self.ms_node, serv,
-                                          'ha-service-config')[0]
-                ha_config_props = self.get_props_from_url(self.ms_node,
-                                                          ha_config_url)
-                prop_dict = self._set_status_timeout_value_in_dict(
-                    ha_config_props, prop_dict)
-
-                service_group['vcs-clustered-service'] = prop_dict
-                prop_dict = {}
-
-                for itype in type_list:
-                    urls = self.find(self.ms_node, serv, itype,
-                                     assert_not_empty=False)
-                    for url in urls:
-                        props = self.get_props_from_url(self.ms_node, url)
-                        prop_dict['url'] = url
-                        for prop in props:
-                            prop_dict[prop] = props[prop]
-
-                        if itype in service_group:
-                            service_group[itype].append(prop_dict)
-                        else:
-                            if itype == 'vm-service':
-                                service_group[itype] = prop_dict
-                            else:
-                                service_group[itype] = []
-                                service_group[itype].append(prop_dict)
-                        prop_dict = {}
-
-                vm_image_name = service_group['vm-service']['image_name']
-                service_group['vm-image'] = infra_dict[vm_image_name]
-
-                nodes = self._get_vm_node_names(
-                    service_group
-                    ['vcs-clustered-service']['node_list'].split(','),
-                    cluster)
-                service_group['nodes'] = nodes
-                service_group['cluster'] = cluster
-                service_group['cluster']['id'] = cluster['url'].split('/')[-1]
-                service_groups.append(service_group)
-                service_group = {}
+                ha_config_urls = snapshot.find(serv, 'ha-service-config')
+                self.assertNotEqual([], ha_config_urls)
+                ha_config_props = snapshot.get_props(ha_config_urls[0])
+                lp_cs = VcsClusteredService(
+                    serv, self._set_status_timeout_value_in_dict(
+                        ha_config_props, snapshot.get_props(serv)))
+                vm_service = VmService(
+                    vm_service_urls[0],
+                    snapshot.get_props(vm_service_urls[0]))
+
+                items = {}
+                for itype, field, record_type in SERVICE_GROUP_ITEMS:
+                    items[field] = tuple(
+                        record_type(url, snapshot.get_props(url))
+                        for url in snapshot.find(serv, itype))
+
+                vm_image_name = vm_service['image_name']
+                self.assertTrue(vm_image_name in images)
+
+                # VM addresses are allocated over every node in the model
+                # when the service runs on all of them.
+                if len(lp_cs.node_ids) == len(nodename_list):
+                    vm_node_ids = tuple(nodename_list)
+                else:
+                    vm_node_ids = lp_cs.node_ids
+                self.assertEqual(len(vm_node_ids),
+                                 lp_cs.active + lp_cs.standby)
+
+                service_groups.append(ServiceGroup(
+                    clustered_service=lp_cs,
+                    vm_service=vm_service,
+                    vm_image=images.get(vm_image_name),
+                    cluster_id=cluster_id,
+                    nodes=FrozenDict(
+                        self._get_vm_node_names(lp_cs.node_ids, cluster)),
+                    vm_node_ids=vm_node_ids,
+                    nodes_hostnames=get_vm_hostname_map(
+                        vm_service, vm_node_ids, lp_cs.active,
+                        lp_cs.standby),
+                    # e.g. 'Grp_CS_c1_FO_SG_vm1'
+                    vcs_group_name=self.vcs.generate_clustered_service_name(
+                        serv.split('/')[-1], cluster_id),
+                    # e.g. 'Res_App_c1_FO_SG_vm1_vmservice2'
+                    vcs_resource_name=self.vcs.
+                    generate_application_resource_name(
+                        lp_cs['name'], cluster_id,
+                        vm_service.url.split('/')[-1]),
+                    **items))
 
         self.log("info", "Printing dict from get_vcs_vm_model_info()")
-        self._print_list(0, service_groups)
+        self._print_list(0, [sv_gp.to_dict() for sv_gp in service_groups])
         self.log("info", "Finished printing dict")
         return service_groups
 
+    def _get_vm_addressing_plan(self):
+        """
+        Get the addresses expected on the VMs of every Service Group,
+        computed once per model snapshot.
+        """
+        return self.get_model_snapshot(self.ms_node).get_derived(
+            'vm_addressing_plan',
+            lambda: VmAddressingPlan(self.get_vcs_vm_model_info()))
+
     @staticmethod
     def _set_status_timeout_value_in_dict(ha_config_props, prop_dict):
         """
@@ -233,19 +254,32 @@ class VCSVM(GenericTest):
         print ret_ip
         return ret_ip
 
+    def _check_on_vm_nodes(self, check, sv_gp, *args):
+        """
+        Description:
+            Run check(sv_gp, *args, node) for every node of the service
+            group at the same time. Failures are reported in node order.
+        :param check: The check to run for each node.
+        :type check: function
+        :param sv_gp: The service group to check.
+        :type sv_gp: ServiceGroup
+        :return: The values returned by check, in node order.
+        """
+        return self.fan_out.run(lambda node: check(sv_gp, *(args + (node,))),
+                                sorted(sv_gp.nodes))
+
     def _check_vcs_clustered_service(self, sv_gp, lp_cs_nm, lp_nd, lp_cs,
-                                     v_cs_nm, hares, hagrp, hastat):
+                                     v_cs_nm, hares, vcs_states):
         """
         Check the 'vcs-clustered-service' type for a service group.
+        Returns the online state of the service group on each node.
         """
         self.log('info', 'Check Service Group: "{0}" is listed for all '
                  'nodes in node_list, on node: "{1}"'.format(lp_cs_nm, lp_nd))
-        nodes_listed = []
-        for svg in hastat['SERVICE_GROUPS']:
-            if svg['GROUP'] == v_cs_nm:
-                nodes_listed.append(svg['SYSTEM'])
-        for node in sv_gp['nodes']:
-            self.assertTrue(sv_gp['nodes'][node] in nodes_listed)
+        group_states = vcs_states.groups.get(v_cs_nm, {})
+        nodes_listed = group_states.keys()
+        for node in sv_gp.nodes:
+            self.assertTrue(sv_gp.nodes[node] in nodes_listed)
 
         # Check online timeout
         self.log('info', 'Check online_timeout for Service Group: "{0}" on'
@@ -263,17 +297,13 @@ class VCSVM(GenericTest):
         self.log('info',
                  'Check active/standby for Service Group: "{0}" on '
                  'node: "{1}"'.format(lp_cs_nm, lp_nd))
-        active = standby = 0
-        sv_gp['node-state'] = {}
-        for state in hagrp['State']:
-            if state['VALUE'] == '|ONLINE|':
-                active += 1
-                sv_gp['node-state'][state['SYSTEM']] = True
-            else:
-                standby += 1
-                sv_gp['node-state'][state['SYSTEM']] = False
+        active = vcs_states.count(v_cs_nm, 'ONLINE')
+        standby = len(group_states) - active
+        node_state = dict((system, state == 'ONLINE')
+                          for system, state in group_states.iteritems())
         self.assertEqual(lp_cs['active'], str(active))
         self.assertEqual(lp_cs['standby'], str(standby))
+        return FrozenDict(node_state)
 
     def _check_vm_service(self, sv_gp, hares, vm_nodes):
         """
@@ -281,57 +311,54 @@ class VCSVM(GenericTest):
         """
         # Check cleanup command
         self.log('info', 'Check cleanup_command for Service: "{0}"'.
-                 format(sv_gp['vm-service']['service_name']))
+                 format(sv_gp.vm_service['service_name']))
         self.assertEqual(hares['CleanProgram'][0]['VALUE'],
-                         sv_gp['vm-service']['cleanup_command'])
+                         sv_gp.vm_service['cleanup_command'])
 
-        for node in sv_gp['nodes']:
-            if not sv_gp['node-state'][sv_gp['nodes'][node]]:
+        for node in sv_gp.nodes:
+            if not sv_gp.node_state[sv_gp.nodes[node]]:
                 # CHECK Service is not running and continue the next
                 # node in the loop
-                if "status_command" in sv_gp['vm-service']:
-                    _, _, rc = self.run_command(sv_gp['nodes'][node], \
-                        sv_gp['vm-service']['status_command'], su_root=True)
+                if "status_command" in sv_gp.vm_service:
+                    _, _, rc = self.run_command(sv_gp.nodes[node], \
+                        sv_gp.vm_service['status_command'], su_root=True)
                     self.assertNotEqual(0, rc)
                 else:
-                    _, _, rc = self.get_service_status(sv_gp['nodes'][node], \
-                                sv_gp['vm-service']['service_name'], \
+                    _, _, rc = self.get_service_status(sv_gp.nodes[node], \
+                                sv_gp.vm_service['service_name'], \
                                 assert_running=False)
                     self.assertNotEqual(0, rc)
                 continue
 
             # Check Service is running
-            if "status_command" in sv_gp['vm-service']:
-                _, _, rc = self.run_command(sv_gp['nodes'][node], \
-                    sv_gp['vm-service']['status_command'], su_root=True)
+            if "status_command" in sv_gp.vm_service:
+                _, _, rc = self.run_command(sv_gp.nodes[node], \
+                    sv_gp.vm_service['status_command'], su_root=True)
                 self.assertEqual(0, rc)
             else:
-                self.get_service_status(sv_gp['nodes'][node], \
-                        sv_gp['vm-service']['service_name'])
+                self.get_service_status(sv_gp.nodes[node], \
+                        sv_gp.vm_service['service_name'])
 
             # Get dominfo for service, from this check cpus, memory
             cmd = '/usr/bin/virsh dominfo {0}'.\
-                    format(sv_gp['vm-service']['service_name'])
-            out, err, rc = self.run_command(sv_gp['nodes'][node], cmd,
+                    format(sv_gp.vm_service['service_name'])
+            out, err, rc = self.run_command(sv_gp.nodes[node], cmd,
                                             su_root=True)
             self.assertEqual(0, rc)
             self.assertEqual([], err)
             self.assertNotEqual([], out)
-            dominfo = {}
-            for line in out:
-                line = line.split(':')
-                dominfo[line[0]] = line[1].strip(' ')
+            dominfo = parse_virsh_dominfo(out)
 
             # Check adaptor version
             self.log('info',
                      'Check adaptor version for Service Group: "{0}" on '
                      'node: "{1}"'.\
-                     format(sv_gp['vcs-clustered-service']['name'], \
-                     sv_gp['nodes'][node]))
+                     format(sv_gp.clustered_service['name'], \
+                     sv_gp.nodes[node]))
             cmd = self.rhc.check_pkg_installed(
                 ['ERIClitpmnlibvirt_CXP9031529-{0}'
-                 .format(sv_gp['vm-service']['adaptor_version'])])
-            out, err, rc = self.run_command(sv_gp['nodes'][node], cmd)
+                 .format(sv_gp.vm_service['adaptor_version'])])
+            out, err, rc = self.run_command(sv_gp.nodes[node], cmd)
             self.assertEqual(0, rc)
             self.assertEqual([], err)
             self.assertNotEqual([], out)
@@ -339,39 +366,36 @@ class VCSVM(GenericTest):
             # Check cpus
             self.log('info',
                 'Check number of cpus for Service: "{0}" on '
-                'node: "{1}"'.format(sv_gp['vcs-clustered-service']['name'], \
-                 sv_gp['nodes'][node]))
-            self.assertEqual(sv_gp['vm-service']['cpus'], dominfo['CPU(s)'])
+                'node: "{1}"'.format(sv_gp.clustered_service['name'], \
+                 sv_gp.nodes[node]))
+            self.assertEqual(sv_gp.vm_service['cpus'], dominfo['CPU(s)'])
 
             # Check memory
             self.log('info',
                 'Check memory for Service: "{0}" on '
-                'node: "{1}"'.format(sv_gp['vcs-clustered-service']['name'], \
-                       sv_gp['nodes'][node]))
+                'node: "{1}"'.format(sv_gp.clustered_service['name'], \
+                       sv_gp.nodes[node]))
             dominfo['Max memory'] = dominfo['Max memory'].split(' ')[0]
-            sv_gp['vm-service']['ram'] = sv_gp['vm-service']['ram'].strip('M')
             v_ram = str(int(dominfo['Max memory']) / 1024)
-            self.assertEqual(sv_gp['vm-service']['ram'], v_ram)
+            self.assertEqual(sv_gp.vm_service.ram_mb, v_ram)
 
             # Check the internal-status-check.
             self.log('info',
                      'Check internal_status_check for Service: "{0}" on '
                      'VM node: "{1}", on Peer node: "{2}"'
-                     .format(sv_gp['vm-service']['service_name'],
+                     .format(sv_gp.vm_service['service_name'],
                              vm_nodes[node],
-                             sv_gp['nodes'][node]))
+                             sv_gp.nodes[node]))
 
-            cmd = self.rhc.get_cat_cmd('{0}/{1}/config.json'.format(
-                test_constants.LIBVIRT_INSTANCES_DIR,
-                sv_gp['vm-service']['service_name']))
-            out, err, rc = self.run_command(sv_gp['nodes'][node], cmd)
-            self.assertEqual([], err)
+            out = self.get_remote_file(
+                sv_gp.nodes[node], '{0}/{1}/config.json'.format(
+                    test_constants.LIBVIRT_INSTANCES_DIR,
+                    sv_gp.vm_service['service_name']))
             self.assertNotEqual([], out)
-            self.assertEqual(0, rc)
             conf = simplejson.loads(out[0])
             status = \
                 conf['adaptor_data']['internal_status_check']['active']
-            if sv_gp['vm-service']['internal_status_check'] == 'on':
+            if sv_gp.vm_service['internal_status_check'] == 'on':
                 self.assertEqual('on', status)
             else:
                 self.assertEqual('off', status)
@@ -379,17 +403,17 @@ class VCSVM(GenericTest):
             self.log('info',
                      'Check "vmmonitord" is running for Service: "{0}" on '
                      'VM node: "{1}", on Peer node: "{2}"'
-                     .format(sv_gp['vm-service']['service_name'],
+                     .format(sv_gp.vm_service['service_name'],
                              vm_nodes[node],
-                             sv_gp['nodes'][node]))
+                             sv_gp.nodes[node]))
             cmd = self.rhc.get_service_running_cmd('vmmonitord')
 
-            if sv_gp['vm-service']['service_name'] == 'sles':
-                out, err, rc = self.run_command_via_node(sv_gp['nodes'][node],
+            if sv_gp.vm_service['service_name'] == 'sles':
+                out, err, rc = self.run_command_via_node(sv_gp.nodes[node],
                                                          vm_nodes[node], cmd,
                             password=test_constants.LIBVIRT_SLES_VM_PASSWORD)
             else:
-                out, err, rc = self.run_command_via_node(sv_gp['nodes'][node],
+                out, err, rc = self.run_command_via_node(sv_gp.nodes[node],
                                                      vm_nodes[node], cmd)
             self.assertEqual([], err)
             self.assertNotEqual([], out)
@@ -399,10 +423,10 @@ class VCSVM(GenericTest):
             self.log('info',
                      'Check "tuned" is installed for Service: "{0}" on '
                      'Peer node: "{1}"'
-                     .format(sv_gp['vm-service']['service_name'],
-                     sv_gp['nodes'][node]))
+                     .format(sv_gp.vm_service['service_name'],
+                     sv_gp.nodes[node]))
             cmd = self.rhc.check_pkg_installed(['tuned'])
-            out, err, rc = self.run_command(sv_gp['nodes'][node], cmd)
+            out, err, rc = self.run_command_memoized(sv_gp.nodes[node], cmd)
             self.assertEqual([], err)
             self.assertNotEqual([], out)
             self.assertEqual(0, rc)
@@ -411,11 +435,11 @@ class VCSVM(GenericTest):
             self.log('info',
                      'Check "tuned" is running for Service: "{0}" on '
                      ' on Peer node: "{1}"'
-                     .format(sv_gp['vm-service']['service_name'],
-                             sv_gp['nodes'][node]))
+                     .format(sv_gp.vm_service['service_name'],
+                             sv_gp.nodes[node]))
             cmd = self.rhc.get_systemctl_is_active_cmd('tuned')
             running_status = ['active']
-            out, err, rc = self.run_command(sv_gp['nodes'][node], cmd)
+            out, err, rc = self.run_command_memoized(sv_gp.nodes[node], cmd)
             self.assertEqual([], err)
             self.assertEqual(running_status, out)
             self.assertEqual(0, rc)
@@ -424,11 +448,11 @@ class VCSVM(GenericTest):
             self.log('info',
                      'Check "tuned" package is active for Service: "{0}"'
                      ' on VM node: "{1}", on Peer node: "{2}"'
-                     .format(sv_gp['vm-service']['service_name'],
+                     .format(sv_gp.vm_service['service_name'],
                              vm_nodes[node],
-                             sv_gp['nodes'][node]))
+                             sv_gp.nodes[node]))
             cmd = "/bin/systemctl list-unit-files tuned.service"
-            out, err, rc = self.run_command(sv_gp['nodes'][node], cmd)
+            out, err, rc = self.run_command_memoized(sv_gp.nodes[node], cmd)
             active_out = 'tuned.service enabled'
             err_message = 'Text "{0}" does not appear in the specified ' \
                           'list'.format(active_out)
@@ -436,15 +460,35 @@ class VCSVM(GenericTest):
             self.assertTrue(self.is_text_in_list(active_out, out), err_message)
             self.assertEqual(0, rc)
 
+    def _get_vm_network_probe(self, sv_gp, node, vm_node, network_scripts_dir,
+                              vm_password):
+        """
+        Description:
+            Collect the network state of a VM with a single remote
+            execution through its peer node.
+        :return: A VmNetworkProbe.
+        """
+        out, err, rc = self.run_probe(
+            vm_node, VM_NETWORK_PROBE,
+            [self.net.get_ifconfig_cmd(), network_scripts_dir],
+            via_node=sv_gp.nodes[node], password=vm_password)
+        self.assertEqual(0, rc)
+        self.assertEqual([], err)
+        probe = VmNetworkProbe.from_output(out)
+        self.assertNotEqual([], probe.ifconfig)
+        return probe
+
     def _check_vm_network_interface(self, sv_gp, lp_cs, vm_nodes):
         """
         Check the 'vm-network-interface' type for a service group.
+        The network state of each VM is collected once, by
+        _get_vm_network_probe, and all interfaces are checked against it.
         """
-        for node in sv_gp['nodes']:
-            if not sv_gp['node-state'][sv_gp['nodes'][node]]:
+        for node in sv_gp.nodes:
+            if not sv_gp.node_state[sv_gp.nodes[node]]:
                 continue
 
-            if sv_gp['vm-service']['service_name'] == 'sles':
+            if sv_gp.vm_service['service_name'] == 'sles':
                 vm_password = test_constants.LIBVIRT_SLES_VM_PASSWORD
                 network_scripts_dir = test_constants.NETWORK_SCRIPTS_SLES_DIR
                 os_ver = test_constants.SLES_VERSION_15_4
@@ -452,133 +496,101 @@ class VCSVM(GenericTest):
                 vm_password = test_constants.LIBVIRT_VM_PASSWORD
                 network_scripts_dir = test_constants.NETWORK_SCRIPTS_DIR
                 os_ver = self.get_rhelver_used_on_node(vm_nodes[node],
-                                                       sv_gp['nodes'][node])
-
-            cmd = self.net.get_ifconfig_cmd()
-            ifconfig, err, rc = self.run_command_via_node(
-                    sv_gp['nodes'][node],
-                    vm_nodes[node], cmd,
-                    password=vm_password)
+                                                       sv_gp.nodes[node])
 
-            self.assertEqual(0, rc)
-            self.assertEqual([], err)
-            self.assertNotEqual([], ifconfig)
+            probe = self._get_vm_network_probe(sv_gp, node, vm_nodes[node],
+                                               network_scripts_dir,
+                                               vm_password)
             macs = []
 
-            # CREATE VM NETWORK MAPPING (NOT USING THE LITP EXPOSED PROPERTY)
-            if len(sv_gp['vcs-clustered-service']["node_list"].split(",")) \
-                        == len(self.model["nodename_list"]):
-                node_hst = self.model["nodename_list"]
-            else:
-                node_hst = sv_gp['vcs-clustered-service']['node_list']\
-                    .split(",")
-            act_hst = sv_gp['vcs-clustered-service']['active']
-            stb_hst = sv_gp['vcs-clustered-service']['standby']
-            total_hst = int(act_hst) + int(stb_hst)
-            self.assertEqual(len(node_hst), total_hst)
-            for vm_net in sv_gp['vm-network-interface']:
-                ip_map = self._generate_ip_map(node_hst, vm_net)
+            # VM NETWORK MAPPING (NOT USING THE LITP EXPOSED PROPERTY)
+            plan = self._get_vm_addressing_plan()
+            for vm_net in sv_gp.interfaces:
+                device_name = vm_net['device_name']
+                address = plan.get_interface_address(sv_gp, node,
+                                                     device_name)
                 # Check eth is up and correct mac prefix if supplied.
-                cmd = self._check_eth_isup_correct_prefix(vm_net)
-                out, err, rc = self.run_command_via_node(
-                        sv_gp['nodes'][node],
-                        vm_nodes[node], cmd,
-                        password=vm_password)
-
                 self.log('info',
                          'Checking eth: "{0}" UP for Service Group: '
                          '"{1}" on VM node: "{2}", on Peer node: "{3}"'
-                         .format(vm_net["device_name"],
+                         .format(device_name,
                                  lp_cs['name'],
                                  vm_nodes[node],
-                                 sv_gp['nodes'][node]
+                                 sv_gp.nodes[node]
                                  )
                          )
-                self.assertEqual(0, rc)
-                self.assertEqual([], err)
-                self.assertNotEqual([], out)
+                self.assertTrue(probe.is_up(device_name))
+                mac = probe.get_mac(device_name)
+                self.assertNotEqual(None, mac)
+                if 'mac_prefix' in vm_net:
+                    self.assertTrue(mac.lower().startswith(
+                        vm_net['mac_prefix'].lower()))
                 # Check mac address uniqueness
-                self.assertTrue(out[0] not in macs)
-                macs.append(out[0])
+                self.assertTrue(mac not in macs)
+                macs.append(mac)
 
-                ifcfg_dict = self.net.get_ifcfg_dict(ifconfig,
-                                        vm_net["device_name"], os_ver=os_ver)
-
-                default_gw_cmd = self.net.get_route_gw_ips_cmd()
+                ifcfg_dict = self.net.get_ifcfg_dict(probe.ifconfig,
+                                                     device_name,
+                                                     os_ver=os_ver)
 
                 print "------->>> VM NET IS", vm_net
                 if 'ipaddresses' in vm_net:
                     if vm_net['ipaddresses'] == 'dhcp':
                         self._check_vm_dhcp(vm_nodes[node],
-                                            sv_gp['nodes'][node],
+                                            sv_gp.nodes[node],
                                             lp_cs['name'],
-                                            vm_net['device_name'])
+                                            device_name,
+                                            vm_dhcp_props=ifcfg_dict)
                         continue
 
-                if 'ipv4' in ip_map[node]:
+                if address.ipv4:
                     self.log('info', 'Checking ip address "{0}" on eth: '
                              '"{1}" for Service Group: "{2}" on VM node: '
                              '"{3}", on Peer node: "{4}"'
-                             .format(ip_map[node]['ipv4'],
-                                     vm_net["device_name"],
+                             .format(address.ipv4,
+                                     device_name,
                                      lp_cs['name'],
                                      vm_nodes[node],
-                                     sv_gp['nodes'][node]
+                                     sv_gp.nodes[node]
                                      )
                              )
-                    self.assertEqual(ip_map[node]['ipv4'],
+                    self.assertEqual(address.ipv4,
                                      self.net.get_ipv4_from_dict(ifcfg_dict))
                     # PING IP AND MAKE SURE REACHABLE
-                    self.assertTrue(self.is_ip_pingable(sv_gp['nodes'][node], \
-                        ip_map[node]['ipv4'], timeout_secs=30))
-                if 'ipv6' in ip_map[node]:
-                    if '/' not in ip_map[node]['ipv6']:
-                        ip_map[node]['ipv6'] += '/64'
+                    self.assertTrue(self.is_ip_pingable(sv_gp.nodes[node], \
+                        address.ipv4, timeout_secs=30))
+                if address.ipv6:
+                    vm_ipv6 = address.ipv6
+                    if '/' not in vm_ipv6:
+                        vm_ipv6 += '/64'
                     self.log('info', 'Checking ipv6 address "{0}" on eth: '
                              '"{1}" for Service Group: "{2}" on VM node: '
                              '"{3}", on Peer node: "{4}"'
-                             .format(ip_map[node]['ipv6'],
-                                     vm_net["device_name"],
+                             .format(vm_ipv6,
+                                     device_name,
                                      lp_cs['name'],
                                      vm_nodes[node],
-                                     sv_gp['nodes'][node]
+                                     sv_gp.nodes[node]
                                      )
                              )
-                    cmd = "/sbin/ip -6 addr show {0} |"\
-                                " awk 'NR == 2 {{print}}'"\
-                                .format(vm_net["device_name"])
-
-                    out, err, rc = self.run_command_via_node(
-                        sv_gp['nodes'][node],
-                            vm_nodes[node], cmd,
-                            password=vm_password)
-
-                    self.assertEqual(['inet6 {0} scope global'.
-                                        format(ip_map[node]['ipv6'])], out)
+                    self.assertEqual('inet6 {0} scope global'.format(vm_ipv6),
+                                     probe.get_ipv6_addr_line(device_name))
                     ip6_addrs = self.net.get_ipv6_from_dict(ifcfg_dict)
-                    ipv6 = self._format_ipv6_to_list(ip_map[node]['ipv6'])
+                    ipv6 = self._format_ipv6_to_list(vm_ipv6)
                     self.assertTrue(
                         any(ipv6 == self._format_ipv6_to_list(ip)
                             for ip in ip6_addrs))
                     # metadata check here:
-                    cmd = "/bin/cat {0}/ifcfg-{1} | /bin/grep IPV6ADDR=".\
-                        format(network_scripts_dir, vm_net["device_name"])
-
-                    out, err, rc = self.run_command_via_node(
-                            sv_gp['nodes'][node],
-                            vm_nodes[node], cmd,
-                            password=vm_password)
-
+                    out = probe.grep_file('ifcfg-{0}'.format(device_name),
+                                          'IPV6ADDR=')
+                    self.assertNotEqual([], out)
                     actual_address = out[0].split("=")[-1].strip()
 
                     split_actual = actual_address.split("/")
-                    split_expected = ip_map[node]['ipv6'].split("/")
+                    split_expected = vm_ipv6.split("/")
                     actual_address_root = split_actual[0]
                     expected_address_root = split_expected[0]
 
-                    self.assertEqual(0, rc)
-                    self.assertEqual([], err)
-                    self.assertNotEqual([], out)
                     self.assertEqual(expected_address_root, \
                                      actual_address_root)
 
@@ -587,36 +599,24 @@ class VCSVM(GenericTest):
                              'Checking eth: "{0}" gateway for Service '
                              'Group: "{1}" on VM node: "{2}", on Peer '
                              'node: "{3}"'
-                             .format(vm_net["device_name"],
+                             .format(device_name,
                                      lp_cs['name'],
                                      vm_nodes[node],
-                                     sv_gp['nodes'][node]
+                                     sv_gp.nodes[node]
                                      )
                              )
-                    if sv_gp['vm-service']['service_name'] == 'sles':
-                        file_path = "{0}/ifroute-{1}".format(
-                            network_scripts_dir, vm_net["device_name"])
-                        cmd = '/bin/cat {0} | grep {1}'.format(
-                            file_path, vm_net['gateway'])
+                    if sv_gp.vm_service['service_name'] == 'sles':
+                        out = probe.grep_file(
+                            'ifroute-{0}'.format(device_name),
+                            vm_net['gateway'])
                     else:
-                        file_path = "{0}/ifcfg-{1}".format(
-                            network_scripts_dir, vm_net["device_name"])
-                        cmd = '/bin/cat {0} | grep GATEWAY={1}'.format(
-                            file_path, vm_net['gateway'])
-                    out, err, rc = self.run_command_via_node(
-                            sv_gp['nodes'][node],
-                            vm_nodes[node], cmd,
-                            password=vm_password)
-
-                    self.assertEqual(0, rc)
-                    self.assertEqual([], err)
+                        out = probe.grep_file(
+                            'ifcfg-{0}'.format(device_name),
+                            'GATEWAY={0}'.format(vm_net['gateway']))
                     self.assertNotEqual([], out)
                     # Default route address check
-                    out, err, rc = self.run_command_via_node(
-                        sv_gp['nodes'][node],
-                        vm_nodes[node], default_gw_cmd,
-                        password=vm_password)
-
+                    out = probe.get_default_routes()
+                    self.assertNotEqual([], out)
                     self.assertTrue(vm_net['gateway'] in out[0])
 
                 if 'gateway6' in vm_net:
@@ -624,423 +624,318 @@ class VCSVM(GenericTest):
                              'Checking eth: "{0}" gateway6 for Service '
                              'Group: "{1}" on VM node: "{2}", on Peer '
                              'node: "{3}"'
-                             .format(vm_net["device_name"],
+                             .format(device_name,
                                      lp_cs['name'],
                                      vm_nodes[node],
-                                     sv_gp['nodes'][node]
+                                     sv_gp.nodes[node]
                                      )
                              )
-                    file_path = "{0}/ifcfg-{1}".format(network_scripts_dir,
-                                                       vm_net["device_name"])
-                    cmd = '/bin/cat {0} | grep IPV6_DEFAULTGW'\
-                          .format(file_path)
-                    out, err, rc = self.run_command_via_node(
-                        sv_gp['nodes'][node], vm_nodes[node], cmd,
-                            password=vm_password)
-
-                    self.assertEqual(0, rc)
-                    self.assertEqual([], err)
+                    out = probe.grep_file('ifcfg-{0}'.format(device_name),
+                                          'IPV6_DEFAULTGW')
                     self.assertNotEqual([], out)
                     out = out[0].split("=")[1]
                     self.assertEqual(
                         self._format_ipv6_to_list(vm_net['gateway6']),
                         self._format_ipv6_to_list(out))
                     # Default route address check
-                    cmd = "/sbin/ip -6 route show dev {0} |"\
-                            " awk '/default via/ {{print}}'"\
-                            .format(vm_net["device_name"])
-                    out, err, rc = self.run_command_via_node(
-                            sv_gp['nodes'][node],
-                            vm_nodes[node], cmd,
-                            password=vm_password)
+                    out = probe.get_default_routes(device_name, ipv6=True)
+                    self.assertNotEqual([], out)
                     self.assertTrue(vm_net['gateway6'] in out[0])
 
-    def _generate_ip_map(self, node_hst, vm_net):
-        """
-        Generate the ip address map for each vm and then link the addresses
-        to nodes on the cluster.
-        :param node_hst:
-        :param vm_net:
-        :return:
-        """
-        ip_map = {}
-        ipaddr, ipv6addr = self._check_ips(vm_net)
-        # POPULATE A NODE IP MAPPING IF PRESENT
-        self._populate_node_ip_mapping(ip_map, ipaddr, ipv6addr, node_hst)
-        return ip_map
-
-    @staticmethod
-    def _check_eth_isup_correct_prefix(vm_net):
-        """
-        Description:
-            Check that the eth device is up and using the correct
-            mac prefix
-        :param vm_net:
-        :return:
-        """
-        if 'mac_prefix' in vm_net:
-            return "ip -o link show | grep 'link/ether' \
-                    | grep -Ei '{0}:.*{1}'" \
-                    .format(vm_net["device_name"], vm_net['mac_prefix'])
-        else:
-            return "/sbin/ifconfig | grep -E '^{0} |^{0}:'" \
-                .format(vm_net["device_name"])
-
-    @staticmethod
-    def _populate_node_ip_mapping(ip_map, ipaddr, ipv6addr, node_hst):
-        """
-        Description:
-            Logic for populating node ip map
-        :param ip_map: The possibly non empty map to populate
-        :param ipaddr: An ipv4 address to consider in logic
-        :param ipv6addr: An ipv6 address to consider in logic
-        :param node_hst: The node hst to compare against
-        """
-        if ipaddr != [] and ipv6addr != []:
-            VCSVM._populate_node_ip_map_ipv4_and_ipv6(ip_map, ipaddr, ipv6addr,
-                                                      node_hst)
-        if ipaddr == [] and ipv6addr != []:
-            VCSVM._populate_node_ip_map_ipv6_only(ip_map, ipv6addr, node_hst)
-        if ipaddr != [] and ipv6addr == []:
-            VCSVM._populate_node_ip_map_ipv4_only(ip_map, ipaddr, node_hst)
-
-    @staticmethod
-    def _populate_node_ip_map_ipv4_and_ipv6(ip_map, ipaddr, ipv6addr,
-                                            node_hst):
-        """
-        Worker method for adding info for both ipv4 and 6
-        :param ip_map:
-        :param ipaddr:
-        :param ipv6addr:
-        :param node_hst:
-        :return:
-        """
-        if len(node_hst) == len(ipaddr) and \
-                        len(node_hst) == len(ipv6addr):
-            for tlen in range(len(node_hst)):
-                ip_map[node_hst[tlen]] = \
-                    {"ipv4": ipaddr[tlen], "ipv6": ipv6addr[tlen]}
-        if len(ipaddr) == 1 and len(ipv6addr) == 1:
-            for tlen in range(len(node_hst)):
-                ip_map[node_hst[tlen]] = \
-                    {"ipv4": ipaddr[0], "ipv6": ipv6addr[0]}
-
-    @staticmethod
-    def _populate_node_ip_map_ipv6_only(ip_map, ipv6addr, node_hst):
-        """
-        Worker method for adding info for only ipv6
-        :param ip_map:
-        :param ipv6addr:
-        :param node_hst:
-        :return:
-        """
-        if len(node_hst) == len(ipv6addr):
-            for tlen in range(len(node_hst)):
-                ip_map[node_hst[tlen]] = {"ipv6": ipv6addr[tlen]}
-        if len(ipv6addr) == 1:
-            for tlen in range(len(node_hst)):
-                ip_map[node_hst[tlen]] = {"ipv6": ipv6addr[0]}
-
-    @staticmethod
-    def _populate_node_ip_map_ipv4_only(ip_map, ipaddr, node_hst):
-        """
-        Worker method for adding info for only ipv4
-        :param ip_map:
-        :param ipaddr:
-        :param node_hst:
-        :return:
-        """
-        if len(node_hst) == len(ipaddr):
-            for tlen in range(len(node_hst)):
-                ip_map[node_hst[tlen]] = {"ipv4": ipaddr[tlen]}
-        if len(ipaddr) == 1:
-            for tlen in range(len(node_hst)):
-                ip_map[node_hst[tlen]] = {"ipv4": ipaddr[0]}
-
-    @staticmethod
-    def _check_ips(vm_net):
+    def _check_vm_ssh_key(self, sv_gp, lp_cs, vm_nodes):
         """
-        :param vm_net: (str) of vm-network-interface information
-        :return: IPV4 and IPV6 addresses
+        Check the 'vm-ssh-key' type for a service group.
         """
-        ipaddr = []
-        ipv6addr = []
-        # CHECK NODE LIST MATCHES NUMBER OF IPV4/IPV6 ADDRESSES
-        model_ip_node_map = ast.literal_eval(vm_net['node_ip_map'])
-        for node in model_ip_node_map.keys():
-            if 'ipaddresses' in vm_net:
-                if vm_net['ipaddresses'] != "dhcp":
-                    ipaddr.append(model_ip_node_map[node]['ipv4'])
-            if 'ipv6addresses' in vm_net:
-                ipv6addr.append(model_ip_node_map[node]['ipv6'])
+        if sv_gp.ssh_keys:
+            self._check_on_vm_nodes(self._check_vm_ssh_key_on_node,
+                                    sv_gp, lp_cs, vm_nodes)
 
-        return ipaddr, ipv6addr
-
-    def _check_vm_ssh_key(self, sv_gp, lp_cs, vm_nodes):
+    def _check_vm_ssh_key_on_node(self, sv_gp, lp_cs, vm_nodes, node):
         """
-        Check the 'vm-ssh-key' type for a service group.
+        Check the 'vm-ssh-key' type for a service group on one node.
         """
-        for node in sv_gp['nodes']:
+        if sv_gp.node_state[sv_gp.nodes[node]]:
 
-            if 'vm-ssh-key' not in sv_gp:
-                break
+            self.log('info', 'Checking vm-ssh-key for Service Group: '
+                             '"{0}", on VM node: "{1}", on Peer node '
+                             '"{2}"'.format(lp_cs['name'],
+                                            vm_nodes[node],
+                                            sv_gp.nodes[node]))
+            cmd = '/bin/cat /root/.ssh/authorized_keys'
+            if sv_gp.vm_service['service_name'] == 'sles':
+                out, err, rc = self.run_command_via_node(
+                    sv_gp.nodes[node],
+                    vm_nodes[node], cmd,
+                    password=test_constants.LIBVIRT_SLES_VM_PASSWORD)
+            else:
+                out, err, rc = self.run_command_via_node(
+                    sv_gp.nodes[node],
+                    vm_nodes[node], cmd)
 
-            if sv_gp['node-state'][sv_gp['nodes'][node]]:
-
-                self.log('info', 'Checking vm-ssh-key for Service Group: '
-                                 '"{0}", on VM node: "{1}", on Peer node '
-                                 '"{2}"'.format(lp_cs['name'],
-                                                vm_nodes[node],
-                                                sv_gp['nodes'][node]))
-                cmd = '/bin/cat /root/.ssh/authorized_keys'
-                if sv_gp['vm-service']['service_name'] == 'sles':
-                    out, err, rc = self.run_command_via_node(
-                        sv_gp['nodes'][node],
-                        vm_nodes[node], cmd,
-                        password=test_constants.LIBVIRT_SLES_VM_PASSWORD)
+            self.assertEqual(0, rc)
+            self.assertEqual([], err)
+            for key in sv_gp.ssh_keys:
+                self.assertTrue(
+                    any(key['ssh_key'] in line for line in out))
+                ipv4_ip = self.get_node_att(vm_nodes[node], "ipv4")
+                if sv_gp.vm_service['service_name'] == 'sles':
+                    ssh_cmd = "/usr/bin/ssh -o StrictHostKeyChecking=no " \
+                              "-i {0}/{1} root@{2} exit".format(
+                        test_constants.SSH_KEYS_FOLDER, \
+                                   key.url.split("/")[-1], ipv4_ip)
                 else:
-                    out, err, rc = self.run_command_via_node(
-                        sv_gp['nodes'][node],
-                        vm_nodes[node], cmd)
-
+                    ssh_cmd = \
+                    "/usr/bin/ssh -o StrictHostKeyChecking=no -i {0}/{1} "\
+                    "cloud-user@{2} exit". \
+                        format(test_constants.SSH_KEYS_FOLDER, \
+                        key.url.split("/")[-1], ipv4_ip)
+                _, _, rc = self.run_command(self.ms_node, ssh_cmd)
                 self.assertEqual(0, rc)
-                self.assertEqual([], err)
-                for key in sv_gp['vm-ssh-key']:
-                    self.assertTrue(
-                        any(key['ssh_key'] in line for line in out))
-                    ipv4_ip = self.get_node_att(vm_nodes[node], "ipv4")
-                    if sv_gp['vm-service']['service_name'] == 'sles':
-                        ssh_cmd = "/usr/bin/ssh -o StrictHostKeyChecking=no " \
-                                  "-i {0}/{1} root@{2} exit".format(
-                            test_constants.SSH_KEYS_FOLDER, \
-                                       key['url'].split("/")[-1], ipv4_ip)
-                    else:
-                        ssh_cmd = \
-                        "/usr/bin/ssh -o StrictHostKeyChecking=no -i {0}/{1} "\
-                        "cloud-user@{2} exit". \
-                            format(test_constants.SSH_KEYS_FOLDER, \
-                            key['url'].split("/")[-1], ipv4_ip)
-                    _, _, rc = self.run_command(self.ms_node, ssh_cmd)
-                    self.assertEqual(0, rc)
 
     def _check_vm_package(self, sv_gp, vm_nodes):
         """
         Check the 'vm-package' type for a service group.
         """
-        if 'vm-package' in sv_gp:
+        if sv_gp.packages:
             pkg_list = []
-            for pkg in sv_gp['vm-package']:
+            for pkg in sv_gp.packages:
                 pkg_list.append(pkg['name'])
 
                 if not pkg_list:
                     break
 
-            for node in sv_gp['nodes']:
-                # Get the contents of the user-data file for the service group.
-                data = self.get_file_contents(
-                    sv_gp['nodes'][node], '/var/lib/libvirt/instances/{0}/'
-                    'user-data'.format(sv_gp['vm-service']['service_name']))
-
-                for pkg in pkg_list:
-                    self.assertTrue(any(pkg in line for line in data))
-                    # LOG ONTO NODE AND CHECK PACKAGE EXISTS IF ONLINE ON NODE
-                    if sv_gp['node-state'][sv_gp['nodes'][node]]:
-                        pkg_cmd = self.rhc.check_pkg_installed([pkg])
-                        if sv_gp['vm-service']['service_name'] == 'sles':
-                            pkgs, _, rc = self.run_command_via_node(
-                                sv_gp['nodes'][node], vm_nodes[node], pkg_cmd,
-                            password=test_constants.LIBVIRT_SLES_VM_PASSWORD,
-                                timeout_secs=180)
-                        else:
-                            pkgs, _, rc = self.run_command_via_node(
-                                sv_gp['nodes'][node], vm_nodes[node], pkg_cmd,
-                                timeout_secs=180)
-                        self.assertEqual(1, len(pkgs))
-                        self.assertEqual(0, rc)
+            self._check_on_vm_nodes(self._check_vm_package_on_node,
+                                    sv_gp, vm_nodes, pkg_list)
+
+    def _check_vm_package_on_node(self, sv_gp, vm_nodes, pkg_list, node):
+        """
+        Check the 'vm-package' type for a service group on one node.
+        """
+        # Get the contents of the user-data file for the service group.
+        data = self.get_remote_file(
+            sv_gp.nodes[node], '/var/lib/libvirt/instances/{0}/'
+            'user-data'.format(sv_gp.vm_service['service_name']))
+
+        for pkg in pkg_list:
+            self.assertTrue(any(pkg in line for line in data))
+            # LOG ONTO NODE AND CHECK PACKAGE EXISTS IF ONLINE ON NODE
+            if sv_gp.node_state[sv_gp.nodes[node]]:
+                pkg_cmd = self.rhc.check_pkg_installed([pkg])
+                if sv_gp.vm_service['service_name'] == 'sles':
+                    pkgs, _, rc = self.run_command_via_node(
+                        sv_gp.nodes[node], vm_nodes[node], pkg_cmd,
+                    password=test_constants.LIBVIRT_SLES_VM_PASSWORD,
+                        timeout_secs=180)
+                else:
+                    pkgs, _, rc = self.run_command_via_node(
+                        sv_gp.nodes[node], vm_nodes[node], pkg_cmd,
+                        timeout_secs=180)
+                self.assertEqual(1, len(pkgs))
+                self.assertEqual(0, rc)
 
     def _check_vm_yum_repo(self, sv_gp, lp_cs, vm_nodes):
         """
         Check the 'vm-yum-repo' type for a service group.
         """
-        for node in sv_gp['nodes']:
-
-            if 'vm-yum-repo' not in sv_gp:
-                break
+        if sv_gp.yum_repos:
+            self._check_on_vm_nodes(self._check_vm_yum_repo_on_node,
+                                    sv_gp, lp_cs, vm_nodes)
 
-            if sv_gp['node-state'][sv_gp['nodes'][node]]:
+    def _check_vm_yum_repo_on_node(self, sv_gp, lp_cs, vm_nodes, node):
+        """
+        Check the 'vm-yum-repo' type for a service group on one node.
+        """
+        if sv_gp.node_state[sv_gp.nodes[node]]:
 
-                for repo in sv_gp['vm-yum-repo']:
-                    self.log('info',
-                             'Checking repo "{0}" for Service Group: '
-                             '"{1}" on VM node: "{2}", on Peer node: "{3}"'
-                             .format(repo['name'],
-                                     lp_cs['name'],
-                                     vm_nodes[node],
-                                     sv_gp['nodes'][node]
-                                     )
-                             )
+            for repo in sv_gp.yum_repos:
+                self.log('info',
+                         'Checking repo "{0}" for Service Group: '
+                         '"{1}" on VM node: "{2}", on Peer node: "{3}"'
+                         .format(repo['name'],
+                                 lp_cs['name'],
+                                 vm_nodes[node],
+                                 sv_gp.nodes[node]
+                                 )
+                         )
 
-                    path = test_constants.YUM_CONFIG_FILES_DIR + '/' +\
-                        repo['name'].lower() + '.repo'
-                    cmd = '/bin/cat {0}'.format(path)
-                    out, err, rc = self.run_command_via_node(
-                        sv_gp['nodes'][node],
-                        vm_nodes[node],
-                        cmd)
-                    self.assertEqual(0, rc)
-                    self.assertEqual([], err)
-                    self.assertTrue(
-                        'baseurl = {0}'.format(repo['base_url']) in out)
-                    # check repolist cmd output
-                    print "=-------> ", repo['name']
+                path = test_constants.YUM_CONFIG_FILES_DIR + '/' +\
+                    repo['name'].lower() + '.repo'
+                cmd = '/bin/cat {0}'.format(path)
+                out, err, rc = self.run_command_via_node(
+                    sv_gp.nodes[node],
+                    vm_nodes[node],
+                    cmd)
+                self.assertEqual(0, rc)
+                self.assertEqual([], err)
+                self.assertTrue(
+                    'baseurl = {0}'.format(repo['base_url']) in out)
+                # check repolist cmd output
+                print "=-------> ", repo['name']
 
     def _check_vm_zypper_repo(self, sv_gp, lp_cs, vm_nodes):
         """
         Check the 'vm-zypper-repo' type for a service group.
 
         Args:
-            sv_gp  (dict): service group details
+            sv_gp  (ServiceGroup): service group details
             lp_cs  (list): clustered service details
             vm_nodes (list): node aliases
         """
-        for node in sv_gp['nodes']:
-            if sv_gp['node-state'][sv_gp['nodes'][node]]:
-                for repo in sv_gp['vm-zypper-repo']:
-                    self.log('info',
-                             'Checking repo "{0}" for Service Group: '
-                             '"{1}" on VM node: "{2}", on Peer node: "{3}"'
-                             .format(repo['name'],
-                                     lp_cs['name'],
-                                     vm_nodes[node],
-                                     sv_gp['nodes'][node]
-                                     )
-                             )
-                    path = "{0}/{1}.repo".format(test_constants.
-                                ZYPPER_CONFIG_FILES_DIR, repo['name'].lower())
-                    cmd = '/bin/cat {0}'.format(path)
-                    out, err, rc = self.run_command_via_node(
-                        sv_gp['nodes'][node],
-                        vm_nodes[node],
-                        cmd, password=test_constants.LIBVIRT_SLES_VM_PASSWORD)
-                    self.assertEqual(0, rc)
-                    self.assertEqual([], err)
-                    self.assertTrue(
-                        'baseurl={0}'.format(repo['base_url']) in out)
-                    # check repolist cmd output
-                    print "=-------> ", repo['name']
+        self._check_on_vm_nodes(self._check_vm_zypper_repo_on_node,
+                                sv_gp, lp_cs, vm_nodes)
 
-    def _check_vm_alias(self, sv_gp, lp_cs, vm_nodes):
+    def _check_vm_zypper_repo_on_node(self, sv_gp, lp_cs, vm_nodes, node):
         """
-        Check the 'vm-alias' type for a service group.
+        Check the 'vm-zypper-repo' type for a service group on one node.
         """
-        for node in sv_gp['nodes']:
-            if 'vm-alias' not in sv_gp:
-                break
-
-            if sv_gp['node-state'][sv_gp['nodes'][node]]:
-
-                cmd = self.net.get_cat_etc_hosts_cmd()
-                if sv_gp['vm-service']['service_name'] == 'sles':
-                    out, err, rc = self.run_command_via_node(
-                        sv_gp['nodes'][node],
-                        vm_nodes[node], cmd,
-                        password=test_constants.LIBVIRT_SLES_VM_PASSWORD)
-                else:
-                    out, err, rc = self.run_command_via_node(
-                        sv_gp['nodes'][node],
-                        vm_nodes[node], cmd)
-                self.assertEqual(0, rc)
-                self.assertEqual([], err)
-
+        if sv_gp.node_state[sv_gp.nodes[node]]:
+            for repo in sv_gp.zypper_repos:
                 self.log('info',
-                         'Checking alias names for Service Group: '
-                         '"{0}" on VM node: "{1}", on Peer node: "{2}"'
-                         .format(lp_cs['name'],
+                         'Checking repo "{0}" for Service Group: '
+                         '"{1}" on VM node: "{2}", on Peer node: "{3}"'
+                         .format(repo['name'],
+                                 lp_cs['name'],
                                  vm_nodes[node],
-                                 sv_gp['nodes'][node]
+                                 sv_gp.nodes[node]
                                  )
                          )
-                for alias in sv_gp['vm-alias']:
-                    alias_address = alias['address'].split("/")[0] + " "
-                    # First check if the ip address is in the list.
-                    self.assertTrue(
-                        any(alias_address in line for line in out))
+                path = "{0}/{1}.repo".format(test_constants.
+                            ZYPPER_CONFIG_FILES_DIR, repo['name'].lower())
+                cmd = '/bin/cat {0}'.format(path)
+                out, err, rc = self.run_command_via_node(
+                    sv_gp.nodes[node],
+                    vm_nodes[node],
+                    cmd, password=test_constants.LIBVIRT_SLES_VM_PASSWORD)
+                self.assertEqual(0, rc)
+                self.assertEqual([], err)
+                self.assertTrue(
+                    'baseurl={0}'.format(repo['base_url']) in out)
+                # check repolist cmd output
+                print "=-------> ", repo['name']
+
+    def _check_vm_alias(self, sv_gp, lp_cs, vm_nodes):
+        """
+        Check the 'vm-alias' type for a service group.
+        """
+        if sv_gp.aliases:
+            self._check_on_vm_nodes(self._check_vm_alias_on_node,
+                                    sv_gp, lp_cs, vm_nodes)
 
-                    # Now check if the alias names are configured for the
-                    # ip address
-                    for line in out:
-                        if alias_address in line:
-                            for name in alias['alias_names'].split(','):
-                                self.assertTrue(name in line)
-                            continue
+    def _check_vm_alias_on_node(self, sv_gp, lp_cs, vm_nodes, node):
+        """
+        Check the 'vm-alias' type for a service group on one node.
+        """
+        if sv_gp.node_state[sv_gp.nodes[node]]:
+
+            if sv_gp.vm_service['service_name'] == 'sles':
+                out = self.get_remote_file(
+                    vm_nodes[node], test_constants.ETC_HOSTS,
+                    via_node=sv_gp.nodes[node],
+                    password=test_constants.LIBVIRT_SLES_VM_PASSWORD)
+            else:
+                out = self.get_remote_file(
+                    vm_nodes[node], test_constants.ETC_HOSTS,
+                    via_node=sv_gp.nodes[node])
+
+            self.log('info',
+                     'Checking alias names for Service Group: '
+                     '"{0}" on VM node: "{1}", on Peer node: "{2}"'
+                     .format(lp_cs['name'],
+                             vm_nodes[node],
+                             sv_gp.nodes[node]
+                             )
+                     )
+            hosts = parse_hosts_file(out)
+            for alias in sv_gp.aliases:
+                alias_address = alias['address'].split("/")[0]
+                # First check if the ip address is in the file.
+                self.assertNotEqual(0, hosts.count(alias_address))
+
+                # Now check if the alias names are configured for the
+                # ip address
+                names = hosts.names_for(alias_address)
+                for name in alias['alias_names'].split(','):
+                    self.assertTrue(name in names)
 
     def _check_vm_nfs_mount(self, sv_gp, lp_cs, vm_nodes):
         """
         Check the 'vm-nfs-mount' type for a service group
         """
-        fstab_cmd = self.rhc.get_cat_cmd("/etc/fstab")
+        if sv_gp.nfs_mounts:
+            self._check_on_vm_nodes(self._check_vm_nfs_mount_on_node,
+                                    sv_gp, lp_cs, vm_nodes)
+
+    def _check_vm_nfs_mount_on_node(self, sv_gp, lp_cs, vm_nodes, node):
+        """
+        Check the 'vm-nfs-mount' type for a service group on one node.
+        """
         mount_cmd = self.stor.get_mount_list_cmd()
-        for node in sv_gp['nodes']:
-            if 'vm-nfs-mount' not in sv_gp:
-                break
-            if sv_gp['node-state'][sv_gp['nodes'][node]]:
-                self.log('info', 'Checking vm-nfs-mount for '
-                         'Service Group: "{0}" on node: "{1}"'
-                         .format(lp_cs['name'], sv_gp['nodes'][node]))
-                fstab, stderr, return_code = \
-                                self.run_command_via_node(sv_gp['nodes'][node],
-                                                            vm_nodes[node],
-                                                            fstab_cmd)
-                self.assertEqual(return_code, 0)
-                self.assertEqual(stderr, [], stderr)
-                _, stderr, return_code = \
-                                self.run_command_via_node(sv_gp['nodes'][node],
-                                                            vm_nodes[node],
-                                                            mount_cmd)
-                self.assertEqual(return_code, 0)
-                self.assertEqual(stderr, [], stderr)
-                for nfs in sv_gp['vm-nfs-mount']:
-                    # Check item props are in /etc/fstab file
-                    found_mount = False
-                    for line in fstab:
-                        if nfs['device_path'] in line and \
-                            nfs['mount_point'] in line and \
-                            nfs['mount_options'] in line:
-                            found_mount = True
-                    # Check item props exist in /bin/mount cmd output
-                    self.assertTrue(found_mount)
+        if sv_gp.node_state[sv_gp.nodes[node]]:
+            self.log('info', 'Checking vm-nfs-mount for '
+                     'Service Group: "{0}" on node: "{1}"'
+                     .format(lp_cs['name'], sv_gp.nodes[node]))
+            fstab = self.get_remote_file(vm_nodes[node], "/etc/fstab",
+                                         via_node=sv_gp.nodes[node])
+            _, stderr, return_code = \
+                            self.run_command_via_node(sv_gp.nodes[node],
+                                                        vm_nodes[node],
+                                                        mount_cmd)
+            self.assertEqual(return_code, 0)
+            self.assertEqual(stderr, [], stderr)
+            fstab = parse_fstab(fstab)
+            for nfs in sv_gp.nfs_mounts:
+                # Check item props are in /etc/fstab file
+                entry = fstab.get(nfs['mount_point'])
+                self.assertNotEqual(None, entry)
+                self.assertEqual(nfs['device_path'], entry.device)
+                self.assertTrue(nfs['mount_options'] in entry.options)
 
     def _check_vm_hostnames(self, sv_gp, lp_cs, vm_nodes):
         """
         Verify hostnames on nested VM
         """
+        self._check_on_vm_nodes(self._check_vm_hostname_on_node,
+                                sv_gp, lp_cs, vm_nodes)
+
+    def _check_vm_hostname_on_node(self, sv_gp, lp_cs, vm_nodes, node):
+        """
+        Verify the hostname of the nested VM on one node.
+        """
         grep_cmd = "/bin/hostname"
-        for node in sv_gp['nodes']:
-            if sv_gp['node-state'][sv_gp['nodes'][node]]:
-                self.log('info', 'Checking hostname for '
-                             'Service Group: "{0}" on node: "{1}"'
-                             .format(lp_cs['name'], sv_gp['nodes'][node]))
-                if sv_gp['vm-service']['service_name'] == 'sles':
-                    stdout, stderr, rcode = self.run_command_via_node(
-                        sv_gp['nodes'][node],
-                        vm_nodes[node], grep_cmd,
-                        password=test_constants.LIBVIRT_SLES_VM_PASSWORD)
-                else:
-                    stdout, stderr, rcode = self.run_command_via_node(
-                        sv_gp['nodes'][node], vm_nodes[node], grep_cmd)
-                vm_hostname = stdout[0]
-                self.assertEqual(rcode, 0)
-                self.assertEqual(stderr, [], stderr)
-                self.assertEqual(vm_hostname, vm_nodes[node],
-                                    "Different hostnames found on the VM.")
+        if sv_gp.node_state[sv_gp.nodes[node]]:
+            self.log('info', 'Checking hostname for '
+                         'Service Group: "{0}" on node: "{1}"'
+                         .format(lp_cs['name'], sv_gp.nodes[node]))
+            if sv_gp.vm_service['service_name'] == 'sles':
+                stdout, stderr, rcode = self.run_command_via_node(
+                    sv_gp.nodes[node],
+                    vm_nodes[node], grep_cmd,
+                    password=test_constants.LIBVIRT_SLES_VM_PASSWORD)
+            else:
+                stdout, stderr, rcode = self.run_command_via_node(
+                    sv_gp.nodes[node], vm_nodes[node], grep_cmd)
+            vm_hostname = stdout[0]
+            self.assertEqual(rcode, 0)
+            self.assertEqual(stderr, [], stderr)
+            self.assertEqual(vm_hostname, vm_nodes[node],
+                                "Different hostnames found on the VM.")
 
     def _get_abv_tz_on_node(self, sv_gp, node, via_node=None):
+        """
+        Get the abbreviated timezone of a given node, once per verification
+        epoch.
+        """
+        return self._command_memo.get(
+            ('_get_abv_tz_on_node', node, via_node),
+            lambda: self._read_abv_tz_on_node(sv_gp, node, via_node))
+
+    def _read_abv_tz_on_node(self, sv_gp, node, via_node=None):
         """
         Get the abbreviated timezone of a given node from the "date" command
         """
         cmd = "/bin/date"
         if via_node is not None:
-            if sv_gp['vm-service']['service_name'] == 'sles':
+            if sv_gp.vm_service['service_name'] == 'sles':
                 out, err, r_code = self.run_command_via_node(via_node, node,
                         cmd, password=test_constants.LIBVIRT_SLES_VM_PASSWORD)
             else:
@@ -1066,19 +961,27 @@ class VCSVM(GenericTest):
         """
         ms_tz = self.get_timezone_on_node(self.ms_node).strip()
         ms_avg_tz = self._get_abv_tz_on_node(sv_gp, self.ms_node).strip()
-        for node in sv_gp['nodes']:
-            if sv_gp['node-state'][sv_gp['nodes'][node]]:
-                self.log('info', 'Checking timezone for '
-                         'Service Group: "{0}" on node: "{1}"'
-                         .format(lp_cs['name'], sv_gp['nodes'][node]))
+        self._check_on_vm_nodes(self._check_vm_timezone_on_node,
+                                sv_gp, lp_cs, vm_nodes, ms_tz, ms_avg_tz)
 
-                vm_tz = self.get_timezone_on_node(vm_nodes[node],
-                                        via_node=sv_gp['nodes'][node]).strip()
+    def _check_vm_timezone_on_node(self, sv_gp, lp_cs, vm_nodes, ms_tz,
+                                   ms_avg_tz, node):
+        """
+        Ensure the timezone of the VM on one node matches the timezone of
+        the MS.
+        """
+        if sv_gp.node_state[sv_gp.nodes[node]]:
+            self.log('info', 'Checking timezone for '
+                     'Service Group: "{0}" on node: "{1}"'
+                     .format(lp_cs['name'], sv_gp.nodes[node]))
+
+            vm_tz = self.get_timezone_on_node(vm_nodes[node],
+                                    via_node=sv_gp.nodes[node]).strip()
 
-                vm_avg_tz = self._get_abv_tz_on_node(sv_gp, vm_nodes[node],\
-                                        via_node=sv_gp['nodes'][node]).strip()
-                self.assertEqual(ms_tz, vm_tz)
-                self.assertEqual(ms_avg_tz, vm_avg_tz)
+            vm_avg_tz = self._get_abv_tz_on_node(sv_gp, vm_nodes[node],\
+                                    via_node=sv_gp.nodes[node]).strip()
+            self.assertEqual(ms_tz, vm_tz)
+            self.assertEqual(ms_avg_tz, vm_avg_tz)
 
     def _get_vm_dhcp_details(self, node, via_node=None, dhcp_nic=None):
         """
@@ -1111,24 +1014,28 @@ class VCSVM(GenericTest):
                         os_ver=self.get_rhelver_used_on_node(node, via_node))
         return dhcp_int
 
-    def _check_vm_dhcp(self, vm_node, node, lp_cs_name, device_name):
+    def _check_vm_dhcp(self, vm_node, node, lp_cs_name, device_name,
+                       vm_dhcp_props=None):
         """
         Description:
             For each vm dhcp network interface found in
             _check_vm_network_interface function, ensure its IP address
             is in dhcp service IPs range.
+            vm_dhcp_props is the interface's ifcfg dictionary, if already
+            known, otherwise it is fetched from the VM.
         """
         self.log('info', 'Checking DHCP for '
                      'Service Group: "{0}" on node: "{1}"'
                      .format(lp_cs_name, node))
+        if vm_dhcp_props is None:
+            vm_dhcp_props = self._get_vm_dhcp_details(vm_node, \
+                    node, device_name)
         range_found = False
         for dhcp_range in self.dhcp_ranges:
-            dhcp_range_props = self.get_props_from_url(self.ms_node,
-                                                       dhcp_range)
+            dhcp_range_props = \
+                self.get_model_snapshot(self.ms_node).get_props(dhcp_range)
             range_start = dhcp_range_props['start']
             range_end = dhcp_range_props['end']
-            vm_dhcp_props = self._get_vm_dhcp_details(vm_node, \
-                    node, device_name)
             if self.net.is_ip_in_range(vm_dhcp_props['IPV4'],\
                                         range_start, range_end):
                 range_found = True
@@ -1140,108 +1047,21 @@ class VCSVM(GenericTest):
         Build a list of all connection details for each node and add to
         utils node_list.
         """
-        # CREATE VM NETWORK MAPPING (NOT USING THE LITP EXPOSED PROPERTY)
-        index_sg = 0
+        # VM NETWORK MAPPING (NOT USING THE LITP EXPOSED PROPERTY)
+        plan = self._get_vm_addressing_plan()
         for sv_gp in service_groups:
-            node_template = {'hostname': None, 'ipv4': None, 'ipv6': None}
-            ip_map = {}
-            if len(sv_gp['vcs-clustered-service']["node_list"].split(",")) \
-                        == len(self.model["nodename_list"]):
-                node_hst = self.model["nodename_list"]
-            else:
-                node_hst = sv_gp['vcs-clustered-service']['node_list']\
-                    .split(",")
-            act_hst = sv_gp['vcs-clustered-service']['active']
-            stb_hst = sv_gp['vcs-clustered-service']['standby']
-            total_hst = int(act_hst) + int(stb_hst)
-            self.assertEqual(len(node_hst), total_hst)
-            for node in node_hst:
-                ip_map[node] = node_template.copy()
-            sg_hsts = self._handle_hostnames_in_mapping(node_hst,
-                                                        stb_hst, sv_gp)
-            if int(act_hst) == 1 and int(stb_hst) == 1:
-                for node in ip_map:
-                    ip_map[node]["hostname"] = sg_hsts[0]
-            else:
-                for tlen in range(len(ip_map)):
-                    ip_map[node_hst[tlen]]["hostname"] = sg_hsts[tlen]
-            service_groups[index_sg]["nodes-hostnames"] = {}
-            for nl_node in ip_map:
-                service_groups[index_sg]["nodes-hostnames"][nl_node] = \
-                ip_map[nl_node]["hostname"]
-            index_sg += 1
-            for vm_net in sv_gp['vm-network-interface']:
-                ipaddr, ipv6addr = self._check_ips(vm_net)
-                self._allocate_ips_based_on_act_stb(act_hst, ip_map, ipaddr,
-                                                    ipv6addr, node_hst,
-                                                    stb_hst)
-            for node in ip_map:
+            for _, address in plan.get_vm_addresses(sv_gp):
                 self.log("info", "VMHOSTCONNSET: {0} IPV4: {1} IPV6: {2}"\
-                        .format(ip_map[node]['hostname'],
-                                ip_map[node]['ipv4'],
-                                ip_map[node]['ipv6']))
+                        .format(address.hostname,
+                                address.ipv4,
+                                address.ipv6))
                 self.add_vm_to_nodelist(
-                    ip_map[node]['hostname'],
-                    ip_map[node]['ipv4'],
+                    address.hostname,
+                    address.ipv4,
                     test_constants.LIBVIRT_VM_USERNAME,
                     test_constants.LIBVIRT_VM_PASSWORD,
-                    ipv6=ip_map[node]['ipv6']
+                    ipv6=address.ipv6
                 )
-        self._print_list(0, service_groups)
-
-    @staticmethod
-    def _allocate_ips_based_on_act_stb(act_hst, ip_map, ipaddr, ipv6addr,
-                                       node_hst, stb_hst):
-        """
-        Allocate ips to nodes in the ipnode map based on the number of active
-         and standby hosts defined in the model.
-        :param act_hst: The number of active hosts
-        :param ip_map: The ip map to use
-        :param ipaddr:
-        :param ipv6addr:
-        :param node_hst:
-        :param stb_hst: The number of standby hosts
-        :return:
-        """
-        if int(act_hst) == 1 and int(stb_hst) == 1:
-            for node in ip_map:
-                if ipaddr:
-                    ip_map[node]["ipv4"] = ipaddr[0]
-                if ipv6addr:
-                    ip_map[node]["ipv6"] = ipv6addr[0]
-        else:
-            for tlen in range(len(ip_map)):
-                if ipaddr:
-                    ip_map[node_hst[tlen]]["ipv4"] = ipaddr[tlen]
-                if ipv6addr:
-                    ip_map[node_hst[tlen]]["ipv6"] = ipv6addr[tlen]
-
-    @staticmethod
-    def _handle_hostnames_in_mapping(node_hst, stb_hst, sv_gp):
-        """
-        Generate hostnames using those defined in the model if they can be
-        found and deriving them from the servicename otherwise.
-        :param node_hst:
-        :param stb_hst:
-        :param sv_gp:
-        :return:
-        """
-        if 'hostnames' in sv_gp['vm-service']:
-            sg_hsts = sv_gp['vm-service']['hostnames'].split(",")
-        else:
-            if int(stb_hst) != 1:
-                sg_hsts = []
-                for node in node_hst:
-                    print node
-                    print sg_hsts
-                    print sv_gp['vm-service']['service_name'].split(",")[0]
-                    sg_hsts.append("{0}-{1}".format(node, \
-                                                    sv_gp['vm-service'][
-                                                        'service_name']. \
-                                                    split(",")[0]))
-            else:
-                sg_hsts = sv_gp['vm-service']['service_name'].split(",")
-        return sg_hsts
 
     def _get_ifcfg_dict(self, node, device_name):
         """Gets the ifcfg dictionary from a node
@@ -1324,9 +1144,7 @@ class VCSVM(GenericTest):
         :param node: The node to query
         :return: A hosts file as a list
         """
-        cmd = self.net.get_cat_etc_hosts_cmd()
-        out, _, _ = self.run_command(node, cmd)
-        return out
+        return self.get_remote_file(node, test_constants.ETC_HOSTS)
 
     def _confirm_alias_not_on_node(self, node, alias_data):
         """
@@ -1402,7 +1220,7 @@ class VCSVM(GenericTest):
         """
         filename = '/var/lib/libvirt/instances/{0}/user-data'.format(
                                                                   service_name)
-        data = self.get_file_contents(node, filename)
+        data = self.get_remote_file(node, filename)
         name_regex = '^- ' + pkg_test_data["name"] + '$'
         self.assertFalse(any(re.match(name_regex, line) for line in data))
 
@@ -1413,10 +1231,7 @@ class VCSVM(GenericTest):
         :param node:
         :param key_test_data:
         """
-        cmd = self.rhc.get_cat_cmd("/etc/fstab")
-        out, err, rc = self.run_command(node, cmd)
-        self.assertEqual(0, rc)
-        self.assertEqual([], err)
+        out = self.get_remote_file(node, "/etc/fstab")
         self.assertFalse(any((mnt_test_data['device_path'] in line) and
                              (mnt_test_data['mount_point'] in line)
                          for line in out))
@@ -1514,6 +1329,169 @@ class VCSVM(GenericTest):
                                 default_asserts=True)[0],
                     ["export OCF_TIMEOUT={0}".format(timeout_value)])
 
+    def _filter_changed_service_groups(self, service_groups, diff):
+        """
+        Description:
+            Get the service groups affected by the model changes in diff.
+            A service group is affected if its clustered service, the
+            vm-service it references or its vm-image has changed.
+        :param service_groups: Service groups from get_vcs_vm_model_info.
+        :type service_groups: list
+        :param diff: The model changes, or None to keep every group.
+        :type diff: ModelDiff
+        :return: The list of service groups to verify.
+        """
+        if diff is None:
+            return service_groups
+        snapshot = self.get_model_snapshot(self.ms_node)
+        changed = []
+        for sv_gp in service_groups:
+            urls = [sv_gp.clustered_service.url, sv_gp.vm_image.url]
+            vm_service = snapshot.get_item(sv_gp.vm_service.url)
+            if vm_service is not None and vm_service.source:
+                urls.append(vm_service.source)
+            if any(diff.touches(url) for url in urls):
+                changed.append(sv_gp)
+            else:
+                self.log('info', 'Service Group "{0}" is unchanged since it '
+                         'was last verified, skipping'
+                         .format(sv_gp.clustered_service['name']))
+        return changed
+
+    def _verify_vm_service_groups(self, changed_only=False):
+        """
+        Description:
+            Verify every part of the vm service groups in the model against
+            the nodes, VCS and the VMs themselves.
+            When changed_only is set, only the service groups changed since
+            the last successful verification are checked again. Every
+            group is checked if there is no baseline, e.g. after a
+            failover or a reboot, which drop it.
+        :param changed_only: Only verify service groups changed since the
+                             last verification.
+        :type changed_only: bool
+        :return: All vm service groups in the model.
+        """
+        diff = None
+        if changed_only:
+            diff = self.get_model_diff_from_baseline(VERIFIED_MODEL)
+
+        # 1. Get all vm service groups in the model.
+        service_groups = self.get_vcs_vm_model_info()
+
+        # 2: Gather connection details for vm_nodes.
+        self._add_vm_nodes_connection_details(service_groups)
+
+        # 3. Verify every vm service group at the same time.
+        self.fan_out.run(self._verify_vm_service_group,
+                         self._filter_changed_service_groups(service_groups,
+                                                             diff),
+                         label=lambda sv_gp: sv_gp.name)
+        self.save_model_baseline(VERIFIED_MODEL, self.ms_node)
+        return service_groups
+
+    def _verify_vm_service_group(self, sv_gp):
+        """
+        Description:
+            Verify one vm service group against the nodes, VCS and its VMs.
+        :param sv_gp: The service group to verify.
+        :type sv_gp: ServiceGroup
+        """
+        # Some naming convention for this method:
+        #   lp_*  : A value that comes from the Litp model.
+        #   v_*   : A value that comes from VCS.
+        #   sv    : service
+        #   pt    : path
+        #   nm    : name
+        #   sv_gp : service group
+        #   cs    : clustered service
+        #   cl    : cluster
+        #   hns   : hostnames
+
+        # Litp clustered service record.
+        lp_cs = sv_gp.clustered_service
+        # Litp clustered service name: FO_SG_vm1
+        lp_cs_nm = lp_cs['name']
+
+        # VCS clustered service name : 'Grp_CS_c1_FO_SG_vm1'
+        v_cs_nm = sv_gp.vcs_group_name
+        # VCS application resource name : 'Res_App_c1_FO_SG_vm1_vmservice2'
+        v_rs_nm = sv_gp.vcs_resource_name
+        # VCS and Litp node names - VCS: n1, Litp: node1
+        # Commands only need to run on one node so just take one
+        lp_nd = next(sv_gp.nodes.itervalues())
+
+        # a. Gather information about the service group(hares, and the
+        #    VCS states of the cluster, fetched once for all the groups)
+        vcs_states = self.get_vcs_states(lp_nd)
+        hares = self.run_vcs_hares_display_command(lp_nd, v_rs_nm)
+
+        vm_nd_hns = sv_gp.nodes_hostnames
+
+        # b. Check the 'vcs-clustered-service' type
+        sv_gp = sv_gp.replace(node_state=self._check_vcs_clustered_service(
+            sv_gp, lp_cs_nm, lp_nd, lp_cs, v_cs_nm, hares, vcs_states))
+
+        # c. Check the 'vm-service' type
+        self._check_vm_service(sv_gp, hares, vm_nd_hns)
+
+        # d. Check the 'vm-image' type
+        image = sv_gp.vm_image
+        # get md5sum of the image on the ms and on every node at once
+        md5sums = self.command_engine.run_all(
+            [(self.ms_node, "/usr/bin/md5sum {0}".format(image.ms_path))] +
+            [(sv_gp.nodes[node],
+              "/usr/bin/md5sum {0}".format(image.node_path))
+             for node in sorted(sv_gp.nodes)])
+        for result in md5sums:
+            self.assertEqual(0, result.rc)
+            self.assertEqual([], result.stderr)
+            self.assertNotEqual([], result.stdout)
+        msmd5sum = md5sums[0].stdout[0].split()[0]
+        for node, result in zip(sorted(sv_gp.nodes), md5sums[1:]):
+            self.log('info', 'Checking vm-image source_uri for Service '
+                     'Group: "{0}" on node: "{1}"'
+                     .format(lp_cs['name'], sv_gp.nodes[node]))
+            self.assertTrue(
+                        self.check_repo_url_exists(sv_gp.nodes[node],
+                        image.source_uri))
+            ndmd5sum = result.stdout[0].split()[0]
+            # compare node and ms md5checksum
+            self.assertEqual(msmd5sum, ndmd5sum)
+
+        # e. Check the 'vm-network-interface' type
+        self._check_vm_network_interface(sv_gp, lp_cs, vm_nd_hns)
+
+        # f. Check the 'vm-ssh-key' type
+        self._check_vm_ssh_key(sv_gp, lp_cs, vm_nd_hns)
+
+        # g. Check the 'vm-package' type
+        self._check_vm_package(sv_gp, vm_nd_hns)
+
+        # h. Check 'vm-zypper-repo' or 'vm-yum-repo' type
+        if sv_gp.vm_service['service_name'] == 'sles':
+            self._check_vm_zypper_repo(sv_gp, lp_cs, vm_nd_hns)
+        else:
+            self._check_vm_yum_repo(sv_gp, lp_cs, vm_nd_hns)
+
+        # i. Check the 'vm-alias' type
+        self._check_vm_alias(sv_gp, lp_cs, vm_nd_hns)
+
+        # j. Check the 'vm-nfs-mount' type
+        self._check_vm_nfs_mount(sv_gp, lp_cs, vm_nd_hns)
+
+        # k. Check vm hostnames
+        self._check_vm_hostnames(sv_gp, lp_cs, vm_nd_hns)
+
+        # l. Check that VM timezones are equal to MS timezone
+        self._check_vm_timezone(sv_gp, lp_cs, vm_nd_hns)
+
+        # m. Check the hastatus vmmonitord files match status_timeout in
+        # the litp model
+        self._verify_vmmonitord_file(vm_nd_hns,
+                                     sv_gp.clustered_service[
+                                         'status_timeout'])
+
     @attr('all', 'revert', 'system_check', 'vcs_vm', 'vcs_vm_tc01')
     def test_01_p_verify_vm_vcs_clustered_service(self):
         """
@@ -1602,130 +1580,10 @@ class VCSVM(GenericTest):
             - VM images are present on the MS
         @tms_execution_type: Automated
         """
-
-        # 1. Get all vm service groups in the model.
-        service_groups = self.get_vcs_vm_model_info()
-        self.model["nodename_list"] = []
-        for node in self.model["nodes"]:
-            self.model["nodename_list"].append(node["url"].split("/")[-1])
-
-        # 2: Gather connection details for vm_nodes.
-        self._add_vm_nodes_connection_details(service_groups)
-
-        # 3. For each vm service group:
-        for sv_gp in service_groups:
-            # Some naming convention for this method:
-            #   lp_*  : A value that comes from the Litp model.
-            #   v_*   : A value that comes from VCS.
-            #   sv    : service
-            #   pt    : path
-            #   nm    : name
-            #   sv_gp : service group
-            #   cs    : clustered service
-            #   cl    : cluster
-            #   hns   : hostnames
-
-            # Litp clustered service dict.
-            lp_cs = sv_gp['vcs-clustered-service']
-            lp_cs_id = lp_cs['url'].split('/')[-1]
-            # Litp clustered service name: FO_SG_vm1
-            lp_cs_nm = lp_cs['name']
-            # Litp clustered service id: vmservice2
-            lp_cl_id = sv_gp['cluster']['id']
-            lp_sv_id = sv_gp['vm-service']['url'].split('/')[-1]
-
-            # VCS clustered service name : 'Grp_CS_c1_FO_SG_vm1'
-            v_cs_nm = self.vcs.generate_clustered_service_name(lp_cs_id,
-                                                               lp_cl_id)
-            # VCS application resource name : 'Res_App_c1_FO_SG_vm1_vmservice2'
-            v_rs_nm = self.vcs.generate_application_resource_name(lp_cs_nm,
-                                                                  lp_cl_id,
-                                                                  lp_sv_id)
-            # VCS and Litp node names - VCS: n1, Litp: node1
-            # Commands only need to run on one node so just pop one from list
-            v_nd, lp_nd = sv_gp['nodes'].popitem()
-            sv_gp['nodes'][v_nd] = lp_nd
-
-            # a. Gather information about the service group(hares, hastat,
-            #    hagrp)
-            hastat = self.run_vcs_hastatus_sum_command(lp_nd)
-            hares = self.run_vcs_hares_display_command(lp_nd, v_rs_nm)
-            hagrp = self.run_vcs_hagrp_display_command(lp_nd, v_cs_nm)
-
-            vm_nd_hns = sv_gp["nodes-hostnames"]
-
-            # b. Check the 'vcs-clustered-service' type
-            self._check_vcs_clustered_service(sv_gp, lp_cs_nm, lp_nd, lp_cs,
-                                             v_cs_nm, hares, hagrp, hastat)
-
-            # c. Check the 'vm-service' type
-            self._check_vm_service(sv_gp, hares, vm_nd_hns)
-
-            # d. Check the 'vm-image' type
-            image = sv_gp['vm-image']
-            # get locations on ms for image
-            vm_image_ms = test_constants.VM_IMAGE_MS_DIR + "/" \
-                    + image['source_uri'].split("/")[-1]
-            # get md5sum on ms for image
-            outp, err, rc = self.run_command(self.ms_node, \
-                    "/usr/bin/md5sum {0}".format(vm_image_ms))
-            self.assertEqual(0, rc)
-            self.assertEqual([], err)
-            self.assertNotEqual([], outp)
-            msmd5sum = outp[0].split()[0]
-            # get locations on nodes for image
-            vm_image_nd = test_constants.LIBVIRT_IMAGE_DIR + "/" \
-                    + image['source_uri'].split("/")[-1]
-            for node in sv_gp['nodes']:
-                self.log('info', 'Checking vm-image source_uri for Service '
-                         'Group: "{0}" on node: "{1}"'
-                         .format(lp_cs['name'], sv_gp['nodes'][node]))
-                self.assertTrue(
-                            self.check_repo_url_exists(sv_gp['nodes'][node],
-                            image['source_uri']))
-                # get md5sum on node for image
-                outp, err, rc = self.run_command(sv_gp['nodes'][node], \
-                    "/usr/bin/md5sum {0}".format(vm_image_nd))
-                self.assertEqual(0, rc)
-                self.assertEqual([], err)
-                self.assertNotEqual([], outp)
-                ndmd5sum = outp[0].split()[0]
-                # compare node and ms md5checksum
-                self.assertEqual(msmd5sum, ndmd5sum)
-
-            # e. Check the 'vm-network-interface' type
-            self._check_vm_network_interface(sv_gp, lp_cs, vm_nd_hns)
-
-            # f. Check the 'vm-ssh-key' type
-            self._check_vm_ssh_key(sv_gp, lp_cs, vm_nd_hns)
-
-            # g. Check the 'vm-package' type
-            self._check_vm_package(sv_gp, vm_nd_hns)
-
-            # h. Check 'vm-zypper-repo' or 'vm-yum-repo' type
-            if sv_gp['vm-service']['service_name'] == 'sles':
-                self._check_vm_zypper_repo(sv_gp, lp_cs, vm_nd_hns)
-            else:
-                self._check_vm_yum_repo(sv_gp, lp_cs, vm_nd_hns)
-
-            # i. Check the 'vm-alias' type
-            self._check_vm_alias(sv_gp, lp_cs, vm_nd_hns)
-
-            # j. Check the 'vm-nfs-mount' type
-            self._check_vm_nfs_mount(sv_gp, lp_cs, vm_nd_hns)
-
-            # k. Check vm hostnames
-            self._check_vm_hostnames(sv_gp, lp_cs, vm_nd_hns)
-
-            # l. Check that VM timezones are equal to MS timezone
-            self._check_vm_timezone(sv_gp, lp_cs, vm_nd_hns)
-
-            # m. Check the hastatus vmmonitord files match status_timeout in
-            # the litp model
-            self._verify_vmmonitord_file(vm_nd_hns,
-                                         sv_gp['vcs-clustered-service'][
-                                             'status_timeout'])
-        return service_groups
+        # Later tests only verify what changed since this test, never
+        # what changed since an earlier run.
+        self.clear_model_baseline(VERIFIED_MODEL)
+        return self._verify_vm_service_groups()
 
     @attr('all', 'revert', 'system_check', 'vcs_vm', 'vcs_vm_tc02')
     def test_02_p_verify_vm_vcs_clustered_service2(self):
@@ -1814,7 +1672,7 @@ class VCSVM(GenericTest):
             - VM images are present on the MS
         @tms_execution_type: Automated
         """
-        self.test_01_p_verify_vm_vcs_clustered_service()
+        self._verify_vm_service_groups(changed_only=True)
         self._confirm_update1_vm_interface_removals()
 
     @attr('all', 'revert', 'system_check', 'vcs_vm', 'vcs_vm_tc03')
@@ -1900,7 +1758,7 @@ class VCSVM(GenericTest):
             - VM images are present on the MS
         @tms_execution_type: Automated
         """
-        self.test_01_p_verify_vm_vcs_clustered_service()
+        self._verify_vm_service_groups(changed_only=True)
 
     @attr('all', 'revert', 'system_check', 'vcs_vm', 'vcs_vm_tc04')
     def test_04_p_verify_vm_vcs_clustered_service4(self):
@@ -2001,7 +1859,7 @@ class VCSVM(GenericTest):
             - VM images are present on the MS
         @tms_execution_type: Automated
         """
-        self.test_01_p_verify_vm_vcs_clustered_service()
+        self._verify_vm_service_groups(changed_only=True)
         self._check_aliases_removed()
         self._confirm_removals()
         self._confirm_item_removals()
@@ -2092,7 +1950,7 @@ class VCSVM(GenericTest):
             - VM images are present on the MS
         @tms_execution_type: Automated
         """
-        self.test_01_p_verify_vm_vcs_clustered_service()
+        self._verify_vm_service_groups(changed_only=True)
 
     @attr('all', 'revert', 'system_check', 'vcs_vm', 'vcs_vm_tc06')
     def test_06_p_verify_vm_vcs_clustered_service6(self):
@@ -2180,4 +2038,4 @@ class VCSVM(GenericTest):
             - VM images are present on the MS
         @tms_execution_type: Automated
         """
-        self.test_01_p_verify_vm_vcs_clustered_service()
+        self._verify_vm_service_groups(changed_only=True)